@@ -0,0 +1,348 @@
+"""
+Cache de assets pré-processados para o jogo Flappy Bird
+Guarda em um único arquivo os pixels RGBA já invertidos (prontos para o
+glTexImage2D) das páginas do atlas (inclusive sprites gerados em código, como
+os glifos das fontes) e de imagens avulsas, arrays derivados dos assets (ex.:
+máscaras de colisão e métricas dos glifos), com um manifesto de tamanhos e
+hashes dos arquivos de origem. Na inicialização o arquivo é mapeado em memória
+e as texturas são enviadas direto do mmap, sem decodificar PNG/JPG.
+
+Uso: python src/asset_cache.py  (gera o cache novamente)
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório atual ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from atlas import AtlasPage, decode_image, pack_atlas
+
+# Identificação do formato: assinatura + tamanho do manifesto (uint64)
+MAGIC: bytes = b"FBCACHE1"
+CACHE_VERSION: int = 2
+_HEADER = struct.Struct("<8sQ")
+
+# Alinhamento de cada bloco de pixels dentro do arquivo
+_ALIGNMENT: int = 64
+
+def _file_hash(path: str) -> str:
+    """
+    Hash SHA-256 do conteúdo de um arquivo
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class AssetCache:
+    """
+    Arquivo de cache aberto com mmap. Os arrays devolvidos são visões somente
+    leitura do mapeamento e valem enquanto o cache estiver aberto.
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre e valida o arquivo de cache
+
+        Args:
+            path: Caminho do arquivo
+
+        Raises:
+            OSError: Se o arquivo não puder ser aberto
+            ValueError: Se o arquivo não for um cache válido desta versão
+        """
+        self.path = os.path.abspath(path)
+        self._base_dir = os.path.dirname(self.path)
+        with open(self.path, "rb") as cache_file:
+            self._mmap = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, manifest_size = _HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC:
+                raise ValueError("assinatura inválida")
+            manifest_bytes = self._mmap[_HEADER.size:_HEADER.size + manifest_size]
+            self.manifest: typing.Dict[str, typing.Any] = json.loads(manifest_bytes.decode("utf-8"))
+            if self.manifest.get("version") != CACHE_VERSION:
+                raise ValueError(f"versão {self.manifest.get('version')} (esperada {CACHE_VERSION})")
+        except (ValueError, struct.error, UnicodeDecodeError) as e:
+            self.close()
+            raise ValueError(f"Cache '{path}' inválido: {e}") from e
+
+    def _relative(self, path: typing.Any) -> str:
+        """
+        Caminho de um asset relativo à pasta do cache (chave usada no manifesto)
+        """
+        return os.path.relpath(os.path.abspath(path), self._base_dir).replace(os.sep, "/")
+
+    def _pixels(self, entry: typing.Mapping[str, int]) -> np.ndarray:
+        """
+        Visão do mmap com os pixels de um bloco do manifesto
+        """
+        count = entry["height"] * entry["width"] * 4
+        data = np.frombuffer(self._mmap, dtype=np.uint8, count=count, offset=entry["offset"])
+        return data.reshape(entry["height"], entry["width"], 4)
+
+    def is_fresh(self) -> bool:
+        """
+        Verifica se nenhum arquivo de origem mudou desde o bake. Compara tamanho
+        e data de modificação; se diferirem, compara o hash do conteúdo
+
+        Returns:
+            True se o cache ainda corresponde aos arquivos de origem
+        """
+        for relative, info in self.manifest["sources"].items():
+            source = os.path.join(self._base_dir, relative)
+            try:
+                stat = os.stat(source)
+            except OSError:
+                return False
+            if stat.st_size == info["size"] and stat.st_mtime_ns == info["mtime_ns"]:
+                continue
+            if stat.st_size != info["size"] or _file_hash(source) != info["sha256"]:
+                return False
+        return True
+
+    def matches(self, atlas_sprites: typing.Mapping[str, typing.Any], images: typing.Iterable[typing.Any],
+                padding: int, arrays: typing.Iterable[str] = (), generated: typing.Iterable[str] = ()) -> bool:
+        """
+        Verifica se o cache foi gerado com o mesmo conjunto de sprites, imagens e arrays
+        """
+        key = _cache_key(self._relative, atlas_sprites, images, padding, arrays, generated)
+        return self.manifest["key"] == key
+
+    def has_atlas(self, atlas_sprites: typing.Mapping[str, typing.Any], padding: int) -> bool:
+        """
+        Verifica se as páginas do atlas no cache foram geradas com estes sprites
+        """
+        key = _cache_key(self._relative, atlas_sprites, (), padding)
+        return self.manifest["key"]["atlas"] == key["atlas"] and self.manifest["key"]["padding"] == padding
+
+    def image(self, path: typing.Any) -> typing.Optional[np.ndarray]:
+        """
+        Pixels RGBA invertidos de uma imagem avulsa
+
+        Args:
+            path: Caminho do arquivo de origem
+
+        Returns:
+            Array (altura, largura, 4) ou None se a imagem não estiver no cache
+        """
+        entry = self.manifest["images"].get(self._relative(path))
+        return None if entry is None else self._pixels(entry)
+
+    def array(self, name: str) -> typing.Optional[np.ndarray]:
+        """
+        Array derivado guardado com o nome dado no bake
+
+        Args:
+            name: Nome do array (chave de arrays em bake_asset_cache)
+
+        Returns:
+            Visão somente leitura do mmap ou None se o array não estiver no cache
+        """
+        entry = self.manifest["arrays"].get(name)
+        if entry is None:
+            return None
+        dtype = np.dtype(entry["dtype"])
+        count = int(np.prod(entry["shape"], dtype=np.int64))
+        data = np.frombuffer(self._mmap, dtype=dtype, count=count, offset=entry["offset"])
+        return data.reshape(entry["shape"])
+
+    def atlas_pages(self) -> typing.List[AtlasPage]:
+        """
+        Páginas do atlas guardadas no cache
+        """
+        pages: typing.List[AtlasPage] = []
+        for entry in self.manifest["atlas"]:
+            regions = {name: tuple(region) for name, region in entry["regions"].items()}
+            pages.append(AtlasPage(self._pixels(entry), regions)) # type: ignore
+        return pages
+
+    def close(self) -> None:
+        """
+        Fecha o mapeamento (se ainda houver arrays apontando para ele, o
+        fechamento fica para quando forem liberados)
+        """
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+def _cache_key(relative: typing.Callable[[typing.Any], str], atlas_sprites: typing.Mapping[str, typing.Any],
+               images: typing.Iterable[typing.Any], padding: int,
+               arrays: typing.Iterable[str] = (), generated: typing.Iterable[str] = ()) -> typing.Dict[str, typing.Any]:
+    """
+    Descrição do conteúdo pedido para o cache, comparada com a do manifesto
+    """
+    return {
+        "atlas": sorted([name, relative(path)] for name, path in atlas_sprites.items()),
+        "generated": sorted(generated),
+        "images": sorted(relative(path) for path in images),
+        "arrays": sorted(arrays),
+        "padding": padding,
+    }
+
+def bake_asset_cache(path: str, atlas_sprites: typing.Mapping[str, typing.Any],
+                     images: typing.Iterable[typing.Any] = (), padding: int = 2, max_size: int = 2048,
+                     arrays: typing.Optional[typing.Mapping[str, typing.Callable[[], np.ndarray]]] = None,
+                     generated: typing.Optional[typing.Mapping[str, typing.Callable[[], typing.Mapping[str, np.ndarray]]]]
+                     = None) -> None:
+    """
+    Gera o arquivo de cache: decodifica as imagens, empacota o atlas e grava
+    os pixels invertidos com o manifesto. A gravação é atômica (arquivo
+    temporário + os.replace)
+
+    Args:
+        path: Caminho do arquivo de cache
+        atlas_sprites: Sprites do atlas (nome -> caminho)
+        images: Imagens avulsas, carregadas com TextureManager.load_texture
+        padding: Borda de cada sprite no atlas
+        max_size: Tamanho máximo de uma página do atlas
+        arrays: Arrays derivados dos assets (nome -> função que gera o array);
+            o nome deve mudar quando mudam os parâmetros da geração
+        generated: Grupos de sprites gerados em código que também vão para o
+            atlas (nome do grupo -> função que devolve nome -> pixels RGBA,
+            linha 0 no topo), ex.: os glifos de uma fonte
+    """
+    arrays = arrays or {}
+    generated = generated or {}
+    path = os.path.abspath(path)
+    base_dir = os.path.dirname(path)
+    os.makedirs(base_dir, exist_ok=True)
+    images = list(images)
+
+    def relative(source: typing.Any) -> str:
+        return os.path.relpath(os.path.abspath(source), base_dir).replace(os.sep, "/")
+
+    sources: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    for source in list(atlas_sprites.values()) + images:
+        stat = os.stat(source)
+        sources[relative(source)] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                                     "sha256": _file_hash(str(source))}
+
+    sprites = {name: decode_image(source) for name, source in atlas_sprites.items()}
+    for generate in generated.values():
+        sprites.update(generate())
+    pages = pack_atlas(sprites, padding, max_size)
+    blocks: typing.List[np.ndarray] = []
+    atlas_entries: typing.List[typing.Dict[str, typing.Any]] = []
+    for page in pages:
+        atlas_entries.append({"width": page.pixels.shape[1], "height": page.pixels.shape[0],
+                              "regions": page.regions})
+        blocks.append(page.pixels)
+
+    image_entries: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    for source in images:
+        pixels = np.ascontiguousarray(decode_image(source)[::-1])
+        image_entries[relative(source)] = {"width": pixels.shape[1], "height": pixels.shape[0]}
+        blocks.append(pixels)
+
+    array_entries: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+    for name, generate in arrays.items():
+        array = np.ascontiguousarray(generate())
+        array_entries[name] = {"dtype": array.dtype.str, "shape": list(array.shape)}
+        blocks.append(array)
+
+    manifest = {
+        "version": CACHE_VERSION,
+        "key": _cache_key(relative, atlas_sprites, images, padding, arrays, generated),
+        "sources": sources,
+        "atlas": atlas_entries,
+        "images": image_entries,
+        "arrays": array_entries,
+    }
+
+    # Os offsets dependem do tamanho do manifesto, que depende dos offsets:
+    # reserva espaço fixo para eles e calcula até estabilizar
+    entries = atlas_entries + list(image_entries.values()) + list(array_entries.values())
+    for entry in entries:
+        entry["offset"] = 0
+    while True:
+        manifest_bytes = json.dumps(manifest, sort_keys=True).encode("utf-8")
+        offset = _align(_HEADER.size + len(manifest_bytes))
+        changed = False
+        for entry, block in zip(entries, blocks):
+            if entry["offset"] != offset:
+                entry["offset"] = offset
+                changed = True
+            offset = _align(offset + block.nbytes)
+        if not changed:
+            break
+
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as cache_file:
+        cache_file.write(_HEADER.pack(MAGIC, len(manifest_bytes)))
+        cache_file.write(manifest_bytes)
+        for entry, block in zip(entries, blocks):
+            cache_file.write(b"\0" * (entry["offset"] - cache_file.tell()))
+            cache_file.write(block.tobytes())
+    os.replace(temporary, path)
+
+def _align(offset: int) -> int:
+    """
+    Arredonda offset para o próximo múltiplo de _ALIGNMENT
+    """
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+def open_asset_cache(path: str, atlas_sprites: typing.Mapping[str, typing.Any],
+                     images: typing.Iterable[typing.Any] = (), padding: int = 2, rebuild: bool = True,
+                     arrays: typing.Optional[typing.Mapping[str, typing.Callable[[], np.ndarray]]] = None,
+                     generated: typing.Optional[typing.Mapping[str, typing.Callable[[], typing.Mapping[str, np.ndarray]]]]
+                     = None) -> typing.Optional[AssetCache]:
+    """
+    Abre o cache, gerando-o novamente se não existir, estiver desatualizado
+    ou tiver sido gerado com outros sprites
+
+    Args:
+        path: Caminho do arquivo de cache
+        atlas_sprites: Sprites do atlas (nome -> caminho)
+        images: Imagens avulsas
+        padding: Borda de cada sprite no atlas
+        rebuild: Se False, não gera o cache (quem chamou decodifica as imagens
+            e pode gerá-lo depois, ex.: AssetLoader.submit_after_loading)
+        arrays: Arrays derivados (nome -> função que gera o array), como em bake_asset_cache
+        generated: Grupos de sprites gerados para o atlas, como em bake_asset_cache
+
+    Returns:
+        Cache aberto ou None se não for possível gerá-lo (ou rebuild for False)
+    """
+    images = list(images)
+    arrays = arrays or {}
+    generated = generated or {}
+    action = "gerando novamente..." if rebuild else "usando as imagens originais"
+    cache: typing.Optional[AssetCache] = None
+    try:
+        cache = AssetCache(path)
+        if cache.matches(atlas_sprites, images, padding, arrays, generated) and cache.is_fresh():
+            return cache
+        print(f"Cache de assets desatualizado, {action}")
+        cache.close()
+    except FileNotFoundError:
+        print(f"Cache de assets não encontrado, {action}")
+    except (OSError, ValueError) as e:
+        print(f"Aviso: {e}; {action}")
+
+    if not rebuild:
+        return None
+    try:
+        bake_asset_cache(path, atlas_sprites, images, padding, arrays=arrays, generated=generated)
+        return AssetCache(path)
+    except (OSError, ValueError) as e:
+        print(f"Erro ao gerar o cache de assets: {e}")
+        return None
+
+if __name__ == "__main__":
+    from assets import ASSET_CACHE_PATH, ATLAS_SPRITES, CACHED_IMAGES, cached_arrays, generated_sprites
+
+    bake_asset_cache(str(ASSET_CACHE_PATH), ATLAS_SPRITES, CACHED_IMAGES, arrays=cached_arrays(),
+                     generated=generated_sprites())
+    size = os.path.getsize(ASSET_CACHE_PATH)
+    print(f"Cache de assets gerado em '{ASSET_CACHE_PATH}' ({size / 1024 / 1024:.1f} MB)")
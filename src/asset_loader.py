@@ -0,0 +1,340 @@
+"""
+Carregamento assíncrono de texturas para o jogo Flappy Bird
+As imagens são decodificadas em um pool de threads (o PIL libera o GIL durante
+a decodificação) e os envios ao OpenGL ficam em uma fila consumida pela thread
+principal, um pouco a cada quadro. As regiões do atlas são calculadas só com os
+cabeçalhos das imagens, então os componentes podem ser criados antes de os
+pixels chegarem: cada sprite aparece assim que é enviado. Outros dados da
+inicialização (ex.: máscaras de colisão) podem ser gerados no mesmo pool com
+load_task e contam no carregamento.
+"""
+
+from OpenGL.GL import glBindTexture, glTexSubImage2D, glGenBuffers, glBindBuffer, glBufferData, glDeleteBuffers # type: ignore
+from OpenGL.GL import glMapBuffer, glUnmapBuffer, GL_PIXEL_UNPACK_BUFFER, GL_STREAM_DRAW, GL_WRITE_ONLY # type: ignore
+from OpenGL.GL import GL_TEXTURE_2D, GL_RGBA, GL_UNSIGNED_BYTE # type: ignore
+from concurrent.futures import Future, ThreadPoolExecutor
+import ctypes
+import os
+import queue
+import time
+import numpy as np # type: ignore
+import typing # type: ignore
+
+from atlas import WHITE_SPRITE, block_offset, decode_image, layout_atlas, padded_block, read_image_size, white_pixels
+from texture_manager import TextureManager
+
+# Quantidade de pixel buffer objects usados em rodízio no envio por PBO
+PIXEL_BUFFER_COUNT: int = 2
+
+class _Upload(typing.NamedTuple):
+    """
+    Envio pendente: bloco de pixels (ou tarefa que o produz) e seu destino na textura
+    """
+    texture_id: int
+    x: int
+    y: int
+    pixels: typing.Union[np.ndarray, "Future[np.ndarray]"]
+
+class _Task(typing.NamedTuple):
+    """
+    Tarefa de carregamento cujo resultado é entregue na thread principal
+    """
+    result: "Future[typing.Any]"
+    callback: typing.Callable[[typing.Any], typing.Any]
+
+def _decode_sprite(path: typing.Any, padding: int) -> np.ndarray:
+    """
+    Decodifica um sprite do atlas já com a borda e invertido (executa no pool)
+    """
+    return padded_block(decode_image(path), padding)
+
+def _decode_texture(path: typing.Any) -> np.ndarray:
+    """
+    Decodifica uma imagem avulsa já invertida (executa no pool)
+    """
+    return np.ascontiguousarray(decode_image(path)[::-1])
+
+class AssetLoader:
+    """
+    Carrega as texturas do TextureManager sem bloquear a thread principal.
+    As texturas são criadas vazias (transparentes) e preenchidas por
+    process_uploads(), chamado a cada quadro; finish() espera tudo.
+    """
+
+    def __init__(self, texture_manager: TextureManager, workers: typing.Optional[int] = None, use_pbo: bool = False):
+        """
+        Inicializa o carregador
+
+        Args:
+            texture_manager: Gerenciador onde as texturas são registradas
+            workers: Threads de decodificação (padrão: até 4, conforme os núcleos)
+            use_pbo: Envia os pixels por pixel buffer objects em vez de direto da memória
+        """
+        self.texture_manager = texture_manager
+        self._executor = ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1),
+                                            thread_name_prefix="asset-decode")
+        self._ready: "queue.Queue[typing.Union[_Upload, _Task]]" = queue.Queue()
+        self._total = 0
+        self._pending = 0
+        self._decoding: typing.List["Future[typing.Any]"] = []
+        self._after_loading: typing.List[typing.Tuple[typing.Callable[..., typing.Any], typing.Tuple[typing.Any, ...]]] = []
+
+        self._pixel_buffers: typing.List[int] = []
+        self._next_buffer = 0
+        if use_pbo:
+            buffers = glGenBuffers(PIXEL_BUFFER_COUNT)
+            self._pixel_buffers = [int(buffer) for buffer in np.atleast_1d(buffers)]
+
+    @property
+    def done(self) -> bool:
+        """
+        Indica se todas as texturas pedidas já foram enviadas
+        """
+        return self._pending == 0
+
+    @property
+    def progress(self) -> float:
+        """
+        Fração dos envios concluídos (0 a 1)
+        """
+        return 1.0 if self._total == 0 else 1.0 - self._pending / self._total
+
+    def load_atlas(self, sprites: typing.Mapping[str, typing.Any], padding: int = 2,
+                   max_size: int = 2048) -> typing.List[int]:
+        """
+        Equivalente assíncrono de TextureManager.build_atlas. As regiões ficam
+        disponíveis imediatamente; os pixels de cada sprite chegam depois
+
+        Args:
+            sprites: Dicionário nome -> caminho da imagem
+            padding: Pixels de borda em volta de cada sprite
+            max_size: Tamanho máximo de uma página
+
+        Returns:
+            IDs das texturas das páginas criadas
+        """
+        manager = self.texture_manager
+        max_size = manager.max_atlas_size(max_size)
+
+        # Páginas do cache já estão prontas: não há o que decodificar
+        cache = manager.cache
+        if cache is not None and cache.has_atlas(sprites, padding):
+            pages = cache.atlas_pages()
+            if all(page.pixels.shape[0] <= max_size for page in pages):
+                return [manager.add_atlas_page(page.pixels, page.regions) for page in pages]
+
+        sizes: typing.Dict[str, typing.Tuple[int, int]] = {}
+        for name, path in sprites.items():
+            try:
+                sizes[name] = read_image_size(path)
+            except OSError as e:
+                print(f"Erro ao carregar sprite '{name}': {e}")
+        sizes.setdefault(WHITE_SPRITE, white_pixels().shape[:2])
+
+        page_ids: typing.List[int] = []
+        for layout in layout_atlas(sizes, padding, max_size):
+            page = np.zeros((layout.size, layout.size, 4), dtype=np.uint8)
+            texture_id = manager.add_atlas_page(page, layout.regions)
+            page_ids.append(texture_id)
+            # Os maiores sprites vêm primeiro no layout e começam a ser decodificados antes
+            for name in layout.placements:
+                x, y = block_offset(layout, name, padding)
+                if name in sprites:
+                    self._submit(texture_id, x, y, _decode_sprite, sprites[name], padding)
+                else:
+                    self._queue(_Upload(texture_id, x, y, padded_block(white_pixels(), padding)))
+        return page_ids
+
+    def load_texture(self, path: typing.Any, name: typing.Optional[str] = None) -> typing.Optional[int]:
+        """
+        Equivalente assíncrono de TextureManager.load_texture
+
+        Args:
+            path: Caminho do arquivo de imagem
+            name: Nome para referenciar a textura (opcional, usa o path se não fornecido)
+
+        Returns:
+            ID da textura OpenGL (vazia até a imagem ser enviada) ou None se houver erro
+        """
+        manager = self.texture_manager
+        if name is None:
+            name = str(path)
+        if name in manager.textures:
+            return manager.textures[name]
+
+        pixels = manager.cache.image(path) if manager.cache is not None else None
+        if pixels is not None:
+            return manager.add_texture(name, pixels)
+
+        try:
+            height, width = read_image_size(path)
+        except OSError as e:
+            print(f"Erro ao carregar textura '{path}': {e}")
+            return None
+        texture_id = manager.add_texture(name, np.zeros((height, width, 4), dtype=np.uint8))
+        self._submit(texture_id, 0, 0, _decode_texture, path)
+        return texture_id
+
+    def load_task(self, callback: typing.Callable[[typing.Any], typing.Any],
+                  function: typing.Callable[..., typing.Any], *args: typing.Any) -> None:
+        """
+        Executa uma tarefa no pool como parte do carregamento: done só fica
+        True depois que callback receber o resultado, chamado na thread
+        principal por process_uploads() ou finish()
+
+        Args:
+            callback: Recebe o resultado da tarefa (não é chamado se ela falhar)
+            function: Função a executar no pool
+            *args: Argumentos da função
+        """
+        self._total += 1
+        self._pending += 1
+        future = self._executor.submit(function, *args)
+        self._decoding.append(future)
+        future.add_done_callback(lambda done: self._ready.put(_Task(done, callback)))
+
+    def submit_after_loading(self, function: typing.Callable[..., typing.Any], *args: typing.Any) -> None:
+        """
+        Agenda uma tarefa no pool para quando todas as texturas tiverem sido
+        enviadas (ex.: gerar o cache de assets sem atrasar o carregamento)
+
+        Args:
+            function: Função a executar
+            *args: Argumentos da função
+        """
+        if self.done:
+            self._executor.submit(self._run_task, function, args)
+        else:
+            self._after_loading.append((function, args))
+
+    def process_uploads(self, budget: float = 0.004) -> int:
+        """
+        Envia ao OpenGL os pixels já decodificados (chamar na thread do contexto,
+        uma vez por quadro). Envia pelo menos um bloco por chamada
+
+        Args:
+            budget: Tempo máximo aproximado gasto na chamada, em segundos
+
+        Returns:
+            Quantidade de blocos enviados
+        """
+        start = time.perf_counter()
+        uploaded = 0
+        while self._pending:
+            try:
+                item = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            self._complete(item)
+            uploaded += 1
+            if time.perf_counter() - start >= budget:
+                break
+        return uploaded
+
+    def finish(self) -> None:
+        """
+        Espera todas as decodificações e envia os pixels restantes
+        """
+        while self._pending:
+            self._complete(self._ready.get())
+
+    def shutdown(self) -> None:
+        """
+        Cancela as decodificações que ainda não começaram, espera as tarefas
+        em andamento (inclusive as agendadas para depois do carregamento) e
+        libera os pixel buffers
+        """
+        for future in self._decoding:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        if self._pixel_buffers:
+            glDeleteBuffers(len(self._pixel_buffers), self._pixel_buffers)
+            self._pixel_buffers = []
+
+    def _submit(self, texture_id: int, x: int, y: int, function: typing.Callable[..., np.ndarray],
+                *args: typing.Any) -> None:
+        """
+        Agenda uma decodificação; o resultado entra na fila de envios ao terminar
+        """
+        self._total += 1
+        self._pending += 1
+        future = self._executor.submit(function, *args)
+        self._decoding.append(future)
+        future.add_done_callback(lambda done: self._ready.put(_Upload(texture_id, x, y, done)))
+
+    def _queue(self, item: _Upload) -> None:
+        """
+        Coloca na fila um bloco de pixels que já está pronto
+        """
+        self._total += 1
+        self._pending += 1
+        self._ready.put(item)
+
+    def _complete(self, item: typing.Union[_Upload, _Task]) -> None:
+        """
+        Envia um bloco da fila (ou entrega o resultado de uma tarefa) e, se era
+        o último, dispara as tarefas agendadas
+        """
+        self._pending -= 1
+        if isinstance(item, _Task):
+            try:
+                result = item.result.result()
+            except Exception as e:
+                print(f"Erro em tarefa de carregamento: {e}")
+            else:
+                item.callback(result)
+            self._after_complete()
+            return
+
+        pixels = item.pixels
+        if isinstance(pixels, Future):
+            try:
+                pixels = pixels.result()
+            except Exception as e:
+                print(f"Erro ao decodificar imagem: {e}")
+                pixels = None
+        if pixels is not None:
+            self._upload(item.texture_id, item.x, item.y, pixels)
+        self._after_complete()
+
+    def _after_complete(self) -> None:
+        """
+        Dispara as tarefas agendadas quando não há mais nada pendente
+        """
+        if self._pending == 0:
+            self._decoding.clear()
+            for function, args in self._after_loading:
+                self._executor.submit(self._run_task, function, args)
+            self._after_loading.clear()
+
+    def _upload(self, texture_id: int, x: int, y: int, pixels: np.ndarray) -> None:
+        """
+        Copia um bloco RGBA para a textura, direto ou por um pixel buffer object
+        """
+        glBindTexture(GL_TEXTURE_2D, texture_id)
+        height, width = pixels.shape[:2]
+        if not self._pixel_buffers:
+            glTexSubImage2D(GL_TEXTURE_2D, 0, x, y, width, height, GL_RGBA, GL_UNSIGNED_BYTE, pixels)
+            return
+
+        # Descarta o conteúdo anterior do buffer (sem esperar a GPU terminar de
+        # lê-lo), copia os pixels para a memória mapeada e envia a partir do buffer
+        buffer = self._pixel_buffers[self._next_buffer]
+        self._next_buffer = (self._next_buffer + 1) % len(self._pixel_buffers)
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, buffer)
+        glBufferData(GL_PIXEL_UNPACK_BUFFER, pixels.nbytes, None, GL_STREAM_DRAW)
+        pointer = glMapBuffer(GL_PIXEL_UNPACK_BUFFER, GL_WRITE_ONLY)
+        ctypes.memmove(pointer, pixels.ctypes.data, pixels.nbytes)
+        glUnmapBuffer(GL_PIXEL_UNPACK_BUFFER)
+        glTexSubImage2D(GL_TEXTURE_2D, 0, x, y, width, height, GL_RGBA, GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+
+    @staticmethod
+    def _run_task(function: typing.Callable[..., typing.Any], args: typing.Tuple[typing.Any, ...]) -> None:
+        """
+        Executa uma tarefa agendada, mostrando o erro em vez de perdê-lo no pool
+        """
+        try:
+            function(*args)
+        except Exception as e:
+            print(f"Erro em tarefa de carregamento: {e}")
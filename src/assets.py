@@ -4,6 +4,7 @@ Compatível com qualquer sistema operacional usando pathlib
 """
 
 from pathlib import Path
+import typing
 
 # Caminho base relativo ao local deste arquivo
 BASE_PATH = Path(__file__).resolve().parent / "assets"
@@ -43,3 +44,56 @@ NUMBER_9 = SCORE_PATH / "9.png"
 FLYING = AUDIO_PATH / "fly.wav"
 COLLISION = AUDIO_PATH / "collision.wav"
 POINT = AUDIO_PATH / "point.wav"
+
+
+# Cache com os pixels já decodificados (gerado por asset_cache.py)
+ASSET_CACHE_PATH = BASE_PATH / "assets.cache"
+
+# Sprites empacotados no atlas de texturas (nome -> imagem)
+# menu.jpg e clouds.png não são usados pelo jogo e ficam fora do atlas
+ATLAS_SPRITES = {
+    "background": BACKGROUND,
+    "ground": GROUND,
+    "pipe": PIPE,
+    "pipe_rotated": PIPE_ROTATED,
+    "bird_mid": BIRD_MID_FLAP,
+    "bird_up": BIRD_UP_FLAP,
+    "bird_down": BIRD_DOWN_FLAP,
+    "game_over": GAME_OVER,
+    "message": MESSAGE,
+    "heart": HEART,
+    **{f"number_{digit}": SCORE_PATH / f"{digit}.png" for digit in range(10)},
+}
+
+# Imagens fora do atlas que também vão para o cache (carregadas com load_texture)
+CACHED_IMAGES = [MENU, CLOUDS]
+
+def _cached_fonts() -> typing.List[typing.Tuple[int, typing.Optional[str]]]:
+    """
+    Fontes dos overlays (tamanho, arquivo), como pedidas a TextureManager.load_font
+    """
+    from config import FONT_PATH, INFO_TEXT_SIZE, BUTTON_TEXT_SIZE, SCORE_TEXT_SIZE
+    return list(dict.fromkeys((size, FONT_PATH or None) for size in (INFO_TEXT_SIZE, BUTTON_TEXT_SIZE, SCORE_TEXT_SIZE)))
+
+def cached_arrays() -> typing.Dict[str, typing.Callable[[], typing.Any]]:
+    """
+    Arrays derivados dos assets que também vão para o cache (nome -> função
+    que gera o array): as máscaras de colisão do pássaro e as métricas dos
+    glifos das fontes
+    """
+    # Importado aqui: os módulos de máscaras e de texto dependem deste
+    from simulation.masks import bird_mask_arrays
+    from simulation.reachability import BIRD_WIDTH, BIRD_HEIGHT
+    from text import font_arrays
+    arrays = bird_mask_arrays(BIRD_WIDTH, BIRD_HEIGHT)
+    for size, path in _cached_fonts():
+        arrays.update(font_arrays(size, path))
+    return arrays
+
+def generated_sprites() -> typing.Dict[str, typing.Callable[[], typing.Any]]:
+    """
+    Sprites gerados em código que o cache guarda na página do atlas (nome do
+    grupo -> função que devolve os sprites): os glifos das fontes
+    """
+    from text import font_name, font_sprites
+    return {font_name(size, path): font_sprites(size, path) for size, path in _cached_fonts()}
@@ -0,0 +1,207 @@
+"""
+Empacotamento de sprites em atlas de texturas, sem dependência de OpenGL
+Usado pelo TextureManager em tempo de execução e pelo cache de assets no bake
+"""
+
+from PIL import Image # type: ignore
+import numpy as np # type: ignore
+import typing # type: ignore
+
+# Sprite branco sólido incluído em todo atlas (retângulos de cor)
+WHITE_SPRITE: str = "white"
+
+# Região de um sprite na página: (u0, v0, u1, v1, largura, altura)
+RegionData = typing.Tuple[float, float, float, float, int, int]
+
+class AtlasPage(typing.NamedTuple):
+    """
+    Página do atlas pronta para o OpenGL
+    """
+    pixels: np.ndarray  # RGBA (altura, largura, 4) já invertido: a linha 0 é a base
+    regions: typing.Dict[str, RegionData]
+
+def decode_image(path: typing.Any) -> np.ndarray:
+    """
+    Decodifica uma imagem para um array RGBA (altura, largura, 4), linha 0 no topo
+
+    Args:
+        path: Caminho do arquivo de imagem
+
+    Returns:
+        Pixels da imagem
+    """
+    with Image.open(path) as image:
+        return np.array(image.convert("RGBA"), dtype=np.uint8)
+
+def read_image_size(path: typing.Any) -> typing.Tuple[int, int]:
+    """
+    Lê apenas o cabeçalho de uma imagem para obter o seu tamanho
+
+    Args:
+        path: Caminho do arquivo de imagem
+
+    Returns:
+        Tupla (altura, largura)
+    """
+    with Image.open(path) as image:
+        width, height = image.size
+    return height, width
+
+def _sorted_by_height(sizes: typing.Mapping[str, typing.Tuple[int, int]]) -> typing.List[str]:
+    """
+    Nomes ordenados por altura (maiores primeiro) para aproveitar melhor as prateleiras
+    """
+    return sorted(sizes, key=lambda key: (-sizes[key][0], key))
+
+def _pack_page(names: typing.List[str], sizes: typing.Mapping[str, typing.Tuple[int, int]], padding: int,
+               page_size: int) -> typing.Tuple[typing.Dict[str, typing.Tuple[int, int]], typing.List[str]]:
+    """
+    Distribui os sprites em prateleiras de uma página
+
+    Returns:
+        Posições (x, y a partir do topo, sem a borda) dos sprites que couberam
+        e a lista dos que ficaram de fora
+    """
+    placements: typing.Dict[str, typing.Tuple[int, int]] = {}
+    rest: typing.List[str] = []
+    shelf_y = 0
+    shelf_height = 0
+    cursor_x = 0
+    for name in names:
+        height, width = sizes[name]
+        cell_w = width + 2 * padding
+        cell_h = height + 2 * padding
+        if cursor_x + cell_w > page_size:
+            # Abre uma nova prateleira abaixo da atual
+            shelf_y += shelf_height
+            shelf_height = 0
+            cursor_x = 0
+        if cell_w > page_size or shelf_y + cell_h > page_size:
+            rest.append(name)
+            continue
+        placements[name] = (cursor_x + padding, shelf_y + padding)
+        cursor_x += cell_w
+        shelf_height = max(shelf_height, cell_h)
+    return placements, rest
+
+def _page_size(sizes: typing.Mapping[str, typing.Tuple[int, int]], padding: int, max_size: int) -> int:
+    """
+    Menor potência de 2 em que todos os sprites cabem em uma única página (até max_size)
+    """
+    size = 64
+    names = _sorted_by_height(sizes)
+    while size < max_size:
+        _, rest = _pack_page(names, sizes, padding, size)
+        if not rest:
+            return size
+        size *= 2
+    return max_size
+
+class PageLayout(typing.NamedTuple):
+    """
+    Posição dos sprites em uma página do atlas, calculada só a partir dos tamanhos
+    """
+    size: int
+    placements: typing.Dict[str, typing.Tuple[int, int]]  # x, y a partir do topo, sem a borda
+    regions: typing.Dict[str, RegionData]
+
+def layout_atlas(sizes: typing.Mapping[str, typing.Tuple[int, int]], padding: int = 2,
+                 max_size: int = 2048) -> typing.List[PageLayout]:
+    """
+    Distribui os sprites nas páginas sem precisar dos pixels
+
+    Os sprites são ordenados por altura e distribuídos em prateleiras; a
+    página é a menor potência de 2 que comporte todos, limitada por max_size
+    (o que não couber vai para uma nova página).
+
+    Args:
+        sizes: Dicionário nome -> (altura, largura)
+        padding: Pixels de borda em volta de cada sprite
+        max_size: Tamanho máximo de uma página
+
+    Returns:
+        Layout de cada página
+    """
+    page_size = _page_size(sizes, padding, max_size)
+
+    layouts: typing.List[PageLayout] = []
+    pending = _sorted_by_height(sizes)
+    while pending:
+        placements, pending = _pack_page(pending, sizes, padding, page_size)
+        if not placements:
+            print(f"Erro: Sprite '{pending[0]}' não cabe em uma página de {page_size}x{page_size}")
+            pending = pending[1:]
+            continue
+
+        regions: typing.Dict[str, RegionData] = {}
+        for name, (x, y) in placements.items():
+            height, width = sizes[name]
+            regions[name] = (x / page_size, (page_size - y - height) / page_size,
+                             (x + width) / page_size, (page_size - y) / page_size,
+                             width, height)
+        layouts.append(PageLayout(page_size, placements, regions))
+    return layouts
+
+def padded_block(pixels: np.ndarray, padding: int) -> np.ndarray:
+    """
+    Sprite com a borda repetida, já invertido para o OpenGL
+
+    Args:
+        pixels: Pixels RGBA do sprite (linha 0 no topo)
+        padding: Pixels de borda
+
+    Returns:
+        Array contíguo (altura + 2 * padding, largura + 2 * padding, 4)
+    """
+    padded = np.pad(pixels, ((padding, padding), (padding, padding), (0, 0)), mode="edge")
+    return np.ascontiguousarray(padded[::-1])
+
+def block_offset(layout: PageLayout, name: str, padding: int) -> typing.Tuple[int, int]:
+    """
+    Canto inferior esquerdo do bloco de um sprite (com a borda) na página invertida,
+    usado como xoffset/yoffset do glTexSubImage2D
+
+    Returns:
+        Tupla (x, y)
+    """
+    x, y = layout.placements[name]
+    height = layout.regions[name][5]
+    return x - padding, layout.size - y - height - padding
+
+def white_pixels() -> np.ndarray:
+    """
+    Pixels do sprite WHITE_SPRITE
+    """
+    return np.full((4, 4, 4), 255, dtype=np.uint8)
+
+def pack_atlas(images: typing.Mapping[str, np.ndarray], padding: int = 2,
+               max_size: int = 2048) -> typing.List[AtlasPage]:
+    """
+    Empacota imagens em uma ou mais páginas (distribuição de layout_atlas)
+
+    Cada sprite recebe uma borda de padding pixels repetindo a sua borda,
+    para que a filtragem linear não misture sprites vizinhos. O sprite
+    WHITE_SPRITE é sempre incluído.
+
+    Args:
+        images: Dicionário nome -> pixels RGBA (linha 0 no topo)
+        padding: Pixels de borda em volta de cada sprite
+        max_size: Tamanho máximo de uma página
+
+    Returns:
+        Páginas do atlas
+    """
+    images = dict(images)
+    images.setdefault(WHITE_SPRITE, white_pixels())
+    sizes = {name: pixels.shape[:2] for name, pixels in images.items()}
+
+    pages: typing.List[AtlasPage] = []
+    for layout in layout_atlas(sizes, padding, max_size):
+        # No OpenGL a textura começa na parte inferior esquerda: a página é montada invertida
+        page = np.zeros((layout.size, layout.size, 4), dtype=np.uint8)
+        for name in layout.placements:
+            block = padded_block(images[name], padding)
+            x, y = block_offset(layout, name, padding)
+            page[y:y + block.shape[0], x:x + block.shape[1]] = block
+        pages.append(AtlasPage(page, layout.regions))
+    return pages
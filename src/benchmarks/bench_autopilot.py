@@ -0,0 +1,59 @@
+"""
+Benchmark do piloto automático por busca (SearchAutopilot)
+Joga partidas headless com o piloto (com o limite de tempo por busca usado
+na janela) e com o piloto simples dos outros benchmarks, que só mira no
+centro do próximo vão, e mostra a pontuação de cada um, o tempo das buscas
+contra o limite e os nós expandidos por segundo
+
+Uso: python src/benchmarks/bench_autopilot.py [partidas] [segundos]
+"""
+
+import sys
+import os
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import AUTOPILOT_BUDGET
+from benchmarks.suite import DELTA_TIME, autopilot
+from simulation.game_simulation import GameSimulation, SimulationInput
+from simulation.autopilot import SearchAutopilot
+
+if __name__ == "__main__":
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 600.0
+    max_ticks = int(seconds / DELTA_TIME)
+
+    search_scores = []
+    simple_scores = []
+    plan_times = []
+    nodes = 0
+    for seed in range(games):
+        # Piloto por busca, medindo cada busca
+        simulation = GameSimulation(seed=seed)
+        pilot = SearchAutopilot(simulation, DELTA_TIME, restart=False)
+        while not simulation.game_over and simulation.ticks < max_ticks:
+            plans = pilot.plans
+            inputs = pilot.act()
+            if pilot.plans != plans:
+                plan_times.append(pilot.last_plan_time)
+            simulation.step(DELTA_TIME, inputs)
+        search_scores.append(simulation.score)
+        nodes += pilot.nodes
+
+        # Piloto simples, mesma semente
+        simulation = GameSimulation(seed=seed)
+        simulation.step(DELTA_TIME, SimulationInput.FLAP)
+        while not simulation.game_over and simulation.ticks < max_ticks:
+            simulation.step(DELTA_TIME, autopilot(simulation))
+        simple_scores.append(simulation.score)
+
+    plan_us = np.array(plan_times) * 1e6
+    over = np.count_nonzero(plan_us > AUTOPILOT_BUDGET * 1e6)
+    print(f"pontuação (busca):   {search_scores} (média {np.mean(search_scores):.1f})")
+    print(f"pontuação (simples): {simple_scores} (média {np.mean(simple_scores):.1f})")
+    print(f"buscas: {len(plan_us)}, p50 {np.percentile(plan_us, 50):.0f} µs, p95 {np.percentile(plan_us, 95):.0f} µs, "
+          f"p99 {np.percentile(plan_us, 99):.0f} µs, máx {plan_us.max():.0f} µs; "
+          f"{over} acima do limite de {AUTOPILOT_BUDGET * 1e3:.1f} ms")
+    print(f"nós expandidos: {nodes / (plan_us.sum() * 1e-6) / 1e3:.0f} mil/s ({nodes / len(plan_us):.0f} por busca)")
@@ -0,0 +1,70 @@
+"""
+Benchmark do ambiente em lote (BatchFlappyEnv) contra um laço de GameSimulation
+Compara quantos passos de mundo por segundo cada abordagem executa
+
+Uso: python src/benchmarks/bench_batch_env.py [mundos] [passos]
+"""
+
+import sys
+import os
+import time
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation.batch_env import BatchFlappyEnv
+from simulation.game_simulation import GameSimulation, SimulationInput
+
+DELTA_TIME: float = 1 / 60
+
+def bench_scalar(num_worlds: int, steps: int, seed: int = 0) -> float:
+    """
+    Avança num_worlds instâncias de GameSimulation, uma a uma
+
+    Returns:
+        Passos de mundo por segundo
+    """
+    rng = np.random.default_rng(seed)
+    worlds = [GameSimulation(seed=seed + i) for i in range(num_worlds)]
+    for world in worlds:
+        world.step(DELTA_TIME, SimulationInput.FLAP)  # inicia o jogo
+    actions = rng.random((steps, num_worlds)) < 0.08
+
+    start = time.perf_counter()
+    for t in range(steps):
+        row = actions[t]
+        for i, world in enumerate(worlds):
+            inputs = SimulationInput.FLAP if row[i] else SimulationInput.NONE
+            if world.game_over:
+                inputs = SimulationInput.RESTART
+            world.step(DELTA_TIME, inputs)
+    elapsed = time.perf_counter() - start
+    return num_worlds * steps / elapsed
+
+def bench_batch(num_worlds: int, steps: int, seed: int = 0) -> float:
+    """
+    Avança num_worlds mundos de BatchFlappyEnv em chamadas vetorizadas
+
+    Returns:
+        Passos de mundo por segundo
+    """
+    rng = np.random.default_rng(seed)
+    env = BatchFlappyEnv(num_worlds, seed=seed)
+    actions = rng.random((steps, num_worlds)) < 0.08
+
+    start = time.perf_counter()
+    for t in range(steps):
+        env.step(actions[t], DELTA_TIME)
+    elapsed = time.perf_counter() - start
+    return num_worlds * steps / elapsed
+
+if __name__ == "__main__":
+    num_worlds = int(sys.argv[1]) if len(sys.argv) > 1 else 4096
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    scalar_rate = bench_scalar(num_worlds, max(1, steps // 10))
+    batch_rate = bench_batch(num_worlds, steps)
+    print(f"GameSimulation em laço: {scalar_rate:,.0f} passos de mundo/s")
+    print(f"BatchFlappyEnv ({num_worlds} mundos): {batch_rate:,.0f} passos de mundo/s")
+    print(f"Ganho: {batch_rate / scalar_rate:.1f}x")
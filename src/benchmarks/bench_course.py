@@ -0,0 +1,98 @@
+"""
+Benchmark do gerador de percurso (simulation.course)
+Mede a geração em blocos (pares por segundo, com e sem a verificação de
+alcance), o custo de cada spawn de cano tirando o par do percurso contra o
+sorteio no momento do spawn, a abertura de um percurso nomeado com mmap e
+confere que jogos diferentes (piloto automático com ruído em cada "gabinete")
+recebem os mesmos pares
+
+Uso: python src/benchmarks/bench_course.py [pares] [gabinetes]
+"""
+
+import random
+import sys
+import os
+import tempfile
+import time
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from benchmarks.suite import DELTA_TIME, autopilot
+from simulation.entities import PipeField
+from simulation.game_simulation import GameSimulation, SimulationInput
+from simulation.course import CourseGenerator, save_course, load_course
+
+def spawn_time(pipes: PipeField, repeat: int = 20_000) -> float:
+    """
+    Tempo médio de um spawn de par, em microssegundos (os pares saem da tela a
+    cada chamada, então o pool não cresce)
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        pipes._spawn_pipe()
+        pipes._remove_oldest()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+def cabinet_pairs(seed: int, noise: int, pairs: int) -> np.ndarray:
+    """
+    Joga com o piloto simples e pulos extras aleatórios (cada gabinete joga
+    diferente, morre em outros pontos e recomeça as partidas do início do
+    percurso) e devolve a base do vão de cada par do percurso, pela posição
+    """
+    simulation = GameSimulation(seed=seed)
+    extra = random.Random(noise)
+    gaps = np.full(pairs, np.nan)
+    simulation.step(DELTA_TIME, SimulationInput.FLAP)
+    while np.isnan(gaps).any():
+        inputs = autopilot(simulation)
+        if simulation.game_over:
+            inputs = SimulationInput.RESTART | SimulationInput.FLAP
+        elif extra.random() < 0.002:
+            inputs |= SimulationInput.FLAP
+        position = simulation.course.position
+        simulation.step(DELTA_TIME, inputs)
+        if simulation.course.position == position + 1 and position < pairs:
+            pipes = simulation.pipes
+            gaps[position] = pipes.gap_y[(pipes._head + pipes.pair_count - 1) % pipes.capacity]
+    return gaps
+
+if __name__ == "__main__":
+    pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    cabinets = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    pipes = PipeField(WINDOW_WIDTH, WINDOW_HEIGHT)
+    gap_min, gap_max = pipes._min_pipe_height, pipes._max_pipe_height
+
+    # Geração em blocos (tabelas de alcance já carregadas na primeira passada)
+    for check in (False, True):
+        course = CourseGenerator(1, gap_min, gap_max, WINDOW_HEIGHT, check_reachability=check)
+        course.rows(pairs)
+        start = time.perf_counter()
+        rows = course.rows(pairs)
+        elapsed = time.perf_counter() - start
+        print(f"gerar (alcance {'sim' if check else 'não'}): {pairs / elapsed / 1e3:7.0f} mil pares/s "
+              f"({elapsed / pairs * course.chunk_size * 1e6:.0f} µs por bloco de {course.chunk_size})")
+
+    # Spawn de um par: do percurso contra o sorteio no momento do spawn
+    pipes.course = CourseGenerator(1, gap_min, gap_max, WINDOW_HEIGHT)
+    course_us = spawn_time(pipes)
+    pipes.course = None
+    pipes.rng = random.Random(1)
+    random_us = spawn_time(pipes)
+    print(f"spawn:     {course_us:.2f} µs com o percurso, {random_us:.2f} µs sorteando no spawn")
+
+    # Percurso nomeado gravado e aberto com mmap
+    path = os.path.join(tempfile.mkdtemp(), "bench.course")
+    save_course(path, CourseGenerator(1, gap_min, gap_max, WINDOW_HEIGHT), pairs)
+    start = time.perf_counter()
+    loaded = load_course(path, gap_min, gap_max, WINDOW_HEIGHT)
+    load_ms = (time.perf_counter() - start) * 1e3
+    print(f"abrir:     {load_ms:.2f} ms ({os.path.getsize(path) / 1e3:.0f} KB, {pairs} pares); "
+          f"iguais aos gerados pela semente: {np.array_equal(loaded.rows(pairs), rows)}")
+
+    # Gabinetes jogando diferente recebem os mesmos canos
+    results = [cabinet_pairs(7, noise, 20) for noise in range(cabinets)]
+    same = all(np.array_equal(results[0], other) for other in results[1:])
+    print(f"gabinetes: {cabinets} jogos diferentes, primeiros 20 pares do percurso iguais: {same}")
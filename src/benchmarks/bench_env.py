@@ -0,0 +1,64 @@
+"""
+Benchmark do ambiente FlappyEnv com cada codificador de observação
+Mede quantos passos por segundo o ambiente executa, incluindo a codificação
+
+Uso: python src/benchmarks/bench_env.py [passos]
+"""
+
+import sys
+import os
+import time
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation.env import FlappyEnv
+from simulation.encoders import ObservationEncoder, FeatureEncoder, PixelEncoder
+
+class NullEncoder(ObservationEncoder):
+    """
+    Codificador vazio: mede apenas o custo da simulação
+    """
+
+    shape = (0,)
+
+    def __init__(self):
+        self._empty = np.zeros(0, dtype=np.float32)
+
+    def encode(self, simulation: typing.Any) -> np.ndarray:
+        return self._empty
+
+def bench_encoder(encoder: ObservationEncoder, steps: int, seed: int = 0) -> float:
+    """
+    Executa steps passos com ações aleatórias, reiniciando ao fim de cada episódio
+
+    Returns:
+        Passos por segundo
+    """
+    rng = np.random.default_rng(seed)
+    actions = rng.random(steps) < 0.08
+    env = FlappyEnv(encoder=encoder)
+    env.reset(seed)
+
+    start = time.perf_counter()
+    for t in range(steps):
+        _, _, terminated, truncated, _ = env.step(int(actions[t]))
+        if terminated or truncated:
+            env.reset(seed + t)
+    elapsed = time.perf_counter() - start
+    return steps / elapsed
+
+if __name__ == "__main__":
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+
+    encoders: typing.List[typing.Tuple[str, ObservationEncoder]] = [
+        ("nenhum", NullEncoder()),
+        ("características", FeatureEncoder()),
+        ("características normalizadas", FeatureEncoder(normalize=True)),
+        ("pixels 84x84", PixelEncoder()),
+    ]
+    for name, encoder in encoders:
+        rate = bench_encoder(encoder, steps)
+        print(f"Codificador {name:<30} {rate:>12,.0f} passos/s")
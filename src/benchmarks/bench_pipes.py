@@ -0,0 +1,160 @@
+"""
+Benchmark do PipeField com muitos pares de canos na tela
+Mede update(), check_collision() e check_score() em regime permanente: a cada
+passo um par entra pela direita e outro sai pela esquerda. Compara com a
+versão anterior, um objeto por cano em uma lista (ListPipeField)
+
+Uso: python src/benchmarks/bench_pipes.py [pares ...]
+"""
+
+import sys
+import os
+import time
+import typing
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WINDOW_HEIGHT, PIPE_GAP, PIPE_WIDTH, PIPE_HEIGHT
+from simulation.entities import PipeField
+
+DELTA_TIME: float = 1 / 60
+PAIR_SPACING: float = 100.0 # Distância entre pares consecutivos
+
+class MidpointRandom:
+    """
+    Gerador "aleatório" determinístico: sempre o ponto médio do intervalo,
+    para que todos os vãos fiquem na mesma altura e os spawns em todo passo
+    """
+
+    def uniform(self, low: float, high: float) -> float:
+        return (low + high) / 2
+
+class ListPipe:
+    """
+    Um cano (superior ou inferior) como objeto, como antes do PipeField em arrays
+    """
+
+    def __init__(self, x: float, y: float, is_top_pipe: bool):
+        self.x = x
+        self.y = y
+        self.is_top_pipe = is_top_pipe
+        self.width = PIPE_WIDTH
+        self.height = PIPE_HEIGHT
+        self.scored = False
+
+class ListPipeField:
+    """
+    Linha de base: os canos em uma lista de objetos, movidos um a um e
+    percorridos inteiros na colisão e na pontuação (o PipeField antes dos
+    arrays, com o mesmo spawn por distância)
+    """
+
+    def __init__(self, window_width: int, window_height: int, rng: MidpointRandom):
+        self.window_width = window_width
+        self.rng = rng
+        self.speed = 0.0
+        self.spacing = PAIR_SPACING
+        self.scroll = 0.0
+        self._next_spawn = self.spacing
+        self._pipes: typing.List[ListPipe] = []
+        self._last_scored_pipe: typing.Optional[ListPipe] = None
+        self._min_pipe_height = 100
+        self._max_pipe_height = window_height - PIPE_GAP - self._min_pipe_height
+
+    @property
+    def pair_count(self) -> int:
+        return len(self._pipes) // 2
+
+    def update(self, delta_time: float) -> None:
+        dx = self.speed * delta_time
+        self.scroll += dx
+        removed = False
+        for pipe in self._pipes:
+            pipe.x -= dx
+            if pipe.x + pipe.width < 0:
+                removed = True
+        while self.scroll >= self._next_spawn:
+            x = self.window_width - (self.scroll - self._next_spawn)
+            gap_y = self.rng.uniform(self._min_pipe_height, self._max_pipe_height)
+            self._pipes.append(ListPipe(x, gap_y - PIPE_HEIGHT, False))
+            self._pipes.append(ListPipe(x, gap_y + PIPE_GAP, True))
+            self._next_spawn += self.spacing
+        if removed:
+            self._pipes = [pipe for pipe in self._pipes if pipe.x + pipe.width >= 0]
+
+    def check_collision(self, bird_rect: typing.Tuple[float, float, float, float]) -> bool:
+        bird_x, bird_y, bird_w, bird_h = bird_rect
+        for pipe in self._pipes:
+            if (bird_x < pipe.x + pipe.width and bird_x + bird_w > pipe.x and
+                    bird_y < pipe.y + pipe.height and bird_y + bird_h > pipe.y):
+                return True
+        return False
+
+    def check_score(self, bird_x: float) -> int:
+        closest: typing.Optional[ListPipe] = None
+        for pipe in self._pipes:
+            if (not pipe.is_top_pipe and not pipe.scored and pipe.x + pipe.width < bird_x and
+                    (closest is None or pipe.x < closest.x)):
+                closest = pipe
+        if closest is not None and self._last_scored_pipe is not closest:
+            closest.scored = True
+            self._last_scored_pipe = closest
+            return 1
+        return 0
+
+def create_list_field(pairs: int) -> ListPipeField:
+    """
+    Cria a linha de base em regime permanente com aproximadamente pairs pares ativos
+    """
+    field = ListPipeField(int(pairs * PAIR_SPACING), WINDOW_HEIGHT, MidpointRandom())
+    field.speed = PAIR_SPACING / DELTA_TIME
+    for _ in range(pairs + 2):
+        field.update(DELTA_TIME)
+    return field
+
+def create_field(pairs: int) -> PipeField:
+    """
+    Cria um PipeField em regime permanente com aproximadamente pairs pares ativos
+    """
+    field = PipeField(int(pairs * PAIR_SPACING), WINDOW_HEIGHT, MidpointRandom())
+    field.speed = PAIR_SPACING / DELTA_TIME
+    field.spacing = PAIR_SPACING
+    # A linha de base não verifica o alcance dos vãos: mede só a estrutura dos canos
+    field.check_reachability = False
+    field.reset()
+    for _ in range(pairs + 2):
+        field.update(DELTA_TIME)
+    return field
+
+def time_call(function, iterations: int) -> float:
+    """
+    Tempo médio de uma chamada, em microssegundos
+    """
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:]] or [3, 32, 256, 2048]
+
+    # Cada coluna: lista de objetos -> PipeField (ganho)
+    print(f"{'pares':>6} {'update':>32} {'check_collision':>32} {'check_score':>32}")
+    for pairs in counts:
+        iterations = max(200, 200_000 // pairs)
+        timings = []
+        for field in (create_list_field(pairs), create_field(pairs)):
+            # Pássaro no meio da tela, dentro do vão (com MidpointRandom todos os vãos
+            # são centrados na tela): sem colisão, todos os pares são testados
+            bird_x = field.window_width / 2
+            bird_rect = (bird_x, WINDOW_HEIGHT / 2 - 10.0, 26.7, 18.7)
+
+            update_us = time_call(lambda: field.update(DELTA_TIME), iterations)
+            collision_us = time_call(lambda: field.check_collision(bird_rect), iterations)
+            field.check_score(bird_x)
+            score_us = time_call(lambda: field.check_score(bird_x), iterations)
+            timings.append((update_us, collision_us, score_us))
+        columns = " ".join(f"{before:>9.2f} -> {after:>8.2f} µs ({before / after:>5.1f}x)"
+                           for before, after in zip(*timings))
+        print(f"{field.pair_count:>6} {columns}")
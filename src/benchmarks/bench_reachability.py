@@ -0,0 +1,110 @@
+"""
+Benchmark do oráculo de alcance (simulation.reachability)
+Para cada nível de velocidade mede a geração das tabelas e a leitura do cache
+em disco, o custo das consultas e quantos vãos sorteados sem a verificação
+seriam impossíveis de alcançar a partir do par anterior. Por fim joga partidas
+com o piloto automático (colisão por caixa, a mesma das tabelas) e confere que
+nenhum estado pelo qual o pássaro passou antes de atravessar um par foi
+considerado sem saída
+
+Uso: python src/benchmarks/bench_reachability.py [níveis] [segundos]
+"""
+
+import random
+import sys
+import os
+import time
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, PIPE_SPACING, PIPE_SPACING_JITTER
+from config import REACHABILITY_TIERS
+from benchmarks.suite import DELTA_TIME
+from simulation.entities import PipeField
+from simulation.game_simulation import GameSimulation, SimulationEvent
+from simulation.autopilot import SearchAutopilot
+from simulation import reachability
+
+def time_call(function, repeat: int = 20_000) -> float:
+    """
+    Tempo médio de uma chamada, em microssegundos
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+def check_states(seconds: float, seed: int) -> tuple:
+    """
+    Joga com o piloto automático e consulta o oráculo a cada passo para o
+    próximo par; conta as respostas "sem saída" dadas para pares que o
+    pássaro atravessou em seguida
+
+    Returns:
+        Tupla (consultas, respostas erradas)
+    """
+    simulation = GameSimulation(seed=seed, pixel_collision=False)
+    pilot = SearchAutopilot(simulation, DELTA_TIME, budget=None, restart=True)
+    left, _, right, _ = reachability.bird_box(False)
+    pending: dict = {}
+    queries = wrong = 0
+    for _ in range(int(seconds / DELTA_TIME)):
+        pipes, bird = simulation.pipes, simulation.bird
+        if simulation.game_started and not simulation.game_over:
+            table = reachability.reachability_table(pipes.speed, pipes._min_pipe_height, pipes._max_pipe_height,
+                                                    DELTA_TIME, pixel_collision=False)
+            for slot in pipes.slots():
+                if pipes.x[slot] > bird.x + right:
+                    ticks = int((pipes.x[slot] - bird.x - right) / (pipes.speed * DELTA_TIME)) + 1
+                    answer = table.reachable_states(np.array([bird.y]), np.array([bird.velocity]),
+                                                    float(pipes.gap_y[slot]), ticks)
+                    pending.setdefault(float(pipes.gap_y[slot]), []).append(bool(answer[0]))
+                    break
+        if simulation.step(DELTA_TIME, pilot.act()) & SimulationEvent.HIT:
+            pending.clear()
+        for slot in simulation.pipes.slots():
+            gap = float(simulation.pipes.gap_y[slot])
+            if gap in pending and simulation.pipes.x[slot] + simulation.pipes.pipe_width < simulation.bird.x + left:
+                answers = pending.pop(gap)
+                queries += len(answers)
+                wrong += answers.count(False)
+    return queries, wrong
+
+if __name__ == "__main__":
+    tiers = int(sys.argv[1]) if len(sys.argv) > 1 else REACHABILITY_TIERS
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 300.0
+    pipes = PipeField(WINDOW_WIDTH, WINDOW_HEIGHT)
+    gap_min, gap_max = pipes._min_pipe_height, pipes._max_pipe_height
+    rng = random.Random(0)
+
+    print(f"{'nível':>5} {'px/s':>6} {'gerar':>9} {'cache':>9} {'gap_range':>10} {'estados':>9} {'impossíveis':>12}")
+    for tier in range(tiers):
+        speed = reachability.tier_speed(tier)
+        start = time.perf_counter()
+        table = reachability.build_reachability(speed, DELTA_TIME, gap_min, gap_max)
+        build_ms = (time.perf_counter() - start) * 1e3
+
+        # Grava o cache e mede a leitura (sem as tabelas já carregadas na memória)
+        reachability.reachability_table(speed, gap_min, gap_max, DELTA_TIME)
+        reachability._TABLES.clear()
+        start = time.perf_counter()
+        table = reachability.reachability_table(speed, gap_min, gap_max, DELTA_TIME)
+        load_ms = (time.perf_counter() - start) * 1e3
+
+        range_us = time_call(lambda: table.gap_range(225.0, 300.0))
+        y = np.linspace(150.0, 450.0, 48)
+        velocity = np.linspace(-400.0, 300.0, 48)
+        states_us = time_call(lambda: table.reachable_states(y, velocity, 225.0, 40), 5_000)
+
+        # Pares consecutivos sorteados sem a verificação, com o espaçamento em pixels dos canos
+        samples = 20_000
+        impossible = sum(not table.reachable(rng.uniform(gap_min, gap_max), rng.uniform(gap_min, gap_max),
+                                             PIPE_SPACING + rng.uniform(-PIPE_SPACING_JITTER, PIPE_SPACING_JITTER))
+                         for _ in range(samples))
+        print(f"{tier:>5} {speed:>6.0f} {build_ms:>6.0f} ms {load_ms:>6.1f} ms {range_us:>7.2f} µs "
+              f"{states_us:>6.1f} µs {impossible / samples * 100:>11.2f}%")
+
+    queries, wrong = check_states(seconds, 0)
+    print(f"estados consultados em {seconds:.0f} s de jogo: {queries}, considerados sem saída e atravessados: {wrong}")
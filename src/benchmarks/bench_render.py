@@ -0,0 +1,95 @@
+"""
+Benchmark da renderização de um quadro completo do jogo
+Usa um contexto OpenGL fora da tela (janela GLFW invisível ou EGL/Mesa) e
+mede, por quadro, o tempo, as chamadas gl* feitas pelo Python, as chamadas
+de desenho e as trocas de textura
+
+Uso: python src/benchmarks/bench_render.py [quadros]
+"""
+
+import sys
+import os
+import time
+import typing
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Precisa vir antes de qualquer import do OpenGL
+from benchmarks.gl_context import create_offscreen_context, GLCallCounter
+
+from OpenGL.GL import glFinish # type: ignore
+import main
+import sprite_batch
+from components import background, bird, ground, heart_item, overlay, pipe
+from config import PIPE_GAP
+from simulation.game_simulation import SimulationInput
+
+DELTA_TIME: float = 1 / 60
+
+# Módulos cujas chamadas gl* entram na contagem
+RENDER_MODULES = [main, sprite_batch, background, bird, ground, heart_item, overlay, pipe]
+
+def autopilot() -> int:
+    """
+    Controle simples: bate asas quando o pássaro está abaixo do centro do próximo vão
+    """
+    simulation = main.simulation
+    assert simulation is not None
+    pipes = simulation.pipes
+    slot = pipes.next_pair
+    target = simulation.window_height / 2 if slot is None else float(pipes.gap_y[slot]) + PIPE_GAP / 2
+    if simulation.bird.y < target - 20 and simulation.bird.velocity <= 0:
+        return SimulationInput.FLAP
+    return SimulationInput.NONE
+
+def bench_scene(name: str, frames: int, play: bool) -> None:
+    """
+    Renderiza frames quadros, avançando a partida se play for True, e imprime as médias
+    """
+    counter = GLCallCounter(RENDER_MODULES)
+    batch = main.sprite_batch
+    assert batch is not None
+    draw_calls = 0
+    texture_binds = 0
+    sprites = 0
+    render_time = 0.0
+    try:
+        for _ in range(frames):
+            if play:
+                main.pending_inputs |= autopilot()
+                main.update(DELTA_TIME)
+            start = time.perf_counter()
+            main.render()
+            glFinish()
+            render_time += time.perf_counter() - start
+            draw_calls += batch.draw_calls
+            texture_binds += batch.texture_binds
+            sprites += batch.sprites_drawn
+    finally:
+        counter.restore()
+
+    print(f"{name:<10} {render_time / frames * 1000:8.3f} ms/quadro  "
+          f"{counter.calls / frames:7.1f} chamadas gl*/quadro  "
+          f"{draw_calls / frames:5.1f} desenhos  {texture_binds / frames:5.1f} texturas  "
+          f"{sprites / frames:5.1f} sprites")
+
+if __name__ == "__main__":
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+
+    create_offscreen_context()
+    main.create_game_objects(seed=0)
+
+    bench_scene("menu", frames, play=False)
+
+    # Inicia a partida e joga alguns segundos para ter canos na tela
+    main.pending_inputs |= SimulationInput.FLAP
+    main.update(DELTA_TIME)
+    for _ in range(240):
+        main.pending_inputs |= autopilot()
+        main.update(DELTA_TIME)
+    bench_scene("jogo", frames, play=True)
+
+    assert main.game_over_screen is not None and main.simulation is not None
+    main.game_over_screen.show_with_score(main.simulation.score)
+    bench_scene("game over", frames, play=False)
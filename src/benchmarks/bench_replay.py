@@ -0,0 +1,68 @@
+"""
+Benchmark da verificação de replays
+Grava partidas headless jogadas por um piloto automático imperfeito e mede
+quantos replays por minuto são verificados em um processo e no pool
+
+Uso: python src/benchmarks/bench_replay.py [replays] [segundos por partida] [processos]
+"""
+
+import random
+import sys
+import os
+import tempfile
+import time
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import PIPE_GAP, SIMULATION_RATE
+from simulation.game_simulation import GameSimulation, SimulationInput
+from simulation.replay import ReplayRecorder, save_replay, find_replays, verify_replays, REPLAY_EXTENSION
+
+def autopilot(simulation: GameSimulation, noise: random.Random) -> int:
+    """
+    Mira no centro do próximo vão, errando de vez em quando
+    """
+    if noise.random() < 0.002:
+        return SimulationInput.FLAP
+    pipes = simulation.pipes
+    slot = pipes.next_pair
+    target = simulation.window_height / 2 if slot is None else float(pipes.gap_y[slot]) + PIPE_GAP / 2
+    if simulation.bird.y < target - 20 and simulation.bird.velocity <= 0:
+        return SimulationInput.FLAP
+    return SimulationInput.NONE
+
+def record_session(path: str, seed: int, seconds: float) -> None:
+    """
+    Joga uma partida (reiniciando após o Game Over) e grava o replay
+    """
+    simulation = GameSimulation(seed=seed)
+    recorder = ReplayRecorder(seed, 1.0 / SIMULATION_RATE)
+    noise = random.Random(seed)
+    for tick in range(int(seconds * SIMULATION_RATE)):
+        inputs = SimulationInput.FLAP if tick == 0 else autopilot(simulation, noise)
+        if simulation.game_over:
+            inputs |= SimulationInput.RESTART
+        recorder.record(simulation.ticks, inputs)
+        simulation.step(recorder.step, inputs)
+    save_replay(path, recorder.finish(simulation))
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 60.0
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+
+    with tempfile.TemporaryDirectory() as directory:
+        for seed in range(count):
+            record_session(os.path.join(directory, f"{seed:05d}{REPLAY_EXTENSION}"), seed, seconds)
+        paths = find_replays(directory)
+        size = sum(os.path.getsize(path) for path in paths) / len(paths)
+        print(f"{count} replays de {seconds:.0f} s de jogo ({size:.0f} bytes em média)")
+
+        for label, pool_size in (("1 processo", 1), ("pool", workers)):
+            start = time.perf_counter()
+            results = verify_replays(paths, pool_size)
+            elapsed = time.perf_counter() - start
+            valid = sum(result.valid for result in results)
+            print(f"{label:<10} {valid}/{len(results)} válidos  {elapsed:6.2f} s  "
+                  f"{len(results) / elapsed * 60:8.0f} replays/min")
@@ -0,0 +1,154 @@
+"""
+Benchmark do histórico de rewind (RewindBuffer)
+Joga uma partida headless com o piloto automático gravando um passo por
+vez e mede o custo de gravar (comparado a um quadro de 60 fps), a memória
+ocupada contra snapshots inteiros, quantos segundos cabem no orçamento, o
+custo de voltar no tempo e confere se os estados reconstruídos são iguais
+aos snapshots originais, inclusive com orçamentos pequenos em que o anel da
+área de bytes dá a volta
+
+Uso: python src/benchmarks/bench_rewind.py [segundos] [semente]
+"""
+
+import random
+import sys
+import os
+import time
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import REWIND_SECONDS, REWIND_MEMORY
+from benchmarks.suite import DELTA_TIME, autopilot
+from simulation.game_simulation import GameSimulation, SimulationInput
+from simulation.rewind import RewindBuffer
+
+FRAME_TIME: float = 1 / 60
+
+class SyntheticSimulation:
+    """
+    Snapshots sintéticos: poucas palavras mudam por passo e o tamanho muda de
+    vez em quando, forçando keyframes fora do intervalo
+    """
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.data = bytearray(rng.randbytes(rng.randint(64, 3000)))
+
+    def step(self) -> None:
+        rng = self.rng
+        if rng.random() < 0.02:
+            self.data = bytearray(rng.randbytes(rng.randint(64, 3000)))
+        for _ in range(rng.randint(0, 40)):
+            self.data[rng.randrange(len(self.data))] = rng.randrange(256)
+
+    def snapshot(self) -> bytes:
+        return bytes(self.data)
+
+    def restore(self, data: bytes) -> None:
+        self.data = bytearray(data)
+
+def check_wraparound(runs: int, seed: int, synthetic: bool) -> int:
+    """
+    Grava com orçamentos de 60 a 120 KB (o limite de bytes é o que força o
+    descarte), voltando no tempo de vez em quando, e confere os passos
+    guardados contra os snapshots gravados
+
+    Returns:
+        Quantidade de execuções com algum passo diferente
+    """
+    failures = 0
+    for run in range(runs):
+        rng = random.Random(seed * 1_000_003 + run)
+        buffer = RewindBuffer(REWIND_SECONDS, 1 / DELTA_TIME, rng.randint(60_000, 120_000))
+        if synthetic:
+            simulation = SyntheticSimulation(rng)
+        else:
+            simulation = GameSimulation(seed=run)
+            simulation.step(DELTA_TIME, SimulationInput.FLAP)
+        snapshots = []
+        ok = True
+        for step in range(1500 if synthetic else 3000):
+            if synthetic:
+                simulation.step()
+            else:
+                inputs = autopilot(simulation)
+                if simulation.game_over:
+                    inputs = SimulationInput.RESTART | SimulationInput.FLAP
+                elif rng.random() < 0.01:
+                    inputs |= SimulationInput.FLAP
+                simulation.step(DELTA_TIME, inputs)
+            buffer.record(simulation)
+            snapshots.append(simulation.snapshot())
+            if rng.random() < 0.005:
+                steps = buffer.rewind(simulation, rng.randint(1, 200))
+                del snapshots[len(snapshots) - steps:]
+            # O mais antigo e um passo qualquer a cada passo; todos de tempos em tempos
+            kept = snapshots[len(snapshots) - len(buffer):]
+            indices = range(len(buffer)) if step % 97 == 0 else (0, rng.randrange(len(buffer)), -1)
+            try:
+                ok = all(buffer.state(j) == kept[j] for j in indices)
+            except ValueError:
+                ok = False
+            if not ok:
+                break
+        failures += not ok
+    return failures
+
+if __name__ == "__main__":
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 60.0
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    rate = 1 / DELTA_TIME
+
+    simulation = GameSimulation(seed=seed)
+    buffer = RewindBuffer(REWIND_SECONDS, rate)
+    simulation.step(DELTA_TIME, SimulationInput.FLAP)
+
+    # Grava a partida inteira, guardando os snapshots dos últimos passos para conferir
+    record_times = []
+    snapshots = []
+    for _ in range(int(seconds * rate)):
+        inputs = autopilot(simulation)
+        if simulation.game_over:
+            inputs = SimulationInput.RESTART | SimulationInput.FLAP
+        simulation.step(DELTA_TIME, inputs)
+        start = time.perf_counter()
+        buffer.record(simulation)
+        record_times.append(time.perf_counter() - start)
+        snapshots.append(simulation.snapshot())
+    snapshots = snapshots[len(snapshots) - len(buffer):]
+
+    record_us = np.array(record_times) * 1e6
+    p50, p95 = np.percentile(record_us, [50, 95])
+    full_bytes = len(snapshots[-1]) * len(buffer)
+    steps_per_frame = rate * FRAME_TIME
+    print(f"gravar:      p50 {p50:.1f} µs, p95 {p95:.1f} µs por passo "
+          f"({p50 * 1e-6 * steps_per_frame / FRAME_TIME * 100:.2f}% de um quadro de 60 fps com {steps_per_frame:.0f} passos/quadro)")
+    print(f"histórico:   {buffer.seconds:.1f} s ({len(buffer)} passos, {buffer.keyframes} keyframes) "
+          f"em {buffer.used_bytes / 1e3:.0f} KB de {buffer.nbytes / 1e3:.0f} KB alocados (orçamento {REWIND_MEMORY / 1e3:.0f} KB)")
+    print(f"por passo:   {buffer.used_bytes / max(1, len(buffer)):.0f} bytes contra {len(snapshots[-1])} do snapshot inteiro "
+          f"({full_bytes / 1e6:.2f} MB para os mesmos passos)")
+
+    # Confere a reconstrução de todos os passos guardados
+    start = time.perf_counter()
+    matches = sum(buffer.state(index) == snapshot for index, snapshot in enumerate(snapshots))
+    decode_us = (time.perf_counter() - start) / len(snapshots) * 1e6
+    print(f"reconstruir: {decode_us:.1f} µs por passo, {matches}/{len(snapshots)} iguais ao snapshot original")
+
+    # Volta no tempo aos poucos, como segurando a tecla (alguns passos por quadro)
+    rewind_times = []
+    rng = random.Random(seed)
+    while len(buffer) > 1:
+        start = time.perf_counter()
+        buffer.rewind(simulation, rng.randint(1, 4))
+        rewind_times.append(time.perf_counter() - start)
+    rewind_us = np.array(rewind_times) * 1e6
+    print(f"voltar:      p50 {np.percentile(rewind_us, 50):.1f} µs, p95 {np.percentile(rewind_us, 95):.1f} µs por chamada "
+          f"({len(rewind_times)} chamadas); estado final igual ao mais antigo: {simulation.snapshot() == snapshots[0]}")
+
+    # Orçamentos pequenos: o anel dá a volta várias vezes
+    failures = check_wraparound(100, seed, synthetic=True)
+    print(f"anel:        snapshots sintéticos, 100 execuções com 60-120 KB: {failures} com passos diferentes")
+    failures = check_wraparound(10, seed, synthetic=False)
+    print(f"anel:        partidas, 10 execuções com 60-120 KB: {failures} com passos diferentes")
@@ -0,0 +1,62 @@
+"""
+Benchmark do RolloutRunner (processos + memória compartilhada)
+Compara um único BatchFlappyEnv com o lote dividido entre processos,
+nos modos síncrono e assíncrono
+
+Uso: python src/benchmarks/bench_rollout.py [mundos] [passos] [processos]
+"""
+
+import sys
+import os
+import time
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation.batch_env import BatchFlappyEnv
+from simulation.rollout import RolloutRunner
+
+DELTA_TIME: float = 1 / 60
+
+def bench_single(num_worlds: int, steps: int, actions: np.ndarray) -> float:
+    """
+    Passos de mundo por segundo de um único BatchFlappyEnv
+    """
+    env = BatchFlappyEnv(num_worlds, seed=0)
+    start = time.perf_counter()
+    for t in range(steps):
+        env.step(actions[t], DELTA_TIME)
+    return num_worlds * steps / (time.perf_counter() - start)
+
+def bench_runner(num_worlds: int, steps: int, num_workers: int, actions: np.ndarray, asynchronous: bool) -> float:
+    """
+    Passos de mundo por segundo do RolloutRunner
+    """
+    with RolloutRunner(num_worlds, num_workers=num_workers, seed=0) as runner:
+        runner.reset()
+        start = time.perf_counter()
+        if asynchronous:
+            # Mantém o anel cheio: publica um passo novo a cada resultado coletado
+            for t in range(min(runner.ring_size, steps)):
+                runner.step_async(actions[t])
+            for t in range(runner.ring_size, steps):
+                runner.step_wait()
+                runner.step_async(actions[t])
+            for _ in range(min(runner.ring_size, steps)):
+                runner.step_wait()
+        else:
+            for t in range(steps):
+                runner.step(actions[t])
+        return num_worlds * steps / (time.perf_counter() - start)
+
+if __name__ == "__main__":
+    num_worlds = int(sys.argv[1]) if len(sys.argv) > 1 else 32768
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    num_workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+
+    actions = np.random.default_rng(0).random((steps, num_worlds)) < 0.08
+    print(f"{num_worlds} mundos, {steps} passos, {num_workers} processos ({os.cpu_count()} núcleos)")
+    print(f"BatchFlappyEnv único:     {bench_single(num_worlds, steps, actions):,.0f} passos de mundo/s")
+    print(f"RolloutRunner síncrono:   {bench_runner(num_worlds, steps, num_workers, actions, False):,.0f} passos de mundo/s")
+    print(f"RolloutRunner assíncrono: {bench_runner(num_worlds, steps, num_workers, actions, True):,.0f} passos de mundo/s")
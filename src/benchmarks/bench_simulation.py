@@ -0,0 +1,55 @@
+"""
+Benchmark do motor de simulação headless (GameSimulation)
+Mede quantos passos por segundo a simulação executa sem janela nem OpenGL
+
+Uso: python src/benchmarks/bench_simulation.py [passos] [semente]
+"""
+
+import sys
+import os
+import time
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation.game_simulation import GameSimulation, SimulationInput
+
+def run(ticks: int = 200_000, seed: int = 1234, delta_time: float = 1 / 120) -> float:
+    """
+    Executa a simulação com um piloto simples e reinício automático
+
+    Args:
+        ticks: Número de passos a simular
+        seed: Semente do gerador aleatório
+        delta_time: Duração de cada passo em segundos
+
+    Returns:
+        Passos por segundo
+    """
+    simulation = GameSimulation(seed=seed)
+    bird = simulation.bird
+    flap = SimulationInput.FLAP
+    restart = SimulationInput.RESTART
+    gap_center = simulation.window_height / 2
+    rounds = 0
+
+    # O primeiro FLAP apenas inicia o jogo
+    simulation.step(delta_time, flap)
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        # Piloto simples: bate asas quando está abaixo do centro da tela e caindo
+        inputs = flap if bird.y < gap_center and bird.velocity < 0 else 0
+        if simulation.game_over:
+            inputs = restart
+            rounds += 1
+        simulation.step(delta_time, inputs)
+    elapsed = time.perf_counter() - start
+    print(f"Partidas concluídas: {rounds}, pontuação atual: {simulation.score}")
+    return ticks / elapsed
+
+if __name__ == "__main__":
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 1234
+    rate = run(ticks, seed)
+    print(f"GameSimulation: {ticks} passos, {rate:,.0f} passos/s")
@@ -0,0 +1,193 @@
+"""
+Benchmark do carregamento de texturas na inicialização
+Compara a decodificação das imagens (PIL) com o cache de assets mapeado em
+memória, medindo o preparo dos pixels e o tempo total até as texturas estarem
+no OpenGL (contexto fora da tela). Também mede o tempo até o primeiro quadro
+de main.create_game_objects() esperando as texturas ou carregando-as em
+segundo plano (AssetLoader), cada amostra em um processo novo: nada gerado na
+memória por uma amostra (máscaras, fontes, tabelas) ajuda a seguinte. Confere
+que, sem cache e em segundo plano, o primeiro quadro vem antes do fim do
+carregamento
+
+Uso: python src/benchmarks/bench_startup.py [repetições]
+"""
+
+import sys
+import os
+import time
+import statistics
+import typing
+import contextlib
+import io
+import subprocess
+import tempfile
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Precisa vir antes de qualquer import do OpenGL
+from benchmarks.gl_context import create_offscreen_context
+
+from OpenGL.GL import glFinish # type: ignore
+from assets import ATLAS_SPRITES, CACHED_IMAGES, ASSET_CACHE_PATH, cached_arrays, generated_sprites
+from asset_cache import AssetCache, open_asset_cache
+from atlas import decode_image, pack_atlas
+from texture_manager import TextureManager
+import main
+
+def median_ms(function: typing.Callable[[], typing.Any], repetitions: int) -> float:
+    """
+    Mediana do tempo de execução de function, em milissegundos
+    """
+    samples = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+def prepare_decode() -> None:
+    """
+    Preparo dos pixels sem cache: decodifica, empacota o atlas e inverte as imagens avulsas
+    """
+    pack_atlas({name: decode_image(path) for name, path in ATLAS_SPRITES.items()})
+    for path in CACHED_IMAGES:
+        decode_image(path)[::-1].copy()
+
+def prepare_cache() -> None:
+    """
+    Preparo dos pixels com cache: abre o mmap, valida e obtém as visões
+    """
+    cache = AssetCache(str(ASSET_CACHE_PATH))
+    cache.is_fresh()
+    cache.atlas_pages()
+    for path in CACHED_IMAGES:
+        cache.image(path)
+    cache.close()
+
+def load_textures(use_cache: bool) -> None:
+    """
+    Inicialização completa das texturas, como em main.create_game_objects()
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        cache = AssetCache(str(ASSET_CACHE_PATH)) if use_cache else None
+        if cache is not None:
+            cache.is_fresh()
+        texture_manager = TextureManager(cache)
+        texture_manager.build_atlas(ATLAS_SPRITES)
+        for path in CACHED_IMAGES:
+            texture_manager.load_texture(path)
+        glFinish()
+        texture_manager.cleanup()
+
+def first_frame(use_cache: bool, wait_for_assets: bool) -> typing.Tuple[float, float]:
+    """
+    Cria os objetos do jogo e renderiza quadros até todas as texturas chegarem
+    (no processo atual, que precisa de um contexto OpenGL)
+
+    Returns:
+        Tempos (s) até o primeiro quadro e até o carregamento completo
+    """
+    cache_path = main.ASSET_CACHE_PATH
+    if not use_cache:
+        # Caminho sem cache; o cache gerado depois do carregamento é descartado
+        main.ASSET_CACHE_PATH = os.path.join(tempfile.mkdtemp(), "assets.cache")
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            main.create_game_objects(seed=0, wait_for_assets=wait_for_assets)
+            loader = main.asset_loader
+            assert loader is not None
+            loader.process_uploads()
+            main.render()
+            glFinish()
+            first = time.perf_counter() - start
+            while not loader.done:
+                loader.process_uploads()
+                main.render()
+                glFinish()
+            loaded = time.perf_counter() - start
+
+            loader.shutdown()
+            if main.sprite_batch:
+                main.sprite_batch.cleanup()
+            if main.texture_manager:
+                main.texture_manager.cleanup()
+    finally:
+        if not use_cache:
+            if os.path.exists(main.ASSET_CACHE_PATH):
+                os.remove(main.ASSET_CACHE_PATH)
+            os.rmdir(os.path.dirname(main.ASSET_CACHE_PATH))
+            main.ASSET_CACHE_PATH = cache_path
+    return first, loaded
+
+def first_frame_process(use_cache: bool, wait_for_assets: bool) -> typing.Tuple[float, float]:
+    """
+    first_frame() em um processo novo (python bench_startup.py --first-frame ...)
+
+    Returns:
+        Tempos (s) até o primeiro quadro e até o carregamento completo
+    """
+    command = [sys.executable, os.path.abspath(__file__), "--first-frame",
+               "cache" if use_cache else "no-cache", "wait" if wait_for_assets else "background"]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    first, loaded = output.split()[-2:]
+    return float(first), float(loaded)
+
+def median_first_frame(use_cache: bool, wait_for_assets: bool, repetitions: int) -> typing.Tuple[float, float]:
+    """
+    Medianas (ms) de first_frame(), cada amostra em um processo novo
+    """
+    samples = [first_frame_process(use_cache, wait_for_assets) for _ in range(repetitions)]
+    return (statistics.median(sample[0] for sample in samples) * 1000,
+            statistics.median(sample[1] for sample in samples) * 1000)
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--first-frame":
+        # Amostra de first_frame_process: imprime os dois tempos em segundos
+        create_offscreen_context()
+        first, loaded = first_frame(sys.argv[2] == "cache", sys.argv[3] == "wait")
+        print(first, loaded)
+        sys.exit(0)
+
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    # Garante um cache atualizado antes de medir
+    cache = open_asset_cache(str(ASSET_CACHE_PATH), ATLAS_SPRITES, CACHED_IMAGES, arrays=cached_arrays(),
+                             generated=generated_sprites())
+    if cache is None:
+        sys.exit(1)
+    cache.close()
+    size_mb = os.path.getsize(ASSET_CACHE_PATH) / 1024 / 1024
+    print(f"Cache: {ASSET_CACHE_PATH} ({size_mb:.1f} MB)")
+
+    create_offscreen_context()
+
+    decode_prepare = median_ms(prepare_decode, repetitions)
+    cache_prepare = median_ms(prepare_cache, repetitions)
+    decode_total = median_ms(lambda: load_textures(False), repetitions)
+    cache_total = median_ms(lambda: load_textures(True), repetitions)
+
+    print(f"{'':<22}{'preparo':>12}{'com upload':>14}")
+    print(f"{'Decodificação (PIL)':<22}{decode_prepare:>9.1f} ms{decode_total:>11.1f} ms")
+    print(f"{'Cache (mmap)':<22}{cache_prepare:>9.1f} ms{cache_total:>11.1f} ms")
+    print(f"Ganho: {decode_prepare / cache_prepare:.0f}x no preparo, {decode_total / cache_total:.1f}x no total")
+
+    print()
+    print(f"{'create_game_objects() (processo novo)':<38}{'1º quadro':>12}{'tudo carregado':>17}")
+    background = (0.0, 0.0)
+    for use_cache in (False, True):
+        for wait_for_assets in (True, False):
+            first, loaded = median_first_frame(use_cache, wait_for_assets, repetitions)
+            label = f"{'cache' if use_cache else 'sem cache'}, {'esperando' if wait_for_assets else 'em segundo plano'}"
+            print(f"{label:<38}{first:>9.1f} ms{loaded:>14.1f} ms")
+            if not use_cache and not wait_for_assets:
+                background = (first, loaded)
+
+    # Sem cache e em segundo plano, o primeiro quadro (barra de progresso) tem
+    # que aparecer antes de as texturas e as máscaras terminarem de carregar
+    first, loaded = background
+    if first < loaded:
+        print(f"Sem cache: 1º quadro {loaded - first:.1f} ms antes do carregamento completo")
+    else:
+        print("Aviso: sem cache, o 1º quadro só aparece com tudo carregado")
@@ -0,0 +1,280 @@
+"""
+Cenas de estresse para medir como o custo do quadro cresce com a quantidade de entidades
+A cena enche a tela com N pares de canos, N itens de vida, N pássaros e N
+overlays (pontuação e vidas), usando os próprios componentes do jogo, e mede
+o tempo de atualização e de renderização por quadro para cada N. A curva
+tempo x N mostra custos por entidade (e por chamada) que a cena normal, com
+poucos sprites, esconde.
+
+Uso: python src/benchmarks/bench_stress.py [quadros] [contagem ...] [--csv arquivo]
+"""
+
+import csv
+import random
+import sys
+import os
+import time
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Precisa vir antes de qualquer import do OpenGL
+from benchmarks.gl_context import create_offscreen_context
+
+from OpenGL.GL import glFinish # type: ignore
+import main
+from benchmarks.bench_pipes import MidpointRandom
+from components.bird import Bird
+from components.heart_item import HeartItem
+from components.overlay import Overlay, ScoreDisplay, HeartDisplay
+from components.pipe import PipeManager
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, MAX_LIVES
+from sprite_batch import SpriteBatch
+from texture_manager import TextureManager
+
+DELTA_TIME: float = 1 / 120
+DEFAULT_COUNTS: typing.List[int] = [1, 4, 16, 64, 256, 1024]
+
+# Tempos medidos por quadro, na ordem da tabela e do CSV
+TIMES: typing.Tuple[str, ...] = ("update_p50", "update_p95", "batch_p50", "batch_p95", "submit_p50", "submit_p95")
+
+class StressScene:
+    """
+    Cena com count entidades de cada tipo, espalhadas pela tela
+    """
+
+    def __init__(self, texture_manager: TextureManager, count: int, seed: int = 0,
+                 window_width: float = WINDOW_WIDTH, window_height: float = WINDOW_HEIGHT):
+        """
+        Cria a cena
+
+        Args:
+            texture_manager: Gerenciador de texturas (atlas já carregado)
+            count: Quantidade de entidades de cada tipo
+            seed: Semente das posições iniciais
+            window_width: Largura da janela
+            window_height: Altura da janela
+        """
+        self.count = count
+        self.window_width = window_width
+        self.window_height = window_height
+        rng = random.Random(seed)
+
+        # Canos: um par entra e outro sai a cada passo, mantendo count pares na
+        # tela; com MidpointRandom todos os vãos ficam na mesma altura e o
+        # spawn não tem variação aleatória
+        self.pipes = PipeManager(texture_manager, int(window_width), int(window_height), MidpointRandom())
+        spacing = (window_width + self.pipes.pipe_width) / count
+        self.pipes.speed = spacing / DELTA_TIME
+        self.pipes.spacing = spacing
+        self.pipes.reset()
+        for _ in range(count + 2):
+            self.pipes.update(DELTA_TIME)
+
+        # Itens de vida espalhados na horizontal, cada um com sua flutuação
+        self.hearts: typing.List[HeartItem] = []
+        for _ in range(count):
+            heart = HeartItem(texture_manager, window_width, window_height, rng)
+            heart.spawn()
+            heart.x = rng.uniform(0.0, window_width)
+            heart.store_previous()
+            self.hearts.append(heart)
+
+        # Pássaros em ordem de x (a fase larga da colisão avança o cursor de
+        # um para o outro), cada um batendo asas em uma altura diferente
+        self.birds: typing.List[Bird] = []
+        self.flap_heights: typing.List[float] = []
+        for x in sorted(rng.uniform(window_width * 0.1, window_width * 0.9) for _ in range(count)):
+            bird = Bird(texture_manager, window_width, window_height)
+            bird.x = x
+            bird.y = rng.uniform(window_height * 0.3, window_height * 0.8)
+            bird.store_previous()
+            self.birds.append(bird)
+            self.flap_heights.append(rng.uniform(window_height * 0.3, window_height * 0.6))
+
+        # Overlays: metade pontuações, metade vidas, em posições sorteadas
+        self.overlays: typing.List[Overlay] = []
+        for i in range(count):
+            if i % 2 == 0:
+                score = ScoreDisplay(texture_manager, window_width, window_height)
+                score.update_score(rng.randrange(1000))
+                score.position_y = rng.uniform(0.0, window_height - score.number_height)
+                self.overlays.append(score)
+            else:
+                lives = HeartDisplay(texture_manager, window_width, window_height, MAX_LIVES)
+                lives.update_lives(rng.randint(1, MAX_LIVES))
+                lives.initial_x = rng.uniform(0.0, window_width * 0.7)
+                lives.initial_y = rng.uniform(0.0, window_height - lives.heart_height)
+                self.overlays.append(lives)
+
+        # Resultados das colisões (só para que o trabalho não possa ser ignorado)
+        self.pipe_hits: int = 0
+        self.heart_hits: int = 0
+
+    def update(self, delta_time: float) -> None:
+        """
+        Avança todas as entidades um passo, com as mesmas verificações do jogo
+        (cada pássaro contra os canos; o primeiro pássaro contra os itens de vida)
+
+        Args:
+            delta_time: Duração do passo em segundos
+        """
+        pipes = self.pipes
+        pipes.store_previous()
+        pipes.update(delta_time)
+
+        for heart in self.hearts:
+            heart.store_previous()
+            heart.update(delta_time)
+            if not heart.active:
+                heart.spawn()
+
+        for bird, flap_height in zip(self.birds, self.flap_heights):
+            bird.store_previous()
+            bird.update(delta_time)
+            if bird.y < flap_height:
+                bird.jump()
+            if pipes.check_collision(bird.hitbox):
+                self.pipe_hits += 1
+
+        if self.birds:
+            bird_rect = self.birds[0].collision_rect
+            for heart in self.hearts:
+                if heart.is_colliding(bird_rect):
+                    self.heart_hits += 1
+
+        for overlay in self.overlays:
+            if isinstance(overlay, ScoreDisplay):
+                overlay.update_score(overlay.score + 1)
+
+    def render(self, batch: SpriteBatch, alpha: float = 1.0) -> None:
+        """
+        Registra todos os sprites da cena no lote
+
+        Args:
+            batch: Lote de sprites do quadro atual
+            alpha: Fração entre o passo anterior (0) e o atual (1)
+        """
+        self.pipes.render(batch, alpha)
+        for heart in self.hearts:
+            heart.render(batch, alpha)
+        for bird in self.birds:
+            bird.render(batch, alpha)
+        for overlay in self.overlays:
+            overlay.render(batch)
+
+def bench_count(count: int, frames: int) -> typing.Dict[str, float]:
+    """
+    Mede frames quadros da cena com count entidades de cada tipo
+
+    Returns:
+        Tempos por quadro (mediana e p95, em segundos) da atualização, da
+        montagem do lote pelos componentes e do envio ao OpenGL (até o
+        glFinish), e médias do lote
+    """
+    assert main.texture_manager is not None and main.sprite_batch is not None
+    assert main.background is not None and main.ground is not None
+    scene = StressScene(main.texture_manager, count)
+    batch = main.sprite_batch
+
+    update_times = np.empty(frames)
+    batch_times = np.empty(frames)
+    submit_times = np.empty(frames)
+    sprites = 0
+    draw_calls = 0
+    clock = time.perf_counter
+    # Os primeiros quadros aquecem caches e o tamanho do lote
+    for frame in range(-10, frames):
+        start = clock()
+        scene.update(DELTA_TIME)
+        updated = clock()
+        batch.begin()
+        main.background.render(batch)
+        scene.render(batch)
+        main.ground.render(batch)
+        batched = clock()
+        batch.end()
+        glFinish()
+        submitted = clock()
+        if frame >= 0:
+            update_times[frame] = updated - start
+            batch_times[frame] = batched - updated
+            submit_times[frame] = submitted - batched
+            sprites += batch.sprites_drawn
+            draw_calls += batch.draw_calls
+
+    return {
+        "count": count,
+        "pairs": scene.pipes.pair_count,
+        "sprites": sprites / frames,
+        "draw_calls": draw_calls / frames,
+        "update_p50": float(np.percentile(update_times, 50)),
+        "update_p95": float(np.percentile(update_times, 95)),
+        "batch_p50": float(np.percentile(batch_times, 50)),
+        "batch_p95": float(np.percentile(batch_times, 95)),
+        "submit_p50": float(np.percentile(submit_times, 50)),
+        "submit_p95": float(np.percentile(submit_times, 95)),
+    }
+
+def scaling(rows: typing.Sequence[typing.Dict[str, float]], key: str) -> typing.Tuple[float, float, float]:
+    """
+    Ajusta as medições a t = fixo + custo * N e a t ~ N^expoente
+
+    Returns:
+        Tupla (custo fixo em s, custo por entidade em s, expoente); um
+        expoente bem acima de 1 indica crescimento mais que linear
+    """
+    counts = np.array([row["count"] for row in rows], dtype=np.float64)
+    times = np.array([row[key] for row in rows], dtype=np.float64)
+    slope, intercept = np.polyfit(counts, times, 1)
+    # O expoente só faz sentido onde o custo por entidade já domina o custo fixo
+    large = counts >= 16
+    exponent = np.polyfit(np.log(counts[large]), np.log(times[large]), 1)[0] if large.sum() >= 2 else float("nan")
+    return float(intercept), float(slope), float(exponent)
+
+def write_csv(path: str, rows: typing.Sequence[typing.Dict[str, float]]) -> None:
+    """
+    Grava as curvas (uma linha por contagem, tempos em ms)
+    """
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["count", "pairs", "sprites", "draw_calls",
+                         "update_p50_ms", "update_p95_ms", "batch_p50_ms", "batch_p95_ms",
+                         "submit_p50_ms", "submit_p95_ms"])
+        for row in rows:
+            writer.writerow([row["count"], row["pairs"], f"{row['sprites']:.0f}", f"{row['draw_calls']:.1f}"] +
+                            [f"{row[key] * 1000:.4f}" for key in TIMES])
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    csv_path = None
+    if "--csv" in args:
+        index = args.index("--csv")
+        csv_path = args[index + 1]
+        del args[index:index + 2]
+    frames = int(args[0]) if args else 120
+    counts = [int(arg) for arg in args[1:]] or DEFAULT_COUNTS
+
+    create_offscreen_context()
+    main.create_game_objects(seed=0)
+
+    print(f"{'N':>6} {'pares':>6} {'sprites':>8} {'desenhos':>9} " +
+          " ".join(f"{key.replace('_', ' '):>11}" for key in TIMES))
+    rows = []
+    for count in counts:
+        row = bench_count(count, frames)
+        rows.append(row)
+        print(f"{count:>6} {row['pairs']:>6} {row['sprites']:>8.0f} {row['draw_calls']:>9.1f} " +
+              " ".join(f"{row[key] * 1000:>8.3f} ms" for key in TIMES))
+
+    if len(rows) >= 2:
+        print()
+        for key, name in (("update_p50", "update"), ("batch_p50", "lote"), ("submit_p50", "envio")):
+            fixed, per_entity, exponent = scaling(rows, key)
+            print(f"{name:<7} fixo {fixed * 1000:7.3f} ms  por entidade {per_entity * 1e6:7.2f} µs  expoente {exponent:.2f}")
+
+    if csv_path:
+        write_csv(csv_path, rows)
+        print(f"Curvas gravadas em '{csv_path}'")
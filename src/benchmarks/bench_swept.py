@@ -0,0 +1,113 @@
+"""
+Benchmark da colisão contínua (varrida) do pássaro com os canos
+Para várias velocidades de cano (níveis de dificuldade) e durações de passo,
+compara o custo por verificação do teste discreto (check_collision), do
+teste varrido (sweep_collision) e da subdivisão do passo em subpassos de no
+máximo 1 pixel, e conta quantos contatos cada um deixa passar (a referência
+é a subdivisão)
+
+Uso: python src/benchmarks/bench_swept.py [casos] [semente]
+"""
+
+import math
+import random
+import sys
+import os
+import time
+import typing
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, INITIAL_PIPE_SPEED, SPEED_INCREASE_MULTIPLIER, BIRD_VELOCITY
+from simulation.entities import PipeField, BirdBody, CollisionRect
+
+# (aumentos de velocidade, duração do passo)
+SCENARIOS: typing.List[typing.Tuple[int, float]] = [(0, 1 / 120), (10, 1 / 120), (0, 0.05), (10, 0.05), (20, 0.05), (30, 0.05)]
+
+Case = typing.Tuple[PipeField, CollisionRect, float]
+
+def create_cases(count: int, speed: float, delta_time: float, seed: int) -> typing.List[Case]:
+    """
+    Sorteia situações de um passo: canos que andaram um passo e um pássaro que
+    subiu ou desceu, terminando perto do próximo par
+
+    Returns:
+        Lista de (canos, hitbox no fim do passo, deslocamento vertical)
+    """
+    rng = random.Random(seed)
+    bird = BirdBody(WINDOW_WIDTH, WINDOW_HEIGHT)
+    _, _, bird_w, bird_h = bird.hitbox
+    cases: typing.List[Case] = []
+    while len(cases) < count:
+        pipes = PipeField(WINDOW_WIDTH, WINDOW_HEIGHT, rng)
+        pipes.speed = speed
+        pipes.spacing = speed * 0.6
+        pipes.reset()
+        # Avança em passos curtos até haver um par perto do pássaro
+        while pipes.next_pair is None or pipes.x[pipes.next_pair] > bird.x + rng.uniform(-80.0, 40.0):
+            pipes.update(1 / 120)
+            pipes.check_score(bird.x)
+        pipes.store_previous()
+        pipes.update(delta_time)
+        # Pássaro perto do vão, subindo ou caindo
+        slot = pipes.next_pair if pipes.next_pair is not None else 0
+        y = float(pipes.gap_y[slot]) + rng.uniform(-30.0, 150.0)
+        dy = rng.uniform(-2.0, 1.0) * BIRD_VELOCITY * delta_time
+        cases.append((pipes, (bird.x - bird_w / 2, y, bird_w, bird_h), dy))
+    return cases
+
+def substep_count(pipes: PipeField, dy: float) -> int:
+    """
+    Subpassos necessários para que o movimento relativo em cada um seja de no máximo 1 pixel
+    """
+    return max(1, math.ceil(max(abs(pipes.scroll - pipes.previous_scroll), abs(dy))))
+
+def substep_collision(pipes: PipeField, rect: CollisionRect, dy: float) -> bool:
+    """
+    Referência por força bruta: testa a hitbox no início, no fim e em
+    subpassos de no máximo 1 pixel
+    """
+    x, y, w, h = rect
+    dx = pipes.scroll - pipes.previous_scroll
+    steps = substep_count(pipes, dy)
+    for k in range(steps + 1):
+        remaining = 1.0 - k / steps
+        if pipes.check_collision((x - dx * remaining, y - dy * remaining, w, h)):
+            return True
+    return False
+
+def time_checks(function: typing.Callable[[Case], typing.Any], cases: typing.Sequence[Case]) -> float:
+    """
+    Tempo médio de uma verificação, em microssegundos
+    """
+    start = time.perf_counter()
+    for case in cases:
+        function(case)
+    return (time.perf_counter() - start) / len(cases) * 1e6
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    print(f"{'velocidade':>10} {'passo':>7} {'px/passo':>9} {'discreto':>10} {'varrido':>10} {'subpassos':>19} "
+          f"{'contatos':>9} {'perdidos disc.':>15} {'perdidos varr.':>15}")
+    for increases, delta_time in SCENARIOS:
+        speed = INITIAL_PIPE_SPEED * SPEED_INCREASE_MULTIPLIER ** increases
+        cases = create_cases(count, speed, delta_time, seed)
+
+        discrete = [pipes.check_collision(rect) for pipes, rect, _ in cases]
+        swept = [pipes.sweep_collision(rect, 0.0, dy) is not None for pipes, rect, dy in cases]
+        reference = [substep_collision(pipes, rect, dy) for pipes, rect, dy in cases]
+        contacts = sum(reference)
+        missed_discrete = sum(r and not d for r, d in zip(reference, discrete))
+        missed_swept = sum(r and not s for r, s in zip(reference, swept))
+
+        discrete_us = time_checks(lambda case: case[0].check_collision(case[1]), cases)
+        swept_us = time_checks(lambda case: case[0].sweep_collision(case[1], 0.0, case[2]), cases)
+        substep_us = time_checks(lambda case: substep_collision(*case), cases)
+        substeps = sum(substep_count(pipes, dy) for pipes, _, dy in cases) / len(cases)
+
+        print(f"{speed:>10.0f} {delta_time * 1000:>5.1f}ms {speed * delta_time:>9.1f} {discrete_us:>7.2f} µs "
+              f"{swept_us:>7.2f} µs {substep_us:>8.2f} µs ({substeps:>5.1f} x) {contacts:>9} "
+              f"{missed_discrete:>15} {missed_swept:>15}")
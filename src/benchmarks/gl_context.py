@@ -0,0 +1,148 @@
+"""
+Contexto OpenGL fora da tela para benchmarks de renderização
+Tenta uma janela GLFW invisível; sem servidor gráfico, usa EGL sem superfície
+(Mesa llvmpipe). Deve ser importado antes de qualquer módulo do OpenGL
+"""
+
+import os
+import sys
+import typing
+
+# Sem X11/Wayland o PyOpenGL precisa carregar as funções via EGL
+_HEADLESS = not os.environ.get("DISPLAY") and not os.environ.get("WAYLAND_DISPLAY")
+if _HEADLESS and sys.platform.startswith("linux"):
+    os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+    os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT
+
+def _create_glfw_context(width: int, height: int) -> typing.Optional[typing.Any]:
+    """
+    Cria uma janela GLFW invisível e torna seu contexto atual
+
+    Returns:
+        Janela GLFW ou None se não for possível
+    """
+    import glfw # type: ignore
+    if not glfw.init():
+        return None
+    glfw.window_hint(glfw.VISIBLE, glfw.FALSE)
+    window = glfw.create_window(width, height, "benchmark", None, None)
+    if not window:
+        glfw.terminate()
+        return None
+    glfw.make_context_current(window)
+    # Sem vsync: o benchmark mede o custo de CPU do quadro
+    glfw.swap_interval(0)
+    return window
+
+def _create_egl_context(width: int, height: int) -> typing.Optional[typing.Any]:
+    """
+    Cria um contexto OpenGL (perfil de compatibilidade) com um pbuffer EGL
+
+    Returns:
+        Tupla (display, superfície, contexto) ou None se não for possível
+    """
+    import ctypes
+    from OpenGL import EGL # type: ignore
+
+    display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+    major, minor = EGL.EGLint(), EGL.EGLint()
+    try:
+        EGL.eglInitialize(display, ctypes.pointer(major), ctypes.pointer(minor))
+    except EGL.EGLError as e:
+        print(f"Erro ao inicializar EGL: {e.err}")
+        return None
+
+    # RGBA de 8 bits, como a janela do jogo
+    config_attributes = (EGL.EGLint * 13)(EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+                                          EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+                                          EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8,
+                                          EGL.EGL_BLUE_SIZE, 8, EGL.EGL_ALPHA_SIZE, 8, EGL.EGL_NONE)
+    config = EGL.EGLConfig()
+    count = EGL.EGLint()
+    if not EGL.eglChooseConfig(display, config_attributes, ctypes.pointer(config), 1, ctypes.pointer(count)) or count.value == 0:
+        return None
+
+    EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+    context = EGL.eglCreateContext(display, config, EGL.EGL_NO_CONTEXT, None)
+    surface_attributes = (EGL.EGLint * 5)(EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE)
+    surface = EGL.eglCreatePbufferSurface(display, config, surface_attributes)
+    if not EGL.eglMakeCurrent(display, surface, surface, context):
+        return None
+    return (display, surface, context)
+
+def create_offscreen_context(width: int = WINDOW_WIDTH, height: int = WINDOW_HEIGHT) -> typing.Any:
+    """
+    Cria um contexto OpenGL atual com a mesma projeção ortográfica do jogo
+
+    Args:
+        width: Largura da área de desenho
+        height: Altura da área de desenho
+
+    Returns:
+        Handle do contexto (janela GLFW ou tupla EGL)
+
+    Raises:
+        RuntimeError: Se nenhum contexto puder ser criado
+    """
+    handle = None if _HEADLESS else _create_glfw_context(width, height)
+    if handle is None:
+        handle = _create_egl_context(width, height)
+    if handle is None:
+        raise RuntimeError("Não foi possível criar um contexto OpenGL fora da tela")
+
+    from OpenGL.GL import glViewport, glMatrixMode, glLoadIdentity, glOrtho, glEnable, glBlendFunc # type: ignore
+    from OpenGL.GL import GL_PROJECTION, GL_MODELVIEW, GL_BLEND, GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA # type: ignore
+
+    # Mesma configuração de main.initialize()
+    glViewport(0, 0, width, height)
+    glMatrixMode(GL_PROJECTION)
+    glLoadIdentity()
+    glOrtho(0, width, 0, height, -1, 1)
+    glMatrixMode(GL_MODELVIEW)
+    glEnable(GL_BLEND)
+    glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+    return handle
+
+class GLCallCounter:
+    """
+    Conta as chamadas gl* feitas pelos módulos indicados, substituindo as
+    funções importadas em cada módulo por versões que incrementam um contador
+    """
+
+    def __init__(self, modules: typing.Iterable[typing.Any]):
+        """
+        Instala os contadores
+
+        Args:
+            modules: Módulos cujas chamadas gl* serão contadas
+        """
+        self.calls: int = 0
+        self._originals: typing.List[typing.Tuple[typing.Any, str, typing.Any]] = []
+        wrapped: typing.Dict[int, typing.Callable[..., typing.Any]] = {}
+        for module in modules:
+            for name, value in list(vars(module).items()):
+                if not name.startswith("gl") or not callable(value):
+                    continue
+                if id(value) not in wrapped:
+                    wrapped[id(value)] = self._wrap(value)
+                self._originals.append((module, name, value))
+                setattr(module, name, wrapped[id(value)])
+
+    def _wrap(self, function: typing.Callable[..., typing.Any]) -> typing.Callable[..., typing.Any]:
+        def counted(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            self.calls += 1
+            return function(*args, **kwargs)
+        return counted
+
+    def restore(self) -> None:
+        """
+        Devolve as funções originais aos módulos
+        """
+        for module, name, value in self._originals:
+            setattr(module, name, value)
+        self._originals.clear()
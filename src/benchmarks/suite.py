@@ -0,0 +1,439 @@
+"""
+Suíte de benchmarks dos caminhos quentes do jogo
+Cada caso prepara um estado reprodutível (semente fixa) e mede uma operação:
+a operação é repetida em lotes calibrados e o tempo por operação de cada lote
+vira uma amostra, da qual saem ops/s e os percentis 50/95/99. Os resultados
+podem ser salvos em JSON e comparados com uma linha de base salva antes.
+
+Os casos de renderização usam um contexto fora da tela (gl_context): janela
+GLFW invisível ou EGL sem superfície, forçando o Mesa por software
+(LIBGL_ALWAYS_SOFTWARE) para que os números sejam comparáveis entre máquinas.
+
+Uso:
+    python src/benchmarks/suite.py run [casos ...] [--seed N] [--time S] [--save base.json] [--compare base.json]
+    python src/benchmarks/suite.py compare base.json novo.json [--threshold 0.1]
+    python src/benchmarks/suite.py list
+"""
+
+import argparse
+import contextlib
+import datetime
+import fnmatch
+import gc
+import json
+import platform
+import random
+import sys
+import os
+import time
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, PIPE_GAP, SIMULATION_RATE
+
+DELTA_TIME: float = 1.0 / SIMULATION_RATE
+
+Operation = typing.Callable[[], typing.Any]
+
+class Case(typing.NamedTuple):
+    """
+    Caso da suíte: setup(semente) devolve a operação a medir
+    """
+    name: str
+    setup: typing.Callable[[int], Operation]
+    needs_gl: bool = False
+
+class Result(typing.NamedTuple):
+    """
+    Medição de um caso (tempos por operação em segundos)
+    """
+    ops_per_sec: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    batch: int    # Operações por amostra
+    samples: int
+
+# --- Estados reprodutíveis ---
+
+def autopilot(simulation: typing.Any) -> int:
+    """
+    Mira no centro do próximo vão (mesmo piloto dos outros benchmarks)
+    """
+    from simulation.game_simulation import SimulationInput
+    pipes = simulation.pipes
+    slot = pipes.next_pair
+    target = simulation.window_height / 2 if slot is None else float(pipes.gap_y[slot]) + PIPE_GAP / 2
+    if simulation.bird.y < target - 20 and simulation.bird.velocity <= 0:
+        return SimulationInput.FLAP
+    return SimulationInput.NONE
+
+def playing_simulation(seed: int, seconds: float = 5.0) -> typing.Any:
+    """
+    Simulação headless em andamento, com canos na tela e o pássaro sem colidir
+    """
+    from simulation.game_simulation import GameSimulation, SimulationInput
+    simulation = GameSimulation(seed=seed)
+    simulation.step(DELTA_TIME, SimulationInput.FLAP)
+    for _ in range(int(seconds / DELTA_TIME)):
+        simulation.step(DELTA_TIME, autopilot(simulation))
+    # Avança até um passo em que o pássaro não toca em nada, para que medir a
+    # colisão repetidamente não altere o estado
+    while simulation.pipes.check_collision(simulation.bird.hitbox) or simulation.bird.is_dead:
+        simulation.step(DELTA_TIME, autopilot(simulation))
+    return simulation
+
+# --- Casos ---
+
+def setup_bird_update(seed: int) -> Operation:
+    from simulation.entities import BirdBody
+    bird = BirdBody(WINDOW_WIDTH, WINDOW_HEIGHT)
+    floor = WINDOW_HEIGHT * 0.3
+
+    def operation() -> None:
+        bird.update(DELTA_TIME)
+        if bird.y < floor:
+            bird.jump()
+    return operation
+
+def setup_pipes_update(seed: int) -> Operation:
+    pipes = playing_simulation(seed).pipes
+    return lambda: pipes.update(DELTA_TIME)
+
+def setup_pipes_check_collision(seed: int) -> Operation:
+    simulation = playing_simulation(seed)
+    pipes = simulation.pipes
+    hitbox = simulation.bird.hitbox
+    return lambda: pipes.check_collision(hitbox)
+
+def setup_pipes_sweep_collision(seed: int) -> Operation:
+    simulation = playing_simulation(seed)
+    pipes = simulation.pipes
+    bird = simulation.bird
+    hitbox = bird.hitbox
+    dy = bird.y - bird.previous_y
+    return lambda: pipes.sweep_collision(hitbox, 0.0, dy)
+
+def setup_pipes_sweep_collision_mask(seed: int) -> Operation:
+    # Pior caso da colisão por pixel: a caixa do pássaro encosta no canto do
+    # cano inferior do próximo par, então o pré-filtro passa e as máscaras são testadas
+    simulation = playing_simulation(seed)
+    pipes = simulation.pipes
+    bird = simulation.bird
+    mask, (_, _, width, height) = bird.collision_mask(simulation.bird_masks)
+    slot = pipes.next_pair if pipes.next_pair is not None else next(pipes.slots())
+    (pipe_x, bottom_y, _, pipe_height), _ = pipes.pipe_rects(slot)
+    hitbox = (pipe_x - width + 3.0, bottom_y + pipe_height - 3.0, width, height)
+    dy = bird.y - bird.previous_y
+    return lambda: pipes.sweep_collision(hitbox, 0.0, dy, mask)
+
+def setup_pipes_check_score(seed: int) -> Operation:
+    simulation = playing_simulation(seed)
+    pipes = simulation.pipes
+    bird_x = simulation.bird.x
+    return lambda: pipes.check_score(bird_x)
+
+def setup_check_collisions(seed: int) -> Operation:
+    simulation = playing_simulation(seed)
+    return simulation._check_collisions
+
+def setup_simulation_step(seed: int) -> Operation:
+    simulation = playing_simulation(seed)
+    rng = random.Random(seed)
+    from simulation.game_simulation import SimulationInput
+
+    def operation() -> None:
+        inputs = autopilot(simulation)
+        if simulation.game_over:
+            inputs |= SimulationInput.RESTART
+        # Um pulo aleatório de vez em quando faz o piloto errar e reiniciar
+        if rng.random() < 0.002:
+            inputs |= SimulationInput.FLAP
+        simulation.step(DELTA_TIME, inputs)
+    return operation
+
+def setup_simulation_snapshot(seed: int) -> Operation:
+    simulation = playing_simulation(seed)
+    return simulation.snapshot
+
+def setup_simulation_restore(seed: int) -> Operation:
+    simulation = playing_simulation(seed)
+    snapshot = simulation.snapshot()
+    return lambda: simulation.restore(snapshot)
+
+def setup_autopilot_plan(seed: int) -> Operation:
+    from simulation.autopilot import SearchAutopilot
+    # Sem limite de tempo: a busca completa, sempre do mesmo estado
+    return SearchAutopilot(playing_simulation(seed), DELTA_TIME, budget=None).plan
+
+def _setup_load_texture(use_cache: bool) -> Operation:
+    from OpenGL.GL import glDeleteTextures # type: ignore
+    from texture_manager import TextureManager
+    from asset_cache import open_asset_cache
+    from assets import ASSET_CACHE_PATH, ATLAS_SPRITES, CACHED_IMAGES, MENU, cached_arrays, generated_sprites
+
+    cache = (open_asset_cache(str(ASSET_CACHE_PATH), ATLAS_SPRITES, CACHED_IMAGES, rebuild=False,
+                              arrays=cached_arrays(), generated=generated_sprites()) if use_cache else None)
+    if use_cache and cache is None:
+        raise RuntimeError("cache de assets ausente ou desatualizado (gere com python src/asset_cache.py)")
+    manager = TextureManager(cache)
+
+    def operation() -> None:
+        texture_id = manager.load_texture(str(MENU), "benchmark")
+        del manager.textures["benchmark"]
+        glDeleteTextures(1, [texture_id])
+    return operation
+
+def setup_load_texture(seed: int) -> Operation:
+    return _setup_load_texture(use_cache=False)
+
+def setup_load_texture_cached(seed: int) -> Operation:
+    return _setup_load_texture(use_cache=True)
+
+def setup_render_frame(seed: int) -> Operation:
+    from OpenGL.GL import glFinish # type: ignore
+    import main
+    from simulation.game_simulation import SimulationInput
+
+    if main.simulation is None:
+        main.create_game_objects(seed=seed)
+        main.pending_inputs |= SimulationInput.FLAP
+        main.update(DELTA_TIME)
+        for _ in range(int(4.0 / DELTA_TIME)):
+            main.pending_inputs |= autopilot(main.simulation)
+            main.update(DELTA_TIME)
+
+    def operation() -> None:
+        main.render(0.5)
+        glFinish()
+    return operation
+
+CASES: typing.List[Case] = [
+    Case("bird.update", setup_bird_update),
+    Case("pipes.update", setup_pipes_update),
+    Case("pipes.check_collision", setup_pipes_check_collision),
+    Case("pipes.sweep_collision", setup_pipes_sweep_collision),
+    Case("pipes.sweep_collision[mask]", setup_pipes_sweep_collision_mask),
+    Case("pipes.check_score", setup_pipes_check_score),
+    Case("simulation.check_collisions", setup_check_collisions),
+    Case("simulation.step", setup_simulation_step),
+    Case("simulation.snapshot", setup_simulation_snapshot),
+    Case("simulation.restore", setup_simulation_restore),
+    Case("autopilot.plan", setup_autopilot_plan),
+    Case("texture_manager.load_texture", setup_load_texture, needs_gl=True),
+    Case("texture_manager.load_texture[cache]", setup_load_texture_cached, needs_gl=True),
+    Case("render.frame", setup_render_frame, needs_gl=True),
+]
+
+# --- Medição ---
+
+def measure(operation: Operation, duration: float = 1.0, samples: int = 50) -> Result:
+    """
+    Mede uma operação em amostras de lotes calibrados
+
+    Args:
+        operation: Função sem argumentos a medir
+        duration: Tempo aproximado total de medição em segundos
+        samples: Quantidade de amostras
+
+    Returns:
+        Resultado com ops/s e percentis do tempo por operação
+    """
+    clock = time.perf_counter
+
+    # Aquece e calibra: cada amostra deve durar cerca de duration / samples
+    batch = 1
+    while True:
+        start = clock()
+        for _ in range(batch):
+            operation()
+        elapsed = clock() - start
+        if elapsed >= duration / samples or batch >= 1 << 24:
+            break
+        batch *= 2
+
+    times = np.empty(samples)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(samples):
+            start = clock()
+            for _ in range(batch):
+                operation()
+            times[i] = (clock() - start) / batch
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    p50, p95, p99 = np.percentile(times, (50, 95, 99)).tolist()
+    mean = float(times.mean())
+    return Result(1.0 / mean, mean, p50, p95, p99, batch, samples)
+
+def select_cases(patterns: typing.Sequence[str]) -> typing.List[Case]:
+    """
+    Casos cujos nomes casam com algum dos padrões (fnmatch); todos se vazio
+    """
+    if not patterns:
+        return list(CASES)
+    return [case for case in CASES if any(fnmatch.fnmatch(case.name, pattern) for pattern in patterns)]
+
+def environment(renderer: typing.Optional[str]) -> typing.Dict[str, typing.Any]:
+    """
+    Descrição da máquina e das bibliotecas, guardada junto com os resultados
+    """
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "renderer": renderer,
+    }
+
+def run(cases: typing.Sequence[Case], seed: int, duration: float, samples: int) -> typing.Dict[str, typing.Any]:
+    """
+    Executa os casos e imprime uma tabela
+
+    Returns:
+        Dicionário com o ambiente e os resultados por caso (pronto para JSON)
+    """
+    renderer = None
+    if any(case.needs_gl for case in cases):
+        from benchmarks.gl_context import create_offscreen_context
+        create_offscreen_context()
+        from OpenGL.GL import glGetString, GL_RENDERER # type: ignore
+        renderer = glGetString(GL_RENDERER).decode(errors="replace")
+        print(f"OpenGL: {renderer}")
+
+    print(f"{'caso':<38} {'ops/s':>12} {'p50':>10} {'p95':>10} {'p99':>10}")
+    results: typing.Dict[str, typing.Dict[str, float]] = {}
+    with open(os.devnull, "w") as devnull:
+        for case in cases:
+            try:
+                # Os componentes imprimem mensagens de carregamento: silencia durante o caso
+                with contextlib.redirect_stdout(devnull):
+                    operation = case.setup(seed)
+                    result = measure(operation, duration, samples)
+            except Exception as e:
+                print(f"{case.name:<38} ignorado: {e}")
+                continue
+            results[case.name] = result._asdict()
+            print(f"{case.name:<38} {result.ops_per_sec:>12,.0f} {format_time(result.p50):>10} "
+                  f"{format_time(result.p95):>10} {format_time(result.p99):>10}")
+
+    return {"environment": environment(renderer), "seed": seed, "results": results}
+
+def format_time(seconds: float) -> str:
+    """
+    Formata um tempo por operação na unidade mais legível
+    """
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    if seconds >= 1e-6:
+        return f"{seconds * 1e6:.2f} µs"
+    return f"{seconds * 1e9:.0f} ns"
+
+def compare(baseline: typing.Dict[str, typing.Any], current: typing.Dict[str, typing.Any],
+            threshold: float = 0.10) -> int:
+    """
+    Compara o p50 de cada caso com a linha de base e imprime as diferenças
+
+    Args:
+        baseline: Resultados salvos anteriormente
+        current: Resultados novos
+        threshold: Variação relativa a partir da qual o caso é marcado (0.10 = 10%)
+
+    Returns:
+        Quantidade de casos que ficaram mais lentos que o limite
+    """
+    before_env = baseline.get("environment", {})
+    after_env = current.get("environment", {})
+    for key in ("renderer", "python", "processor"):
+        if before_env.get(key) and after_env.get(key) and before_env[key] != after_env[key]:
+            print(f"Aviso: {key} diferente da linha de base ({before_env[key]} -> {after_env[key]})")
+
+    regressions = 0
+    print(f"{'caso':<38} {'base p50':>10} {'atual p50':>10} {'variação':>9}")
+    for name, after in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<38} {'-':>10} {format_time(after['p50']):>10}       novo")
+            continue
+        change = after["p50"] / before["p50"] - 1.0
+        if change > threshold:
+            flag = "  REGRESSÃO"
+            regressions += 1
+        elif change < -threshold:
+            flag = "  melhora"
+        else:
+            flag = ""
+        print(f"{name:<38} {format_time(before['p50']):>10} {format_time(after['p50']):>10} {change:>+8.1%}{flag}")
+    return regressions
+
+def load_results(path: str) -> typing.Dict[str, typing.Any]:
+    """
+    Lê resultados salvos em JSON
+    """
+    with open(path) as file:
+        return json.load(file)
+
+def main(argv: typing.Optional[typing.Sequence[str]] = None) -> int:
+    """
+    Ponto de entrada da linha de comando
+
+    Returns:
+        Código de saída (1 se houver regressões)
+    """
+    parser = argparse.ArgumentParser(description="Suíte de benchmarks do Flappy Bird")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="executa os casos")
+    run_parser.add_argument("cases", nargs="*", help="padrões de nome dos casos (ex.: 'pipes.*')")
+    run_parser.add_argument("--seed", type=int, default=0, help="semente dos estados de teste")
+    run_parser.add_argument("--time", type=float, default=1.0, help="segundos de medição por caso")
+    run_parser.add_argument("--samples", type=int, default=50, help="amostras por caso")
+    run_parser.add_argument("--save", help="grava os resultados neste arquivo JSON")
+    run_parser.add_argument("--compare", help="compara com a linha de base deste arquivo JSON")
+    run_parser.add_argument("--threshold", type=float, default=0.10, help="variação tolerada (0.10 = 10%%)")
+    run_parser.add_argument("--hardware", action="store_true", help="usa o driver OpenGL da máquina em vez do Mesa por software")
+
+    compare_parser = commands.add_parser("compare", help="compara dois arquivos de resultados")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="variação tolerada (0.10 = 10%%)")
+
+    commands.add_parser("list", help="lista os casos")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for case in CASES:
+            print(f"{case.name}{'  (OpenGL)' if case.needs_gl else ''}")
+        return 0
+
+    if args.command == "compare":
+        return 1 if compare(load_results(args.baseline), load_results(args.current), args.threshold) else 0
+
+    if not args.hardware:
+        os.environ.setdefault("LIBGL_ALWAYS_SOFTWARE", "1")
+    cases = select_cases(args.cases)
+    if not cases:
+        print("Nenhum caso corresponde aos padrões")
+        return 2
+    results = run(cases, args.seed, args.time, args.samples)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Resultados gravados em '{args.save}'")
+    if args.compare:
+        print()
+        return 1 if compare(load_results(args.compare), results, args.threshold) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
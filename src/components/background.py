@@ -3,10 +3,6 @@ Componente de plano de fundo para o jogo Flappy Bird
 Corresponde ao arquivo background.dart do projeto Flutter
 """
 
-from OpenGL.GL import * # type: ignore
-from OpenGL.GL import glPushMatrix, glLoadIdentity, glEnable, glBindTexture, glBegin, glEnd, glDisable, glPopMatrix # type: ignore
-from OpenGL.GL import glTexCoord2f, glVertex2f, GL_TEXTURE_2D, GL_QUADS # type: ignore
-import numpy as np # type: ignore
 import sys # type: ignore
 import os # type: ignore
 import typing # type: ignore
@@ -15,7 +11,8 @@ import typing # type: ignore
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from assets import BACKGROUND
-from texture_manager import TextureManager
+from texture_manager import TextureManager, SpriteRegion
+from sprite_batch import SpriteBatch
 
 class Background:
     """
@@ -46,56 +43,15 @@ class Background:
         self.width: float = window_width
         self.height: float = window_height
         
-        # Carrega a textura do plano de fundo
-        self.texture_id: typing.Optional[int] = texture_manager.load_texture(BACKGROUND, "background")
+        # Sprite do plano de fundo
+        self.sprite: typing.Optional[SpriteRegion] = texture_manager.load_sprite(BACKGROUND, "background")
         
-    def render(self) -> None:
+    def render(self, batch: SpriteBatch) -> None:
         """
-        Renderiza o plano de fundo usando OpenGL
+        Renderiza o plano de fundo cobrindo toda a janela
         Equivalente ao método render do Flame que é chamado automaticamente
-        """
-        # Verifica se a textura foi carregada corretamente
-        if self.texture_id is None:
-            return
-            
-        # Salva o estado da matriz atual
-        glPushMatrix()
-        
-        # Reseta a matriz para identidade (limpa transformações anteriores)
-        glLoadIdentity()
-        
-        # Ativa o mapeamento de texturas 2D
-        glEnable(GL_TEXTURE_2D)
-        
-        # Vincula a textura do plano de fundo
-        glBindTexture(GL_TEXTURE_2D, self.texture_id)
-        
-        # Desenha um quadrilátero com a textura do plano de fundo
-        glBegin(GL_QUADS)
-        
-        # Define coordenadas de textura e vértices para cada canto do quadrilátero
-        # No OpenGL, o eixo Y começa de baixo para cima
-        
-        # Inferior esquerdo
-        glTexCoord2f(0, 0)
-        glVertex2f(0, 0)
         
-        # Inferior direito
-        glTexCoord2f(1, 0)
-        glVertex2f(self.width, 0)
-        
-        # Superior direito
-        glTexCoord2f(1, 1)
-        glVertex2f(self.width, self.height)
-        
-        # Superior esquerdo
-        glTexCoord2f(0, 1)
-        glVertex2f(0, self.height)
-        
-        glEnd()
-        
-        # Desativa o mapeamento de texturas 2D
-        glDisable(GL_TEXTURE_2D)
-        
-        # Restaura o estado da matriz anterior
-        glPopMatrix() 
\ No newline at end of file
+        Args:
+            batch: Lote de sprites do quadro atual
+        """
+        batch.draw_region(self.sprite, 0, 0, self.width, self.height)
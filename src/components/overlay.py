@@ -3,10 +3,6 @@ Componentes de overlay para o jogo Flappy Bird
 Corresponde aos arquivos main_menu_screen.dart e game_over_screen.dart do projeto Flutter
 """
 
-from OpenGL.GL import * # type: ignore
-from OpenGL.GL import glPushMatrix, glLoadIdentity, glEnable, glBindTexture, glBegin, glEnd, glDisable, glPopMatrix # type: ignore
-from OpenGL.GL import glTexCoord2f, glVertex2f, GL_TEXTURE_2D, GL_QUADS, glTranslatef, glColor4f, glColor3f # type: ignore
-import numpy as np # type: ignore
 import sys # type: ignore
 import os # type: ignore
 import typing # type: ignore
@@ -16,8 +12,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from assets import MESSAGE, GAME_OVER, HEART
 from assets import NUMBER_0, NUMBER_1, NUMBER_2, NUMBER_3, NUMBER_4, NUMBER_5, NUMBER_6, NUMBER_7, NUMBER_8, NUMBER_9
-from texture_manager import TextureManager
+from texture_manager import TextureManager, SpriteRegion
+from sprite_batch import SpriteBatch
+from text import TextLabel
 from config import HEART_WIDTH, HEART_HEIGHT, HEART_SPACING, SCORE_NUMBER_WIDTH, SCORE_NUMBER_HEIGHT, SCORE_NUMBER_SPACING, MAX_LIVES
+from config import FONT_PATH, INFO_TEXT_SIZE, BUTTON_TEXT_SIZE, SCORE_TEXT_SIZE, TEXT_SHADOW_COLOR
 
 class Overlay:
     """
@@ -51,46 +50,34 @@ class Overlay:
         """
         self.is_visible = False
         
-    def render(self) -> None:
+    def render(self, batch: SpriteBatch) -> None:
         """
         Renderiza o overlay
+        
+        Args:
+            batch: Lote de sprites do quadro atual
         """
         if self.is_visible:
-            self._render_impl()
+            self._render_impl(batch)
             
-    def _render_impl(self) -> None:
+    def _render_impl(self, batch: SpriteBatch) -> None:
         """
         Implementação específica de renderização para cada tipo de overlay
         Deve ser sobrescrita pelas subclasses
+        
+        Args:
+            batch: Lote de sprites do quadro atual
         """
         pass
         
-    def _render_semitransparent_background(self) -> None:
-        """
-        Renderiza um fundo semi-transparente
+    def _render_semitransparent_background(self, batch: SpriteBatch) -> None:
         """
-        # Salva o estado da matriz atual
-        glPushMatrix()
-        
-        # Reseta a matriz
-        glLoadIdentity()
+        Renderiza um fundo semi-transparente (preto com 70% de opacidade) cobrindo a tela
         
-        # Configura uma cor semi-transparente (preto com 70% de opacidade)
-        glColor4f(0.0, 0.0, 0.0, 0.7)
-        
-        # Desenha um retângulo que cobre toda a tela
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(self.window_width, 0)
-        glVertex2f(self.window_width, self.window_height)
-        glVertex2f(0, self.window_height)
-        glEnd()
-        
-        # Restaura a cor para branco opaco
-        glColor4f(1.0, 1.0, 1.0, 1.0)
-        
-        # Restaura o estado da matriz
-        glPopMatrix()
+        Args:
+            batch: Lote de sprites do quadro atual
+        """
+        batch.draw_rect(0, 0, self.window_width, self.window_height, (0.0, 0.0, 0.0, 0.7))
 
 class StartScreenOverlay(Overlay):
     """
@@ -110,8 +97,8 @@ class StartScreenOverlay(Overlay):
         super().__init__(texture_manager, window_width, window_height)
         self.is_visible = True  # Começa visível
         
-        # Carrega a textura da mensagem "Get Ready"
-        self.message_texture: typing.Optional[int] = texture_manager.load_texture(MESSAGE, "message")
+        # Sprite da mensagem "Get Ready"
+        self.message_sprite: typing.Optional[SpriteRegion] = texture_manager.load_sprite(MESSAGE, "message")
         
         # Dimensões da textura da mensagem
         self.message_width: float = 200.0
@@ -121,74 +108,36 @@ class StartScreenOverlay(Overlay):
         self.message_x: float = window_width / 2 - self.message_width / 2
         self.message_y: float = window_height / 2 - self.message_height / 2
         
-    def _render_impl(self) -> None:
+        # Instrução abaixo da mensagem
+        self.start_label = TextLabel(texture_manager.load_font(INFO_TEXT_SIZE, FONT_PATH or None),
+                                     window_width / 2, self.message_y - 40, "Pressione Espaço para Iniciar",
+                                     anchor_x=0.5, shadow=TEXT_SHADOW_COLOR)
+        
+    def _render_impl(self, batch: SpriteBatch) -> None:
         """
         Renderiza a tela de início com a mensagem "Get Ready"
+        
+        Args:
+            batch: Lote de sprites do quadro atual
         """
-        # Verifica se a textura foi carregada
-        if self.message_texture is None:
+        # Verifica se o sprite foi carregado
+        if self.message_sprite is None:
             return
             
-        # Salva o estado da matriz atual
-        glPushMatrix()
-        
         # Não precisamos de um fundo semi-transparente aqui
-        
-        # Ativa o mapeamento de texturas 2D
-        glEnable(GL_TEXTURE_2D)
-        
-        # Vincula a textura da mensagem
-        glBindTexture(GL_TEXTURE_2D, self.message_texture)
-        
-        # Desenha a textura no centro da tela
-        glBegin(GL_QUADS)
-        
-        glTexCoord2f(0, 0)
-        glVertex2f(self.message_x, self.message_y)
-        
-        glTexCoord2f(1, 0)
-        glVertex2f(self.message_x + self.message_width, self.message_y)
-        
-        glTexCoord2f(1, 1)
-        glVertex2f(self.message_x + self.message_width, self.message_y + self.message_height)
-        
-        glTexCoord2f(0, 1)
-        glVertex2f(self.message_x, self.message_y + self.message_height)
-        
-        glEnd()
-        
-        # Desativa o mapeamento de texturas 2D
-        glDisable(GL_TEXTURE_2D)
+        batch.draw_region(self.message_sprite, self.message_x, self.message_y, self.message_width, self.message_height)
         
         # Renderiza o texto de instrução "Pressione Espaço para Iniciar"
-        self._render_start_text()
+        self._render_start_text(batch)
         
-        # Restaura o estado da matriz
-        glPopMatrix()
-        
-    def _render_start_text(self) -> None:
+    def _render_start_text(self, batch: SpriteBatch) -> None:
         """
         Renderiza o texto com instrução para iniciar o jogo
-        Em um contexto real, usaríamos uma biblioteca de texto como FTGL ou FreeType,
-        mas para simplificar, vamos apenas mostrar um texto simples
-        """
-        # Salva o estado da matriz atual
-        glPushMatrix()
-        
-        # Reseta a matriz
-        glLoadIdentity()
-        
-        # Configura a cor do texto (branco)
-        glColor3f(1.0, 1.0, 1.0)
-        
-        # Desenhar linhas para formar as letras seria muito complexo aqui
-        # Em um contexto real, usaríamos uma biblioteca de texto
-        
-        # Restaura a cor para branco
-        glColor3f(1.0, 1.0, 1.0)
         
-        # Restaura o estado da matriz
-        glPopMatrix()
+        Args:
+            batch: Lote de sprites do quadro atual
+        """
+        self.start_label.render(batch)
 
 class GameOverOverlay(Overlay):
     """
@@ -207,8 +156,8 @@ class GameOverOverlay(Overlay):
         """
         super().__init__(texture_manager, window_width, window_height)
         
-        # Carrega a textura "Game Over"
-        self.game_over_texture: typing.Optional[int] = texture_manager.load_texture(GAME_OVER, "game_over")
+        # Sprite "Game Over"
+        self.game_over_sprite: typing.Optional[SpriteRegion] = texture_manager.load_sprite(GAME_OVER, "game_over")
         
         # Dimensões da textura "Game Over"
         self.game_over_width: float = 200.0
@@ -230,6 +179,15 @@ class GameOverOverlay(Overlay):
         # Pontuação atual (será atualizada quando o overlay for mostrado)
         self.score: int = 0
         
+        # Textos: o layout só é refeito quando a pontuação muda
+        button_font = texture_manager.load_font(BUTTON_TEXT_SIZE, FONT_PATH or None)
+        self.restart_label = TextLabel(button_font, window_width / 2,
+                                       self.restart_button_y + (self.restart_button_height - button_font.line_height) / 2,
+                                       "RESTART", anchor_x=0.5)
+        self.score_label = TextLabel(texture_manager.load_font(SCORE_TEXT_SIZE, FONT_PATH or None),
+                                     window_width / 2, self.restart_button_y - 40, "Score: 0",
+                                     anchor_x=0.5, shadow=TEXT_SHADOW_COLOR)
+        
     def show_with_score(self, score: int) -> None:
         """
         Mostra o overlay com a pontuação final
@@ -238,6 +196,7 @@ class GameOverOverlay(Overlay):
             score: Pontuação final do jogador
         """
         self.score = score
+        self.score_label.set_text(f"Score: {score}")
         self.show()
         
     def is_restart_button_clicked(self, x: float, y: float) -> bool:
@@ -260,336 +219,61 @@ class GameOverOverlay(Overlay):
                 y >= self.restart_button_y and 
                 y <= self.restart_button_y + self.restart_button_height)
         
-    def _render_impl(self) -> None:
+    def _render_impl(self, batch: SpriteBatch) -> None:
         """
         Renderiza a tela de fim de jogo com a mensagem "Game Over" e a pontuação
+        
+        Args:
+            batch: Lote de sprites do quadro atual
         """
-        # Verifica se a textura foi carregada
-        if self.game_over_texture is None:
+        # Verifica se o sprite foi carregado
+        if self.game_over_sprite is None:
             return
             
         # Renderiza um fundo semi-transparente
-        self._render_semitransparent_background()
-            
-        # Salva o estado da matriz atual
-        glPushMatrix()
+        self._render_semitransparent_background(batch)
         
-        # Ativa o mapeamento de texturas 2D
-        glEnable(GL_TEXTURE_2D)
-        
-        # Vincula a textura "Game Over"
-        glBindTexture(GL_TEXTURE_2D, self.game_over_texture)
-        
-        # Desenha a textura
-        glBegin(GL_QUADS)
-        
-        glTexCoord2f(0, 0)
-        glVertex2f(self.game_over_x, self.game_over_y)
-        
-        glTexCoord2f(1, 0)
-        glVertex2f(self.game_over_x + self.game_over_width, self.game_over_y)
-        
-        glTexCoord2f(1, 1)
-        glVertex2f(self.game_over_x + self.game_over_width, self.game_over_y + self.game_over_height)
-        
-        glTexCoord2f(0, 1)
-        glVertex2f(self.game_over_x, self.game_over_y + self.game_over_height)
-        
-        glEnd()
-        
-        # Desativa o mapeamento de texturas 2D
-        glDisable(GL_TEXTURE_2D)
-        
-        # Restaura o estado da matriz
-        glPopMatrix()
+        # Desenha a textura "Game Over"
+        batch.draw_region(self.game_over_sprite, self.game_over_x, self.game_over_y,
+                          self.game_over_width, self.game_over_height)
         
         # Renderiza o botão de restart
-        self._render_restart_button()
+        self._render_restart_button(batch)
         
         # Renderiza o texto "Score: X"
-        self._render_score_text()
+        self._render_score_text(batch)
         
-    def _render_restart_button(self) -> None:
+    def _render_restart_button(self, batch: SpriteBatch) -> None:
         """
         Renderiza o botão de restart
-        """
-        # Salva o estado da matriz atual
-        glPushMatrix()
-        
-        # Reseta a matriz
-        glLoadIdentity()
         
-        # Configura a cor do botão (laranja)
-        glColor4f(*self.button_color)
-        
-        # Desenha o botão como um retângulo
-        glBegin(GL_QUADS)
-        glVertex2f(self.restart_button_x, self.restart_button_y)
-        glVertex2f(self.restart_button_x + self.restart_button_width, self.restart_button_y)
-        glVertex2f(self.restart_button_x + self.restart_button_width, self.restart_button_y + self.restart_button_height)
-        glVertex2f(self.restart_button_x, self.restart_button_y + self.restart_button_height)
-        glEnd()
-        
-        # Restaura a cor para branco
-        glColor4f(1.0, 1.0, 1.0, 1.0)
-        
-        # Restaura o estado da matriz
-        glPopMatrix()
+        Args:
+            batch: Lote de sprites do quadro atual
+        """
+        # Desenha o botão como um retângulo laranja
+        batch.draw_rect(self.restart_button_x, self.restart_button_y,
+                        self.restart_button_width, self.restart_button_height, self.button_color)
         
         # Texto "Restart" dentro do botão
-        self._render_restart_text()
+        self._render_restart_text(batch)
         
-    def _render_restart_text(self) -> None:
+    def _render_restart_text(self, batch: SpriteBatch) -> None:
         """
         Renderiza o texto "RESTART" dentro do botão
-        """
-        # Salva o estado da matriz atual
-        glPushMatrix()
-        
-        # Reseta a matriz
-        glLoadIdentity()
-        
-        # Configura a cor do texto (branco)
-        glColor3f(1.0, 1.0, 1.0)
-        
-        # Vamos desenhar o texto "RESTART" com linhas simples
-        # Posição central do texto
-        text_x = self.restart_button_x + self.restart_button_width / 2
-        text_y = self.restart_button_y + self.restart_button_height / 2
-        
-        # Tamanho das letras - aumentado para letras mais grossas
-        letter_height = 16.0
-        letter_width = 10.0
-        spacing = 3.0
-        thickness = 1.5  # Espessura das linhas
-        
-        # Ajustar a posição inicial para centralizar o texto "RESTART" (7 letras)
-        start_x = text_x - ((letter_width * 7 + spacing * 6) / 2)
-        start_y = text_y - letter_height / 2
-        
-        # Define a espessura das linhas (funciona apenas em algumas implementações OpenGL)
-        glLineWidth(thickness)
         
-        # Desenhar cada letra do texto "RESTART"
-        current_x = start_x
-        
-        # R
-        self._draw_letter_r(current_x, start_y, letter_width, letter_height)
-        current_x += letter_width + spacing
-        
-        # E
-        self._draw_letter_e(current_x, start_y, letter_width, letter_height)
-        current_x += letter_width + spacing
-        
-        # S
-        self._draw_letter_s(current_x, start_y, letter_width, letter_height)
-        current_x += letter_width + spacing
-        
-        # T
-        self._draw_letter_t(current_x, start_y, letter_width, letter_height)
-        current_x += letter_width + spacing
-        
-        # A
-        self._draw_letter_a(current_x, start_y, letter_width, letter_height)
-        current_x += letter_width + spacing
-        
-        # R
-        self._draw_letter_r(current_x, start_y, letter_width, letter_height)
-        current_x += letter_width + spacing
-        
-        # T
-        self._draw_letter_t(current_x, start_y, letter_width, letter_height)
-        
-        # Resetar a espessura da linha
-        glLineWidth(1.0)
-        
-        # Restaura a cor para branco
-        glColor3f(1.0, 1.0, 1.0)
+        Args:
+            batch: Lote de sprites do quadro atual
+        """
+        self.restart_label.render(batch)
         
-        # Restaura o estado da matriz
-        glPopMatrix()
-    
-    def _draw_letter_r(self, x: float, y: float, width: float, height: float) -> None:
-        """Desenha a letra R"""
-        # Versão mais grossa da letra R
-        glBegin(GL_LINES)
-        # Linha vertical esquerda (principal)
-        glVertex2f(x, y)
-        glVertex2f(x, y + height)
-        
-        # Linha vertical esquerda (duplicada para espessura)
-        glVertex2f(x + 1, y)
-        glVertex2f(x + 1, y + height)
-        
-        # Linha horizontal superior
-        glVertex2f(x, y + height)
-        glVertex2f(x + width, y + height)
-        
-        # Linha horizontal superior (duplicada para espessura)
-        glVertex2f(x, y + height - 1)
-        glVertex2f(x + width, y + height - 1)
-        
-        # Linha vertical direita superior
-        glVertex2f(x + width, y + height)
-        glVertex2f(x + width, y + height / 2)
-        
-        # Linha vertical direita superior (duplicada para espessura)
-        glVertex2f(x + width - 1, y + height)
-        glVertex2f(x + width - 1, y + height / 2)
-        
-        # Linha horizontal meio
-        glVertex2f(x, y + height / 2)
-        glVertex2f(x + width, y + height / 2)
-        
-        # Linha horizontal meio (duplicada para espessura)
-        glVertex2f(x, y + height / 2 + 1)
-        glVertex2f(x + width, y + height / 2 + 1)
-        
-        # Diagonal inferior
-        glVertex2f(x, y + height / 2)
-        glVertex2f(x + width, y)
-        
-        # Diagonal inferior (duplicada para espessura)
-        glVertex2f(x, y + height / 2 - 1)
-        glVertex2f(x + width - 1, y + 1)
-        glEnd()
-    
-    def _draw_letter_e(self, x: float, y: float, width: float, height: float) -> None:
-        """Desenha a letra E"""
-        glBegin(GL_LINES)
-        # Linha vertical esquerda
-        glVertex2f(x, y)
-        glVertex2f(x, y + height)
-        
-        # Linha vertical esquerda (duplicada para espessura)
-        glVertex2f(x + 1, y)
-        glVertex2f(x + 1, y + height)
-        
-        # Linha horizontal superior
-        glVertex2f(x, y + height)
-        glVertex2f(x + width, y + height)
-        
-        # Linha horizontal superior (duplicada para espessura)
-        glVertex2f(x, y + height - 1)
-        glVertex2f(x + width, y + height - 1)
-        
-        # Linha horizontal meio
-        glVertex2f(x, y + height / 2)
-        glVertex2f(x + width * 0.8, y + height / 2)
-        
-        # Linha horizontal meio (duplicada para espessura)
-        glVertex2f(x, y + height / 2 + 1)
-        glVertex2f(x + width * 0.8, y + height / 2 + 1)
-        
-        # Linha horizontal inferior
-        glVertex2f(x, y)
-        glVertex2f(x + width, y)
-        
-        # Linha horizontal inferior (duplicada para espessura)
-        glVertex2f(x, y + 1)
-        glVertex2f(x + width, y + 1)
-        glEnd()
-        
-    def _draw_letter_s(self, x: float, y: float, width: float, height: float) -> None:
-        """Desenha a letra S"""
-        glBegin(GL_LINES)
-        # Linha horizontal superior
-        glVertex2f(x, y + height)
-        glVertex2f(x + width, y + height)
-        
-        # Linha horizontal superior (duplicada para espessura)
-        glVertex2f(x, y + height - 1)
-        glVertex2f(x + width, y + height - 1)
-        
-        # Linha vertical esquerda superior
-        glVertex2f(x, y + height)
-        glVertex2f(x, y + height / 2)
-        
-        # Linha vertical esquerda superior (duplicada para espessura)
-        glVertex2f(x + 1, y + height)
-        glVertex2f(x + 1, y + height / 2)
-        
-        # Linha horizontal meio
-        glVertex2f(x, y + height / 2)
-        glVertex2f(x + width, y + height / 2)
-        
-        # Linha horizontal meio (duplicada para espessura)
-        glVertex2f(x, y + height / 2 + 1)
-        glVertex2f(x + width, y + height / 2 + 1)
-        
-        # Linha vertical direita inferior
-        glVertex2f(x + width, y + height / 2)
-        glVertex2f(x + width, y)
-        
-        # Linha vertical direita inferior (duplicada para espessura)
-        glVertex2f(x + width - 1, y + height / 2)
-        glVertex2f(x + width - 1, y)
-        
-        # Linha horizontal inferior
-        glVertex2f(x, y)
-        glVertex2f(x + width, y)
-        
-        # Linha horizontal inferior (duplicada para espessura)
-        glVertex2f(x, y + 1)
-        glVertex2f(x + width, y + 1)
-        glEnd()
-        
-    def _draw_letter_t(self, x: float, y: float, width: float, height: float) -> None:
-        """Desenha a letra T"""
-        glBegin(GL_LINES)
-        # Linha horizontal superior
-        glVertex2f(x, y + height)
-        glVertex2f(x + width, y + height)
-        
-        # Linha horizontal superior (duplicada para espessura)
-        glVertex2f(x, y + height - 1)
-        glVertex2f(x + width, y + height - 1)
-        
-        # Linha vertical central
-        glVertex2f(x + width / 2, y + height)
-        glVertex2f(x + width / 2, y)
-        
-        # Linha vertical central (duplicada para espessura)
-        glVertex2f(x + width / 2 + 1, y + height)
-        glVertex2f(x + width / 2 + 1, y)
-        glEnd()
-        
-    def _draw_letter_a(self, x: float, y: float, width: float, height: float) -> None:
-        """Desenha a letra A"""
-        glBegin(GL_LINES)
-        # Linha diagonal esquerda
-        glVertex2f(x, y)
-        glVertex2f(x + width / 2, y + height)
-        
-        # Linha diagonal esquerda (duplicada para espessura)
-        glVertex2f(x + 1, y)
-        glVertex2f(x + width / 2 + 1, y + height)
-        
-        # Linha diagonal direita
-        glVertex2f(x + width / 2, y + height)
-        glVertex2f(x + width, y)
-        
-        # Linha diagonal direita (duplicada para espessura)
-        glVertex2f(x + width / 2 - 1, y + height)
-        glVertex2f(x + width - 1, y)
-        
-        # Linha horizontal meio
-        glVertex2f(x + width * 0.25, y + height / 2)
-        glVertex2f(x + width * 0.75, y + height / 2)
-        
-        # Linha horizontal meio (duplicada para espessura)
-        glVertex2f(x + width * 0.25, y + height / 2 + 1)
-        glVertex2f(x + width * 0.75, y + height / 2 + 1)
-        glEnd()
-        
-    def _render_score_text(self) -> None:
+    def _render_score_text(self, batch: SpriteBatch) -> None:
         """
         Renderiza o texto com a pontuação final
+        
+        Args:
+            batch: Lote de sprites do quadro atual
         """
-        # Em um caso real, usaríamos uma biblioteca de texto
-        # para renderizar algo como "Score: {self.score}"
-        # posicionado acima do botão de restart
-        pass 
+        self.score_label.render(batch)
 
 class HeartDisplay(Overlay):
     """
@@ -612,8 +296,8 @@ class HeartDisplay(Overlay):
         # Sempre visível durante o jogo
         self.is_visible = True
         
-        # Carrega a textura do coração
-        self.heart_texture = texture_manager.load_texture(HEART, "heart")
+        # Sprite do coração
+        self.heart_sprite = texture_manager.load_sprite(HEART, "heart")
         
         # Dimensões de cada coração (usando valores do config)
         self.heart_width = HEART_WIDTH
@@ -639,49 +323,17 @@ class HeartDisplay(Overlay):
         """
         self.current_lives = max(0, min(lives, self.max_lives))
     
-    def _render_impl(self) -> None:
+    def _render_impl(self, batch: SpriteBatch) -> None:
         """
         Renderiza os corações na tela
-        """
-        # Verifica se a textura foi carregada
-        if self.heart_texture is None:
-            return
-            
-        # Salva o estado da matriz atual
-        glPushMatrix()
         
-        # Ativa o mapeamento de texturas 2D
-        glEnable(GL_TEXTURE_2D)
-        
-        # Vincula a textura do coração
-        glBindTexture(GL_TEXTURE_2D, self.heart_texture)
-        
-        # Desenha cada coração
+        Args:
+            batch: Lote de sprites do quadro atual
+        """
+        # Desenha cada coração (o lote ignora o sprite se ele não foi carregado)
         for i in range(self.current_lives):
             x = self.initial_x + (self.heart_width + self.heart_spacing) * i
-            y = self.initial_y
-            
-            glBegin(GL_QUADS)
-            
-            glTexCoord2f(0, 0)
-            glVertex2f(x, y)
-            
-            glTexCoord2f(1, 0)
-            glVertex2f(x + self.heart_width, y)
-            
-            glTexCoord2f(1, 1)
-            glVertex2f(x + self.heart_width, y + self.heart_height)
-            
-            glTexCoord2f(0, 1)
-            glVertex2f(x, y + self.heart_height)
-            
-            glEnd()
-        
-        # Desativa o mapeamento de texturas 2D
-        glDisable(GL_TEXTURE_2D)
-        
-        # Restaura o estado da matriz
-        glPopMatrix() 
+            batch.draw_region(self.heart_sprite, x, self.initial_y, self.heart_width, self.heart_height)
 
 class ScoreDisplay(Overlay):
     """
@@ -702,18 +354,18 @@ class ScoreDisplay(Overlay):
         # Sempre visível durante o jogo
         self.is_visible = True
         
-        # Lista de constantes de números
-        self.number_textures = [
-            texture_manager.load_texture(NUMBER_0, "number_0"),
-            texture_manager.load_texture(NUMBER_1, "number_1"),
-            texture_manager.load_texture(NUMBER_2, "number_2"),
-            texture_manager.load_texture(NUMBER_3, "number_3"),
-            texture_manager.load_texture(NUMBER_4, "number_4"),
-            texture_manager.load_texture(NUMBER_5, "number_5"),
-            texture_manager.load_texture(NUMBER_6, "number_6"),
-            texture_manager.load_texture(NUMBER_7, "number_7"),
-            texture_manager.load_texture(NUMBER_8, "number_8"),
-            texture_manager.load_texture(NUMBER_9, "number_9")
+        # Sprites dos números (no atlas, todos compartilham a mesma textura)
+        self.number_sprites = [
+            texture_manager.load_sprite(NUMBER_0, "number_0"),
+            texture_manager.load_sprite(NUMBER_1, "number_1"),
+            texture_manager.load_sprite(NUMBER_2, "number_2"),
+            texture_manager.load_sprite(NUMBER_3, "number_3"),
+            texture_manager.load_sprite(NUMBER_4, "number_4"),
+            texture_manager.load_sprite(NUMBER_5, "number_5"),
+            texture_manager.load_sprite(NUMBER_6, "number_6"),
+            texture_manager.load_sprite(NUMBER_7, "number_7"),
+            texture_manager.load_sprite(NUMBER_8, "number_8"),
+            texture_manager.load_sprite(NUMBER_9, "number_9")
         ]
         
         # Dimensões de cada número (usando valores do config)
@@ -738,9 +390,12 @@ class ScoreDisplay(Overlay):
         """
         self.score = max(0, score)
     
-    def _render_impl(self) -> None:
+    def _render_impl(self, batch: SpriteBatch) -> None:
         """
         Renderiza a pontuação atual na tela
+        
+        Args:
+            batch: Lote de sprites do quadro atual
         """
         # Converte a pontuação para string
         score_str = str(self.score)
@@ -751,44 +406,10 @@ class ScoreDisplay(Overlay):
         # Posição X inicial (centralizada)
         start_x = (self.window_width - total_width) / 2
         
-        # Salva o estado da matriz atual
-        glPushMatrix()
-        
-        # Ativa o mapeamento de texturas 2D
-        glEnable(GL_TEXTURE_2D)
-        
         # Desenha cada dígito da pontuação
         for i, digit in enumerate(score_str):
             # Posição X deste dígito
             x = start_x + i * (self.number_width + self.number_spacing)
             
-            # Obtém o índice da textura (convertendo o caractere para inteiro)
-            digit_index = int(digit)
-            
-            # Verifica se a textura para este dígito foi carregada corretamente
-            if 0 <= digit_index < 10 and self.number_textures[digit_index] is not None:
-                # Vincula a textura para este dígito
-                glBindTexture(GL_TEXTURE_2D, self.number_textures[digit_index])
-                
-                # Desenha o dígito
-                glBegin(GL_QUADS)
-                
-                glTexCoord2f(0, 0)
-                glVertex2f(x, self.position_y)
-                
-                glTexCoord2f(1, 0)
-                glVertex2f(x + self.number_width, self.position_y)
-                
-                glTexCoord2f(1, 1)
-                glVertex2f(x + self.number_width, self.position_y + self.number_height)
-                
-                glTexCoord2f(0, 1)
-                glVertex2f(x, self.position_y + self.number_height)
-                
-                glEnd()
-        
-        # Desativa o mapeamento de texturas 2D
-        glDisable(GL_TEXTURE_2D)
-        
-        # Restaura o estado da matriz
-        glPopMatrix() 
\ No newline at end of file
+            # Sprite do dígito (convertendo o caractere para inteiro)
+            batch.draw_region(self.number_sprites[int(digit)], x, self.position_y, self.number_width, self.number_height)
@@ -0,0 +1,140 @@
+"""
+HUD de tempo por quadro para o jogo Flappy Bird
+Mostra um gráfico de barras empilhadas com o tempo de cada grupo de fases nos
+últimos quadros e os percentis 50/95/99 do tempo de quadro em milissegundos
+"""
+
+import sys # type: ignore
+import os # type: ignore
+import typing # type: ignore
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assets import NUMBER_0, NUMBER_1, NUMBER_2, NUMBER_3, NUMBER_4, NUMBER_5, NUMBER_6, NUMBER_7, NUMBER_8, NUMBER_9
+from texture_manager import TextureManager
+from sprite_batch import SpriteBatch
+from frame_timer import FrameTimer
+from components.overlay import Overlay
+
+Color = typing.Tuple[float, float, float, float]
+
+# Cor de cada fase no gráfico; fases vizinhas com a mesma cor viram um só segmento
+PHASE_COLORS: typing.Dict[str, Color] = {
+    "uploads": (0.3, 0.6, 1.0, 1.0),      # Simulação e carregamento: azul
+    "update": (0.3, 0.6, 1.0, 1.0),
+    "background": (0.3, 0.9, 0.3, 1.0),   # Componentes montando o lote: verde
+    "pipes": (0.3, 0.9, 0.3, 1.0),
+    "heart_item": (0.3, 0.9, 0.3, 1.0),
+    "ground": (0.3, 0.9, 0.3, 1.0),
+    "bird": (0.3, 0.9, 0.3, 1.0),
+    "overlays": (0.3, 0.9, 0.3, 1.0),
+    "hud": (0.3, 0.9, 0.3, 1.0),
+    "submit": (1.0, 0.6, 0.1, 1.0),       # Chamadas ao OpenGL: laranja
+    "swap_buffers": (0.9, 0.2, 0.9, 1.0), # Troca de buffers: magenta
+}
+IDLE_COLOR: Color = (0.5, 0.5, 0.5, 0.8)  # Espera e eventos: cinza
+
+class TimingHud(Overlay):
+    """
+    Overlay com o gráfico de tempo por quadro (alternado com F3)
+    """
+
+    BARS: int = 100           # Quadros mostrados no gráfico
+    BAR_WIDTH: float = 2.0
+    GRAPH_HEIGHT: float = 60.0
+    DIGIT_WIDTH: float = 8.0
+    DIGIT_HEIGHT: float = 12.0
+    REFRESH_FRAMES: int = 15  # A cada quantos quadros os percentis são recalculados
+
+    def __init__(self, texture_manager: TextureManager, window_width: float, window_height: float,
+                 frame_timer: FrameTimer, target_frame_time: float):
+        """
+        Inicializa o HUD
+
+        Args:
+            texture_manager: Gerenciador de texturas
+            window_width: Largura da janela
+            window_height: Altura da janela
+            frame_timer: Medidor cujas fases são mostradas
+            target_frame_time: Tempo de quadro desejado em segundos (linha de referência)
+        """
+        super().__init__(texture_manager, window_width, window_height)
+        self.frame_timer = frame_timer
+        self.target_frame_time = target_frame_time
+
+        # O gráfico vai até o dobro do tempo desejado
+        self.scale = self.GRAPH_HEIGHT / (2 * target_frame_time)
+
+        self.number_sprites = [texture_manager.load_sprite(path, f"number_{digit}") for digit, path in enumerate(
+            (NUMBER_0, NUMBER_1, NUMBER_2, NUMBER_3, NUMBER_4, NUMBER_5, NUMBER_6, NUMBER_7, NUMBER_8, NUMBER_9))]
+
+        # Matriz fases -> segmentos: soma as fases vizinhas de mesma cor
+        self.segment_colors: typing.List[Color] = []
+        columns: typing.List[int] = []
+        for phase in frame_timer.phases:
+            color = PHASE_COLORS.get(phase, IDLE_COLOR)
+            if not self.segment_colors or self.segment_colors[-1] != color:
+                self.segment_colors.append(color)
+            columns.append(len(self.segment_colors) - 1)
+        self._segments = np.zeros((len(columns), len(self.segment_colors)))
+        self._segments[np.arange(len(columns)), columns] = 1.0
+
+        self._percentiles: typing.List[float] = []
+        self._refreshed_at: int = -self.REFRESH_FRAMES
+
+    def _render_impl(self, batch: SpriteBatch) -> None:
+        """
+        Renderiza o painel, o gráfico e os percentis
+
+        Args:
+            batch: Lote de sprites do quadro atual
+        """
+        timer = self.frame_timer
+        # Painel no canto inferior esquerdo, sobre o chão (longe da pontuação e das vidas)
+        left = 8.0
+        bottom = 10.0
+        width = self.BARS * self.BAR_WIDTH
+        batch.draw_rect(left - 4, bottom - 4, width + 8, self.GRAPH_HEIGHT + self.DIGIT_HEIGHT + 14,
+                        (0.0, 0.0, 0.0, 0.6))
+
+        # Barras empilhadas: os quadros mais recentes ficam à direita
+        graph_y = bottom + self.DIGIT_HEIGHT + 6
+        stacks = np.cumsum(timer.recent(self.BARS) @ self._segments, axis=1) * self.scale
+        np.minimum(stacks, self.GRAPH_HEIGHT, out=stacks)
+        bar_x = left + width - np.arange(len(stacks), 0, -1) * self.BAR_WIDTH
+        base = np.zeros(len(stacks))
+        for column, color in enumerate(self.segment_colors):
+            top = stacks[:, column]
+            shown = top > base
+            batch.draw_rects(bar_x[shown], graph_y + base[shown], self.BAR_WIDTH, (top - base)[shown], color)
+            base = top
+
+        # Linha do tempo de quadro desejado
+        batch.draw_rect(left, graph_y + self.target_frame_time * self.scale, width, 1.0, (1.0, 1.0, 1.0, 0.8))
+
+        # Percentis 50/95/99 do tempo de quadro, em ms
+        if timer.frames - self._refreshed_at >= self.REFRESH_FRAMES:
+            frame_times = timer.frame_times()
+            self._percentiles = np.percentile(frame_times, (50, 95, 99)).tolist() if len(frame_times) else []
+            self._refreshed_at = timer.frames
+        x = left
+        for value in self._percentiles:
+            x = self._draw_number(batch, value * 1000.0, x, bottom) + self.DIGIT_WIDTH * 2
+
+    def _draw_number(self, batch: SpriteBatch, value: float, x: float, y: float) -> float:
+        """
+        Desenha um número com uma casa decimal usando os sprites dos dígitos
+
+        Returns:
+            Posição x logo após o número
+        """
+        for char in f"{value:.1f}":
+            if char == ".":
+                batch.draw_rect(x + 1, y, 2, 2, (1.0, 1.0, 1.0, 1.0))
+                x += 4
+            else:
+                batch.draw_region(self.number_sprites[int(char)], x, y, self.DIGIT_WIDTH, self.DIGIT_HEIGHT)
+                x += self.DIGIT_WIDTH + 1
+        return x
@@ -15,7 +15,7 @@ INITIAL_PIPE_SPEED: float = INITIAL_GAME_SPEED
 # --- Configurações Atuais (Podem mudar durante o jogo) ---
 GROUND_HEIGHT: float = 110.0
 GAME_SPEED: float = INITIAL_GAME_SPEED  # Velocidade atual do chão
-INITIAL_PIPE_SPAWN_INTERVAL: float = 1.5 # Intervalo inicial para spawn dos canos
+INITIAL_PIPE_SPAWN_INTERVAL: float = 1.5 # Intervalo entre os pares na velocidade inicial (define PIPE_SPACING)
 PIPE_INTERVAL: float = 1.5 # Intervalo mantido por compatibilidade
 BIRD_VELOCITY: float = 300.0 
 GRAVITY: float = -700.0 
@@ -24,7 +24,9 @@ CLOUDS_HEIGHT: float = 70.0
 # Configurações dos Canos
 PIPE_SPEED: float = INITIAL_PIPE_SPEED # Velocidade atual de movimento dos canos
 PIPE_GAP: float = 150.0 
-PIPE_SPAWN_INTERVAL: float = INITIAL_PIPE_SPAWN_INTERVAL # Intervalo atual para spawn dos canos
+PIPE_SPAWN_INTERVAL: float = INITIAL_PIPE_SPAWN_INTERVAL # Mantido por compatibilidade (os canos surgem por distância, ver PIPE_SPACING)
+PIPE_SPACING: float = INITIAL_PIPE_SPEED * INITIAL_PIPE_SPAWN_INTERVAL # Distância em pixels entre os pares, igual em qualquer velocidade
+PIPE_SPACING_JITTER: float = 40.0 # Variação máxima em pixels da distância até o par seguinte
 PIPE_WIDTH: float = 70.0 
 PIPE_HEIGHT: float = 400.0 
 
@@ -40,6 +42,13 @@ SCORE_NUMBER_WIDTH: float = 36.0  # Largura dos números do score
 SCORE_NUMBER_HEIGHT: float = 56.0  # Altura dos números do score
 SCORE_NUMBER_SPACING: float = 2.0  # Espaçamento entre os números do score
 
+# Configurações de Texto
+FONT_PATH: str = ""  # Arquivo .ttf/.otf dos textos dos overlays (vazio = fonte embutida no Pillow)
+INFO_TEXT_SIZE: int = 18  # Tamanho da instrução da tela inicial
+BUTTON_TEXT_SIZE: int = 18  # Tamanho do texto do botão de restart
+SCORE_TEXT_SIZE: int = 24  # Tamanho da pontuação final no Game Over
+TEXT_SHADOW_COLOR: tuple = (0.0, 0.0, 0.0, 0.8)  # Sombra dos textos sobre o cenário
+
 # Configurações de Itens
 HEART_ITEM_FREQUENCY: int = 20  # A cada quantos pontos aparece um item de vida
 HEART_ITEM_WIDTH: float = 40.0  # Largura do item de coração
@@ -50,3 +59,52 @@ HEART_ITEM_FLOAT_SPEED: float = 2.0  # Velocidade da flutuação do item
 # Configurações de Dificuldade
 SPEED_INCREASE_FREQUENCY: int = 5  # A cada quantos pontos a velocidade aumenta
 SPEED_INCREASE_MULTIPLIER: float = 1.10  # Fator de aumento da velocidade (10%)
+DIFFICULTY_TIERS: int = 32  # Níveis da tabela de dificuldade gerada; no último a velocidade para de subir
+# Tabela de dificuldade: (pontuação em que o nível começa, multiplicador das velocidades
+# iniciais), em ordem e começando em 0. Gerada com as constantes acima; pode ser
+# trocada por uma lista escrita à mão (ver simulation/difficulty.py)
+DIFFICULTY_SCHEDULE: list[tuple[int, float]] = [
+    (tier * SPEED_INCREASE_FREQUENCY, SPEED_INCREASE_MULTIPLIER ** tier) for tier in range(DIFFICULTY_TIERS)]
+
+# Configurações de Simulação
+SIMULATION_RATE: int = 120  # Passos de simulação por segundo (independente da taxa de quadros)
+MAX_STEPS_PER_FRAME: int = 6  # Máximo de passos por quadro; o tempo além disso é descartado (evita a espiral da morte)
+PIXEL_COLLISION: bool = True  # Colisões pelos pixels opacos dos sprites (False = caixa de 2/3 do pássaro)
+COLLISION_MASK_ROTATION_STEP: float = 1.0  # Largura em graus de cada faixa de rotação das máscaras do pássaro
+COLLISION_MASK_ALPHA_THRESHOLD: int = 128  # Alpha mínimo (0-255) para um pixel contar na colisão
+REWIND_SECONDS: float = 10.0  # Tempo de jogo guardado para voltar no tempo (Backspace)
+REWIND_MEMORY: int = 1_000_000  # Bytes reservados para o histórico de rewind (fixo; os passos mais antigos são descartados)
+REWIND_KEYFRAME_INTERVAL: int = 120  # A cada quantos passos o histórico guarda um estado inteiro (os demais guardam diferenças)
+REWIND_SPEED: float = 2.0  # Velocidade do rewind em relação ao tempo real
+AUTOPILOT_HORIZON: float = 0.75  # Tempo à frente explorado pelo piloto automático, em segundos
+AUTOPILOT_DECISION_TICKS: int = 6  # Passos de simulação entre duas decisões do piloto automático
+AUTOPILOT_BEAM_WIDTH: int = 24  # Caminhos mantidos por nível da busca do piloto automático
+AUTOPILOT_BUDGET: float = 0.002  # Tempo máximo de uma busca do piloto automático, em segundos
+AUTOPILOT_MARGIN: float = 2.0  # Folga em pixels em volta do pássaro nas colisões previstas pelo piloto
+REACHABILITY_CHECK: bool = True  # Sorteia de novo os vãos que não podem ser alcançados a partir do par anterior
+REACHABILITY_HORIZON: float = 2.0  # Maior tempo (s) entre entrar em um par e no seguinte coberto pelas tabelas de alcance
+REACHABILITY_RESOLUTION: float = 2.0  # Distância em pixels entre os vãos de origem tabelados
+REACHABILITY_MARGIN: float = 1.0  # Folga em pixels em volta do pássaro nas tabelas de alcance
+REACHABILITY_TIERS: int = 16  # Níveis de velocidade gerados de antemão; o gerador de percurso usa o último para os pares além dele
+REACHABILITY_CACHE_DIRECTORY: str = "cache"  # Pasta das tabelas de alcance geradas, relativa à raiz do projeto
+REPLAY_RECORDING: bool = True  # Grava a semente e as entradas de cada sessão para verificação posterior
+REPLAY_DIRECTORY: str = "replays"  # Pasta dos replays, relativa à raiz do projeto
+REPLAY_MAX_SECONDS: float = 3600.0  # Duração máxima de uma sessão gravada aceita pelo verificador
+
+# Configurações de Quadros
+VSYNC: bool = True  # Sincroniza a troca de buffers com a atualização do monitor
+TARGET_FPS: float = 144.0  # Limite de quadros por segundo durante a partida (0 = sem limite além do vsync)
+IDLE_FPS: float = 30.0  # Quadros por segundo no menu e no Game Over (teclas e cliques acordam o loop na hora)
+FRAME_SPIN_TIME: float = 0.002  # Final da espera entre quadros feito em laço ativo, para acordar no prazo (s)
+
+# Configurações de Medição
+TIMING_HISTORY: int = 600  # Quadros guardados pelo medidor de tempo por fase (HUD com F3)
+TIMING_DIRECTORY: str = "timings"  # Pasta das exportações em CSV/JSON (F4), relativa à raiz do projeto
+
+# Configurações de Carregamento
+ASSET_UPLOAD_BUDGET: float = 0.004  # Tempo máximo por quadro enviando texturas ao OpenGL durante o carregamento (s)
+ASSET_UPLOAD_USE_PBO: bool = False  # Envia as texturas por pixel buffer objects
+COURSE_CHUNK: int = 16  # Pares gerados de uma vez pelo gerador de percurso
+COURSE_LOOKAHEAD: int = 16  # Pares do percurso já gerados à frente do último par criado
+COURSE_NAME: str = ""  # Percurso nomeado (desafio diário, torneio) carregado de COURSE_DIRECTORY; vazio = gerado pela semente da sessão
+COURSE_DIRECTORY: str = "courses"  # Pasta dos percursos nomeados, relativa à raiz do projeto
@@ -0,0 +1,119 @@
+"""
+Controle do ritmo de quadros do jogo Flappy Bird
+Limita os quadros por segundo esperando até o prazo do próximo quadro: dorme
+a maior parte do tempo e faz só o final da espera em laço ativo, para acordar
+no instante certo sem ocupar a CPU. Em telas paradas (menu, Game Over) a
+espera é feita com glfw.wait_events_timeout, que acorda na hora se chegar
+uma tecla ou clique (e já processa os eventos da janela).
+"""
+
+import glfw # type: ignore
+import time
+import typing
+
+class FramePacer:
+    """
+    Agenda os quadros em prazos fixos (1 / fps) e mede o quanto cada prazo foi cumprido
+    """
+
+    def __init__(self, target_fps: float, idle_fps: float, spin_time: float = 0.002,
+                 clock: typing.Callable[[], float] = time.perf_counter):
+        """
+        Inicializa o agendador
+
+        Args:
+            target_fps: Limite de quadros por segundo durante a partida (0 = sem limite)
+            idle_fps: Quadros por segundo nas telas paradas
+            spin_time: Máximo da parte final da espera feita em laço ativo, em segundos;
+                a parte usada se ajusta à precisão medida do time.sleep
+            clock: Relógio de alta resolução
+        """
+        self.target_fps = target_fps
+        self.idle_fps = idle_fps
+        self.spin_time = spin_time
+        self.clock = clock
+        self._deadline: typing.Optional[float] = None
+
+        # Maior atraso recente do time.sleep (começa pessimista e decai para o medido)
+        self._sleep_overshoot: float = spin_time
+
+        # Estatísticas
+        self.frames: int = 0
+        self.idle_frames: int = 0
+        self.missed_frames: int = 0     # Quadros que terminaram depois do prazo
+        self.event_wakeups: int = 0     # Esperas ociosas interrompidas por eventos
+        self.waited_frames: int = 0     # Quadros que esperaram até o prazo
+        self.total_wake_error: float = 0.0 # Soma dos atrasos ao acordar nos quadros que esperaram
+        self.max_wake_error: float = 0.0
+        self.total_wait: float = 0.0    # Tempo total esperando (CPU livre ou em laço ativo)
+
+    def wait(self, idle: bool = False) -> bool:
+        """
+        Espera o prazo do próximo quadro
+
+        Args:
+            idle: Se True, usa o ritmo das telas paradas e acorda com eventos
+
+        Returns:
+            True se os eventos da janela já foram processados durante a espera
+            (caso contrário, o loop ainda precisa chamar glfw.poll_events)
+        """
+        fps = self.idle_fps if idle else self.target_fps
+        now = self.clock()
+        self.frames += 1
+        if idle:
+            self.idle_frames += 1
+
+        if fps <= 0:
+            self._deadline = None
+            return False
+
+        period = 1.0 / fps
+        deadline = now if self._deadline is None else self._deadline + period
+        if deadline <= now:
+            # Quadro atrasado: não tenta recuperar, recomeça os prazos a partir de agora
+            if self._deadline is not None:
+                self.missed_frames += 1
+            self._deadline = now
+            return False
+        self._deadline = deadline
+
+        if idle:
+            glfw.wait_events_timeout(deadline - now)
+            woke = self.clock()
+            if woke < deadline:
+                # Um evento chegou antes: o próximo quadro começa agora
+                self.event_wakeups += 1
+                self._deadline = woke
+        else:
+            spin = min(self.spin_time, self._sleep_overshoot * 2)
+            remaining = deadline - now - spin
+            if remaining > 0:
+                time.sleep(remaining)
+                overshoot = self.clock() - now - remaining
+                self._sleep_overshoot = max(overshoot, self._sleep_overshoot * 0.95)
+            woke = self.clock()
+            while woke < deadline:
+                woke = self.clock()
+
+        self.total_wait += woke - now
+        if woke >= deadline:
+            error = woke - deadline
+            self.waited_frames += 1
+            self.total_wake_error += error
+            self.max_wake_error = max(self.max_wake_error, error)
+        return idle
+
+    def summary(self) -> typing.Dict[str, float]:
+        """
+        Estatísticas atuais como dicionário (atrasos em segundos)
+        """
+        return {
+            'frames': self.frames,
+            'idle_frames': self.idle_frames,
+            'missed_frames': self.missed_frames,
+            'event_wakeups': self.event_wakeups,
+            'mean_wake_error': self.total_wake_error / self.waited_frames if self.waited_frames else 0.0,
+            'max_wake_error': self.max_wake_error,
+            'total_wait': self.total_wait,
+        }
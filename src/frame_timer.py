@@ -0,0 +1,134 @@
+"""
+Medição do tempo de cada fase dos quadros do jogo Flappy Bird
+O loop marca o fim de cada fase com lap(); o tempo desde a marca anterior é
+somado à fase. As marcas são contínuas entre quadros, então a soma das fases
+de um quadro é o tempo total do quadro. Os últimos quadros ficam em um anel
+de tamanho fixo (um array NumPy) que pode ser exportado em CSV ou JSON.
+"""
+
+import csv
+import json
+import time
+import typing
+import numpy as np # type: ignore
+
+class FrameTimer:
+    """
+    Anel com o tempo de cada fase nos últimos quadros
+    """
+
+    def __init__(self, phases: typing.Sequence[str], capacity: int = 600,
+                 clock: typing.Callable[[], float] = time.perf_counter):
+        """
+        Inicializa o medidor
+
+        Args:
+            phases: Nomes das fases, na ordem em que acontecem no quadro
+            capacity: Quantidade de quadros guardados
+            clock: Relógio de alta resolução
+        """
+        self.phases: typing.List[str] = list(phases)
+        self._phase_index: typing.Dict[str, int] = {name: i for i, name in enumerate(self.phases)}
+        self.clock = clock
+        self.samples: np.ndarray = np.zeros((capacity, len(self.phases)), dtype=np.float64)
+        self.frames: int = 0 # Quadros completos registrados
+        self._current: typing.List[float] = [0.0] * len(self.phases)
+        self._last: float = clock()
+
+    @property
+    def capacity(self) -> int:
+        """
+        Quantidade de quadros guardados no anel
+        """
+        return len(self.samples)
+
+    def lap(self, phase: str) -> None:
+        """
+        Soma à fase o tempo desde a marca anterior
+
+        Args:
+            phase: Nome da fase que acabou de terminar
+        """
+        now = self.clock()
+        self._current[self._phase_index[phase]] += now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        """
+        Fecha o quadro atual, guardando suas fases no anel
+        """
+        self.samples[self.frames % len(self.samples)] = self._current
+        self.frames += 1
+        self._current = [0.0] * len(self.phases)
+
+    def recent(self, count: typing.Optional[int] = None) -> np.ndarray:
+        """
+        Fases dos últimos quadros em ordem cronológica
+
+        Args:
+            count: Quantidade de quadros (padrão: todos os guardados)
+
+        Returns:
+            Array (quadros, fases) em segundos
+        """
+        stored = min(self.frames, len(self.samples))
+        count = stored if count is None else min(count, stored)
+        return self.samples[np.arange(self.frames - count, self.frames) % len(self.samples)]
+
+    def frame_times(self, count: typing.Optional[int] = None) -> np.ndarray:
+        """
+        Tempo total dos últimos quadros em segundos, em ordem cronológica
+        """
+        return self.recent(count).sum(axis=1)
+
+    def percentiles(self, values: typing.Sequence[float] = (50, 95, 99)) -> typing.Dict[str, typing.List[float]]:
+        """
+        Percentis do tempo de cada fase e do quadro inteiro nos quadros guardados
+
+        Args:
+            values: Percentis desejados (0 a 100)
+
+        Returns:
+            Dicionário fase -> percentis em segundos, com a chave 'frame' para o total
+        """
+        samples = self.recent()
+        if len(samples) == 0:
+            return {}
+        result = {name: np.percentile(samples[:, i], values).tolist() for i, name in enumerate(self.phases)}
+        result['frame'] = np.percentile(samples.sum(axis=1), values).tolist()
+        return result
+
+    def export_csv(self, path: str) -> None:
+        """
+        Grava os quadros guardados em CSV, uma linha por quadro (tempos em ms)
+
+        Args:
+            path: Caminho do arquivo
+        """
+        samples = self.recent()
+        first = self.frames - len(samples)
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame"] + self.phases + ["total"])
+            for i, row in enumerate(samples * 1000.0):
+                writer.writerow([first + i] + [f"{value:.4f}" for value in row] + [f"{row.sum():.4f}"])
+
+    def export_json(self, path: str) -> None:
+        """
+        Grava em JSON os percentis e os quadros guardados (tempos em ms)
+
+        Args:
+            path: Caminho do arquivo
+        """
+        samples = self.recent()
+        levels = (50, 95, 99)
+        percentiles = {name: [round(value * 1000.0, 4) for value in values]
+                       for name, values in self.percentiles(levels).items()}
+        with open(path, "w") as file:
+            json.dump({
+                "phases": self.phases,
+                "first_frame": self.frames - len(samples),
+                "percentile_levels": list(levels),
+                "percentiles_ms": percentiles,
+                "frames_ms": np.round(samples * 1000.0, 4).tolist(),
+            }, file)
@@ -8,25 +8,48 @@ from OpenGL.GL import * # type: ignore
 from OpenGL.GL import GL_PROJECTION, GL_MODELVIEW, GL_COLOR_BUFFER_BIT # type: ignore
 from OpenGL.GL import glViewport, glMatrixMode, glLoadIdentity, glOrtho, glClearColor, glClear # type: ignore
 from OpenGL.GL import glEnable, glBlendFunc, GL_BLEND, GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA # type: ignore
+import random
 import time
 import sys
+import os
 import typing
-import config # Importa o módulo config inteiro para modificar seus valores
 
 # Importa módulos do jogo
-from config import WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE, MAX_LIVES
-from config import SPEED_INCREASE_FREQUENCY, SPEED_INCREASE_MULTIPLIER, HEART_ITEM_FREQUENCY
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE, MAX_LIVES, ASSET_UPLOAD_BUDGET, ASSET_UPLOAD_USE_PBO
+from config import SIMULATION_RATE, MAX_STEPS_PER_FRAME, REPLAY_RECORDING, REPLAY_DIRECTORY
+from config import REWIND_SECONDS, REWIND_SPEED, COURSE_NAME, PIXEL_COLLISION
+from config import VSYNC, TARGET_FPS, IDLE_FPS, FRAME_SPIN_TIME, TIMING_HISTORY, TIMING_DIRECTORY
+from assets import ATLAS_SPRITES, CACHED_IMAGES, ASSET_CACHE_PATH, cached_arrays, generated_sprites
+from asset_cache import open_asset_cache, bake_asset_cache
+from asset_loader import AssetLoader
+from frame_pacer import FramePacer
+from frame_timer import FrameTimer
 from texture_manager import TextureManager
+from sprite_batch import SpriteBatch
 from components.background import Background
 from components.ground import Ground
 from components.bird import Bird
 from components.pipe import PipeManager
 from components.overlay import StartScreenOverlay, GameOverOverlay, HeartDisplay, ScoreDisplay
 from components.heart_item import HeartItem
+from components.timing_hud import TimingHud
+from simulation.game_simulation import GameSimulation, SimulationInput, SimulationEvent
+from simulation.fixed_timestep import FixedTimestep
+from simulation.replay import ReplayRecorder, save_replay, REPLAY_EXTENSION
+from simulation.rewind import RewindBuffer
+from simulation.autopilot import SearchAutopilot
+from simulation.course import CourseGenerator, course_path, load_course
+from simulation.masks import BirdMasks, bird_masks, cached_bird_masks
+
+# Fases do loop principal medidas por frame_timer, na ordem em que acontecem
+FRAME_PHASES: typing.Tuple[str, ...] = ("uploads", "update", "background", "pipes", "heart_item", "ground", "bird",
+                                        "overlays", "hud", "submit", "swap_buffers", "wait", "poll_events")
 
 # Variáveis globais
-lives: int = MAX_LIVES
 texture_manager: typing.Optional[TextureManager] = None
+asset_loader: typing.Optional[AssetLoader] = None
+sprite_batch: typing.Optional[SpriteBatch] = None
+simulation: typing.Optional[GameSimulation] = None
 background: typing.Optional[Background] = None
 ground: typing.Optional[Ground] = None
 bird: typing.Optional[Bird] = None
@@ -36,12 +59,16 @@ game_over_screen: typing.Optional[GameOverOverlay] = None
 heart_display: typing.Optional[HeartDisplay] = None
 score_display: typing.Optional[ScoreDisplay] = None
 heart_item: typing.Optional[HeartItem] = None
+timestep: typing.Optional[FixedTimestep] = None
+frame_pacer: typing.Optional[FramePacer] = None
+frame_timer: typing.Optional[FrameTimer] = None
+timing_hud: typing.Optional[TimingHud] = None
+replay_recorder: typing.Optional[ReplayRecorder] = None
+rewind_buffer: typing.Optional[RewindBuffer] = None
+autopilot: typing.Optional[SearchAutopilot] = None # Piloto automático (modo demonstração), None se desligado
+game_seed: int = 0 # Semente da sessão atual
 last_time: float = 0
-game_over: bool = False
-score: int = 0
-game_started: bool = False
-last_speed_increase_score: int = 0 # Guarda a última pontuação que causou aumento de velocidade
-last_heart_spawn_score: int = 0 # Guarda a última pontuação que gerou um item de vida
+pending_inputs: int = SimulationInput.NONE # Entradas acumuladas até o próximo update()
 
 # Callback para teclas
 def key_callback(window, key, scancode, action, mods) -> None:
@@ -55,21 +82,25 @@ def key_callback(window, key, scancode, action, mods) -> None:
         action: Ação (pressionar, soltar, etc.)
         mods: Modificadores (shift, ctrl, etc.)
     """
-    global bird, game_over, game_started, start_screen
+    global pending_inputs
     
     # Tecla espaço para pular ou iniciar o jogo
     if key == glfw.KEY_SPACE and action == glfw.PRESS:
-        if not game_started:
-            # Inicia o jogo
-            game_started = True
-            if start_screen:
-                start_screen.hide()
-        elif not game_over and bird:
-            bird.jump()
+        pending_inputs |= SimulationInput.FLAP
     
     # Tecla R para reiniciar o jogo
-    if key == glfw.KEY_R and action == glfw.PRESS and game_over:
+    if key == glfw.KEY_R and action == glfw.PRESS:
         restart_game()
+    
+    # F3 mostra/esconde o HUD de tempo por quadro; F4 exporta as medições
+    if key == glfw.KEY_F3 and action == glfw.PRESS and timing_hud:
+        timing_hud.is_visible = not timing_hud.is_visible
+    if key == glfw.KEY_F4 and action == glfw.PRESS:
+        export_frame_timings()
+    
+    # Tecla A liga/desliga o piloto automático
+    if key == glfw.KEY_A and action == glfw.PRESS:
+        toggle_autopilot()
 
 def mouse_button_callback(window, button, action, mods) -> None:
     """
@@ -81,7 +112,7 @@ def mouse_button_callback(window, button, action, mods) -> None:
         action: Ação (pressionar, soltar)
         mods: Modificadores (shift, ctrl, etc.)
     """
-    global bird, game_over, game_started, start_screen, game_over_screen
+    global pending_inputs
     
     # Obtém a posição do cursor
     x, y = glfw.get_cursor_pos(window)
@@ -89,104 +120,31 @@ def mouse_button_callback(window, button, action, mods) -> None:
     # Clique para pular ou iniciar o jogo
     if button == glfw.MOUSE_BUTTON_LEFT and action == glfw.PRESS:
         # Verifica se o botão de restart foi clicado
-        if game_over and game_over_screen and game_over_screen.is_restart_button_clicked(x, y):
+        if simulation and simulation.game_over and game_over_screen and game_over_screen.is_restart_button_clicked(x, y):
             restart_game()
-        elif not game_started:
-            # Inicia o jogo
-            game_started = True
-            if start_screen:
-                start_screen.hide()
-        elif not game_over and bird:
-            bird.jump()
-
-def restart_game() -> None:
-    global bird, game_over, texture_manager, pipe_manager, score, game_started, game_over_screen
-    global last_speed_increase_score, lives, heart_display, score_display, heart_item, last_heart_spawn_score
-
-    # Se o jogo acabou de verdade, reseta vidas e score
-    if lives <= 0:
-        lives = MAX_LIVES
-        score = 0
-        last_speed_increase_score = 0
-        last_heart_spawn_score = 0
-        config.GAME_SPEED = config.INITIAL_GAME_SPEED
-        config.PIPE_SPEED = config.INITIAL_PIPE_SPEED
-        config.PIPE_SPAWN_INTERVAL = config.INITIAL_PIPE_SPAWN_INTERVAL
-        print(f"Velocidade/Intervalo resetados: Chão={config.GAME_SPEED}, Canos={config.PIPE_SPEED}, Intervalo={config.PIPE_SPAWN_INTERVAL:.2f}")
-
-    game_over = False
-
-    if game_over_screen:
-        game_over_screen.hide()
-
-    if texture_manager:
-        bird = Bird(texture_manager, WINDOW_WIDTH, WINDOW_HEIGHT)
-
-    if pipe_manager:
-        pipe_manager.reset()
-        
-    # Reseta o item de vida
-    if heart_item:
-        heart_item.reset()
-        
-    # Atualiza os displays
-    if heart_display:
-        heart_display.update_lives(lives)
-    if score_display:
-        score_display.update_score(score)
-
-def check_collisions() -> bool:
-    global bird, ground, pipe_manager, game_over, game_over_screen, score, lives, heart_display, heart_item
-
-    if not bird or not ground or not pipe_manager:
-        return False
-
-    hit = False
-
-    if ground.check_collision(bird.collision_rect):
-        hit = True
-
-    bird_hitbox = (bird.collision_rect['x'], bird.collision_rect['y'], bird.collision_rect['width'], bird.collision_rect['height'])
-    if pipe_manager.check_collision(bird_hitbox):
-        hit = True
-
-    if bird.y + bird.height / 2 > WINDOW_HEIGHT:
-        hit = True
-
-    # Verifica colisão com o item de vida
-    if heart_item and heart_item.active and heart_item.is_colliding(bird.collision_rect):
-        # Adiciona uma vida e atualiza o display
-        lives = min(lives + 1, MAX_LIVES)  # Limita ao máximo de vidas
-        if heart_display:
-            heart_display.update_lives(lives)
-        
-        # Toca um som de coleta (opcional)
-        # se tiver um som de coleta, tocar aqui
-        
-        # Desativa o item após coletado
-        heart_item.reset()
-        
-        print(f"Vida extra coletada! Vidas: {lives}")
-
-    if hit:
-        bird.die()
-        lives -= 1
-        print(f"Colidiu! Vidas restantes: {lives}")
-        
-        # Atualiza o display de corações
-        if heart_display:
-            heart_display.update_lives(lives)
-            
-        if lives <= 0:
-            game_over = True
-            if game_over_screen:
-                game_over_screen.show_with_score(score)
         else:
-            # Reinicia automaticamente para próxima vida
-            restart_game()
-        return True
+            pending_inputs |= SimulationInput.FLAP
+
+def toggle_autopilot() -> None:
+    """
+    Liga ou desliga o piloto automático; ao desligar, mostra o desempenho da busca
+    """
+    global autopilot
+    if autopilot is not None:
+        print(f"Piloto automático desligado: {autopilot.plans} buscas, "
+              f"{autopilot.nodes_per_second / 1000:.0f} mil nós/s")
+        autopilot = None
+    elif simulation and not is_loading():
+        # Só depois do carregamento: a caixa do pássaro vem das máscaras de colisão
+        autopilot = SearchAutopilot(simulation, timestep.step if timestep else 1 / SIMULATION_RATE)
+        print("Piloto automático ligado")
 
-    return False
+def restart_game() -> None:
+    """
+    Solicita o reinício do jogo; a simulação só o aplica se estiver em Game Over
+    """
+    global pending_inputs
+    pending_inputs |= SimulationInput.RESTART
 
 def initialize() -> typing.Optional[typing.Any]:
     """
@@ -196,8 +154,7 @@ def initialize() -> typing.Optional[typing.Any]:
     Returns:
         window: Objeto janela GLFW ou False em caso de erro
     """
-    global texture_manager, background, ground, bird, pipe_manager
-    global last_time, start_screen, game_over_screen, heart_display, score_display, heart_item
+    global last_time
     
     # Inicializa GLFW
     if not glfw.init():
@@ -215,6 +172,9 @@ def initialize() -> typing.Optional[typing.Any]:
     # Torna o contexto da janela atual
     glfw.make_context_current(window)
     
+    # Vsync explícito: o padrão varia com o driver
+    glfw.swap_interval(1 if VSYNC else 0)
+    
     # Configura callbacks
     glfw.set_key_callback(window, key_callback)
     glfw.set_mouse_button_callback(window, mouse_button_callback)
@@ -232,8 +192,51 @@ def initialize() -> typing.Optional[typing.Any]:
     glEnable(GL_BLEND)
     glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
     
-    # Inicializa o gerenciador de texturas
-    texture_manager = TextureManager()
+    # As texturas terminam de carregar durante os primeiros quadros
+    create_game_objects(clock=glfw.get_time, wait_for_assets=False)
+    
+    # Inicializa o tempo
+    last_time = glfw.get_time()
+    
+    return window
+
+def create_game_objects(clock: typing.Callable[[], float] = time.perf_counter, seed: typing.Optional[int] = None,
+                        wait_for_assets: bool = True) -> None:
+    """
+    Cria texturas, componentes, overlays e a simulação
+    Requer um contexto OpenGL atual (também usado pelos benchmarks de renderização)
+    
+    Args:
+        clock: Relógio da simulação
+        seed: Semente da partida (aleatória se None)
+        wait_for_assets: Se False, as imagens continuam sendo decodificadas em
+            segundo plano e enviadas a cada quadro por asset_loader.process_uploads()
+    """
+    global texture_manager, asset_loader, sprite_batch, simulation, background, ground, bird, pipe_manager
+    global start_screen, game_over_screen, heart_display, score_display, heart_item, game_seed
+    global frame_timer, timing_hud
+    
+    # Inicializa o gerenciador de texturas e empacota os sprites em um atlas,
+    # para que o quadro inteiro use uma única textura. Os pixels vêm do cache
+    # de assets; sem ele, as imagens são decodificadas em um pool de threads e
+    # os sprites aparecem à medida que ficam prontos
+    arrays = cached_arrays()
+    generated = generated_sprites()
+    cache = open_asset_cache(str(ASSET_CACHE_PATH), ATLAS_SPRITES, CACHED_IMAGES, rebuild=False,
+                             arrays=arrays, generated=generated)
+    texture_manager = TextureManager(cache)
+    asset_loader = AssetLoader(texture_manager, use_pbo=ASSET_UPLOAD_USE_PBO)
+    asset_loader.load_atlas(ATLAS_SPRITES)
+    if cache is None:
+        # Gera o cache para a próxima inicialização, sem atrasar esta
+        asset_loader.submit_after_loading(bake_asset_cache, str(ASSET_CACHE_PATH), ATLAS_SPRITES, CACHED_IMAGES,
+                                          2, 2048, arrays, generated)
+    
+    # Lote de sprites usado por todos os componentes na renderização
+    sprite_batch = SpriteBatch()
+    white_region = texture_manager.get_region("white")
+    if white_region is not None:
+        sprite_batch.white_region = white_region
     
     # Inicializa os componentes do jogo
     background = Background(texture_manager, WINDOW_WIDTH, WINDOW_HEIGHT)
@@ -247,156 +250,361 @@ def initialize() -> typing.Optional[typing.Any]:
     heart_display = HeartDisplay(texture_manager, WINDOW_WIDTH, WINDOW_HEIGHT, MAX_LIVES)
     score_display = ScoreDisplay(texture_manager, WINDOW_WIDTH, WINDOW_HEIGHT)
     
-    # Inicializa o item de vida
-    heart_item = HeartItem(texture_manager, WINDOW_WIDTH, WINDOW_HEIGHT)
+    # A semente é sorteada e guardada para que a sessão possa ser refeita por um
+    # replay. O item de vida sorteia sua posição inicial com o mesmo gerador da
+    # simulação, na mesma ordem de uma GameSimulation(seed=...) sem janela.
+    # Com um percurso nomeado (desafio diário, torneio), a semente é a dele
+    game_seed = seed if seed is not None else random.getrandbits(63)
+    course: typing.Optional[CourseGenerator] = None
+    if COURSE_NAME:
+        try:
+            course = load_course(course_path(COURSE_NAME), pipe_manager._min_pipe_height,
+                                 pipe_manager._max_pipe_height, WINDOW_HEIGHT)
+            game_seed = course.seed
+        except (OSError, ValueError) as e:
+            print(f"Não foi possível carregar o percurso '{COURSE_NAME}': {e}")
+    if course is None:
+        course = CourseGenerator(game_seed, pipe_manager._min_pipe_height, pipe_manager._max_pipe_height,
+                                 WINDOW_HEIGHT)
+    rng = random.Random(game_seed)
     
-    # Inicializa o tempo
-    last_time = glfw.get_time()
+    # Inicializa o item de vida
+    heart_item = HeartItem(texture_manager, WINDOW_WIDTH, WINDOW_HEIGHT, rng)
+    
+    # A simulação usa os próprios componentes como entidades, então renderizar
+    # os componentes é renderizar o estado atual da simulação
+    # As máscaras de colisão do pássaro vêm do cache de assets; sem ele, são
+    # geradas no pool junto com as texturas e ligadas quando chegam (a partida
+    # só começa depois do carregamento, então nenhum passo jogado fica sem elas)
+    masks = cached_bird_masks(cache, bird.width, bird.height) if cache is not None and PIXEL_COLLISION else None
+    simulation = GameSimulation(WINDOW_WIDTH, WINDOW_HEIGHT, clock=clock, rng=rng,
+                                bird=bird, pipes=pipe_manager, ground=ground, heart_item=heart_item,
+                                pixel_collision=masks is not None, course=course, masks=masks)
+    if PIXEL_COLLISION and masks is None:
+        game = simulation
+
+        def attach_masks(loaded: BirdMasks) -> None:
+            game.bird_masks = loaded
+        asset_loader.load_task(attach_masks, bird_masks, bird.width, bird.height)
+    if wait_for_assets:
+        asset_loader.finish()
+    
+    # Medição do tempo de cada fase do quadro e o HUD que a exibe (F3)
+    frame_timer = FrameTimer(FRAME_PHASES, TIMING_HISTORY)
+    timing_hud = TimingHud(texture_manager, WINDOW_WIDTH, WINDOW_HEIGHT, frame_timer,
+                           1.0 / (TARGET_FPS if TARGET_FPS > 0 else 60.0))
+
+def mark_phase(phase: str) -> None:
+    """
+    Marca o fim de uma fase do quadro em frame_timer (se existir)
     
-    return window
+    Args:
+        phase: Nome da fase, um de FRAME_PHASES
+    """
+    if frame_timer:
+        frame_timer.lap(phase)
+
+def export_frame_timings() -> None:
+    """
+    Exporta os quadros medidos para CSV e JSON em TIMING_DIRECTORY
+    """
+    if not frame_timer:
+        return
+    directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), TIMING_DIRECTORY)
+    path = os.path.join(directory, time.strftime("%Y%m%d-%H%M%S"))
+    try:
+        os.makedirs(directory, exist_ok=True)
+        frame_timer.export_csv(path + ".csv")
+        frame_timer.export_json(path + ".json")
+        print(f"Tempos de quadro exportados em '{path}.csv' e '{path}.json'")
+    except OSError as e:
+        print(f"Erro ao exportar os tempos de quadro: {e}")
+
+def is_loading() -> bool:
+    """
+    Indica se ainda há texturas sendo carregadas
+    """
+    return asset_loader is not None and not asset_loader.done
+
+def is_idle() -> bool:
+    """
+    Indica se a tela está parada (menu ou Game Over), onde o loop pode
+    desenhar menos quadros e dormir até a próxima tecla ou clique
+    """
+    return (simulation is not None and not is_loading() and
+            (not simulation.game_started or simulation.game_over))
 
 def update(delta_time: float) -> None:
     """
     Atualiza o estado do jogo
     
     Args:
-        delta_time: Tempo desde o último quadro em segundos
+        delta_time: Duração do passo de simulação em segundos
     """
-    global ground, bird, pipe_manager, game_over, score, game_started
-    global last_speed_increase_score, score_display, heart_item, last_heart_spawn_score
+    global pending_inputs
     
-    # Atualiza o chão apenas se o jogo não terminou
-    if ground and not game_over:
-        ground.update(delta_time)
+    if not simulation:
+        return
+    
+    # Enquanto as texturas carregam o jogo não começa (os sprites ainda não aparecem)
+    if is_loading():
+        pending_inputs = SimulationInput.NONE
+    elif autopilot is not None:
+        # O piloto automático joga junto com as entradas do jogador
+        pending_inputs |= autopilot.act()
+    
+    if replay_recorder:
+        replay_recorder.record(simulation.ticks, pending_inputs)
+    
+    # Avança a simulação com as entradas recebidas desde o último passo (o
+    # passo guarda antes o estado que a renderização usa para interpolar)
+    was_game_over = simulation.game_over
+    events = simulation.step(delta_time, pending_inputs)
+    pending_inputs = SimulationInput.NONE
+    
+    # Guarda o estado para o rewind enquanto a partida está em andamento; uma
+    # nova partida depois do Game Over não volta para a anterior
+    if rewind_buffer is not None:
+        if was_game_over and not simulation.game_over:
+            rewind_buffer.clear()
+        if simulation.game_started and not simulation.game_over:
+            rewind_buffer.record(simulation)
+    
+    if events:
+        handle_events(events)
+
+def rewind_game(steps: int) -> None:
+    """
+    Volta a partida alguns passos no tempo (tecla Backspace pressionada); ao
+    soltar a tecla, o jogo continua do ponto restaurado
     
-    # Se o jogo ainda não começou, aguarda ação do usuário
-    if not game_started:
+    Args:
+        steps: Quantos passos de simulação voltar
+    """
+    if not simulation or rewind_buffer is None or not rewind_buffer.rewind(simulation, steps):
         return
-        
-    if not game_over:
-        # Atualiza o pássaro
-        if bird:
-            bird.update(delta_time)
-            
-        # Atualiza o item de vida
-        if heart_item:
-            heart_item.update(delta_time)
-            
-        # Atualiza os canos e verifica pontuação
-        if pipe_manager:
-            pipe_manager.update(delta_time)
-            if bird:
-                points = pipe_manager.check_score(bird.x)
-                if points > 0:
-                    score += points
-                    print(f"Pontuação: {score}")
-                    
-                    # Atualiza o display de pontuação
-                    if score_display:
-                        score_display.update_score(score)
-                    
-                    # Verifica se deve aumentar a velocidade (a cada SPEED_INCREASE_FREQUENCY pontos)
-                    if score > 0 and score % SPEED_INCREASE_FREQUENCY == 0 and score > last_speed_increase_score:
-                        speed_multiplier = SPEED_INCREASE_MULTIPLIER
-                        config.GAME_SPEED *= speed_multiplier
-                        config.PIPE_SPEED *= speed_multiplier
-                        config.PIPE_SPAWN_INTERVAL /= speed_multiplier # Diminui o intervalo
-                        print(f"Score {score}: Aumentando velocidade! Nova: Chão={config.GAME_SPEED:.2f}, Canos={config.PIPE_SPEED:.2f}, Intervalo={config.PIPE_SPAWN_INTERVAL:.2f}")
-                        last_speed_increase_score = score # Atualiza a última pontuação que aumentou a velocidade
-                    
-                    # Verifica se deve spawnar um item de vida extra (a cada HEART_ITEM_FREQUENCY pontos)
-                    if (score > 0 and score % HEART_ITEM_FREQUENCY == 0 and 
-                        score > last_heart_spawn_score and heart_item and not heart_item.active):
-                        heart_item.spawn()
-                        last_heart_spawn_score = score
-                        print(f"Score {score}: Spawning vida extra!")
-            
-        # Verifica colisões
-        check_collisions()
-    else:
-        # Mesmo quando o jogo acabar, o pássaro continua atualizando para cair
-        if bird:
-            bird.update(delta_time)
-    
-def render() -> None:
+    
+    # As entradas gravadas depois do ponto restaurado não aconteceram mais
+    if replay_recorder:
+        replay_recorder.truncate(simulation.ticks)
+    
+    if game_over_screen and not simulation.game_over:
+        game_over_screen.hide()
+    if heart_display:
+        heart_display.update_lives(simulation.lives)
+    if score_display:
+        score_display.update_score(simulation.score)
+
+def handle_events(events: int) -> None:
+    """
+    Reflete os eventos da simulação nos overlays e no console
+    
+    Args:
+        events: Combinação de bits de SimulationEvent
+    """
+    if not simulation:
+        return
+    
+    if events & SimulationEvent.STARTED and start_screen:
+        start_screen.hide()
+    
+    if events & SimulationEvent.SCORED:
+        print(f"Pontuação: {simulation.score}")
+    if events & SimulationEvent.SPEED_UP:
+        difficulty = simulation.difficulty
+        print(f"Score {simulation.score}: Aumentando velocidade! Nível {difficulty.tier}: Chão={difficulty.game_speed:.2f}, Canos={difficulty.pipe_speed:.2f}, Espaçamento={difficulty.spacing:.0f}")
+    if events & SimulationEvent.HEART_SPAWNED:
+        print(f"Score {simulation.score}: Spawning vida extra!")
+    if events & SimulationEvent.HEART_COLLECTED:
+        print(f"Vida extra coletada! Vidas: {simulation.lives}")
+    if events & SimulationEvent.HIT:
+        print(f"Colidiu! Vidas restantes: {simulation.lives}")
+    
+    if events & SimulationEvent.GAME_OVER and game_over_screen:
+        game_over_screen.show_with_score(simulation.score)
+    elif events & SimulationEvent.RESTARTED and game_over_screen:
+        game_over_screen.hide()
+    
+    # Atualiza os displays
+    if heart_display:
+        heart_display.update_lives(simulation.lives)
+    if score_display:
+        score_display.update_score(simulation.score)
+    
+def render(alpha: float = 1.0) -> None:
     """
     Renderiza um quadro do jogo
+    
+    Args:
+        alpha: Fração entre o passo anterior (0) e o atual (1) da simulação;
+            as posições do pássaro, dos canos, do chão e do item são interpoladas
     """
     # Limpa o buffer com uma cor de fundo
     glClearColor(0.0, 0.0, 0.0, 1.0)
     glClear(GL_COLOR_BUFFER_BIT)
     
+    if not sprite_batch:
+        return
+    
+    game_started = simulation is not None and simulation.game_started
+    
+    # Os componentes apenas registram sprites no lote; tudo é enviado e
+    # desenhado de uma vez em sprite_batch.end()
+    sprite_batch.begin()
+    
     # Renderiza componentes na ordem correta (de trás para frente)
     if background:
-        background.render()
+        background.render(sprite_batch)
+    mark_phase("background")
     
     # Renderiza os canos apenas se o jogo já começou
     if game_started and pipe_manager:
-        pipe_manager.render()
+        pipe_manager.render(sprite_batch, alpha)
+    mark_phase("pipes")
     
     # Renderiza o item de vida, se estiver ativo
     if game_started and heart_item and heart_item.active:
-        heart_item.render()
+        heart_item.render(sprite_batch, alpha)
+    mark_phase("heart_item")
     
     if ground:
-        ground.render()
+        ground.render(sprite_batch, alpha)
+    mark_phase("ground")
     
     if bird:
-        bird.render()
+        bird.render(sprite_batch, alpha)
+    mark_phase("bird")
     
     # Renderiza os overlays se estiverem visíveis
     if start_screen:
-        start_screen.render()
+        start_screen.render(sprite_batch)
         
     if game_over_screen:
-        game_over_screen.render()
+        game_over_screen.render(sprite_batch)
         
     # Renderiza o display de corações sempre que o jogo estiver em andamento
     if heart_display and game_started:
-        heart_display.render()
+        heart_display.render(sprite_batch)
         
     # Renderiza o display de pontuação se o jogo estiver em andamento
     if score_display and game_started:
-        score_display.render()
+        score_display.render(sprite_batch)
+    
+    # Barra de progresso enquanto as texturas carregam
+    if asset_loader and not asset_loader.done:
+        bar_width = WINDOW_WIDTH * 0.6
+        bar_x = (WINDOW_WIDTH - bar_width) / 2
+        sprite_batch.draw_rect(bar_x, 40, bar_width, 8, (0.2, 0.2, 0.2, 1.0))
+        sprite_batch.draw_rect(bar_x, 40, bar_width * asset_loader.progress, 8, (1.0, 1.0, 1.0, 1.0))
+    mark_phase("overlays")
+    
+    if timing_hud:
+        timing_hud.render(sprite_batch)
+    mark_phase("hud")
+    
+    sprite_batch.end()
+    mark_phase("submit")
+
+def save_session_replay(recorder: ReplayRecorder, game: GameSimulation) -> None:
+    """
+    Grava o replay da sessão em REPLAY_DIRECTORY
+    
+    Args:
+        recorder: Gravador usado durante a sessão
+        game: Simulação gravada
+    """
+    directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), REPLAY_DIRECTORY)
+    path = os.path.join(directory, time.strftime("%Y%m%d-%H%M%S") + REPLAY_EXTENSION)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        save_replay(path, recorder.finish(game))
+        print(f"Replay salvo em '{path}'")
+    except OSError as e:
+        print(f"Erro ao salvar o replay: {e}")
 
 def main() -> None:
     """
     Função principal do jogo
     """
-    global last_time
+    global last_time, timestep, frame_pacer, replay_recorder, rewind_buffer
     
     # Inicializa o jogo
     window = initialize()
     if not window:
         return
     
+    # A simulação avança em passos fixos, independentes da taxa de quadros
+    timestep = FixedTimestep(SIMULATION_RATE, MAX_STEPS_PER_FRAME)
+    frame_pacer = FramePacer(TARGET_FPS, IDLE_FPS, FRAME_SPIN_TIME)
+    if REPLAY_RECORDING:
+        replay_recorder = ReplayRecorder(game_seed, timestep.step)
+    if REWIND_SECONDS > 0:
+        rewind_buffer = RewindBuffer(REWIND_SECONDS, SIMULATION_RATE)
+    
     # Loop principal
     while not glfw.window_should_close(window):
-        # Calcula o delta time
+        # Calcula o tempo real do quadro
         current_time = glfw.get_time()
-        delta_time = current_time - last_time
+        frame_time = current_time - last_time
         last_time = current_time
         
-        # Limita o delta time para evitar problemas com pausas ou debugger
-        delta_time = min(delta_time, 0.05)
+        # Envia ao OpenGL as texturas que já foram decodificadas
+        if asset_loader and not asset_loader.done:
+            asset_loader.process_uploads(ASSET_UPLOAD_BUDGET)
+        mark_phase("uploads")
         
-        # Atualiza o estado do jogo
-        update(delta_time)
+        # Executa os passos de simulação que cabem no tempo acumulado (no máximo
+        # MAX_STEPS_PER_FRAME; o excedente de um travamento é descartado).
+        # Com Backspace pressionado, os passos voltam no histórico
+        steps = timestep.advance(frame_time)
+        rewinding = glfw.get_key(window, glfw.KEY_BACKSPACE) == glfw.PRESS
+        if rewinding:
+            rewind_game(round(steps * REWIND_SPEED))
+        else:
+            for _ in range(steps):
+                update(timestep.step)
+        mark_phase("update")
         
-        # Renderiza o quadro atual
-        render()
+        # Renderiza o quadro interpolando entre os dois últimos passos (no
+        # rewind, o estado restaurado exato)
+        render(1.0 if rewinding else timestep.alpha)
         
         # Troca os buffers de front e back
         glfw.swap_buffers(window)
+        mark_phase("swap_buffers")
         
-        # Processa eventos
-        glfw.poll_events()
+        # Espera o prazo do próximo quadro (no menu e no Game Over, com menos
+        # quadros e acordando com eventos) e processa os eventos
+        events_processed = frame_pacer.wait(is_idle())
+        mark_phase("wait")
+        if not events_processed:
+            glfw.poll_events()
+        mark_phase("poll_events")
+        if frame_timer:
+            frame_timer.end_frame()
         
         # Escape para sair
         if glfw.get_key(window, glfw.KEY_ESCAPE) == glfw.PRESS:
             glfw.set_window_should_close(window, True)
     
+    counters = timestep.summary()
+    print(f"Simulação: {counters['steps']} passos em {counters['frames']} quadros "
+          f"({counters['merged_steps']} agrupados, {counters['idle_frames']} quadros sem passo, "
+          f"{counters['dropped_steps']} descartados)")
+    
+    pacing = frame_pacer.summary()
+    print(f"Quadros: {pacing['frames']} ({pacing['idle_frames']} ociosos, {pacing['missed_frames']} fora do prazo), "
+          f"atraso ao acordar {pacing['mean_wake_error'] * 1e6:.0f} µs em média e "
+          f"{pacing['max_wake_error'] * 1e6:.0f} µs no máximo, {pacing['total_wait']:.1f} s esperando")
+    
+    if replay_recorder and simulation and simulation.game_started:
+        save_session_replay(replay_recorder, simulation)
+    
     # Limpa os recursos
+    if sprite_batch:
+        sprite_batch.cleanup()
+    if asset_loader:
+        asset_loader.shutdown()
     if texture_manager:
         texture_manager.cleanup()
         
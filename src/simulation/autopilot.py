@@ -0,0 +1,287 @@
+"""
+Piloto automático por busca: a cada poucos passos decide entre pular ou não
+com uma busca em feixe (beam search) sobre a física do jogo
+
+Cada nó da busca é só o estado que a decisão muda (altura e velocidade do
+pássaro, passos sobrevividos e a primeira jogada do caminho); o resto do mundo
+é previsível dentro do horizonte: os canos andam juntos com velocidade
+constante e o pássaro só se move na vertical. Assim clonar um nó é copiar
+algumas posições de arrays do NumPy, e um nível inteiro do feixe (todos os
+nós, todos os passos até a próxima decisão) é avançado com poucas operações
+vetorizadas, em vez de copiar a GameSimulation inteira (snapshot/restore)
+por nó. Usado no modo de demonstração da janela e, sem janela, como
+referência de desempenho para medir a dificuldade.
+"""
+
+import sys
+import os
+import time
+import typing
+import numpy as np # type: ignore
+from concurrent.futures import Future
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import BIRD_VELOCITY, GRAVITY, PIPE_GAP, SIMULATION_RATE
+from config import AUTOPILOT_HORIZON, AUTOPILOT_DECISION_TICKS, AUTOPILOT_BEAM_WIDTH, AUTOPILOT_BUDGET, AUTOPILOT_MARGIN
+from simulation.game_simulation import GameSimulation, SimulationInput
+from simulation.reachability import ReachabilityTable, prefetch_reachability_table
+
+def _score(y: np.ndarray, survived: np.ndarray, target: float) -> np.ndarray:
+    """
+    Nota dos nós do feixe: vivos primeiro, depois quem sobreviveu mais passos;
+    no empate, quem está mais perto da altura alvo (centro do próximo vão)
+    """
+    return np.where(survived < 0, 1e9, survived * 1e3) - np.abs(y - target)
+
+class SearchAutopilot:
+    """
+    Escolhe as entradas de uma GameSimulation por busca em feixe
+    """
+
+    def __init__(self, simulation: GameSimulation, step: float = 1 / SIMULATION_RATE,
+                 horizon: float = AUTOPILOT_HORIZON, decision_ticks: int = AUTOPILOT_DECISION_TICKS,
+                 beam_width: int = AUTOPILOT_BEAM_WIDTH, budget: typing.Optional[float] = AUTOPILOT_BUDGET,
+                 margin: float = AUTOPILOT_MARGIN, restart: bool = True, prune: bool = True):
+        """
+        Inicializa o piloto
+
+        Args:
+            simulation: Simulação controlada
+            step: Duração do passo fixo em segundos
+            horizon: Quanto tempo à frente a busca olha, em segundos
+            decision_ticks: Passos entre duas decisões (cada nível do feixe)
+            beam_width: Nós mantidos em cada nível
+            budget: Tempo máximo de uma busca em segundos, conferido durante cada nível;
+                ao estourar, decide com os níveis completos já explorados (None = sem
+                limite, resultado determinístico)
+            margin: Folga em pixels somada à caixa do pássaro
+            restart: Reinicia sozinho após o Game Over (modo de demonstração)
+            prune: Descarta os nós que o oráculo de alcance (simulation.reachability)
+                diz que não atravessam mais o próximo par, mesmo além do horizonte
+        """
+        self.simulation = simulation
+        self.step = step
+        self.decision_ticks = decision_ticks
+        self.levels = max(1, int(round(horizon / (decision_ticks * step))))
+        self.beam_width = beam_width
+        self.budget = budget
+        self.restart = restart
+        self.prune = prune
+
+        # Caixa do pássaro em relação ao centro: a união das máscaras de pixels
+        # de todos os quadros e rotações (ou a hitbox, sem colisão por pixel)
+        bird = simulation.bird
+        if simulation.bird_masks is not None:
+            left, bottom, right, top = simulation.bird_masks.bounds()
+        else:
+            x, y, w, h = bird.hitbox
+            left, right, bottom, top = x - bird.x, x + w - bird.x, y - bird.y, y + h - bird.y
+        self._left = left - margin
+        self._right = right + margin
+        self._bottom = bottom - margin
+        self._top = top + margin
+        self._ceiling = simulation.window_height - bird.height / 2 - margin
+        ground = simulation.ground.collision_rect
+        self._ground = ground['y'] + ground['height']
+
+        # Deslocamentos de cada passo de um nível, pela mesma integração de
+        # BirdBody.update (v += g dt; y += v dt) em forma fechada
+        ticks = np.arange(1, decision_ticks + 1, dtype=np.float64)
+        self._ticks = ticks
+        self._travel = ticks * step
+        self._fall = GRAVITY * step * step * ticks * (ticks + 1) / 2
+
+        # Tabela de alcance do nível de dificuldade atual, trocada fora da busca
+        # quando o nível muda (ver _update_table)
+        self._table: typing.Optional[ReachabilityTable] = None
+        self._pending_table: typing.Optional["Future[ReachabilityTable]"] = None
+        self._table_version: int = -1
+        self._update_table()
+
+        # Estatísticas acumuladas das buscas
+        self.plans: int = 0
+        self.nodes: int = 0
+        self.plan_time: float = 0.0
+        self.last_plan_time: float = 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        """
+        Nós expandidos por segundo de busca
+        """
+        return self.nodes / self.plan_time if self.plan_time > 0 else 0.0
+
+    def reset_stats(self) -> None:
+        """
+        Zera as estatísticas das buscas
+        """
+        self.plans = self.nodes = 0
+        self.plan_time = self.last_plan_time = 0.0
+
+    def _request_table(self, speed: float) -> "Future[ReachabilityTable]":
+        """
+        Pede em segundo plano a tabela de alcance de uma velocidade dos canos
+        """
+        simulation = self.simulation
+        pipes = simulation.pipes
+        return prefetch_reachability_table(speed, pipes._min_pipe_height, pipes._max_pipe_height, self.step,
+                                           simulation.window_height, simulation.bird_masks is not None)
+
+    def _update_table(self) -> None:
+        """
+        Troca a tabela de alcance quando o nível de dificuldade muda e já pede
+        a do nível seguinte. Carregar (~0,5 ms) ou gerar (~100 ms) uma tabela
+        fica em uma thread: com orçamento, as buscas seguem sem poda até a
+        tabela do nível atual ficar pronta; sem orçamento (determinístico),
+        a busca espera por ela
+        """
+        difficulty = self.simulation.difficulty
+        if not self.prune:
+            return
+        if difficulty.version != self._table_version:
+            self._table_version = difficulty.version
+            self._table = None
+            self._pending_table = self._request_table(difficulty.pipe_speed)
+            schedule = difficulty.schedule
+            if difficulty.tier + 1 < len(schedule):
+                self._request_table(float(schedule.pipe_speeds[difficulty.tier + 1]))
+        pending = self._pending_table
+        if pending is not None and (self.budget is None or pending.done()):
+            self._table = pending.result()
+            self._pending_table = None
+
+    def act(self) -> int:
+        """
+        Entradas para o próximo passo da simulação (chamar antes de cada step)
+
+        Returns:
+            Combinação de bits de SimulationInput
+        """
+        simulation = self.simulation
+        if simulation.game_over:
+            return SimulationInput.RESTART | SimulationInput.FLAP if self.restart else SimulationInput.NONE
+        if not simulation.game_started:
+            return SimulationInput.FLAP
+        if simulation.ticks % self.decision_ticks:
+            return SimulationInput.NONE
+        return SimulationInput.FLAP if self.plan() else SimulationInput.NONE
+
+    def plan(self) -> bool:
+        """
+        Busca em feixe a partir do estado atual
+
+        Returns:
+            True se o melhor caminho encontrado começa com um pulo
+        """
+        self._update_table()
+        start = time.perf_counter()
+        deadline = start + self.budget if self.budget is not None else float("inf")
+        simulation = self.simulation
+        bird = simulation.bird
+        pipes = simulation.pipes
+        step = self.step
+        count = self.decision_ticks
+        width = self.beam_width
+        travel, fall = self._travel, self._fall
+
+        # Pares que ainda podem alcançar o pássaro, e quanto andam por passo
+        slots = [slot for slot in pipes.slots() if pipes.x[slot] + pipes.pipe_width > bird.x + self._left]
+        pipe_x = pipes.x[slots]
+        gap_y = pipes.gap_y[slots]
+        pipe_step = pipes.speed * step
+        left, right = bird.x + self._left, bird.x + self._right
+        # Sem par à frente, espera no meio da faixa em que os vãos podem aparecer:
+        # nas velocidades altas não dá tempo de cruzar a tela depois que o par surge
+        waiting_target = (pipes._min_pipe_height + pipes._max_pipe_height + PIPE_GAP) / 2
+        table = self._table
+
+        # Feixe: altura, velocidade, passos sobrevivendo (-1 = vivo) e primeira jogada
+        y = np.array([bird.y])
+        velocity = np.array([bird.velocity])
+        survived = np.array([-1])
+        first = np.array([False])
+        target: typing.Optional[float] = waiting_target
+        nodes = 0
+        level_time = tail_time = 0.0
+
+        for level in range(self.levels):
+            # Não começa um nível que não terminaria no prazo (leva mais ou menos o que levou o anterior)
+            level_start = time.perf_counter()
+            if level_start + level_time > deadline:
+                break
+            # Feixe do último nível completo: volta a ele se o tempo acabar no meio deste
+            beam = (y, velocity, survived, first, target)
+            # Clona cada nó em "não pula" e "pula" no início do nível
+            n = len(y)
+            y = np.concatenate((y, y))
+            velocity = np.concatenate((velocity, np.full(n, BIRD_VELOCITY)))
+            survived = np.concatenate((survived, survived))
+            first = np.concatenate((first, np.ones(n, dtype=bool))) if level == 0 else np.concatenate((first, first))
+            nodes += 2 * n
+
+            # Trajetória de todos os nós nos passos do nível
+            heights = y[:, None] + velocity[:, None] * travel + fall
+            bottoms = heights + self._bottom
+            tops = heights + self._top
+            hit = (bottoms < self._ground) | (heights > self._ceiling)
+
+            # Canos: só os passos em que o par cruza a faixa x do pássaro
+            shift = (level * count + self._ticks) * pipe_step
+            target = None
+            ahead: typing.Optional[typing.Tuple[float, float]] = None  # Próximo par ainda não alcançado
+            expired = False
+            for x, gap in zip(pipe_x, gap_y):
+                if time.perf_counter() > deadline:
+                    expired = True
+                    break
+                columns = x - shift
+                overlap = (columns < right) & (columns + pipes.pipe_width > left)
+                if overlap.any():
+                    hit |= overlap & ((bottoms < gap) | (tops > gap + PIPE_GAP))
+                if target is None and columns[-1] + pipes.pipe_width > left:
+                    target = gap + PIPE_GAP / 2
+                if ahead is None and columns[-1] >= right:
+                    ahead = (columns[-1], gap)
+            if expired:
+                y, velocity, survived, first, target = beam
+                break
+            if target is None:
+                target = waiting_target
+
+            # Quem bateu neste nível guarda o passo da batida; os já mortos não mudam
+            died = (survived < 0) & hit.any(axis=1)
+            survived = np.where(died, level * count + hit.argmax(axis=1), survived)
+            y = heights[:, -1]
+            velocity = velocity + GRAVITY * step * count
+
+            # Quem não consegue mais atravessar o próximo par conta como batido no fim do nível
+            # Poda e seleção levam mais ou menos o mesmo tempo em todo nível
+            tail_start = time.perf_counter()
+            if tail_start + tail_time > deadline:
+                y, velocity, survived, first, target = beam
+                break
+            if table is not None and ahead is not None:
+                entry = int((ahead[0] - right) / pipe_step) + 1
+                doomed = (survived < 0) & ~table.reachable_states(y, velocity, ahead[1], entry)
+                survived = np.where(doomed, (level + 1) * count, survived)
+
+            # Mantém os melhores: vivos primeiro, depois quem sobreviveu mais e
+            # quem termina mais perto do centro do próximo vão
+            score = _score(y, survived, target)
+            if len(score) > width:
+                keep = np.argpartition(-score, width)[:width]
+                y, velocity, survived, first = y[keep], velocity[keep], survived[keep], first[keep]
+
+            level_end = time.perf_counter()
+            level_time = level_end - level_start
+            tail_time = level_end - tail_start
+
+        best = int(np.argmax(_score(y, survived, target)))
+        elapsed = time.perf_counter() - start
+        self.plans += 1
+        self.nodes += nodes
+        self.plan_time += elapsed
+        self.last_plan_time = elapsed
+        return bool(first[best])
@@ -0,0 +1,457 @@
+"""
+Ambiente em lote do Flappy Bird: N partidas independentes avançadas com NumPy
+Aplica as mesmas regras de BirdBody, PipeField, HeartBody e GameSimulation,
+mas guarda o estado em arrays (structure-of-arrays) e atualiza todos os mundos
+de uma vez, sem laços em Python por mundo
+"""
+
+import sys
+import os
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, MAX_LIVES, GROUND_HEIGHT
+from config import BIRD_VELOCITY, GRAVITY
+from config import PIPE_GAP, PIPE_WIDTH, PIPE_SPACING_JITTER
+from config import HEART_ITEM_FREQUENCY
+from config import HEART_ITEM_WIDTH, HEART_ITEM_HEIGHT, HEART_ITEM_FLOAT_AMPLITUDE, HEART_ITEM_FLOAT_SPEED
+from simulation.difficulty import DifficultySchedule
+
+# Dimensões do pássaro (iguais às de BirdBody)
+BIRD_WIDTH: float = 40.0
+BIRD_HEIGHT: float = 28.0
+
+# Número de slots de canos por mundo; com os intervalos atuais nunca há mais de 3 pares na tela
+MAX_PIPE_PAIRS: int = 4
+
+# Tipo de ponto flutuante do estado: float32 basta para coordenadas de tela
+# e reduz pela metade a memória percorrida em cada operação vetorizada
+FLOAT_DTYPE = np.float32
+
+# Tamanho do vetor de observação: altura e velocidade do pássaro,
+# distância horizontal até o próximo par de canos e centro do vão
+OBSERVATION_SIZE: int = 4
+
+# Tangente do ângulo máximo de rotação do pássaro (20 graus)
+_MAX_ROTATION_TAN: float = float(np.tan(np.radians(20.0)))
+
+# Alcances da hitbox contra um par de canos (meia largura do cano + meia hitbox,
+# meia altura do vão - meia hitbox)
+_COLUMN_REACH: float = PIPE_WIDTH / 2 + BIRD_WIDTH / 3
+_GAP_REACH: float = PIPE_GAP / 2 - BIRD_HEIGHT / 3
+
+# Constantes do gerador SplitMix64 (um estado de 64 bits por mundo)
+_SPLITMIX_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_SPLITMIX_MUL1 = np.uint64(0xBF58476D1CE4E5B9)
+_SPLITMIX_MUL2 = np.uint64(0x94D049BB133111EB)
+
+class BatchFlappyEnv:
+    """
+    N mundos do Flappy Bird avançados em paralelo com operações vetorizadas.
+    Cada mundo começa já em jogo; quando as vidas acabam ele é reiniciado
+    automaticamente e o passo correspondente retorna done=True.
+    """
+
+    def __init__(self, num_worlds: int, seed: int = 0,
+                 window_width: int = WINDOW_WIDTH, window_height: int = WINDOW_HEIGHT,
+                 max_pipe_pairs: int = MAX_PIPE_PAIRS, first_world: int = 0,
+                 schedule: typing.Optional[DifficultySchedule] = None):
+        """
+        Inicializa o ambiente em lote
+
+        Args:
+            num_worlds: Número de mundos independentes
+            seed: Semente base; o mundo i usa um fluxo aleatório próprio derivado dela
+            window_width: Largura do mundo
+            window_height: Altura do mundo
+            max_pipe_pairs: Capacidade de pares de canos por mundo (deve exceder os pares visíveis)
+            first_world: Índice global do primeiro mundo; permite dividir um lote entre processos
+                mantendo os mesmos fluxos aleatórios de um único BatchFlappyEnv
+            schedule: Tabela de dificuldade (a do config se None)
+        """
+        n = num_worlds
+        k = max_pipe_pairs
+        self.num_worlds = n
+        self.first_world = first_world
+        self.max_pipe_pairs = k
+        self.window_width = float(window_width)
+        self.window_height = float(window_height)
+        self.schedule: DifficultySchedule = schedule if schedule is not None else DifficultySchedule()
+
+        # Limites do vão dos canos (iguais aos de PipeField)
+        self._min_gap_y = 100.0
+        self._max_gap_y = self.window_height - PIPE_GAP - self._min_gap_y
+
+        # Vão observado enquanto não há próximo par: centrado na tela
+        self._default_gap_y = self.window_height / 2 - PIPE_GAP / 2
+
+        # Faixa vertical permitida para o centro da hitbox: acima do chão e abaixo do teto
+        band_low = GROUND_HEIGHT + BIRD_HEIGHT / 3
+        band_high = self.window_height - BIRD_HEIGHT / 2
+        self._band_center = (band_low + band_high) / 2
+        self._band_half_height = (band_high - band_low) / 2
+
+        # Pássaro
+        self.bird_x: float = self.window_width / 3
+        self.bird_y = np.empty(n, dtype=FLOAT_DTYPE)
+        self.bird_velocity = np.empty(n, dtype=FLOAT_DTYPE)
+        self.bird_rotation = np.empty(n, dtype=FLOAT_DTYPE)
+
+        # Canos: os pares são guardados pela distância rolada no momento do spawn,
+        # então mover todos os canos é só somar a distância do passo em self.scroll
+        # (x do par = largura da janela - (scroll - pipe_spawn_scroll)).
+        # Os slots formam um anel por mundo: o par j da rodada ocupa o slot j % max_pipe_pairs.
+        # Como os canos saem da tela na ordem em que entraram, o próximo par a pontuar
+        # é sempre o de índice pipe_cursor, sem precisar procurar o menor x.
+        # Um novo par surge quando scroll alcança next_spawn_at (espaçamento do nível
+        # mais a variação sorteada), com o x exato dessa distância.
+        # Distâncias acumuladas ficam em float64 para não perder precisão em rodadas longas
+        self.scroll = np.empty(n, dtype=np.float64)
+        self.pipe_spawn_scroll = np.empty((k, n), dtype=np.float64)
+        self.pipe_gap_y = np.empty((k, n), dtype=FLOAT_DTYPE)
+        self.pipe_count = np.empty(n, dtype=np.int64)  # Pares criados na rodada
+        self.pipe_cursor = np.empty(n, dtype=np.int64) # Índice do próximo par ainda não pontuado
+        self.next_spawn_at = np.empty(n, dtype=np.float64)
+        self.pipe_spacing = np.empty(n, dtype=np.float64)
+
+        # Cópias do próximo par (cursor) e do último par pontuado, os únicos que podem
+        # cruzar a hitbox do pássaro: o espaçamento mínimo entre pares
+        # (PIPE_SPACING - PIPE_SPACING_JITTER = 260 px) é bem maior que
+        # PIPE_WIDTH + largura da hitbox
+        self.has_next_pipe = np.empty(n, dtype=bool)
+        self.next_spawn_scroll = np.empty(n, dtype=np.float64)
+        self.next_gap_y = np.empty(n, dtype=FLOAT_DTYPE)
+        self.has_prev_pipe = np.empty(n, dtype=bool)
+        self.prev_spawn_scroll = np.empty(n, dtype=np.float64)
+        self.prev_gap_y = np.empty(n, dtype=FLOAT_DTYPE)
+
+        # Item de vida
+        self.heart_active = np.empty(n, dtype=bool)
+        self.heart_x = np.empty(n, dtype=FLOAT_DTYPE)
+        self.heart_y = np.empty(n, dtype=FLOAT_DTYPE)
+        self.heart_base_y = np.empty(n, dtype=FLOAT_DTYPE)
+        self.heart_time = np.empty(n, dtype=FLOAT_DTYPE)
+        self.heart_float_offset = np.empty(n, dtype=FLOAT_DTYPE)
+
+        # Partida
+        self.score = np.empty(n, dtype=np.int64)
+        self.lives = np.empty(n, dtype=np.int64)
+        self.pipe_speed = np.empty(n, dtype=FLOAT_DTYPE)
+        self.last_heart_spawn_score = np.empty(n, dtype=np.int64)
+        self.episode_steps = np.empty(n, dtype=np.int64)
+
+        # Estado do gerador aleatório de cada mundo
+        self.rng_state = np.empty(n, dtype=np.uint64)
+
+        # Buffers reaproveitados a cada passo
+        # Observações guardadas por atributo (linhas contíguas); step() devolve a transposta
+        self._observations = np.empty((OBSERVATION_SIZE, n), dtype=FLOAT_DTYPE)
+
+        self.reset(seed)
+
+    # --- Gerador aleatório por mundo ---
+
+    def _uniform(self, low: float, high: float, mask: np.ndarray) -> np.ndarray:
+        """
+        Sorteia um valor uniforme para cada mundo selecionado, avançando só o estado deles
+
+        Args:
+            low: Limite inferior
+            high: Limite superior
+            mask: Máscara booleana ou índices dos mundos que sorteiam
+
+        Returns:
+            Array com um valor por mundo selecionado
+        """
+        state = self.rng_state[mask] + _SPLITMIX_GAMMA
+        self.rng_state[mask] = state
+        z = (state ^ (state >> np.uint64(30))) * _SPLITMIX_MUL1
+        z = (z ^ (z >> np.uint64(27))) * _SPLITMIX_MUL2
+        z ^= z >> np.uint64(31)
+        # 53 bits mais altos -> float em [0, 1)
+        unit = (z >> np.uint64(11)).astype(np.float64) * (1.0 / 9007199254740992.0)
+        return (low + (high - low) * unit).astype(FLOAT_DTYPE)
+
+    # --- Reinício ---
+
+    def _reset_round(self, mask: np.ndarray) -> None:
+        """
+        Recomeça a rodada dos mundos selecionados (pássaro, canos e item de vida)
+
+        Args:
+            mask: Máscara booleana ou índices dos mundos
+        """
+        self.bird_y[mask] = self.window_height / 2 + 50
+        self.bird_velocity[mask] = 0.0
+        self.bird_rotation[mask] = 0.0
+        self.scroll[mask] = 0.0
+        self.pipe_count[mask] = 0
+        self.pipe_cursor[mask] = 0
+        self.has_next_pipe[mask] = False
+        self.next_gap_y[mask] = self._default_gap_y
+        self.has_prev_pipe[mask] = False
+        self.next_spawn_at[mask] = self.pipe_spacing[mask]
+        self.heart_active[mask] = False
+
+    def _reset_game(self, mask: np.ndarray) -> None:
+        """
+        Recomeça a partida dos mundos selecionados (vidas, pontuação e velocidade)
+
+        Args:
+            mask: Máscara booleana ou índices dos mundos
+        """
+        self.score[mask] = 0
+        self.lives[mask] = MAX_LIVES
+        self.pipe_speed[mask] = self.schedule.pipe_speeds[0]
+        self.pipe_spacing[mask] = self.schedule.spacings[0]
+        self._reset_round(mask)
+        self.last_heart_spawn_score[mask] = 0
+        self.episode_steps[mask] = 0
+
+    def reset(self, seed: typing.Optional[int] = None) -> np.ndarray:
+        """
+        Reinicia todos os mundos
+
+        Args:
+            seed: Nova semente base (mantém os fluxos atuais se None)
+
+        Returns:
+            Observações iniciais, shape (num_worlds, OBSERVATION_SIZE)
+        """
+        if seed is not None:
+            with np.errstate(over="ignore"):
+                self.rng_state[:] = np.uint64(seed) * _SPLITMIX_MUL2 + np.arange(self.first_world, self.first_world + self.num_worlds, dtype=np.uint64) * _SPLITMIX_GAMMA
+        # Zera os campos que _reset_game não toca, depois reinicia as partidas
+        self.pipe_spawn_scroll.fill(0.0)
+        self.pipe_gap_y.fill(0.0)
+        self.next_spawn_scroll.fill(0.0)
+        self.next_gap_y.fill(0.0)
+        self.prev_spawn_scroll.fill(0.0)
+        self.prev_gap_y.fill(0.0)
+        self.heart_x.fill(0.0)
+        self.heart_y.fill(0.0)
+        self.heart_base_y.fill(0.0)
+        self.heart_time.fill(0.0)
+        self.heart_float_offset.fill(0.0)
+        self._reset_game(np.arange(self.num_worlds))
+        return self.observations()
+
+    # --- Passo ---
+
+    def step(self, actions: np.ndarray, delta_time: float = 1 / 60) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Avança todos os mundos em um passo
+
+        Args:
+            actions: Array (num_worlds,) com 1 para bater asas e 0 para não fazer nada
+            delta_time: Duração do passo em segundos
+
+        Returns:
+            observações (num_worlds, OBSERVATION_SIZE), recompensas (num_worlds,)
+            e flags de fim de partida (num_worlds,); mundos finalizados já voltam reiniciados
+        """
+        with np.errstate(over="ignore"):
+            return self._step(np.asarray(actions, dtype=bool), delta_time)
+
+    def _step(self, flap: np.ndarray, dt: float) -> typing.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        self.episode_steps += 1
+
+        # Pássaro (BirdBody.jump/update)
+        velocity = self.bird_velocity
+        # velocity = BIRD_VELOCITY onde houve pulo, sem máscara booleana (mais barato)
+        jump = BIRD_VELOCITY - velocity
+        jump *= flap
+        velocity += jump
+        velocity += GRAVITY * dt
+        bird_y = self.bird_y
+        bird_y += velocity * dt
+
+        # Rotação alvo = atan2(velocidade, BIRD_VELOCITY) limitada a +-20 graus;
+        # limitar a tangente antes do arctan dá o mesmo resultado com menos trabalho
+        target_rotation = velocity * (1.0 / BIRD_VELOCITY)
+        np.minimum(target_rotation, _MAX_ROTATION_TAN, out=target_rotation)
+        np.maximum(target_rotation, -_MAX_ROTATION_TAN, out=target_rotation)
+        np.arctan(target_rotation, out=target_rotation)
+        target_rotation *= 0.99 * 180.0 / np.pi
+        self.bird_rotation *= 0.01
+        self.bird_rotation += target_rotation
+
+        # Item de vida (HeartBody.update)
+        heart_active = self.heart_active
+        any_heart = heart_active.any()
+        if any_heart:
+            self.heart_x[heart_active] -= self.pipe_speed[heart_active] * dt
+            self.heart_time[heart_active] += dt
+            self.heart_y[:] = self.heart_base_y + HEART_ITEM_FLOAT_AMPLITUDE * np.sin(
+                self.heart_time * HEART_ITEM_FLOAT_SPEED + self.heart_float_offset)
+            heart_active &= self.heart_x + HEART_ITEM_WIDTH >= 0
+
+        # Movimento de todos os canos
+        scroll = self.scroll
+        scroll += self.pipe_speed * dt
+
+        # Spawn de canos (PipeField._spawn_pipe) no próximo slot do anel, na distância
+        # exata em que o par deveria surgir (um passo nunca rola um espaçamento inteiro)
+        spawn = scroll >= self.next_spawn_at
+        if spawn.any():
+            rows = np.flatnonzero(spawn)
+            slots = self.pipe_count[rows] % self.max_pipe_pairs
+            gap_y = self._uniform(self._min_gap_y, self._max_gap_y, rows)
+            spawn_scroll = self.next_spawn_at[rows]
+            self.pipe_spawn_scroll[slots, rows] = spawn_scroll
+            self.pipe_gap_y[slots, rows] = gap_y
+            self.pipe_count[rows] += 1
+            self.next_spawn_at[rows] = spawn_scroll + self.pipe_spacing[rows] + self._uniform(
+                -PIPE_SPACING_JITTER, PIPE_SPACING_JITTER, rows)
+
+            # Se não havia par pendente, o novo par passa a ser o próximo
+            first = ~self.has_next_pipe[rows]
+            first_rows = rows[first]
+            self.has_next_pipe[first_rows] = True
+            self.next_spawn_scroll[first_rows] = spawn_scroll[first]
+            self.next_gap_y[first_rows] = gap_y[first]
+
+        # Pontuação (PipeField.check_score): o par do cursor é o de menor x ainda não pontuado.
+        # x < bird_x - PIPE_WIDTH  <=>  scroll - spawn_scroll > largura + PIPE_WIDTH - bird_x
+        bird_x = self.bird_x
+        next_travel = scroll - self.next_spawn_scroll
+        scored = next_travel > self.window_width + PIPE_WIDTH - bird_x
+        scored &= self.has_next_pipe
+        rewards = np.zeros(self.num_worlds, dtype=np.float32)
+        if scored.any():
+            # O par pontuado vira o anterior e o cursor avança só nos mundos que pontuaram
+            rows = np.flatnonzero(scored)
+            self.has_prev_pipe[rows] = True
+            self.prev_spawn_scroll[rows] = self.next_spawn_scroll[rows]
+            self.prev_gap_y[rows] = self.next_gap_y[rows]
+            cursor = self.pipe_cursor[rows] + 1
+            self.pipe_cursor[rows] = cursor
+            pending = cursor < self.pipe_count[rows]
+            self.has_next_pipe[rows] = pending
+            self.next_gap_y[rows[~pending]] = self._default_gap_y
+            rows = rows[pending]
+            slots = cursor[pending] % self.max_pipe_pairs
+            self.next_spawn_scroll[rows] = self.pipe_spawn_scroll[slots, rows]
+            self.next_gap_y[rows] = self.pipe_gap_y[slots, rows]
+            next_travel = scroll - self.next_spawn_scroll
+
+            self.score += scored
+            rewards += scored
+            score = self.score
+
+            # Nível de dificuldade da nova pontuação (DifficultyState.update)
+            rows = np.flatnonzero(scored)
+            tiers = self.schedule.tiers(score[rows])
+            self.pipe_speed[rows] = self.schedule.pipe_speeds[tiers]
+            self.pipe_spacing[rows] = self.schedule.spacings[tiers]
+
+            # Item de vida a cada HEART_ITEM_FREQUENCY pontos
+            heart_spawn = (scored & (score % HEART_ITEM_FREQUENCY == 0) &
+                           (score > self.last_heart_spawn_score) & ~heart_active)
+            if heart_spawn.any():
+                any_heart = True
+                heart_active |= heart_spawn
+                self.heart_x[heart_spawn] = self.window_width + 100.0
+                base_y = self._uniform(self.window_height * 0.25, self.window_height * 0.75 - HEART_ITEM_HEIGHT, heart_spawn)
+                self.heart_base_y[heart_spawn] = base_y
+                self.heart_y[heart_spawn] = base_y
+                self.heart_time[heart_spawn] = 0.0
+                self.heart_float_offset[heart_spawn] = self._uniform(0.0, 6.28, heart_spawn)
+                self.last_heart_spawn_score[heart_spawn] = score[heart_spawn]
+
+        # Colisões (GameSimulation._check_collisions com pixel_collision=False). A hitbox
+        # de 2/3 do sprite é centrada em (bird_x, bird_y): chão e teto viram um teste de
+        # faixa sobre bird_y
+        hit = np.abs(bird_y - self._band_center) > self._band_half_height
+
+        # Canos: o pássaro cruza a coluna do par se |centro do cano - bird_x| < alcance
+        # horizontal e bate se |bird_y - centro do vão| > alcance vertical. As pontas
+        # distantes dos canos ficam abaixo do chão e acima do teto, já cobertos acima
+        column_offset = self.window_width + PIPE_WIDTH / 2 - bird_x
+        hit |= self._pipe_hit(next_travel, self.next_gap_y, self.has_next_pipe, column_offset)
+        hit |= self._pipe_hit(scroll - self.prev_spawn_scroll, self.prev_gap_y, self.has_prev_pipe, column_offset)
+
+        # Coleta do item de vida
+        if any_heart:
+            box_left = bird_x - BIRD_WIDTH / 3
+            box_right = box_left + BIRD_WIDTH * 2/3
+            box_bottom = bird_y - BIRD_HEIGHT / 3
+            box_top = box_bottom + BIRD_HEIGHT * 2/3
+            collected = (heart_active & (box_left < self.heart_x + HEART_ITEM_WIDTH) & (box_right > self.heart_x) &
+                         (box_bottom < self.heart_y + HEART_ITEM_HEIGHT) & (box_top > self.heart_y))
+            if collected.any():
+                np.minimum(self.lives + collected, MAX_LIVES, out=self.lives)
+                heart_active &= ~collected
+
+        # Perda de vida: reinicia a rodada ou, sem vidas, a partida inteira
+        dones = np.zeros(self.num_worlds, dtype=bool)
+        if hit.any():
+            self.lives -= hit
+            rewards -= hit
+            dones = hit & (self.lives <= 0)
+            # Índices em vez de máscaras: poucos mundos reiniciam em cada passo
+            self._reset_round(np.flatnonzero(hit))
+            if dones.any():
+                self._reset_game(np.flatnonzero(dones))
+
+        return self.observations(), rewards, dones
+
+    def _pipe_hit(self, travel: np.ndarray, gap_y: np.ndarray, present: np.ndarray, column_offset: float) -> np.ndarray:
+        """
+        Testa a hitbox do pássaro contra um par de canos por mundo
+
+        Args:
+            travel: Distância rolada desde o spawn do par
+            gap_y: Base do vão do par
+            present: Máscara dos mundos em que o par existe
+            column_offset: Distância rolada em que o centro do cano alinha com o pássaro
+
+        Returns:
+            Máscara dos mundos em que houve colisão
+        """
+        in_column = np.abs(travel - column_offset) < _COLUMN_REACH
+        in_column &= present
+        outside_gap = np.abs(self.bird_y - gap_y - PIPE_GAP / 2) > _GAP_REACH
+        in_column &= outside_gap
+        return in_column
+
+    # --- Estado derivado ---
+
+    @property
+    def pipe_x(self) -> np.ndarray:
+        """
+        Posição x (borda esquerda) de cada slot de cano, shape (max_pipe_pairs, num_worlds)
+        """
+        return self.window_width - (self.scroll - self.pipe_spawn_scroll)
+
+    @property
+    def pipe_active(self) -> np.ndarray:
+        """
+        Máscara dos slots com um par de canos ainda na tela, shape (max_pipe_pairs, num_worlds)
+        """
+        used = np.arange(self.max_pipe_pairs)[:, None] < self.pipe_count
+        return used & (self.pipe_x >= -PIPE_WIDTH)
+
+    # --- Observações ---
+
+    def observations(self) -> np.ndarray:
+        """
+        Monta as observações de todos os mundos
+
+        Returns:
+            Visão (num_worlds, OBSERVATION_SIZE) de um buffer reaproveitado entre chamadas: altura do pássaro,
+            velocidade, distância até o próximo par de canos e centro do vão
+        """
+        # Próximo par: o do cursor, se já tiver sido criado; senão um par virtual
+        # na borda direita com o vão no centro da tela (next_gap_y já guarda esse vão)
+        obs = self._observations
+        obs[0] = self.bird_y
+        obs[1] = self.bird_velocity
+        spawn_offset = self.next_spawn_scroll - self.scroll
+        spawn_offset *= self.has_next_pipe
+        np.add(spawn_offset, self.window_width - self.bird_x, out=obs[2], casting="same_kind")
+        np.add(self.next_gap_y, PIPE_GAP / 2, out=obs[3])
+        return obs.T
@@ -0,0 +1,399 @@
+"""
+Gerador de percurso do Flappy Bird: a sequência de pares de canos (base do
+vão e variação da distância até o par seguinte) e das posições do item de vida, tirada
+de uma semente e gerada em blocos com o NumPy à frente do jogo
+
+O percurso depende só da semente: o par i é sempre o mesmo, qualquer que seja
+o jogo do jogador, então todos os gabinetes de um torneio jogam os mesmos canos
+e o percurso pode ser conferido antes da partida. Cada bloco de COURSE_CHUNK
+pares usa um gerador próprio derivado de (semente, bloco) e depende apenas do
+último par do bloco anterior: o buffer à frente tem tamanho fixo e qualquer
+posição pode ser reconstruída a partir desse par (ver GameSimulation.restore).
+
+Os vãos de cada bloco passam pelas tabelas de simulation.reachability: os que
+não podem ser alcançados a partir do par anterior são sorteados de novo na
+faixa alcançável, no nível da tabela de dificuldade que o par teria sem perder vidas.
+
+Percursos nomeados (desafio diário, torneios) são gravados em COURSE_DIRECTORY
+e abertos com mmap; depois do último par gravado o percurso continua gerado
+pela mesma semente. Os replays guardam só a semente, então um arquivo editado
+à mão (diferente do que a semente gera) não é refeito por eles.
+
+Uso: python src/simulation/course.py <nome> [pares] [semente]  (grava um percurso nomeado)
+"""
+
+import hashlib
+import math
+import mmap
+import struct
+import sys
+import os
+import time
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, PIPE_SPACING, PIPE_SPACING_JITTER, HEART_ITEM_HEIGHT, REACHABILITY_CHECK
+from config import REACHABILITY_TIERS, COURSE_CHUNK, COURSE_LOOKAHEAD, COURSE_DIRECTORY
+from simulation.reachability import reachability_table, tier_speed
+from simulation.difficulty import DifficultySchedule
+
+COURSE_MAGIC: bytes = b"FBCO"
+COURSE_VERSION: int = 2  # 2: variação do espaçamento em pixels
+COURSE_EXTENSION: str = ".course"
+
+# Variação máxima, em pixels, da distância entre um par e o seguinte
+SPACING_JITTER: float = PIPE_SPACING_JITTER
+
+# Um registro por par: base do vão, variação da distância até o par seguinte,
+# altura base e fase da flutuação do item de vida
+COURSE_DTYPE = np.dtype([("gap_y", "<f8"), ("jitter", "<f8"), ("heart_y", "<f8"), ("heart_phase", "<f8")])
+
+# magic, versão, semente, pares, verificação de alcance, faixa dos vãos,
+# altura do mundo, espaçamento dos pares; os pares começam em _DATA_OFFSET
+_HEADER = struct.Struct("<4sHQI?dddd")
+_DATA_OFFSET: int = 64
+
+class CourseGenerator:
+    """
+    Percurso de uma semente, entregue par a par a partir de um buffer circular
+    de blocos já gerados (sem sortear nada no passo da simulação)
+    """
+
+    def __init__(self, seed: int, gap_min: float, gap_max: float, window_height: float = WINDOW_HEIGHT,
+                 spacing: float = PIPE_SPACING, check_reachability: bool = REACHABILITY_CHECK,
+                 chunk_size: int = COURSE_CHUNK, lookahead: int = COURSE_LOOKAHEAD,
+                 recorded: typing.Optional[np.ndarray] = None,
+                 schedule: typing.Optional[DifficultySchedule] = None):
+        """
+        Inicializa o gerador no início do percurso
+
+        Args:
+            seed: Semente do percurso (inteiro não negativo)
+            gap_min, gap_max: Faixa da base dos vãos
+            window_height: Altura do mundo
+            spacing: Distância entre os pares, antes da variação de cada um
+            check_reachability: Sorteia de novo os vãos inalcançáveis a partir do par anterior
+            chunk_size: Pares gerados de uma vez
+            lookahead: Pares mantidos gerados à frente do último entregue
+            recorded: Primeiros pares já gravados (registros COURSE_DTYPE, ex: um
+                mmap de load_course); os seguintes são gerados
+            schedule: Tabela de dificuldade usada para a velocidade de cada par na
+                verificação de alcance (a do config se None)
+        """
+        self.seed = seed
+        self.gap_min = gap_min
+        self.gap_max = gap_max
+        self.window_height = window_height
+        self.spacing = spacing
+        self.schedule: DifficultySchedule = schedule if schedule is not None else DifficultySchedule()
+        self.check_reachability = check_reachability
+        self.chunk_size = chunk_size
+        self.lookahead = lookahead
+        self.recorded: np.ndarray = recorded if recorded is not None else np.empty(0, COURSE_DTYPE)
+
+        # Buffer circular de blocos inteiros: o bloco do último par entregue
+        # (o item de vida usa a posição sorteada para ele) e os da frente
+        self._chunks = -(-lookahead // chunk_size) + 2
+        self._capacity = self._chunks * chunk_size
+        self._columns = np.zeros((4, self._capacity), dtype=np.float64)
+        self._gap_y = memoryview(self._columns[0])
+        self._jitter = memoryview(self._columns[1])
+        self._heart_y = memoryview(self._columns[2])
+        self._heart_phase = memoryview(self._columns[3])
+        # Par anterior a cada bloco do buffer (base do vão, variação), para o snapshot
+        self._carries = np.full((self._chunks, 2), np.nan)
+
+        self.position: int = 0  # Pares já entregues
+        self._start: int = 0    # Primeiro par do buffer (início de um bloco)
+        self._end: int = 0      # Par seguinte ao último do buffer
+        self._carry: typing.Optional[typing.Tuple[float, float]] = None # Par anterior a _end
+
+    def _generate(self, chunk: int, carry: typing.Optional[typing.Tuple[float, float]]) -> np.ndarray:
+        """
+        Gera um bloco do percurso
+
+        Args:
+            chunk: Número do bloco
+            carry: Base do vão e variação do par anterior ao bloco (None no primeiro)
+
+        Returns:
+            Array (4, chunk_size): bases dos vãos, variações, alturas e fases do item
+        """
+        size = self.chunk_size
+        first = chunk * size
+        rng = np.random.default_rng((self.seed, chunk))
+        columns = rng.random((4, size))
+        gap_y, jitter, heart_y, heart_phase = columns
+        gap_y *= self.gap_max - self.gap_min
+        gap_y += self.gap_min
+        jitter *= 2 * SPACING_JITTER
+        jitter -= SPACING_JITTER
+        # Item de vida entre 25% e 75% da altura, como em HeartBody.spawn
+        heart_y *= self.window_height * 0.5 - HEART_ITEM_HEIGHT
+        heart_y += self.window_height * 0.25
+        heart_phase *= 6.28
+
+        # Os pares gravados têm prioridade sobre os sorteados
+        fixed = np.zeros(size, dtype=bool)
+        recorded = self.recorded[first:first + size]
+        if len(recorded):
+            count = len(recorded)
+            for column, name in zip(columns, COURSE_DTYPE.names):
+                column[:count] = recorded[name]
+            fixed[:count] = True
+
+        if self.check_reachability:
+            self._fit_gaps(first, gap_y, jitter, fixed, carry, rng)
+        return columns
+
+    def _fit_gaps(self, first: int, gap_y: np.ndarray, jitter: np.ndarray, fixed: np.ndarray,
+                  carry: typing.Optional[typing.Tuple[float, float]], rng: typing.Any) -> None:
+        """
+        Sorteia de novo, dentro da faixa alcançável, os vãos do bloco que não
+        podem ser alcançados a partir do par anterior. Cada rodada verifica o
+        bloco inteiro de uma vez; um vão sorteado de novo muda a faixa do
+        seguinte, então repete até nenhum vão mudar (o primeiro vão errado de
+        cada rodada fica certo, então são no máximo chunk_size rodadas)
+        """
+        size = len(gap_y)
+        check = ~fixed
+        if carry is None:
+            check[0] = False
+        if not check.any():
+            return
+
+        # Velocidade de cada par se o jogador não perder vidas (a pontuação
+        # quando o par i aparece é menor que i), até o último nível de alcance
+        # gerado de antemão: além dele o jogo já é rápido demais para ser jogado
+        tiers = self.schedule.tiers(first + np.arange(size))
+        speeds = np.minimum(self.schedule.pipe_speeds[tiers], tier_speed(REACHABILITY_TIERS - 1))
+        groups = []
+        for speed in np.unique(speeds):
+            table = reachability_table(float(speed), self.gap_min, self.gap_max, window_height=self.window_height)
+            groups.append((speeds == speed, table))
+
+        previous_gap = np.empty(size)
+        previous_jitter = np.empty(size)
+        low = np.empty(size)
+        high = np.empty(size)
+        previous_gap[0], previous_jitter[0] = carry if carry is not None else (gap_y[0], 0.0)
+        for _ in range(size):
+            previous_gap[1:] = gap_y[:-1]
+            previous_jitter[1:] = jitter[:-1]
+            for rows, table in groups:
+                low[rows], high[rows] = table.gap_ranges(previous_gap[rows], self.spacing + previous_jitter[rows])
+            wrong = check & (low <= high) & ((gap_y < low) | (gap_y > high))
+            if not wrong.any():
+                break
+            gap_y[wrong] = low[wrong] + rng.random(np.count_nonzero(wrong)) * (high[wrong] - low[wrong])
+
+    def _fill(self, last: int) -> None:
+        """
+        Gera blocos até o buffer conter o par last, descartando os blocos mais
+        antigos que não cabem mais
+        """
+        size = self.chunk_size
+        while self._end <= last:
+            if self._end - self._start + size > self._capacity:
+                self._start += size
+            chunk = self._end // size
+            offset = (chunk % self._chunks) * size
+            self._columns[:, offset:offset + size] = self._generate(chunk, self._carry)
+            self._carries[chunk % self._chunks] = self._carry if self._carry is not None else (np.nan, np.nan)
+            self._end += size
+            self._carry = (self._gap_y[offset + size - 1], self._jitter[offset + size - 1])
+
+    def next_pair(self) -> typing.Tuple[float, float]:
+        """
+        Entrega o próximo par do percurso
+
+        Returns:
+            Tupla (base do vão, variação da distância até o par seguinte)
+        """
+        index = self.position
+        if index + self.lookahead >= self._end:
+            self._fill(index + self.lookahead)
+        slot = index % self._capacity
+        self.position = index + 1
+        return self._gap_y[slot], self._jitter[slot]
+
+    def pair(self, index: int) -> typing.Tuple[float, float, float, float]:
+        """
+        Registro de um par ainda no buffer (do último entregue em diante)
+
+        Returns:
+            Tupla (base do vão, variação, altura base e fase do item de vida)
+
+        Raises:
+            IndexError: Se o par não estiver no buffer
+        """
+        if index >= self._end and index <= self.position + self.lookahead:
+            self._fill(index)
+        if not self._start <= index < self._end:
+            raise IndexError(f"par {index} fora do buffer do percurso")
+        slot = index % self._capacity
+        return self._gap_y[slot], self._jitter[slot], self._heart_y[slot], self._heart_phase[slot]
+
+    def heart(self) -> typing.Tuple[float, float]:
+        """
+        Posição do item de vida sorteada para o último par entregue
+
+        Returns:
+            Tupla (altura base, fase da flutuação)
+        """
+        _, _, heart_y, heart_phase = self.pair(max(self.position - 1, 0))
+        return heart_y, heart_phase
+
+    def rows(self, count: int) -> np.ndarray:
+        """
+        Os primeiros pares do percurso, sem mexer na posição nem no buffer
+
+        Args:
+            count: Quantidade de pares
+
+        Returns:
+            Array de registros COURSE_DTYPE
+        """
+        size = self.chunk_size
+        rows = np.empty(-(-count // size) * size, dtype=COURSE_DTYPE)
+        carry = None
+        for chunk in range(len(rows) // size):
+            columns = self._generate(chunk, carry)
+            for column, name in zip(columns, COURSE_DTYPE.names):
+                rows[name][chunk * size:(chunk + 1) * size] = column
+            carry = (float(columns[0, -1]), float(columns[1, -1]))
+        return rows[:count]
+
+    def state(self) -> typing.Tuple[int, int, float, float]:
+        """
+        O necessário para reconstruir a posição atual (ver seek)
+
+        Returns:
+            Tupla (semente, posição, base do vão e variação do par anterior ao
+            bloco do último par entregue; NaN no primeiro bloco)
+        """
+        size = self.chunk_size
+        base = max(self.position - 1, 0) // size * size
+        if base == self._end:
+            # Bloco ainda não gerado (logo depois de seek): o par anterior é _carry
+            carry_gap, carry_jitter = self._carry if self._carry is not None else (math.nan, math.nan)
+            return self.seed, self.position, float(carry_gap), float(carry_jitter)
+        if not self._start <= base < self._end:
+            return self.seed, self.position, math.nan, math.nan
+        carry_gap, carry_jitter = self._carries[(base // size) % self._chunks]
+        return self.seed, self.position, float(carry_gap), float(carry_jitter)
+
+    def seek(self, position: int, carry_gap: float = math.nan, carry_jitter: float = math.nan,
+             seed: typing.Optional[int] = None) -> None:
+        """
+        Volta ou avança o percurso para o estado devolvido por state(). Se o
+        bloco da posição ainda está no buffer, só move a posição; senão o buffer
+        recomeça nesse bloco, gerado a partir do par anterior
+
+        Args:
+            position: Pares já entregues
+            carry_gap, carry_jitter: Par anterior ao bloco do último par entregue
+            seed: Semente do percurso (outra semente descarta os pares gravados)
+        """
+        if seed is not None and seed != self.seed:
+            self.seed = seed
+            self.recorded = np.empty(0, COURSE_DTYPE)
+            self._start = self._end = 0
+        size = self.chunk_size
+        base = max(position - 1, 0) // size * size
+        if not self._start <= base < self._end:
+            self._start = self._end = base
+            self._carry = None if base == 0 or math.isnan(carry_gap) else (carry_gap, carry_jitter)
+        self.position = position
+
+    def restart(self) -> None:
+        """
+        Volta ao início do percurso (nova partida)
+        """
+        self.seek(0)
+
+def course_path(name: str) -> str:
+    """
+    Arquivo de um percurso nomeado, relativo à raiz do projeto
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(root, COURSE_DIRECTORY, f"{name}{COURSE_EXTENSION}")
+
+def course_seed(name: str) -> int:
+    """
+    Semente derivada do nome de um percurso (ex: "diario-2026-10-17"), igual
+    em qualquer máquina
+    """
+    return int.from_bytes(hashlib.sha256(name.encode("utf-8")).digest()[:8], "little") >> 1
+
+def save_course(path: str, course: CourseGenerator, count: int) -> None:
+    """
+    Grava os primeiros pares de um percurso
+
+    Args:
+        path: Caminho do arquivo
+        course: Percurso a gravar
+        count: Quantidade de pares
+    """
+    rows = course.rows(count)
+    header = _HEADER.pack(COURSE_MAGIC, COURSE_VERSION, course.seed, count, course.check_reachability,
+                          course.gap_min, course.gap_max, course.window_height, course.spacing)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(header.ljust(_DATA_OFFSET, b"\0"))
+        file.write(rows.tobytes())
+
+def load_course(path: str, gap_min: float, gap_max: float, window_height: float = WINDOW_HEIGHT,
+                spacing: float = PIPE_SPACING) -> CourseGenerator:
+    """
+    Abre um percurso gravado por save_course. Os pares são lidos direto do mmap
+    do arquivo, à medida que o jogo chega neles
+
+    Args:
+        path: Caminho do arquivo
+        gap_min, gap_max: Faixa da base dos vãos do jogo
+        window_height: Altura do mundo
+        spacing: Espaçamento dos pares do jogo
+
+    Returns:
+        Gerador posicionado no início do percurso
+
+    Raises:
+        OSError: Se o arquivo não puder ser aberto
+        ValueError: Se o arquivo não for um percurso desta versão ou tiver sido
+            gerado com outras constantes
+    """
+    with open(path, "rb") as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(data) < _DATA_OFFSET:
+        raise ValueError(f"Percurso '{path}' inválido: arquivo curto")
+    (magic, version, seed, count, check_reachability, file_gap_min, file_gap_max, file_height,
+     file_spacing) = _HEADER.unpack_from(data)
+    if magic != COURSE_MAGIC or version != COURSE_VERSION:
+        raise ValueError(f"Percurso '{path}' inválido: assinatura ou versão desconhecida")
+    if (file_gap_min, file_gap_max, file_height, file_spacing) != (gap_min, gap_max, window_height, spacing):
+        raise ValueError(f"Percurso '{path}' gerado com outras constantes do jogo")
+    if len(data) != _DATA_OFFSET + count * COURSE_DTYPE.itemsize:
+        raise ValueError(f"Percurso '{path}' inválido: tamanho não confere")
+    recorded = np.frombuffer(data, dtype=COURSE_DTYPE, count=count, offset=_DATA_OFFSET)
+    return CourseGenerator(seed, gap_min, gap_max, window_height, spacing, check_reachability,
+                           recorded=recorded)
+
+if __name__ == "__main__":
+    from simulation.entities import PipeField
+    if len(sys.argv) < 2:
+        print("Uso: python src/simulation/course.py <nome> [pares] [semente]")
+        sys.exit(1)
+    name = sys.argv[1]
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    seed = int(sys.argv[3]) if len(sys.argv) > 3 else course_seed(name)
+    pipes = PipeField(WINDOW_WIDTH, WINDOW_HEIGHT)
+    course = CourseGenerator(seed, pipes._min_pipe_height, pipes._max_pipe_height)
+    start = time.perf_counter()
+    path = course_path(name)
+    save_course(path, course, count)
+    print(f"percurso '{name}' (semente {seed}): {count} pares em {path}, "
+          f"gerado em {(time.perf_counter() - start) * 1000:.0f} ms")
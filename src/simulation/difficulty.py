@@ -0,0 +1,113 @@
+"""
+Dificuldade do Flappy Bird: uma tabela pré-calculada de níveis de velocidade
+e o estado com o nível atual que a simulação repassa às entidades
+
+Cada nível da tabela (DIFFICULTY_SCHEDULE) começa em uma pontuação e guarda
+as velocidades do chão e dos canos e a distância entre os pares. Os canos
+surgem pela distância rolada, não por um timer, então o espaçamento é o
+mesmo em qualquer velocidade e não depende da duração dos passos. A tabela
+é lida uma vez; na partida só o estado muda, e só quando o nível muda.
+"""
+
+import bisect
+import sys
+import os
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import INITIAL_GAME_SPEED, INITIAL_PIPE_SPEED, PIPE_SPACING, DIFFICULTY_SCHEDULE
+
+class DifficultySchedule:
+    """
+    Níveis de dificuldade em arrays paralelos, indexados pelo nível
+    """
+
+    def __init__(self, schedule: typing.Sequence[typing.Tuple[int, float]] = DIFFICULTY_SCHEDULE,
+                 game_speed: float = INITIAL_GAME_SPEED, pipe_speed: float = INITIAL_PIPE_SPEED,
+                 spacing: float = PIPE_SPACING):
+        """
+        Gera a tabela
+
+        Args:
+            schedule: Pares (pontuação em que o nível começa, multiplicador das velocidades)
+            game_speed: Velocidade do chão no nível 0
+            pipe_speed: Velocidade dos canos e do item de vida no nível 0
+            spacing: Distância entre as bordas esquerdas de dois pares seguidos
+
+        Raises:
+            ValueError: Se a tabela estiver vazia, não começar em 0 ou não estiver em ordem
+        """
+        scores = [int(score) for score, _ in schedule]
+        if not scores or scores[0] != 0 or any(a >= b for a, b in zip(scores, scores[1:])):
+            raise ValueError("a tabela de dificuldade deve começar na pontuação 0, em ordem crescente")
+        multipliers = np.array([multiplier for _, multiplier in schedule], dtype=np.float64)
+        self.scores = np.array(scores, dtype=np.int64)
+        self.game_speeds = game_speed * multipliers
+        self.pipe_speeds = pipe_speed * multipliers
+        self.spacings = np.full(len(scores), spacing)
+        self._scores = scores
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def tier(self, score: int) -> int:
+        """
+        Nível de uma pontuação
+        """
+        return bisect.bisect_right(self._scores, score) - 1
+
+    def tiers(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Níveis de várias pontuações de uma vez
+        """
+        return np.searchsorted(self.scores, scores, side="right") - 1
+
+class DifficultyState:
+    """
+    Nível atual e os valores dele, lidos pela simulação em vez de globais do
+    config. A versão muda a cada troca de nível, então quem copia os valores
+    (GameSimulation para as entidades, HUDs) só precisa compará-la
+    """
+
+    __slots__ = ("schedule", "tier", "version", "game_speed", "pipe_speed", "spacing")
+
+    def __init__(self, schedule: typing.Optional[DifficultySchedule] = None):
+        """
+        Inicializa no nível 0
+
+        Args:
+            schedule: Tabela de dificuldade (a do config se None)
+        """
+        self.schedule: DifficultySchedule = schedule if schedule is not None else DifficultySchedule()
+        self.version: int = 0
+        self.tier: int = -1
+        self.set_tier(0)
+
+    def set_tier(self, tier: int) -> bool:
+        """
+        Muda para um nível da tabela
+
+        Returns:
+            True se o nível mudou
+        """
+        if tier == self.tier:
+            return False
+        schedule = self.schedule
+        self.tier = tier
+        self.game_speed = float(schedule.game_speeds[tier])
+        self.pipe_speed = float(schedule.pipe_speeds[tier])
+        self.spacing = float(schedule.spacings[tier])
+        self.version += 1
+        return True
+
+    def update(self, score: int) -> bool:
+        """
+        Aplica o nível de uma pontuação
+
+        Returns:
+            True se o nível mudou
+        """
+        return self.set_tier(self.schedule.tier(score))
@@ -0,0 +1,151 @@
+"""
+Codificadores de observação para o ambiente FlappyEnv
+Transformam o estado de uma GameSimulation no vetor/imagem entregue ao agente
+"""
+
+import abc
+import sys
+import os
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import PIPE_GAP
+
+if typing.TYPE_CHECKING:
+    from simulation.game_simulation import GameSimulation
+
+class ObservationEncoder(abc.ABC):
+    """
+    Classe base dos codificadores de observação.
+    As subclasses definem shape/dtype e implementam encode(); sem encode(),
+    a subclasse não pode ser instanciada
+    """
+
+    shape: typing.Tuple[int, ...] = ()
+    dtype: typing.Any = np.float32
+
+    def reset(self, simulation: "GameSimulation") -> None:
+        """
+        Chamado no início de cada episódio, antes do primeiro encode()
+
+        Args:
+            simulation: Simulação recém-reiniciada
+        """
+        pass
+
+    @abc.abstractmethod
+    def encode(self, simulation: "GameSimulation") -> np.ndarray:
+        """
+        Gera a observação do estado atual
+
+        Args:
+            simulation: Simulação a observar
+
+        Returns:
+            Array com formato self.shape e tipo self.dtype
+        """
+
+
+class FeatureEncoder(ObservationEncoder):
+    """
+    Vetor compacto de características:
+    [altura do pássaro, velocidade, distância até o próximo par, centro do vão].
+    O próximo par vem de PipeField.next_pair, mantido por um cursor,
+    então o custo não depende de quantos canos existem
+    """
+
+    shape = (4,)
+    dtype = np.float32
+
+    def __init__(self, normalize: bool = False):
+        """
+        Inicializa o codificador
+
+        Args:
+            normalize: Se True, divide posições pelas dimensões da janela e a velocidade por 1000
+        """
+        self.normalize = normalize
+
+    def encode(self, simulation: "GameSimulation") -> np.ndarray:
+        bird = simulation.bird
+        pipes = simulation.pipes
+        slot = pipes.next_pair
+        if slot is not None:
+            distance = float(pipes.x[slot]) - bird.x
+            gap_center = float(pipes.gap_y[slot]) + PIPE_GAP / 2
+        else:
+            # Sem par à frente: considera um par na borda direita com o vão centralizado
+            distance = simulation.window_width - bird.x
+            gap_center = simulation.window_height / 2
+
+        if self.normalize:
+            return np.array((bird.y / simulation.window_height, bird.velocity / 1000.0,
+                             distance / simulation.window_width, gap_center / simulation.window_height),
+                            dtype=np.float32)
+        return np.array((bird.y, bird.velocity, distance, gap_center), dtype=np.float32)
+
+class PixelEncoder(ObservationEncoder):
+    """
+    Imagem em tons de cinza da cena, rasterizada com NumPy (sem OpenGL).
+    Cada elemento é desenhado como um retângulo com um tom fixo
+    """
+
+    # Tons de cinza de cada elemento
+    PIPE_SHADE: int = 255
+    GROUND_SHADE: int = 128
+    BIRD_SHADE: int = 200
+    HEART_SHADE: int = 96
+
+    def __init__(self, width: int = 84, height: int = 84):
+        """
+        Inicializa o codificador
+
+        Args:
+            width: Largura da imagem em pixels
+            height: Altura da imagem em pixels
+        """
+        self.width = width
+        self.height = height
+        self.shape = (height, width)
+        self.dtype = np.uint8
+        self._scale_x = 1.0
+        self._scale_y = 1.0
+
+    def reset(self, simulation: "GameSimulation") -> None:
+        self._scale_x = self.width / simulation.window_width
+        self._scale_y = self.height / simulation.window_height
+
+    def _fill(self, frame: np.ndarray, x: float, y: float, width: float, height: float, shade: int) -> None:
+        """
+        Pinta um retângulo em coordenadas do mundo (origem no canto inferior esquerdo)
+        """
+        left = max(0, int(x * self._scale_x))
+        right = min(self.width, int((x + width) * self._scale_x + 0.5))
+        bottom = max(0, int(y * self._scale_y))
+        top = min(self.height, int((y + height) * self._scale_y + 0.5))
+        if left < right and bottom < top:
+            # A linha 0 da imagem é o topo da tela
+            frame[self.height - top:self.height - bottom, left:right] = shade
+
+    def encode(self, simulation: "GameSimulation") -> np.ndarray:
+        frame = np.zeros(self.shape, dtype=np.uint8)
+        fill = self._fill
+
+        ground = simulation.ground
+        fill(frame, 0.0, ground.y_position, ground.width, ground.height, self.GROUND_SHADE)
+
+        pipes = simulation.pipes
+        for slot in pipes.slots():
+            for x, y, width, height in pipes.pipe_rects(slot):
+                fill(frame, x, y, width, height, self.PIPE_SHADE)
+
+        heart = simulation.heart_item
+        if heart.active:
+            fill(frame, heart.x, heart.y, heart.width, heart.height, self.HEART_SHADE)
+
+        bird = simulation.bird
+        fill(frame, bird.x - bird.width / 2, bird.y - bird.height / 2, bird.width, bird.height, self.BIRD_SHADE)
+        return frame
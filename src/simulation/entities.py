@@ -0,0 +1,1027 @@
+"""
+Entidades puras (sem OpenGL) do jogo Flappy Bird
+Contém apenas a física e as regras de cada elemento; os componentes
+visuais em components/ herdam destas classes e adicionam a renderização
+"""
+
+import math
+import random
+import struct
+import sys
+import os
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import BIRD_VELOCITY, GRAVITY, GROUND_HEIGHT
+from config import PIPE_GAP, PIPE_SPACING, PIPE_HEIGHT, PIPE_WIDTH
+from config import HEART_ITEM_WIDTH, HEART_ITEM_HEIGHT, HEART_ITEM_FLOAT_AMPLITUDE, HEART_ITEM_FLOAT_SPEED
+from config import REACHABILITY_CHECK
+import config
+from simulation.collision import sweep_aabb
+from simulation.masks import BirdMasks, MovingMask, pipe_masks, solid_obstacle_mask, heart_mask, sweep_mask
+from simulation.reachability import reachability_table
+from simulation.course import CourseGenerator, SPACING_JITTER
+
+# Assume um tipo simples para retângulo de colisão (x, y, width, height)
+CollisionRect = typing.Tuple[float, float, float, float]
+
+# Gerador aleatório aceito pelas entidades (random.Random ou o próprio módulo random)
+RandomSource = typing.Any
+
+# A partir de quantos pares ativos PipeField.update move os canos com o NumPy
+VECTORIZED_SCROLL_MIN_PAIRS: int = 8
+
+# Enum para movimento do pássaro (similar ao BirdMovement do Flutter)
+class BirdMovement:
+    UP = 0    # Asas para cima - voando para cima
+    MIDDLE = 1  # Asas no meio - transição
+    DOWN = 2  # Asas para baixo - caindo
+
+class BirdBody:
+    """
+    Física e animação do pássaro, sem dependência de OpenGL
+    """
+
+    # Estado para snapshots: x, y, velocidade, rotação, y e rotação anteriores,
+    # temporizador da animação, morto, quadro da animação
+    _STATE = struct.Struct("<7d?B")
+
+    def __init__(self, window_width: float, window_height: float):
+        """
+        Inicializa o corpo do pássaro
+
+        Args:
+            window_width: Largura da janela
+            window_height: Altura da janela
+        """
+        # Posição e dimensões
+        self.width: float = 40.0
+        self.height: float = 28.0
+        self.window_width: float = window_width
+        self.window_height: float = window_height
+
+        # Tempo de transição da animação "asas para cima" -> "meio"
+        self.animation_transition: float = 0.2  # segundos
+
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Volta o pássaro para a posição e o estado iniciais
+        """
+        # Posição inicial do pássaro (centro da tela, um pouco mais ao topo)
+        self.x: float = self.window_width / 3
+        self.y: float = self.window_height / 2 + 50
+
+        # Velocidade e rotação
+        self.velocity: float = 0.0
+        self.rotation: float = 0.0
+
+        # Estado no passo anterior, para a renderização interpolar entre passos
+        self.previous_y: float = self.y
+        self.previous_rotation: float = self.rotation
+
+        # Estado do jogo
+        self.is_dead: bool = False
+
+        # Começa no estado médio
+        self.current_movement: int = BirdMovement.MIDDLE
+        self.animation_timer: float = 0.0
+
+    def store_previous(self) -> None:
+        """
+        Guarda a posição e a rotação atuais como estado anterior (chamar antes de cada passo)
+        """
+        self.previous_y = self.y
+        self.previous_rotation = self.rotation
+
+    def pack_state(self) -> bytes:
+        """
+        Estado do pássaro em bytes (ver GameSimulation.snapshot)
+        """
+        return self._STATE.pack(self.x, self.y, self.velocity, self.rotation, self.previous_y,
+                                self.previous_rotation, self.animation_timer, self.is_dead, self.current_movement)
+
+    def unpack_state(self, data: bytes, offset: int) -> int:
+        """
+        Restaura o estado gravado por pack_state
+
+        Args:
+            data: Buffer com o estado
+            offset: Posição do estado no buffer
+
+        Returns:
+            Posição logo após o estado
+        """
+        (self.x, self.y, self.velocity, self.rotation, self.previous_y, self.previous_rotation,
+         self.animation_timer, self.is_dead, self.current_movement) = self._STATE.unpack_from(data, offset)
+        return offset + self._STATE.size
+
+    def interpolated(self, alpha: float) -> typing.Tuple[float, float]:
+        """
+        Posição y e rotação entre o passo anterior (alpha = 0) e o atual (alpha = 1)
+
+        Args:
+            alpha: Fração do passo já decorrida no quadro
+
+        Returns:
+            Tupla (y, rotation)
+        """
+        return (self.previous_y + (self.y - self.previous_y) * alpha,
+                self.previous_rotation + (self.rotation - self.previous_rotation) * alpha)
+
+    def jump(self) -> None:
+        """
+        Faz o pássaro pular/voar
+        Corresponde ao método fly() no projeto Flutter
+        """
+        if not self.is_dead:
+            self.velocity = BIRD_VELOCITY
+            self.current_movement = BirdMovement.UP  # muda para sprite com asas para cima
+            self.animation_timer = 0.0  # reinicia o temporizador
+
+    def update(self, delta_time: float) -> None:
+        """
+        Atualiza a posição, velocidade e animação do pássaro
+
+        Args:
+            delta_time: Tempo desde o último quadro em segundos
+        """
+        if self.is_dead:
+            # Se o pássaro está morto, apenas cai no chão
+            self.velocity += GRAVITY * delta_time * 2  # Gravidade mais forte quando morto
+            self.y += self.velocity * delta_time
+
+            # Aumenta a rotação para simular queda
+            self.rotation -= 350.0 * delta_time
+            if self.rotation < -90.0:
+                self.rotation = -90.0
+
+            # Mantém o sprite com asas para baixo quando morto
+            self.current_movement = BirdMovement.DOWN
+            return
+
+        # Física normal
+        velocity = self.velocity + GRAVITY * delta_time
+        self.velocity = velocity
+        self.y += velocity * delta_time
+
+        # Atualiza a rotação com base na velocidade, limitada a +-20 graus e suavizada
+        target_rotation = math.degrees(math.atan2(velocity, BIRD_VELOCITY))
+        if target_rotation > 20.0:
+            target_rotation = 20.0
+        elif target_rotation < -20.0:
+            target_rotation = -20.0
+        self.rotation = self.rotation * 0.01 + target_rotation * 0.99
+
+        # Controle de animação com base no estado atual e temporizador
+        if self.current_movement == BirdMovement.UP:
+            # Se estiver no estado "para cima", espera um pouco e muda para o meio
+            self.animation_timer += delta_time
+            if self.animation_timer >= self.animation_transition:
+                self.current_movement = BirdMovement.MIDDLE
+                self.animation_timer = 0.0
+        elif self.current_movement == BirdMovement.MIDDLE and velocity < -50:
+            # Se estiver no estado "meio" e caindo com certa velocidade, muda para baixo
+            self.current_movement = BirdMovement.DOWN
+
+    @property
+    def hitbox(self) -> CollisionRect:
+        """
+        Hitbox do pássaro como tupla (x, y, width, height), 2/3 do tamanho do sprite
+        """
+        return (self.x - self.width / 3, self.y - self.height / 3, self.width * 2/3, self.height * 2/3)
+
+    def collision_mask(self, masks: BirdMasks) -> typing.Tuple[MovingMask, CollisionRect]:
+        """
+        Máscara de pixels do quadro e da rotação atuais e a caixa dos seus pixels opacos
+
+        Args:
+            masks: Máscaras do pássaro (simulation.masks.bird_masks)
+
+        Returns:
+            Tupla (máscara, retângulo (x, y, width, height) no mundo)
+        """
+        mask = masks.lookup(self.current_movement, self.rotation)
+        return mask, mask.rect(self.x, self.y)
+
+    @property
+    def collision_rect(self) -> dict[str, float]:
+        """
+        Hitbox do pássaro no formato de dicionário (compatível com Ground e HeartItem)
+        """
+        x, y, width, height = self.hitbox
+        return {'x': x, 'y': y, 'width': width, 'height': height}
+
+    def check_collision(self, object_rect: dict[str, float]) -> bool:
+        """
+        Verifica se há colisão entre o pássaro e outro objeto
+
+        Args:
+            object_rect: Retângulo do objeto a verificar colisão (dict com x, y, width, height)
+
+        Returns:
+            bool: True se há colisão, False caso contrário
+        """
+        x, y, width, height = self.hitbox
+        # Implementação de colisão AABB (Axis-Aligned Bounding Box)
+        return (
+            x < object_rect['x'] + object_rect['width'] and
+            x + width > object_rect['x'] and
+            y < object_rect['y'] + object_rect['height'] and
+            y + height > object_rect['y']
+        )
+
+    def die(self) -> None:
+        """
+        Marca o pássaro como morto
+        """
+        self.is_dead = True
+
+class PipeField:
+    """
+    Regras de criação, movimento, colisão e pontuação dos pares de canos
+
+    Os pares ficam em um pool pré-alocado, guardado como colunas paralelas do
+    NumPy (x, gap_y, scored, active) indexadas pelo slot do par. Os slots formam
+    um anel: como todos os canos andam com a mesma velocidade, os pares saem da
+    tela na ordem em que entraram, então o mais antigo é sempre o primeiro a ser
+    removido, o próximo a pontuar é o de um cursor e a colisão pode parar no
+    primeiro par à direita do pássaro. Na partida, spawn, rolagem, colisão e
+    pontuação só leem e escrevem nas colunas, sem criar objetos por cano; o
+    pool só cresce se mais pares do que a capacidade estiverem na tela.
+    """
+
+    # Estado para snapshots: rolagem do próximo spawn, rolagem atual e anterior,
+    # velocidade, espaçamento, pares ativos, posição do cursor de pontuação e da
+    # fase larga no anel, pares não pontuados; seguido das colunas dos pares ativos
+    _STATE = struct.Struct("<5d4I")
+
+    def __init__(self, window_width: int, window_height: int, rng: typing.Optional[RandomSource] = None,
+                 capacity: int = 8, course: typing.Optional[CourseGenerator] = None):
+        """
+        Inicializa o conjunto de canos
+
+        Args:
+            window_width: Largura da janela
+            window_height: Altura da janela
+            rng: Gerador aleatório (usa o módulo random se não fornecido)
+            capacity: Quantidade inicial de slots de pares (dobra quando falta espaço)
+            course: Percurso de onde vêm os pares (a GameSimulation fornece um);
+                sem ele, cada par é sorteado com rng no momento do spawn
+        """
+        self.window_width = window_width
+        self.window_height = window_height
+        self.rng: RandomSource = rng if rng is not None else random
+        self.course: typing.Optional[CourseGenerator] = course
+
+        # Dimensões de cada cano definidas em config.py
+        self.pipe_width: float = PIPE_WIDTH
+        self.pipe_height: float = PIPE_HEIGHT
+
+        self._allocate(capacity)
+        self._head: int = 0   # Slot do par mais antigo (mais à esquerda)
+        self._count: int = 0  # Pares ativos
+        self._next: int = 0   # Slot do próximo par ainda não pontuado
+        self._unscored: int = 0 # Pares ativos ainda não pontuados (do cursor até o mais novo)
+        self._near: int = 0     # Posição no anel (a partir do mais antigo) do primeiro par que alcança o pássaro
+
+        # Distância total rolada: todos os pares andam juntos, então a diferença
+        # para o passo anterior basta para interpolar a posição de qualquer par
+        self.scroll: float = 0.0
+        self.previous_scroll: float = 0.0
+
+        # Velocidade de movimento dos canos (a simulação atualiza este valor)
+        self.speed: float = config.PIPE_SPEED
+
+        # Distância entre os pares (a simulação atualiza este valor) e a rolagem
+        # em que surge o próximo: os pares surgem pela distância percorrida, não
+        # por tempo, então o espaçamento não muda com a velocidade nem com passos longos
+        self.spacing: float = PIPE_SPACING
+        self._next_spawn: float = self.spacing
+
+        # Define os limites para a altura do vão dos canos
+        # Ajustado para garantir que o cano não saia completamente da tela
+        self._min_pipe_height = 100 # Mínimo de espaço visível do cano
+        self._max_pipe_height = self.window_height - PIPE_GAP - self._min_pipe_height
+
+        # Sem percurso, sorteia de novo, dentro da faixa alcançável, os vãos que o
+        # pássaro não consegue alcançar a partir do par anterior (tabelas de
+        # simulation.reachability); o percurso já faz essa verificação ao gerar os blocos
+        self.check_reachability: bool = REACHABILITY_CHECK
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        Cria as colunas do pool com a capacidade indicada
+        """
+        self.x = np.zeros(capacity, dtype=np.float64)       # Borda esquerda do par
+        self.gap_y = np.zeros(capacity, dtype=np.float64)   # Base do vão (topo do cano inferior)
+        self.scored = np.zeros(capacity, dtype=bool)        # Se o pássaro já passou pelo par
+        self.active = np.zeros(capacity, dtype=bool)        # Se o slot está em uso
+        # Acesso a um slot por vez pelas memoryviews: bem mais barato que indexar
+        # o array do NumPy e já devolve float do Python
+        self._x = memoryview(self.x)
+        self._gap_y = memoryview(self.gap_y)
+
+    @property
+    def capacity(self) -> int:
+        """
+        Quantidade de slots do pool
+        """
+        return len(self.x)
+
+    @property
+    def pair_count(self) -> int:
+        """
+        Quantidade de pares ativos
+        """
+        return self._count
+
+    @property
+    def next_pair(self) -> typing.Optional[int]:
+        """
+        Slot do próximo par ainda não ultrapassado (None se não houver),
+        mantido por um cursor a cada spawn e pontuação, sem percorrer o pool
+        """
+        return self._next if self._unscored else None
+
+    def slots(self) -> typing.Iterator[int]:
+        """
+        Slots dos pares ativos, do mais antigo (mais à esquerda) ao mais novo
+        """
+        capacity = len(self.x)
+        for offset in range(self._count):
+            yield (self._head + offset) % capacity
+
+    def pipe_rects(self, slot: int) -> typing.Tuple[CollisionRect, CollisionRect]:
+        """
+        Retângulos (x, y, width, height) dos canos inferior e superior de um par,
+        onde y é a borda inferior de cada cano
+        """
+        x = self._x[slot]
+        gap_y = self._gap_y[slot]
+        return ((x, gap_y - self.pipe_height, self.pipe_width, self.pipe_height),
+                (x, gap_y + PIPE_GAP, self.pipe_width, self.pipe_height))
+
+    def _grow(self) -> None:
+        """
+        Dobra a capacidade do pool, reordenando o anel a partir do slot 0
+        """
+        order = list(self.slots())
+        next_offset = (self._next - self._head) % len(self.x)
+        x, gap_y, scored = self.x[order], self.gap_y[order], self.scored[order]
+        self._allocate(len(self.x) * 2)
+        self.x[:self._count] = x
+        self.gap_y[:self._count] = gap_y
+        self.scored[:self._count] = scored
+        self.active[:self._count] = True
+        self._head = 0
+        self._next = next_offset
+
+    def _spawn_pipe(self, x: typing.Optional[float] = None) -> None:
+        """
+        Cria um novo par de canos (superior e inferior) com o próximo vão do
+        percurso (ou um vão aleatório), reaproveitando o slot seguinte ao par mais novo
+
+        Args:
+            x: Borda esquerda do par (a borda direita da janela se None)
+        """
+        if x is None:
+            x = float(self.window_width)
+        if self.course is not None:
+            gap_y, jitter = self.course.next_pair()
+        else:
+            # Altura aleatória para a base do vão (topo do cano inferior)
+            gap_y = self.rng.uniform(self._min_pipe_height, self._max_pipe_height)
+            if self.check_reachability and self._count:
+                newest = (self._head + self._count - 1) % len(self.x)
+                table = reachability_table(self.speed, self._min_pipe_height, self._max_pipe_height,
+                                           window_height=self.window_height)
+                low, high = table.gap_range(self._gap_y[newest], x - self._x[newest])
+                if low <= high and not low <= gap_y <= high:
+                    gap_y = self.rng.uniform(low, high)
+            # Pequena variação na distância até o próximo par
+            jitter = self.rng.uniform(-SPACING_JITTER, SPACING_JITTER)
+
+        if self._count == len(self.x):
+            self._grow()
+        slot = (self._head + self._count) % len(self.x)
+        self._count += 1
+
+        # Posição inicial X (fora da tela à direita)
+        self.x[slot] = x
+        self.gap_y[slot] = gap_y
+        self.scored[slot] = False
+        self.active[slot] = True
+        if self._unscored == 0:
+            self._next = slot
+        self._unscored += 1
+
+        # O próximo par surge depois de mais um espaçamento, com uma pequena variação
+        self._next_spawn += self.spacing + jitter
+
+    def _remove_oldest(self) -> None:
+        """
+        Libera o slot do par mais antigo
+        """
+        head = self._head
+        self.active[head] = False
+        if self._unscored and self._next == head:
+            # O par saiu da tela sem ser pontuado
+            self._unscored -= 1
+            self._next = (head + 1) % len(self.x)
+        self._head = (head + 1) % len(self.x)
+        self._count -= 1
+        if self._near:
+            self._near -= 1
+
+    def update(self, delta_time: float) -> None:
+        """
+        Atualiza todos os canos, remove os que saíram da tela e gera novos canos
+
+        Args:
+            delta_time: Tempo desde o último quadro
+        """
+        # Move os canos: com poucos pares um laço pelos slots ativos é mais
+        # barato que uma chamada do NumPy; com muitos, move todos os slots de
+        # uma vez (os inativos são ignorados no resto)
+        dx = self.speed * delta_time
+        self.scroll += dx
+        x = self._x
+        count = self._count
+        if count <= VECTORIZED_SCROLL_MIN_PAIRS:
+            capacity = len(x)
+            slot = self._head
+            for _ in range(count):
+                x[slot] -= dx
+                slot += 1
+                if slot == capacity:
+                    slot = 0
+        else:
+            np.subtract(self.x, dx, out=self.x)
+
+        # Cria os pares cuja rolagem de spawn foi alcançada, já na posição exata
+        # (a que teriam se tivessem surgido no instante certo dentro do passo)
+        while self.scroll >= self._next_spawn:
+            self._spawn_pipe(self.window_width - (self.scroll - self._next_spawn))
+
+        # Remove canos que saíram da tela: sempre os mais antigos
+        width = self.pipe_width
+        while self._count and x[self._head] + width < 0:
+            self._remove_oldest()
+
+    def check_collision(self, bird_rect: CollisionRect) -> bool:
+        """
+        Verifica se o retângulo do pássaro colide com algum dos canos
+
+        Fase larga pela ordem em x: um cursor guarda o primeiro par cuja borda
+        direita ainda alcança o pássaro. Como os canos só andam para a esquerda,
+        o cursor só avança (custo amortizado O(1)); a partir dele são testados
+        apenas os pares que cruzam a faixa x da hitbox (um ou dois na prática)
+
+        Args:
+            bird_rect: Retângulo de colisão do pássaro (x, y, width, height)
+
+        Returns:
+            True se houver colisão, False caso contrário
+        """
+        bird_x, bird_y, bird_w, bird_h = bird_rect
+        bird_right = bird_x + bird_w
+        bird_top = bird_y + bird_h
+        height = self.pipe_height
+
+        x = self._x
+        capacity = len(x)
+        slot = self._seek(bird_x)
+
+        gap_y = self._gap_y
+        for _ in range(self._count - self._near):
+            pipe_x = x[slot]
+            if pipe_x >= bird_right:
+                # Os pares estão em ordem de x: este e os seguintes estão à direita
+                break
+            # Verificação simples de colisão AABB (Axis-Aligned Bounding Box)
+            # com o cano inferior e com o superior
+            bottom_y = gap_y[slot] - height
+            if bird_y < bottom_y + height and bird_top > bottom_y:
+                return True # Colisão detectada
+            top_y = gap_y[slot] + PIPE_GAP
+            if bird_y < top_y + height and bird_top > top_y:
+                return True
+            slot += 1
+            if slot == capacity:
+                slot = 0
+
+        return False # Nenhuma colisão
+
+    def _seek(self, left: float) -> int:
+        """
+        Ajusta o cursor da fase larga para o primeiro par cuja borda direita
+        passa de left: recua se left foi para a esquerda (não acontece na
+        partida, mas mantém o resultado correto) e avança sobre os pares que já
+        ficaram totalmente à esquerda
+
+        Returns:
+            Slot do par do cursor
+        """
+        width = self.pipe_width
+        x = self._x
+        capacity = len(x)
+        count = self._count
+        near = self._near
+        slot = self._head + near
+        if slot >= capacity:
+            slot -= capacity
+        while near and x[slot - 1] + width > left:  # slot - 1 = -1 é o último slot
+            near -= 1
+            slot = slot - 1 if slot else capacity - 1
+        while near < count and x[slot] + width <= left:
+            near += 1
+            slot += 1
+            if slot == capacity:
+                slot = 0
+        self._near = near
+        return slot
+
+    def sweep_collision(self, bird_rect: CollisionRect, bird_dx: float, bird_dy: float,
+                        bird_mask: typing.Optional[MovingMask] = None) -> typing.Optional[float]:
+        """
+        Colisão contínua do pássaro com os canos durante o último passo
+
+        O movimento é tomado em relação aos canos (que andaram scroll -
+        previous_scroll para a esquerda), então a hitbox varre em linha reta do
+        início ao fim do passo e cada cano é testado com sweep_aabb. A fase larga
+        é a mesma de check_collision, com a faixa x varrida pela hitbox. Com a
+        máscara do pássaro, o contato das caixas é só um pré-filtro: a partir
+        dele os pixels opacos são comparados com a máscara do cano
+
+        Args:
+            bird_rect: Retângulo de colisão do pássaro no fim do passo (x, y, width, height)
+            bird_dx: Deslocamento horizontal do pássaro no passo
+            bird_dy: Deslocamento vertical do pássaro no passo
+            bird_mask: Máscara do pássaro recortada em bird_rect (só caixas se None)
+
+        Returns:
+            Fração do passo em que o pássaro tocou o primeiro cano, ou None
+        """
+        bird_x, bird_y, bird_w, bird_h = bird_rect
+        dx = bird_dx + (self.scroll - self.previous_scroll)
+        start_x = bird_x - dx
+        start_y = bird_y - bird_dy
+        left = start_x if dx > 0.0 else bird_x
+        right = (bird_x if dx > 0.0 else start_x) + bird_w
+        width = self.pipe_width
+        height = self.pipe_height
+
+        x = self._x
+        capacity = len(x)
+        slot = self._seek(left)
+
+        gap_y = self._gap_y
+        contact: typing.Optional[float] = None
+        for _ in range(self._count - self._near):
+            pipe_x = x[slot]
+            if pipe_x >= right:
+                break
+            # Cano inferior e superior do par
+            for pipe_y, is_top in ((gap_y[slot] - height, False), (gap_y[slot] + PIPE_GAP, True)):
+                hit_time = sweep_aabb(start_x, start_y, bird_w, bird_h, dx, bird_dy,
+                                      pipe_x, pipe_y, width, height)
+                if hit_time is not None and bird_mask is not None:
+                    # Máscaras (inferior, superior) obtidas só quando as caixas se tocam
+                    hit_time = sweep_mask(bird_mask, start_x, start_y, dx, bird_dy, hit_time,
+                                          pipe_masks(width, height)[is_top], pipe_x, pipe_y)
+                if hit_time is not None and (contact is None or hit_time < contact):
+                    contact = hit_time
+            slot += 1
+            if slot == capacity:
+                slot = 0
+        return contact
+
+    def _ordered(self, column: np.ndarray) -> np.ndarray:
+        """
+        Valores de uma coluna nos pares ativos, do mais antigo ao mais novo
+        """
+        end = self._head + self._count
+        if end <= len(column):
+            return column[self._head:end]
+        return np.concatenate((column[self._head:], column[:end - len(column)]))
+
+    def pack_state(self) -> bytes:
+        """
+        Estado dos canos em bytes (ver GameSimulation.snapshot): só os pares
+        ativos, em ordem, então o tamanho não depende da capacidade do pool
+        """
+        count = self._count
+        next_offset = (self._next - self._head) % len(self.x)
+        return b"".join((
+            self._STATE.pack(self._next_spawn, self.scroll, self.previous_scroll, self.speed, self.spacing,
+                             count, next_offset, self._near, self._unscored),
+            self._ordered(self.x).tobytes(),
+            self._ordered(self.gap_y).tobytes(),
+            self._ordered(self.scored).tobytes(),
+        ))
+
+    def unpack_state(self, data: bytes, offset: int) -> int:
+        """
+        Restaura o estado gravado por pack_state, com o par mais antigo no slot 0
+
+        Args:
+            data: Buffer com o estado
+            offset: Posição do estado no buffer
+
+        Returns:
+            Posição logo após o estado
+        """
+        (self._next_spawn, self.scroll, self.previous_scroll, self.speed, self.spacing,
+         count, next_offset, self._near, self._unscored) = self._STATE.unpack_from(data, offset)
+        offset += self._STATE.size
+        if count > len(self.x):
+            capacity = len(self.x)
+            while capacity < count:
+                capacity *= 2
+            self._allocate(capacity)
+        self.x[:count] = np.frombuffer(data, np.float64, count, offset)
+        offset += count * 8
+        self.gap_y[:count] = np.frombuffer(data, np.float64, count, offset)
+        offset += count * 8
+        self.scored[:count] = np.frombuffer(data, bool, count, offset)
+        offset += count
+        self.active[:count] = True
+        self.active[count:] = False
+        self._head = 0
+        self._count = count
+        self._next = next_offset % len(self.x)
+        return offset
+
+    def check_score(self, bird_x: float) -> int:
+        """
+        Verifica se o pássaro passou por um par de canos para pontuar
+
+        Args:
+            bird_x: Posição X do pássaro
+
+        Returns:
+            1 se um novo par de canos foi passado, 0 caso contrário
+        """
+        # O par do cursor é o de menor x ainda não pontuado: se ele não foi
+        # ultrapassado, nenhum dos seguintes foi
+        if self._unscored and self._x[self._next] + self.pipe_width < bird_x:
+            self.scored[self._next] = True
+            self._next = (self._next + 1) % len(self.x)
+            self._unscored -= 1
+            return 1
+        return 0
+
+    def store_previous(self) -> None:
+        """
+        Guarda a rolagem atual como estado anterior (chamar antes de cada passo)
+        """
+        self.previous_scroll = self.scroll
+
+    def interpolated_offset(self, alpha: float) -> float:
+        """
+        Deslocamento em x a somar às posições atuais dos pares para desenhá-los
+        entre o passo anterior (alpha = 0) e o atual (alpha = 1)
+
+        Args:
+            alpha: Fração do passo já decorrida no quadro
+        """
+        return (self.scroll - self.previous_scroll) * (1.0 - alpha)
+
+    def reset(self) -> None:
+        """
+        Remove todos os canos; o primeiro par da rodada surge depois de um espaçamento
+        """
+        self.previous_scroll = self.scroll
+        self.active[:] = False
+        self.scored[:] = False
+        self._head = 0
+        self._count = 0
+        self._next = 0
+        self._unscored = 0
+        self._near = 0
+        self._next_spawn = self.scroll + self.spacing
+
+class GroundBody:
+    """
+    Chão com rolagem contínua e área de colisão, sem textura
+    """
+
+    # Estado para snapshots: offset atual e anterior, velocidade
+    _STATE = struct.Struct("<3d")
+
+    def __init__(self, window_width: float, window_height: float):
+        """
+        Inicializa o chão
+
+        Args:
+            window_width: Largura da janela
+            window_height: Altura da janela
+        """
+        self.width: float = window_width
+        self.height: float = GROUND_HEIGHT
+        self.window_height: float = window_height
+
+        # No OpenGL, o eixo Y começa de baixo para cima: o chão fica em y = 0
+        self.y_position: float = 0
+
+        # Posição x para o efeito de parallax (e a do passo anterior, para interpolar)
+        self.offset_x: float = 0.0
+        self.previous_offset_x: float = 0.0
+
+        # Velocidade de rolagem (a simulação atualiza este valor)
+        self.speed: float = config.GAME_SPEED
+
+        # Configura a área de colisão do chão
+        self.collision_rect: dict[str, float] = {
+            'x': 0,
+            'y': self.y_position,
+            'width': window_width,
+            'height': GROUND_HEIGHT
+        }
+
+    def update(self, delta_time: float) -> None:
+        """
+        Atualiza a posição do chão para criar efeito de movimento
+
+        Args:
+            delta_time: Tempo desde o último quadro em segundos
+        """
+        # Mantém o offset dentro da largura para evitar perda de precisão com o tempo
+        self.offset_x = (self.offset_x + self.speed * delta_time) % self.width
+
+    def store_previous(self) -> None:
+        """
+        Guarda o offset atual como estado anterior (chamar antes de cada passo)
+        """
+        self.previous_offset_x = self.offset_x
+
+    def pack_state(self) -> bytes:
+        """
+        Estado do chão em bytes (ver GameSimulation.snapshot)
+        """
+        return self._STATE.pack(self.offset_x, self.previous_offset_x, self.speed)
+
+    def unpack_state(self, data: bytes, offset: int) -> int:
+        """
+        Restaura o estado gravado por pack_state
+
+        Args:
+            data: Buffer com o estado
+            offset: Posição do estado no buffer
+
+        Returns:
+            Posição logo após o estado
+        """
+        self.offset_x, self.previous_offset_x, self.speed = self._STATE.unpack_from(data, offset)
+        return offset + self._STATE.size
+
+    def interpolated_offset(self, alpha: float) -> float:
+        """
+        Offset entre o passo anterior (alpha = 0) e o atual (alpha = 1)
+
+        Args:
+            alpha: Fração do passo já decorrida no quadro
+        """
+        # O offset dá a volta na largura: o avanço do passo é sempre positivo
+        advance = (self.offset_x - self.previous_offset_x) % self.width
+        return (self.offset_x - advance * (1.0 - alpha)) % self.width
+
+    def check_collision(self, object_rect: dict[str, float]) -> bool:
+        """
+        Verifica se há colisão entre o chão e outro objeto
+
+        Args:
+            object_rect: Retângulo do objeto a verificar colisão (dict com x, y, width, height)
+
+        Returns:
+            bool: True se há colisão, False caso contrário
+        """
+        # Implementação simples de colisão AABB (Axis-Aligned Bounding Box)
+        return (
+            object_rect['x'] < self.collision_rect['x'] + self.collision_rect['width'] and
+            object_rect['x'] + object_rect['width'] > self.collision_rect['x'] and
+            object_rect['y'] < self.collision_rect['y'] + self.collision_rect['height'] and
+            object_rect['y'] + object_rect['height'] > self.collision_rect['y']
+        )
+
+    def sweep_collision(self, bird_rect: CollisionRect, bird_dx: float, bird_dy: float,
+                        bird_mask: typing.Optional[MovingMask] = None) -> typing.Optional[float]:
+        """
+        Colisão contínua do pássaro com o chão durante o último passo (o chão
+        só rola a textura, sua área de colisão é fixa e toda opaca)
+
+        Args:
+            bird_rect: Retângulo de colisão do pássaro no fim do passo (x, y, width, height)
+            bird_dx: Deslocamento horizontal do pássaro no passo
+            bird_dy: Deslocamento vertical do pássaro no passo
+            bird_mask: Máscara do pássaro recortada em bird_rect (só caixas se None)
+
+        Returns:
+            Fração do passo em que o pássaro tocou o chão, ou None
+        """
+        x, y, width, height = bird_rect
+        rect = self.collision_rect
+        hit_time = sweep_aabb(x - bird_dx, y - bird_dy, width, height, bird_dx, bird_dy,
+                              rect['x'], rect['y'], rect['width'], rect['height'])
+        if hit_time is not None and bird_mask is not None:
+            hit_time = sweep_mask(bird_mask, x - bird_dx, y - bird_dy, bird_dx, bird_dy, hit_time,
+                                  solid_obstacle_mask(rect['width'], rect['height']), rect['x'], rect['y'])
+        return hit_time
+
+class HeartBody:
+    """
+    Item de vida extra (coração) flutuante, sem textura
+    """
+
+    # Estado para snapshots: posição, velocidade, altura base, tempo e fase da
+    # flutuação, posição anterior, ativo
+    _STATE = struct.Struct("<8d?")
+
+    def __init__(self, window_width: float, window_height: float, rng: typing.Optional[RandomSource] = None):
+        """
+        Inicializa o item de coração
+
+        Args:
+            window_width: Largura da janela
+            window_height: Altura da janela
+            rng: Gerador aleatório (usa o módulo random se não fornecido)
+        """
+        self.window_width = window_width
+        self.window_height = window_height
+        self.rng: RandomSource = rng if rng is not None else random
+
+        # Dimensões do item (usando valores do config)
+        self.width = HEART_ITEM_WIDTH
+        self.height = HEART_ITEM_HEIGHT
+
+        # Posição inicial (fora da tela à direita)
+        self.x = window_width + 100.0
+
+        # Altura aleatória (entre 25% e 75% da altura total da tela)
+        min_y = window_height * 0.25
+        max_y = window_height * 0.75 - self.height
+        self.y = self.rng.uniform(min_y, max_y)
+
+        # Velocidade do item (igual à dos canos, a simulação atualiza este valor)
+        self.speed = config.PIPE_SPEED
+
+        # Controla se o item está ativo (visível na tela)
+        self.active = False
+
+        # Efeito de flutuação (usando valores do config)
+        self.float_amplitude = HEART_ITEM_FLOAT_AMPLITUDE
+        self.float_speed = HEART_ITEM_FLOAT_SPEED
+        self.float_offset = self.rng.uniform(0.0, 6.28)  # Valor aleatório entre 0 e 2*PI
+        self.base_y = self.y
+        self.time = 0.0
+
+        # Posição no passo anterior, para a renderização interpolar entre passos
+        self.previous_x = self.x
+        self.previous_y = self.y
+
+    def update(self, delta_time: float) -> None:
+        """
+        Atualiza a posição do item
+
+        Args:
+            delta_time: Tempo desde o último quadro em segundos
+        """
+        if not self.active:
+            return
+
+        # Move o item para a esquerda
+        self.x -= self.speed * delta_time
+
+        # Atualiza o efeito de flutuação
+        self.time += delta_time
+        self.y = self.base_y + self.float_amplitude * (
+            math.sin(self.time * self.float_speed + self.float_offset)
+        )
+
+        # Verifica se o item saiu da tela
+        if self.x + self.width < 0:
+            self.active = False
+
+    def spawn(self, base_y: typing.Optional[float] = None, float_offset: typing.Optional[float] = None) -> None:
+        """
+        Ativa o item e posiciona-o fora da tela à direita
+
+        Args:
+            base_y: Altura base (sorteada se None)
+            float_offset: Fase da flutuação (sorteada se None)
+        """
+        self.active = True
+        self.x = self.window_width + 100.0
+
+        # Nova altura aleatória
+        if base_y is None:
+            min_y = self.window_height * 0.25
+            max_y = self.window_height * 0.75 - self.height
+            base_y = self.rng.uniform(min_y, max_y)
+        self.base_y = base_y
+        self.y = self.base_y
+
+        # Reinicia o tempo de flutuação com offset aleatório
+        self.time = 0.0
+        self.float_offset = float_offset if float_offset is not None else self.rng.uniform(0.0, 6.28)
+
+        # O item aparece já na posição nova, sem interpolar a partir da antiga
+        self.store_previous()
+
+    def store_previous(self) -> None:
+        """
+        Guarda a posição atual como estado anterior (chamar antes de cada passo)
+        """
+        self.previous_x = self.x
+        self.previous_y = self.y
+
+    def pack_state(self) -> bytes:
+        """
+        Estado do item em bytes (ver GameSimulation.snapshot)
+        """
+        return self._STATE.pack(self.x, self.y, self.speed, self.base_y, self.time, self.float_offset,
+                                self.previous_x, self.previous_y, self.active)
+
+    def unpack_state(self, data: bytes, offset: int) -> int:
+        """
+        Restaura o estado gravado por pack_state
+
+        Args:
+            data: Buffer com o estado
+            offset: Posição do estado no buffer
+
+        Returns:
+            Posição logo após o estado
+        """
+        (self.x, self.y, self.speed, self.base_y, self.time, self.float_offset,
+         self.previous_x, self.previous_y, self.active) = self._STATE.unpack_from(data, offset)
+        return offset + self._STATE.size
+
+    def interpolated(self, alpha: float) -> typing.Tuple[float, float]:
+        """
+        Posição (x, y) entre o passo anterior (alpha = 0) e o atual (alpha = 1)
+
+        Args:
+            alpha: Fração do passo já decorrida no quadro
+        """
+        return (self.previous_x + (self.x - self.previous_x) * alpha,
+                self.previous_y + (self.y - self.previous_y) * alpha)
+
+    def is_colliding(self, bird_rect: typing.Dict[str, float]) -> bool:
+        """
+        Verifica se o pássaro está colidindo com o item
+
+        Args:
+            bird_rect: Retângulo de colisão do pássaro (dict com x, y, width, height)
+
+        Returns:
+            bool: True se há colisão, False caso contrário
+        """
+        if not self.active:
+            return False
+
+        # Verificação simples de colisão AABB (Axis-Aligned Bounding Box)
+        return (
+            bird_rect['x'] < self.x + self.width and
+            bird_rect['x'] + bird_rect['width'] > self.x and
+            bird_rect['y'] < self.y + self.height and
+            bird_rect['y'] + bird_rect['height'] > self.y
+        )
+
+    def sweep_collision(self, bird_rect: CollisionRect, bird_dx: float, bird_dy: float,
+                        bird_mask: typing.Optional[MovingMask] = None) -> typing.Optional[float]:
+        """
+        Colisão contínua do pássaro com o item durante o último passo, com o
+        movimento do pássaro tomado em relação ao do item (de previous_x,
+        previous_y até a posição atual)
+
+        Args:
+            bird_rect: Retângulo de colisão do pássaro no fim do passo (x, y, width, height)
+            bird_dx: Deslocamento horizontal do pássaro no passo
+            bird_dy: Deslocamento vertical do pássaro no passo
+            bird_mask: Máscara do pássaro recortada em bird_rect (só caixas se None)
+
+        Returns:
+            Fração do passo em que o pássaro tocou o item, ou None (também se inativo)
+        """
+        if not self.active:
+            return None
+        x, y, width, height = bird_rect
+        dx = bird_dx - (self.x - self.previous_x)
+        dy = bird_dy - (self.y - self.previous_y)
+        hit_time = sweep_aabb(x - dx, y - dy, width, height, dx, dy, self.x, self.y, self.width, self.height)
+        if hit_time is not None and bird_mask is not None:
+            hit_time = sweep_mask(bird_mask, x - dx, y - dy, dx, dy, hit_time,
+                                  heart_mask(self.width, self.height), self.x, self.y)
+        return hit_time
+
+    def reset(self) -> None:
+        """
+        Reinicia o estado do item (desativa-o)
+        """
+        self.active = False
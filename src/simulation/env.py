@@ -0,0 +1,114 @@
+"""
+Ambiente no estilo Gym para o Flappy Bird
+Envolve uma GameSimulation com a interface reset(seed) / step(action)
+"""
+
+import sys
+import os
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation.game_simulation import GameSimulation, SimulationInput, SimulationEvent
+from simulation.encoders import ObservationEncoder, FeatureEncoder
+
+class FlappyAction:
+    """
+    Ações aceitas por FlappyEnv.step
+    """
+    NOOP = 0
+    FLAP = 1
+
+class FlappyEnv:
+    """
+    Ambiente de um único jogador com a interface do Gymnasium:
+    reset(seed) -> (observação, info) e
+    step(action) -> (observação, recompensa, terminado, truncado, info).
+
+    Recompensa: +1 por par de canos ultrapassado (PipeField.check_score) e
+    -1 por vida perdida. O episódio termina quando as vidas acabam (Game Over).
+    """
+
+    # Número de ações (FlappyAction.NOOP e FlappyAction.FLAP)
+    action_count: int = 2
+
+    def __init__(self, encoder: typing.Optional[ObservationEncoder] = None,
+                 delta_time: float = 1 / 60, max_steps: typing.Optional[int] = None,
+                 hit_penalty: float = 1.0):
+        """
+        Inicializa o ambiente
+
+        Args:
+            encoder: Codificador de observação (padrão: FeatureEncoder)
+            delta_time: Duração de cada passo em segundos
+            max_steps: Limite de passos por episódio (truncado=True ao atingir)
+            hit_penalty: Valor subtraído da recompensa a cada vida perdida
+        """
+        self.encoder: ObservationEncoder = encoder if encoder is not None else FeatureEncoder()
+        self.delta_time = delta_time
+        self.max_steps = max_steps
+        self.hit_penalty = hit_penalty
+        self.simulation: typing.Optional[GameSimulation] = None
+        self.steps: int = 0
+
+    @property
+    def observation_shape(self) -> typing.Tuple[int, ...]:
+        """
+        Formato das observações do codificador atual
+        """
+        return self.encoder.shape
+
+    def reset(self, seed: typing.Optional[int] = None) -> typing.Tuple[np.ndarray, typing.Dict[str, typing.Any]]:
+        """
+        Começa um novo episódio, já com o jogo iniciado
+
+        Args:
+            seed: Semente da partida (aleatória se None)
+
+        Returns:
+            Observação inicial e dicionário de informações
+        """
+        self.simulation = GameSimulation(seed=seed)
+        # O primeiro FLAP só tira o jogo da tela inicial, sem pulo nem avanço de tempo
+        self.simulation.step(0.0, SimulationInput.FLAP)
+        self.steps = 0
+        self.encoder.reset(self.simulation)
+        return self.encoder.encode(self.simulation), self._info()
+
+    def step(self, action: int) -> typing.Tuple[np.ndarray, float, bool, bool, typing.Dict[str, typing.Any]]:
+        """
+        Avança um passo da partida
+
+        Args:
+            action: FlappyAction.FLAP (Bird.jump) ou FlappyAction.NOOP
+
+        Returns:
+            observação, recompensa, terminado, truncado e dicionário de informações
+        """
+        simulation = self.simulation
+        if simulation is None:
+            raise RuntimeError("Chame reset() antes de step()")
+
+        inputs = SimulationInput.FLAP if action else SimulationInput.NONE
+        events = simulation.step(self.delta_time, inputs)
+        self.steps += 1
+
+        reward = 0.0
+        if events & SimulationEvent.SCORED:
+            reward += 1.0
+        if events & SimulationEvent.HIT:
+            reward -= self.hit_penalty
+
+        terminated = simulation.game_over
+        truncated = self.max_steps is not None and self.steps >= self.max_steps and not terminated
+        return self.encoder.encode(simulation), reward, terminated, truncated, self._info()
+
+    def _info(self) -> typing.Dict[str, typing.Any]:
+        """
+        Informações auxiliares do passo
+        """
+        simulation = self.simulation
+        assert simulation is not None
+        return {"score": simulation.score, "lives": simulation.lives, "steps": self.steps}
@@ -0,0 +1,87 @@
+"""
+Passo fixo para a simulação do Flappy Bird
+Converte o tempo variável entre quadros em uma quantidade inteira de passos de
+mesma duração, para que a física seja idêntica em qualquer taxa de quadros.
+O tempo que sobra (menos de um passo) fica acumulado para o próximo quadro e
+indica quanto a renderização deve interpolar entre o passo anterior e o atual.
+"""
+
+import typing
+
+class FixedTimestep:
+    """
+    Acumulador de passo fixo com proteção contra a "espiral da morte": se um
+    quadro demorar mais que max_steps passos, o excedente é descartado em vez de
+    acumular atraso (o jogo fica mais lento durante o travamento, mas não trava de vez)
+    """
+
+    def __init__(self, rate: float, max_steps: int):
+        """
+        Inicializa o acumulador
+
+        Args:
+            rate: Passos de simulação por segundo
+            max_steps: Máximo de passos executados em um quadro
+        """
+        self.step: float = 1.0 / rate
+        self.max_steps: int = max_steps
+        self.accumulator: float = 0.0
+
+        # Contadores
+        self.frames: int = 0        # Quadros (chamadas a advance)
+        self.steps: int = 0         # Passos executados
+        self.merged_steps: int = 0  # Passos extras executados em um mesmo quadro para recuperar atraso
+        self.idle_frames: int = 0   # Quadros sem passo (só interpolação)
+        self.dropped_steps: int = 0 # Passos descartados pela proteção contra a espiral
+
+    @property
+    def alpha(self) -> float:
+        """
+        Fração do próximo passo já decorrida (0 a 1), usada para interpolar a renderização
+        """
+        return min(self.accumulator / self.step, 1.0)
+
+    def advance(self, frame_time: float) -> int:
+        """
+        Acumula o tempo do quadro e calcula quantos passos executar
+
+        Args:
+            frame_time: Tempo real desde o quadro anterior em segundos
+
+        Returns:
+            Quantidade de passos de duração self.step a executar neste quadro
+        """
+        self.frames += 1
+        if frame_time > 0.0:
+            self.accumulator += frame_time
+
+        steps = int(self.accumulator / self.step)
+        self.accumulator -= steps * self.step
+        if steps > self.max_steps:
+            self.dropped_steps += steps - self.max_steps
+            steps = self.max_steps
+
+        if steps == 0:
+            self.idle_frames += 1
+        else:
+            self.merged_steps += steps - 1
+        self.steps += steps
+        return steps
+
+    def reset(self) -> None:
+        """
+        Descarta o tempo acumulado (ex.: depois de uma pausa)
+        """
+        self.accumulator = 0.0
+
+    def summary(self) -> typing.Dict[str, int]:
+        """
+        Contadores atuais como dicionário
+        """
+        return {
+            'frames': self.frames,
+            'steps': self.steps,
+            'merged_steps': self.merged_steps,
+            'idle_frames': self.idle_frames,
+            'dropped_steps': self.dropped_steps,
+        }
@@ -0,0 +1,405 @@
+"""
+Motor de simulação do Flappy Bird sem dependência de GLFW/OpenGL
+Concentra todo o estado e as regras que antes viviam em variáveis globais do main.py,
+permitindo rodar partidas em modo headless (bots, ajustes de dificuldade, testes)
+"""
+
+import math
+import random
+import struct
+import sys
+import os
+import time
+import typing
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, MAX_LIVES, PIXEL_COLLISION
+from config import HEART_ITEM_FREQUENCY
+from simulation.entities import BirdBody, PipeField, GroundBody, HeartBody
+from simulation.masks import BirdMasks, bird_masks
+from simulation.course import CourseGenerator
+from simulation.difficulty import DifficultySchedule, DifficultyState
+
+class SimulationInput:
+    """
+    Bits de entrada aceitos por GameSimulation.step (podem ser combinados com |)
+    """
+    NONE = 0
+    FLAP = 1     # Espaço/clique: inicia o jogo ou faz o pássaro pular
+    RESTART = 2  # Tecla R/botão de restart: reinicia após o Game Over
+
+class SimulationEvent:
+    """
+    Bits de eventos retornados por GameSimulation.step
+    """
+    NONE = 0
+    STARTED = 1       # O jogo começou
+    SCORED = 2        # O pássaro passou por um par de canos
+    SPEED_UP = 4      # A velocidade aumentou
+    HEART_SPAWNED = 8 # Um item de vida apareceu
+    HEART_COLLECTED = 16 # O pássaro coletou um item de vida
+    HIT = 32          # O pássaro colidiu e perdeu uma vida
+    GAME_OVER = 64    # As vidas acabaram
+    RESTARTED = 128   # Uma nova rodada (ou partida) começou
+
+SNAPSHOT_MAGIC: bytes = b"FBSS"
+SNAPSHOT_VERSION: int = 3  # 2: posição no percurso; 3: nível de dificuldade
+
+# magic, versão, vidas, pontuação, iniciado, game over, pontuação do último
+# item, tempo simulado, passos, instante do contato (NaN se None), nível de
+# dificuldade; percurso: semente, posição e o par anterior ao bloco atual
+# (ver CourseGenerator.state)
+_SNAPSHOT_HEADER = struct.Struct("<4sHii??idQdIQIdd")
+
+# Estado do Mersenne Twister (random.Random.getstate): versão, 624 palavras e
+# a posição, próximo valor gaussiano (NaN se None)
+_RNG_STATE = struct.Struct("<B625Id")
+
+class GameSimulation:
+    """
+    Estado completo de uma partida e as regras que o fazem avançar.
+    O cliente com janela (main.py) é apenas um dos usuários desta classe:
+    ele traduz eventos de teclado/mouse em SimulationInput e desenha o estado.
+    """
+
+    def __init__(self,
+                 window_width: int = WINDOW_WIDTH,
+                 window_height: int = WINDOW_HEIGHT,
+                 seed: typing.Optional[int] = None,
+                 rng: typing.Optional[random.Random] = None,
+                 clock: typing.Callable[[], float] = time.perf_counter,
+                 bird: typing.Optional[BirdBody] = None,
+                 pipes: typing.Optional[PipeField] = None,
+                 ground: typing.Optional[GroundBody] = None,
+                 heart_item: typing.Optional[HeartBody] = None,
+                 pixel_collision: bool = PIXEL_COLLISION,
+                 course: typing.Optional[CourseGenerator] = None,
+                 schedule: typing.Optional[DifficultySchedule] = None,
+                 masks: typing.Optional[BirdMasks] = None):
+        """
+        Inicializa a simulação
+
+        Args:
+            window_width: Largura do mundo (igual à da janela)
+            window_height: Altura do mundo (igual à da janela)
+            seed: Semente do gerador aleatório (ignorada se rng for fornecido)
+            rng: Gerador aleatório injetado (compartilhado com canos e item de vida)
+            clock: Relógio usado quando step() é chamado sem delta_time
+            bird, pipes, ground, heart_item: Entidades já criadas (ex: componentes com textura);
+                se omitidas, são criadas versões sem renderização
+            pixel_collision: Confirma os contatos com as máscaras de pixels dos sprites
+                (se False, usa só a caixa de 2/3 do pássaro)
+            course: Percurso dos canos e do item de vida (ex: um percurso nomeado de
+                load_course); se omitido, é gerado pela semente (ou por um valor
+                tirado de rng, se a semente não for dada ou rng for injetado)
+            schedule: Tabela de dificuldade (a do config se None)
+            masks: Máscaras do pássaro já prontas (ex.: do cache de assets); se
+                omitidas e pixel_collision for True, são geradas aqui. A janela pode
+                criar a simulação sem colisão por pixel e atribuir self.bird_masks
+                quando as máscaras chegarem, antes de a partida começar
+        """
+        self.window_width = window_width
+        self.window_height = window_height
+        self.rng: random.Random = rng if rng is not None else random.Random(seed)
+        self.clock = clock
+        self._last_clock: typing.Optional[float] = None
+
+        self.bird: BirdBody = bird if bird is not None else BirdBody(window_width, window_height)
+        self.pipes: PipeField = pipes if pipes is not None else PipeField(window_width, window_height, self.rng)
+        self.ground: GroundBody = ground if ground is not None else GroundBody(window_width, window_height)
+        self.heart_item: HeartBody = heart_item if heart_item is not None else HeartBody(window_width, window_height, self.rng)
+
+        # Máscaras de colisão do pássaro (geradas uma vez por processo e compartilhadas)
+        if masks is None and pixel_collision:
+            masks = bird_masks(self.bird.width, self.bird.height)
+        self.bird_masks: typing.Optional[BirdMasks] = masks
+
+        # Todas as entidades sorteiam valores com o mesmo gerador
+        self.pipes.rng = self.rng
+        self.heart_item.rng = self.rng
+
+        # Nível de dificuldade: velocidades e espaçamento dos canos vêm da tabela,
+        # repassados às entidades só quando a versão do estado muda
+        self.difficulty: DifficultyState = DifficultyState(schedule)
+        self._difficulty_version: int = -1
+
+        # Os pares de canos e as posições do item de vida vêm do percurso
+        if course is None:
+            course_seed = seed if seed is not None and rng is None else self.rng.getrandbits(63)
+            course = CourseGenerator(course_seed, self.pipes._min_pipe_height, self.pipes._max_pipe_height,
+                                     window_height, schedule=self.difficulty.schedule)
+        self.course: CourseGenerator = course
+        self.pipes.course = course
+
+        # Estado da partida
+        self.lives: int = MAX_LIVES
+        self.score: int = 0
+        self.game_started: bool = False
+        self.game_over: bool = False
+        self.last_heart_spawn_score: int = 0 # Última pontuação que gerou um item de vida
+        self.elapsed: float = 0.0 # Tempo simulado em segundos
+        self.ticks: int = 0
+        self.contact_time: typing.Optional[float] = None # Fração do último passo em que o pássaro colidiu (None se não colidiu)
+
+        # Último estado do gerador lido por restore() (bytes e o valor para setstate)
+        self._rng_data: bytes = b""
+        self._rng_state: typing.Any = None
+        self._apply_difficulty()
+        self.pipes.reset()
+
+    def _apply_difficulty(self) -> None:
+        """
+        Propaga as velocidades e o espaçamento do nível atual para as entidades,
+        se o estado de dificuldade mudou desde a última vez
+        """
+        difficulty = self.difficulty
+        if difficulty.version == self._difficulty_version:
+            return
+        self._difficulty_version = difficulty.version
+        self.ground.speed = difficulty.game_speed
+        self.pipes.speed = difficulty.pipe_speed
+        self.pipes.spacing = difficulty.spacing
+        self.heart_item.speed = difficulty.pipe_speed
+
+    def _reset_round(self) -> None:
+        """
+        Recomeça a rodada atual: pássaro na posição inicial, sem canos nem item de vida
+        """
+        self.bird.reset()
+        self.pipes.reset()
+        self.heart_item.reset()
+
+    def restart(self) -> int:
+        """
+        Reinicia o jogo; se as vidas acabaram, zera também pontuação e velocidades
+
+        Returns:
+            Eventos gerados (SimulationEvent.RESTARTED)
+        """
+        if self.lives <= 0:
+            self.lives = MAX_LIVES
+            self.score = 0
+            self.last_heart_spawn_score = 0
+            self.difficulty.set_tier(0)
+            self._apply_difficulty()
+            # Cada partida começa do início do mesmo percurso
+            self.course.restart()
+
+        self.game_over = False
+        self._reset_round()
+        return SimulationEvent.RESTARTED
+
+    def store_previous(self) -> None:
+        """
+        Guarda o estado das entidades como estado anterior. Chamado no início de
+        cada step(): as colisões contínuas varrem do estado anterior ao atual, e
+        clientes que desenham entre passos interpolam entre os dois
+        """
+        self.bird.store_previous()
+        self.pipes.store_previous()
+        self.ground.store_previous()
+        self.heart_item.store_previous()
+
+    def snapshot(self) -> bytes:
+        """
+        Grava o estado completo da partida em um buffer compacto: pássaro, canos,
+        chão, item de vida, pontuação, vidas, velocidades, posição no percurso e
+        o estado do gerador aleatório. Custa microssegundos (alguns KB, a maior parte do gerador),
+        então serve para bots que exploram jogadas, avaliar alternativas a
+        partir do mesmo ponto e recuperar uma partida após uma falha
+
+        Returns:
+            Estado em bytes, para restore()
+        """
+        rng_version, words, gauss_next = self.rng.getstate()
+        contact_time = math.nan if self.contact_time is None else self.contact_time
+        return b"".join((
+            _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.lives, self.score, self.game_started,
+                                  self.game_over, self.last_heart_spawn_score, self.elapsed, self.ticks,
+                                  contact_time, self.difficulty.tier, *self.course.state()),
+            _RNG_STATE.pack(rng_version, *words, math.nan if gauss_next is None else gauss_next),
+            self.bird.pack_state(),
+            self.pipes.pack_state(),
+            self.ground.pack_state(),
+            self.heart_item.pack_state(),
+        ))
+
+    def restore(self, data: bytes) -> None:
+        """
+        Volta ao estado gravado por snapshot(), inclusive em outra instância
+        (com as mesmas dimensões). As entidades são atualizadas no lugar, então
+        componentes com textura continuam desenhando o estado restaurado.
+        O relógio injetado recomeça: o próximo step() sem delta_time dura 0
+
+        Args:
+            data: Buffer criado por snapshot()
+
+        Raises:
+            ValueError: Se o buffer não for um snapshot desta versão
+        """
+        if len(data) < _SNAPSHOT_HEADER.size or data[:4] != SNAPSHOT_MAGIC:
+            raise ValueError("snapshot inválido")
+        (_, version, self.lives, self.score, self.game_started, self.game_over, self.last_heart_spawn_score,
+         self.elapsed, self.ticks, contact_time, tier, course_seed, course_position, carry_gap,
+         carry_jitter) = _SNAPSHOT_HEADER.unpack_from(data)
+        if version != SNAPSHOT_VERSION:
+            raise ValueError("versão de snapshot desconhecida")
+        self.difficulty.set_tier(tier)
+        self.course.seek(course_position, carry_gap, carry_jitter, course_seed)
+        self.contact_time = None if math.isnan(contact_time) else contact_time
+        self._last_clock = None
+
+        # Converter as 625 palavras do gerador é a parte mais cara: ao restaurar
+        # várias vezes o mesmo estado do gerador (ex: explorar jogadas a partir
+        # do mesmo ponto), a conversão anterior é reaproveitada
+        offset = _SNAPSHOT_HEADER.size + _RNG_STATE.size
+        rng_data = data[_SNAPSHOT_HEADER.size:offset]
+        if rng_data != self._rng_data:
+            rng_state = _RNG_STATE.unpack(rng_data)
+            gauss_next = rng_state[-1]
+            self._rng_state = (rng_state[0], rng_state[1:-1], None if math.isnan(gauss_next) else gauss_next)
+            self._rng_data = rng_data
+        self.rng.setstate(self._rng_state)
+
+        offset = self.bird.unpack_state(data, offset)
+        offset = self.pipes.unpack_state(data, offset)
+        offset = self.ground.unpack_state(data, offset)
+        offset = self.heart_item.unpack_state(data, offset)
+        if offset != len(data):
+            raise ValueError("tamanho não confere com o conteúdo do snapshot")
+
+    def step(self, delta_time: typing.Optional[float] = None, inputs: int = SimulationInput.NONE) -> int:
+        """
+        Avança a simulação em um passo
+
+        Args:
+            delta_time: Duração do passo em segundos (se None, usa o relógio injetado)
+            inputs: Combinação de bits de SimulationInput aplicada antes do passo
+
+        Returns:
+            Combinação de bits de SimulationEvent ocorridos neste passo
+        """
+        if delta_time is None:
+            now = self.clock()
+            delta_time = 0.0 if self._last_clock is None else now - self._last_clock
+            self._last_clock = now
+
+        events = SimulationEvent.NONE
+        bird = self.bird
+        self.store_previous()
+
+        # Aplica as entradas do jogador
+        if inputs:
+            if inputs & SimulationInput.FLAP:
+                if not self.game_started:
+                    self.game_started = True
+                    events |= SimulationEvent.STARTED
+                elif not self.game_over:
+                    bird.jump()
+            if inputs & SimulationInput.RESTART and self.game_over:
+                events |= self.restart()
+
+        self.elapsed += delta_time
+        self.ticks += 1
+
+        # O chão só rola enquanto o jogo não terminou
+        if not self.game_over:
+            self.ground.update(delta_time)
+
+        # Se o jogo ainda não começou, aguarda ação do usuário
+        if not self.game_started:
+            return events
+
+        if self.game_over:
+            # Mesmo quando o jogo acabar, o pássaro continua atualizando para cair
+            bird.update(delta_time)
+            return events
+
+        bird.update(delta_time)
+        self.heart_item.update(delta_time)
+
+        pipes = self.pipes
+        pipes.update(delta_time)
+        if pipes.check_score(bird.x):
+            events |= self._on_scored()
+
+        return events | self._check_collisions()
+
+    def _on_scored(self) -> int:
+        """
+        Soma o ponto e aplica aumento de velocidade e spawn do item de vida
+
+        Returns:
+            Eventos gerados
+        """
+        events = SimulationEvent.SCORED
+        self.score += 1
+        score = self.score
+
+        # Sobe de nível quando a pontuação alcança o próximo da tabela de dificuldade
+        if self.difficulty.update(score):
+            self._apply_difficulty()
+            events |= SimulationEvent.SPEED_UP
+
+        # Gera um item de vida extra a cada HEART_ITEM_FREQUENCY pontos
+        if (score % HEART_ITEM_FREQUENCY == 0 and score > self.last_heart_spawn_score and
+                not self.heart_item.active):
+            self.heart_item.spawn(*self.course.heart())
+            self.last_heart_spawn_score = score
+            events |= SimulationEvent.HEART_SPAWNED
+
+        return events
+
+    def _check_collisions(self) -> int:
+        """
+        Verifica colisões do pássaro com chão, teto, canos e item de vida
+
+        Returns:
+            Eventos gerados
+        """
+        events = SimulationEvent.NONE
+        bird = self.bird
+        if self.bird_masks is not None:
+            # Caixa dos pixels opacos do pássaro como pré-filtro; os contatos
+            # das caixas são confirmados pixel a pixel
+            mask, hitbox = bird.collision_mask(self.bird_masks)
+        else:
+            mask, hitbox = None, bird.hitbox
+
+        # Testes contínuos sobre o passo inteiro: com os canos rápidos das
+        # dificuldades mais altas (ou passos longos), um teste só no fim do passo
+        # deixaria o pássaro atravessar um obstáculo. O pássaro só se move na vertical
+        dy = bird.y - bird.previous_y
+
+        # Chão e canos: o primeiro contato no passo
+        contact = self.ground.sweep_collision(hitbox, 0.0, dy, mask)
+        pipe_contact = self.pipes.sweep_collision(hitbox, 0.0, dy, mask)
+        if pipe_contact is not None and (contact is None or pipe_contact < contact):
+            contact = pipe_contact
+
+        # Teto: basta o teste no fim do passo (não há o que atravessar)
+        if contact is None and bird.y + bird.height / 2 > self.window_height:
+            contact = 1.0
+        self.contact_time = contact
+
+        # Item de vida
+        heart = self.heart_item
+        if heart.sweep_collision(hitbox, 0.0, dy, mask) is not None:
+            self.lives = min(self.lives + 1, MAX_LIVES)
+            heart.reset()
+            events |= SimulationEvent.HEART_COLLECTED
+
+        if contact is not None:
+            bird.die()
+            self.lives -= 1
+            events |= SimulationEvent.HIT
+            if self.lives <= 0:
+                self.game_over = True
+                events |= SimulationEvent.GAME_OVER
+            else:
+                # Reinicia automaticamente para a próxima vida
+                events |= self.restart()
+
+        return events
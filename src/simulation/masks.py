@@ -0,0 +1,400 @@
+"""
+Máscaras de colisão por pixel, sem dependência de OpenGL
+As máscaras vêm do canal alpha das mesmas imagens desenhadas pelo jogo,
+redimensionadas para o tamanho dos objetos no mundo (1 bit por pixel do
+mundo). O pássaro tem uma máscara por quadro da animação e por faixa de
+rotação, geradas uma vez e guardadas em cache (na memória e, empacotadas em
+arrays, no cache de assets da janela); na partida, o teste por pixel
+só acontece quando os retângulos já se tocam, e é um AND bit a bit entre as
+linhas do pássaro (uint64) e uma janela de 64 colunas do obstáculo.
+"""
+
+import math
+import sys
+import os
+import typing
+from PIL import Image # type: ignore
+import numpy as np # type: ignore
+from numpy.lib.stride_tricks import sliding_window_view # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import assets
+from config import COLLISION_MASK_ALPHA_THRESHOLD, COLLISION_MASK_ROTATION_STEP
+
+if typing.TYPE_CHECKING:
+    from asset_cache import AssetCache
+
+# Largura máxima de uma máscara móvel: cada linha é um uint64
+MASK_BITS: int = 64
+
+# Fator de supersampling ao redimensionar e girar as imagens antes de
+# reduzir para a resolução do mundo (bordas mais fiéis ao que é desenhado)
+SUPERSAMPLING: int = 4
+
+# Rotações cobertas pelas máscaras do pássaro, em graus: as colisões só são
+# testadas com o pássaro vivo, cuja rotação BirdBody.update limita a +-20
+MIN_ROTATION: float = -20.0
+MAX_ROTATION: float = 20.0
+
+# Máscaras já geradas, por (tipo, imagem, tamanho, ...)
+_CACHE: typing.Dict[typing.Tuple[typing.Any, ...], typing.Any] = {}
+
+# Colunas da tabela de caixas das máscaras do pássaro guardada no cache de assets
+_MOVEMENT, _BUCKET, _LEFT, _BOTTOM, _WIDTH, _HEIGHT = range(6)
+
+class MovingMask(typing.NamedTuple):
+    """
+    Máscara de um objeto que se move (pássaro), recortada na caixa dos pixels opacos
+    """
+    rows: np.ndarray  # uint64 por linha, de baixo para cima; o bit i é a coluna i a partir da esquerda
+    left: float       # Borda esquerda da caixa em relação ao centro do sprite
+    bottom: float     # Borda inferior da caixa em relação ao centro do sprite
+    width: int
+    height: int
+
+    def rect(self, center_x: float, center_y: float) -> typing.Tuple[float, float, float, float]:
+        """
+        Caixa dos pixels opacos no mundo (x, y, width, height), para a fase larga
+
+        Args:
+            center_x, center_y: Centro do sprite no mundo
+        """
+        return (center_x + self.left, center_y + self.bottom, float(self.width), float(self.height))
+
+class ObstacleMask(typing.NamedTuple):
+    """
+    Máscara de um obstáculo, guardada como janelas de 64 colunas: windows[s, linha]
+    tem as colunas s - 64 a s - 1 da linha (fora da imagem, zeros), então
+    qualquer deslocamento horizontal do pássaro é um índice, sem shifts.
+    Linhas iguais (o corpo do cano) são guardadas uma vez só
+    """
+    windows: np.ndarray     # (largura + 65, linhas distintas) uint64
+    row_index: np.ndarray   # Linha distinta de cada linha, de baixo para cima
+    width: int
+    height: int
+
+def _alpha_mask(image: Image.Image, threshold: int = COLLISION_MASK_ALPHA_THRESHOLD) -> np.ndarray:
+    """
+    Pixels opacos de uma imagem "L" com o alpha, invertida para a linha 0 ser a base
+    """
+    return np.asarray(image)[::-1] >= threshold
+
+def _load_alpha(path: typing.Any, width: int, height: int) -> Image.Image:
+    """
+    Canal alpha de uma imagem redimensionada para width x height pixels
+    (vezes SUPERSAMPLING)
+    """
+    with Image.open(path) as image:
+        alpha = image.convert("RGBA").getchannel("A")
+    return alpha.resize((width * SUPERSAMPLING, height * SUPERSAMPLING), Image.BILINEAR)
+
+def _reduce(image: Image.Image) -> Image.Image:
+    """
+    Volta uma imagem com supersampling para a resolução do mundo
+    """
+    width, height = image.size
+    return image.resize((max(1, round(width / SUPERSAMPLING)), max(1, round(height / SUPERSAMPLING))), Image.BOX)
+
+def pack_rows(mask: np.ndarray) -> np.ndarray:
+    """
+    Empacota cada linha de uma máscara booleana (linhas, até 64 colunas) em um uint64
+
+    Returns:
+        Array (linhas,) uint64 com o bit i igual à coluna i
+    """
+    rows, columns = mask.shape
+    if columns > MASK_BITS:
+        raise ValueError(f"Máscara com {columns} colunas (máximo {MASK_BITS})")
+    padded = np.zeros((rows, MASK_BITS), dtype=bool)
+    padded[:, :columns] = mask
+    return np.packbits(padded, axis=1, bitorder="little").view("<u8").reshape(rows)
+
+def moving_mask(mask: np.ndarray, center_x: float, center_y: float) -> MovingMask:
+    """
+    Recorta uma máscara na caixa dos pixels opacos
+
+    Args:
+        mask: Máscara booleana (linhas de baixo para cima)
+        center_x, center_y: Centro do sprite em coordenadas da máscara
+
+    Returns:
+        Máscara recortada (vazia, com largura 0, se não houver pixels opacos)
+    """
+    columns = np.flatnonzero(mask.any(axis=0))
+    rows = np.flatnonzero(mask.any(axis=1))
+    if not len(columns):
+        return MovingMask(np.zeros(0, dtype=np.uint64), 0.0, 0.0, 0, 0)
+    c0, c1 = int(columns[0]), int(columns[-1]) + 1
+    r0, r1 = int(rows[0]), int(rows[-1]) + 1
+    return MovingMask(pack_rows(mask[r0:r1, c0:c1]), c0 - center_x, r0 - center_y, c1 - c0, r1 - r0)
+
+def obstacle_mask(mask: np.ndarray) -> ObstacleMask:
+    """
+    Monta as janelas de 64 colunas de uma máscara de obstáculo
+
+    Args:
+        mask: Máscara booleana (linhas de baixo para cima)
+    """
+    height, width = mask.shape
+    unique, row_index = np.unique(mask, axis=0, return_inverse=True)
+    padded = np.zeros((len(unique), width + 2 * MASK_BITS), dtype=bool)
+    padded[:, MASK_BITS:MASK_BITS + width] = unique
+    # Cada janela de 64 colunas vira um uint64 (bit k = coluna s + k do array com margem)
+    view = sliding_window_view(padded, MASK_BITS, axis=1)
+    windows = np.packbits(view, axis=2, bitorder="little").view("<u8")[:, :, 0]
+    # Um deslocamento por linha do array: as janelas de um deslocamento ficam contíguas
+    return ObstacleMask(np.ascontiguousarray(windows.T), row_index.reshape(height).astype(np.intp), width, height)
+
+def image_obstacle_mask(path: typing.Any, width: float, height: float) -> ObstacleMask:
+    """
+    Máscara de obstáculo de uma imagem desenhada com width x height pixels (em cache)
+    """
+    key = ("obstacle", str(path), round(width), round(height))
+    mask = _CACHE.get(key)
+    if mask is None:
+        alpha = _reduce(_load_alpha(path, round(width), round(height)))
+        mask = obstacle_mask(_alpha_mask(alpha))
+        _CACHE[key] = mask
+    return mask
+
+def solid_obstacle_mask(width: float, height: float) -> ObstacleMask:
+    """
+    Máscara de um obstáculo totalmente opaco (em cache)
+    """
+    key = ("solid", round(width), round(height))
+    mask = _CACHE.get(key)
+    if mask is None:
+        mask = obstacle_mask(np.ones((round(height), round(width)), dtype=bool))
+        _CACHE[key] = mask
+    return mask
+
+def pipe_masks(width: float, height: float) -> typing.Tuple[ObstacleMask, ObstacleMask]:
+    """
+    Máscaras dos canos inferior e superior no tamanho em que são desenhados (em cache)
+    """
+    key = ("pipes", width, height)
+    masks = _CACHE.get(key)
+    if masks is None:
+        masks = (image_obstacle_mask(assets.PIPE, width, height), image_obstacle_mask(assets.PIPE_ROTATED, width, height))
+        _CACHE[key] = masks
+    return masks
+
+def heart_mask(width: float, height: float) -> ObstacleMask:
+    """
+    Máscara do item de vida no tamanho em que é desenhado (em cache)
+    """
+    key = ("heart", width, height)
+    mask = _CACHE.get(key)
+    if mask is None:
+        mask = image_obstacle_mask(assets.HEART, width, height)
+        _CACHE[key] = mask
+    return mask
+
+class BirdMasks:
+    """
+    Máscaras do pássaro para cada quadro da animação e cada faixa de rotação
+    """
+
+    def __init__(self, frames: typing.Mapping[int, typing.Any], width: float, height: float,
+                 rotation_step: float = COLLISION_MASK_ROTATION_STEP):
+        """
+        Gera as máscaras girando o alpha de cada quadro como o lote gira o sprite
+        (em torno do centro, sentido anti-horário)
+
+        Args:
+            frames: Imagem de cada quadro, por BirdMovement
+            width: Largura em que o pássaro é desenhado
+            height: Altura em que o pássaro é desenhado
+            rotation_step: Largura de cada faixa de rotação, em graus
+        """
+        self.rotation_step = rotation_step
+        self.buckets: int = int(math.floor((MAX_ROTATION - MIN_ROTATION) / rotation_step)) + 1
+        self.masks: typing.Dict[int, typing.List[MovingMask]] = {}
+        for movement, path in frames.items():
+            alpha = _load_alpha(path, round(width), round(height))
+            masks: typing.List[MovingMask] = []
+            for bucket in range(self.buckets):
+                rotated = _reduce(alpha.rotate(MIN_ROTATION + bucket * rotation_step, Image.BILINEAR, expand=True))
+                mask = _alpha_mask(rotated)
+                rows, columns = mask.shape
+                masks.append(moving_mask(mask, columns / 2, rows / 2))
+            self.masks[movement] = masks
+
+    @classmethod
+    def from_arrays(cls, rows: np.ndarray, boxes: np.ndarray,
+                    rotation_step: float = COLLISION_MASK_ROTATION_STEP) -> "BirdMasks":
+        """
+        Reconstrói as máscaras a partir dos arrays de to_arrays(), sem imagens
+
+        Args:
+            rows: Linhas de todas as máscaras, em sequência
+            boxes: Uma linha por máscara: quadro, faixa, left, bottom, largura, altura
+            rotation_step: Largura de cada faixa de rotação, em graus
+        """
+        masks = cls.__new__(cls)
+        masks.rotation_step = rotation_step
+        masks.buckets = int(math.floor((MAX_ROTATION - MIN_ROTATION) / rotation_step)) + 1
+        masks.masks = {}
+        start = 0
+        for box in boxes:
+            height = int(box[_HEIGHT])
+            mask = MovingMask(np.array(rows[start:start + height], dtype=np.uint64), float(box[_LEFT]),
+                              float(box[_BOTTOM]), int(box[_WIDTH]), height)
+            masks.masks.setdefault(int(box[_MOVEMENT]), []).append(mask)
+            start += height
+        if any(len(frame) != masks.buckets for frame in masks.masks.values()) or start != len(rows):
+            raise ValueError("Máscaras do pássaro incompletas")
+        return masks
+
+    def to_arrays(self) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Empacota as máscaras em dois arrays, para o cache de assets
+
+        Returns:
+            Tupla (linhas de todas as máscaras em sequência, tabela de caixas)
+        """
+        boxes = [(movement, bucket, mask.left, mask.bottom, mask.width, mask.height)
+                 for movement, frame in self.masks.items() for bucket, mask in enumerate(frame)]
+        rows = [mask.rows for frame in self.masks.values() for mask in frame]
+        return np.concatenate(rows).astype(np.uint64), np.array(boxes, dtype=np.float64)
+
+    def lookup(self, movement: int, rotation: float) -> MovingMask:
+        """
+        Máscara do quadro e da faixa de rotação mais próxima
+
+        Args:
+            movement: Quadro da animação (BirdMovement)
+            rotation: Rotação em graus
+        """
+        bucket = int(round((rotation - MIN_ROTATION) / self.rotation_step))
+        if bucket < 0:
+            bucket = 0
+        elif bucket >= self.buckets:
+            bucket = self.buckets - 1
+        return self.masks[movement][bucket]
+
+    def bounds(self) -> typing.Tuple[float, float, float, float]:
+        """
+        Caixa que contém os pixels opacos de todos os quadros e rotações, em
+        relação ao centro do sprite (para quem prevê colisões sem saber o
+        quadro ou a rotação futuros)
+
+        Returns:
+            Tupla (left, bottom, right, top)
+        """
+        masks = [mask for frame in self.masks.values() for mask in frame]
+        return (min(mask.left for mask in masks), min(mask.bottom for mask in masks),
+                max(mask.left + mask.width for mask in masks), max(mask.bottom + mask.height for mask in masks))
+
+def bird_masks(width: float, height: float) -> BirdMasks:
+    """
+    Máscaras do pássaro com as imagens do jogo (geradas na primeira chamada e guardadas em cache)
+    """
+    # Importado aqui: entities importa este módulo
+    from simulation.entities import BirdMovement
+    key = ("bird", round(width), round(height), COLLISION_MASK_ROTATION_STEP)
+    masks = _CACHE.get(key)
+    if masks is None:
+        masks = BirdMasks({BirdMovement.UP: assets.BIRD_UP_FLAP, BirdMovement.MIDDLE: assets.BIRD_MID_FLAP,
+                           BirdMovement.DOWN: assets.BIRD_DOWN_FLAP}, width, height)
+        _CACHE[key] = masks
+    return masks
+
+def _bird_masks_name(width: float, height: float) -> str:
+    """
+    Nome dos arrays das máscaras do pássaro no cache de assets, com todos os
+    parâmetros da geração (as imagens de origem já são conferidas pelo cache)
+    """
+    return (f"bird_masks_{round(width)}x{round(height)}_step{COLLISION_MASK_ROTATION_STEP:g}"
+            f"_rotation{MIN_ROTATION:g}:{MAX_ROTATION:g}_alpha{COLLISION_MASK_ALPHA_THRESHOLD}_x{SUPERSAMPLING}")
+
+def bird_mask_arrays(width: float, height: float) -> typing.Dict[str, typing.Callable[[], np.ndarray]]:
+    """
+    Arrays das máscaras do pássaro para bake_asset_cache (nome -> função que gera o array)
+    """
+    name = _bird_masks_name(width, height)
+    return {f"{name}.rows": lambda: bird_masks(width, height).to_arrays()[0],
+            f"{name}.boxes": lambda: bird_masks(width, height).to_arrays()[1]}
+
+def cached_bird_masks(cache: "AssetCache", width: float, height: float) -> typing.Optional[BirdMasks]:
+    """
+    Máscaras do pássaro guardadas no cache de assets, registradas no cache em
+    memória para que bird_masks() não precise gerá-las
+
+    Args:
+        cache: Cache de assets aberto
+        width, height: Tamanho em que o pássaro é desenhado
+
+    Returns:
+        Máscaras ou None se não estiverem no cache de assets
+    """
+    key = ("bird", round(width), round(height), COLLISION_MASK_ROTATION_STEP)
+    masks = _CACHE.get(key)
+    if masks is not None:
+        return masks
+    name = _bird_masks_name(width, height)
+    rows, boxes = cache.array(f"{name}.rows"), cache.array(f"{name}.boxes")
+    if rows is None or boxes is None:
+        return None
+    try:
+        masks = BirdMasks.from_arrays(rows, boxes)
+    except ValueError as e:
+        print(f"Aviso: {e}")
+        return None
+    _CACHE[key] = masks
+    return masks
+
+def overlaps(mask: MovingMask, x: float, y: float, obstacle: ObstacleMask, obstacle_x: float, obstacle_y: float) -> bool:
+    """
+    Verifica se os pixels opacos de uma máscara móvel tocam os de um obstáculo
+
+    Args:
+        mask: Máscara móvel
+        x, y: Canto inferior esquerdo da caixa da máscara no mundo
+        obstacle: Máscara do obstáculo
+        obstacle_x, obstacle_y: Canto inferior esquerdo do obstáculo no mundo
+
+    Returns:
+        True se algum pixel opaco se sobrepõe
+    """
+    shift = math.floor(x) - math.floor(obstacle_x) + MASK_BITS
+    if shift < 0 or shift > obstacle.width + MASK_BITS:
+        return False
+    offset = math.floor(y) - math.floor(obstacle_y)  # Linha do obstáculo na base da máscara
+    first = -offset if offset < 0 else 0
+    last = obstacle.height - offset
+    if last > mask.height:
+        last = mask.height
+    if first >= last:
+        return False
+    windows = obstacle.windows[shift].take(obstacle.row_index[first + offset:last + offset])
+    return np.count_nonzero(mask.rows[first:last] & windows) > 0
+
+def sweep_mask(mask: MovingMask, x: float, y: float, dx: float, dy: float, start: float,
+               obstacle: ObstacleMask, obstacle_x: float, obstacle_y: float) -> typing.Optional[float]:
+    """
+    Primeiro instante do passo, a partir de start, em que uma máscara móvel
+    toca um obstáculo parado (movimento relativo em linha reta)
+
+    Testa a máscara em intervalos de no máximo 1 pixel, de start até o fim do
+    passo; start costuma ser o contato das caixas dado por sweep_aabb
+
+    Args:
+        mask: Máscara móvel
+        x, y: Canto inferior esquerdo da caixa da máscara no início do passo
+        dx, dy: Deslocamento da máscara no passo
+        start: Fração do passo em que as caixas começam a se tocar
+        obstacle: Máscara do obstáculo
+        obstacle_x, obstacle_y: Canto inferior esquerdo do obstáculo
+
+    Returns:
+        Fração do passo do primeiro contato dos pixels, ou None
+    """
+    samples = math.ceil(max(abs(dx), abs(dy)) * (1.0 - start))
+    for k in range(samples + 1):
+        time = start + (1.0 - start) * k / samples if samples else start
+        if overlaps(mask, x + dx * time, y + dy * time, obstacle, obstacle_x, obstacle_y):
+            return time
+    return None
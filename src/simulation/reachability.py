@@ -0,0 +1,503 @@
+"""
+Oráculo de alcance do Flappy Bird: tabelas pré-calculadas que dizem, em O(1),
+se um vão pode ser alcançado a partir do anterior (para o gerador de canos)
+ou a partir de um estado do pássaro (para podar a busca do piloto automático)
+
+Entre dois pulos o pássaro segue um arco fixo: k passos depois de pular, a
+altura é a do pulo mais D[k] e a velocidade é BIRD_VELOCITY + GRAVITY * dt * k.
+As tabelas guardam, para cada idade k do arco, o intervalo de alturas que
+ainda leva ao destino; a cada passo os arcos envelhecem ou recomeçam com um
+pulo, e o NumPy trata todas as idades (e todos os vãos de origem) de uma vez.
+Uniões de intervalos viram o intervalo que as contém, então as respostas são
+uma aproximação da física discretizada no passo fixo, não uma garantia.
+
+As tabelas de cada nível de velocidade (um aumento de SPEED_INCREASE_MULTIPLIER
+por nível) são geradas na primeira vez em que são pedidas e gravadas em
+REACHABILITY_CACHE_DIRECTORY, com as constantes usadas para gerá-las. Quem
+não pode esperar (o piloto automático da janela) pede a tabela com
+prefetch_reachability_table, que a carrega ou gera em uma thread.
+
+Uso: python src/simulation/reachability.py [níveis]  (gera o cache dos níveis)
+"""
+
+import hashlib
+import math
+import struct
+import sys
+import os
+import threading
+import time
+import typing
+import numpy as np # type: ignore
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import WINDOW_WIDTH, WINDOW_HEIGHT, GROUND_HEIGHT, BIRD_VELOCITY, GRAVITY, PIPE_GAP, PIPE_WIDTH
+from config import INITIAL_PIPE_SPEED, SPEED_INCREASE_MULTIPLIER, SIMULATION_RATE, PIXEL_COLLISION
+from config import REACHABILITY_HORIZON, REACHABILITY_RESOLUTION, REACHABILITY_MARGIN, REACHABILITY_CACHE_DIRECTORY
+from config import REACHABILITY_TIERS
+from simulation.masks import bird_masks
+
+# Dimensões do pássaro (iguais às de BirdBody)
+BIRD_WIDTH: float = 40.0
+BIRD_HEIGHT: float = 28.0
+
+REACHABILITY_MAGIC: bytes = b"FBRT"
+REACHABILITY_VERSION: int = 1
+
+# magic, versão, vãos de origem, passos, idades de arco, passos para cruzar um par
+_HEADER = struct.Struct("<4sHIIII")
+
+# Constantes usadas na geração (um cache gerado com outras é descartado):
+# velocidade dos canos, passo, pulo, gravidade, vão, largura do cano, caixa do
+# pássaro com a folga (esquerda, base, direita, topo), chão, altura do mundo,
+# faixa dos vãos, resolução, horizonte
+_PARAMETERS = struct.Struct("<16d")
+
+# Tabelas já carregadas, por (nível, faixa dos vãos, passo, colisão por pixel)
+_TABLES: typing.Dict[typing.Tuple[typing.Any, ...], "ReachabilityTable"] = {}
+
+# Tabelas sendo carregadas ou geradas em segundo plano, pela mesma chave
+_PENDING: typing.Dict[typing.Tuple[typing.Any, ...], "Future[ReachabilityTable]"] = {}
+_LOCK = threading.Lock()
+_EXECUTOR: typing.Optional[ThreadPoolExecutor] = None
+
+def speed_tier(speed: float) -> int:
+    """
+    Nível de velocidade mais próximo de uma velocidade dos canos (0 = inicial),
+    até REACHABILITY_TIERS - 1: as velocidades acima dele usam as tabelas do
+    último nível, em vez de criar um nível (e um arquivo de cache) por velocidade
+    """
+    if speed <= INITIAL_PIPE_SPEED:
+        return 0
+    tier = int(round(math.log(speed / INITIAL_PIPE_SPEED) / math.log(SPEED_INCREASE_MULTIPLIER)))
+    return min(tier, REACHABILITY_TIERS - 1)
+
+def tier_speed(tier: int) -> float:
+    """
+    Velocidade dos canos de um nível de velocidade
+    """
+    return INITIAL_PIPE_SPEED * SPEED_INCREASE_MULTIPLIER ** tier
+
+def bird_box(pixel_collision: bool = PIXEL_COLLISION) -> typing.Tuple[float, float, float, float]:
+    """
+    Caixa do pássaro em relação ao centro (left, bottom, right, top): a união das
+    máscaras de pixels de todos os quadros e rotações, ou a hitbox de 2/3 do sprite
+    """
+    if pixel_collision:
+        return bird_masks(BIRD_WIDTH, BIRD_HEIGHT).bounds()
+    return (-BIRD_WIDTH / 3, -BIRD_HEIGHT / 3, BIRD_WIDTH / 3, BIRD_HEIGHT / 3)
+
+def _arcs(step: float, ages: int) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Arcos após um pulo, pela mesma integração de BirdBody.update (v += g dt; y += v dt)
+
+    Returns:
+        Tupla (subida D[k] desde o pulo, deslocamento do passo k), para k = 1..ages
+    """
+    k = np.arange(1, ages + 1, dtype=np.float64)
+    rise = k * BIRD_VELOCITY * step + GRAVITY * step * step * k * (k + 1) / 2
+    moves = (BIRD_VELOCITY + GRAVITY * step * k) * step
+    return rise, moves
+
+def _normalize(low: np.ndarray, high: np.ndarray) -> None:
+    """
+    Marca os intervalos vazios como (inf, -inf), para que uniões e
+    interseções com eles continuem corretas
+    """
+    empty = low > high
+    low[empty] = np.inf
+    high[empty] = -np.inf
+
+def _step_back(low: np.ndarray, high: np.ndarray, rise: np.ndarray,
+               moves: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """
+    Alturas um passo antes, por idade de arco, a partir das quais se chega aos
+    intervalos dados: seguindo o arco (idade k + 1) ou pulando (idade 1)
+    """
+    previous_low = np.full_like(low, np.inf)
+    previous_high = np.full_like(high, -np.inf)
+    previous_low[:-1] = low[1:] - moves[1:]
+    previous_high[:-1] = high[1:] - moves[1:]
+    np.minimum(previous_low, low[0] - rise[0], out=previous_low)
+    np.maximum(previous_high, high[0] - rise[0], out=previous_high)
+    return previous_low, previous_high
+
+class ReachabilityTable:
+    """
+    Tabelas de alcance de um nível de velocidade
+    """
+
+    def __init__(self, speed: float, step: float, gap_min: float, gap_max: float, resolution: float,
+                 crossing_ticks: int, gap_low: np.ndarray, gap_high: np.ndarray,
+                 entry_low: np.ndarray, entry_high: np.ndarray):
+        """
+        Args:
+            speed: Velocidade dos canos
+            step: Duração do passo fixo em segundos
+            gap_min, gap_max: Faixa da base dos vãos sorteados
+            resolution: Distância entre as bases de vão de origem tabeladas
+            crossing_ticks: Passos em que o pássaro fica dentro de um par
+            gap_low, gap_high: [vão de origem, passos até entrar no próximo par] ->
+                faixa das bases de vão alcançáveis (vazia se low > high)
+            entry_low, entry_high: [passos até entrar no par, idade do arco - 1] ->
+                alturas do pássaro, em relação à base do vão, que ainda o atravessam
+        """
+        self.speed = speed
+        self.step = step
+        self.gap_min = gap_min
+        self.gap_max = gap_max
+        self.resolution = resolution
+        self.crossing_ticks = crossing_ticks
+        self.gap_low = gap_low
+        self.gap_high = gap_high
+        self.entry_low = entry_low
+        self.entry_high = entry_high
+        self._pipe_step = speed * step
+        self._ages = entry_low.shape[1]
+        self._ticks = entry_low.shape[0] - 1
+
+    def gap_range(self, gap_a: float, distance: float) -> typing.Tuple[float, float]:
+        """
+        Faixa das bases de vão alcançáveis no par seguinte
+
+        Args:
+            gap_a: Base do vão do par atual
+            distance: Distância horizontal entre as bordas esquerdas dos dois pares
+
+        Returns:
+            Tupla (menor, maior); vazia (menor > maior) se nenhum vão é alcançável
+        """
+        row = int(round((gap_a - self.gap_min) / self.resolution))
+        row = min(max(row, 0), self.gap_low.shape[0] - 1)
+        ticks = int(distance / self._pipe_step) + 1
+        ticks = min(max(ticks, self.crossing_ticks), self._ticks)
+        return float(self.gap_low[row, ticks]), float(self.gap_high[row, ticks])
+
+    def gap_ranges(self, gap_a: np.ndarray, distance: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """
+        Versão vetorizada de gap_range, para vários pares de uma vez
+
+        Args:
+            gap_a: Bases dos vãos dos pares atuais
+            distance: Distâncias até os pares seguintes (mesmo formato de gap_a)
+
+        Returns:
+            Tupla de arrays (menores, maiores)
+        """
+        rows = np.rint((gap_a - self.gap_min) / self.resolution).astype(np.intp)
+        np.clip(rows, 0, self.gap_low.shape[0] - 1, out=rows)
+        ticks = (distance / self._pipe_step).astype(np.intp) + 1
+        np.clip(ticks, self.crossing_ticks, self._ticks, out=ticks)
+        return self.gap_low[rows, ticks].astype(np.float64), self.gap_high[rows, ticks].astype(np.float64)
+
+    def reachable(self, gap_a: float, gap_b: float, distance: float) -> bool:
+        """
+        Verifica se o vão de um par pode ser atravessado depois do vão do par anterior
+
+        Args:
+            gap_a: Base do vão do par anterior
+            gap_b: Base do vão do par seguinte
+            distance: Distância horizontal entre as bordas esquerdas dos dois pares
+        """
+        low, high = self.gap_range(gap_a, distance)
+        return low <= gap_b <= high
+
+    def reachable_states(self, y: np.ndarray, velocity: np.ndarray, gap: float, ticks: int) -> np.ndarray:
+        """
+        Quais estados do pássaro ainda conseguem atravessar um par à frente
+
+        Args:
+            y: Alturas do pássaro
+            velocity: Velocidades do pássaro (mesmo formato de y)
+            gap: Base do vão do par
+            ticks: Passos até o pássaro entrar na faixa x do par
+
+        Returns:
+            Array de bool com o formato de y
+        """
+        ticks = min(max(ticks, 0), self._ticks)
+        # Idade do arco pela velocidade; minimum/maximum em vez de np.clip, que
+        # custa mais que a própria consulta nos feixes pequenos do piloto
+        ages = np.rint((velocity - BIRD_VELOCITY) / (GRAVITY * self.step)).astype(np.intp)
+        ages -= 1
+        np.maximum(ages, 0, out=ages)
+        np.minimum(ages, self._ages - 1, out=ages)
+        relative = y - gap
+        inside = self.entry_low[ticks][ages] <= relative
+        inside &= relative <= self.entry_high[ticks][ages]
+        return inside
+
+def build_reachability(speed: float, step: float, gap_min: float, gap_max: float,
+                       window_height: float = WINDOW_HEIGHT, pixel_collision: bool = PIXEL_COLLISION,
+                       horizon: float = REACHABILITY_HORIZON, resolution: float = REACHABILITY_RESOLUTION,
+                       margin: float = REACHABILITY_MARGIN) -> ReachabilityTable:
+    """
+    Gera as tabelas de alcance de uma velocidade dos canos
+
+    Args:
+        speed: Velocidade dos canos
+        step: Duração do passo fixo em segundos
+        gap_min, gap_max: Faixa da base dos vãos sorteados
+        window_height: Altura do mundo
+        pixel_collision: Usa a caixa das máscaras de pixels do pássaro (ou a hitbox)
+        horizon: Maior tempo, em segundos, entre entrar em um par e entrar no seguinte
+        resolution: Distância entre as bases de vão de origem tabeladas
+        margin: Folga em pixels em volta do pássaro
+
+    Returns:
+        Tabelas geradas
+    """
+    left, bottom, right, top = bird_box(pixel_collision)
+    ticks = int(math.ceil(horizon / step))
+    ages = ticks + 1
+    pipe_step = speed * step
+    crossing = int(math.ceil((PIPE_WIDTH + right - left) / pipe_step))
+    rise, moves = _arcs(step, ages)
+
+    # Faixas do centro do pássaro: livre (entre o chão e o teto) e dentro de um vão
+    floor = GROUND_HEIGHT - bottom + margin
+    ceiling = window_height - BIRD_HEIGHT / 2 - margin
+    inside_low = -bottom + margin            # Em relação à base do vão
+    inside_high = PIPE_GAP - top - margin
+
+    # Para trás: alturas (em relação à base do vão) que atravessam o par inteiro,
+    # por idade de arco ao entrar, e depois a cada passo antes de entrar
+    entry_low = np.empty((ticks + 1, ages))
+    entry_high = np.empty((ticks + 1, ages))
+    low = np.full(ages, inside_low)
+    high = np.full(ages, inside_high)
+    for _ in range(crossing - 1):
+        low, high = _step_back(low, high, rise, moves)
+        np.maximum(low, inside_low, out=low)
+        np.minimum(high, inside_high, out=high)
+        _normalize(low, high)
+    entry_low[0], entry_high[0] = low, high
+    for t in range(1, ticks + 1):
+        low, high = _step_back(low, high, rise, moves)
+        entry_low[t], entry_high[t] = low, high
+    safe_low, safe_high = entry_low[0], entry_high[0]
+
+    # Para a frente, todos os vãos de origem de uma vez: cada arco guarda o
+    # intervalo das alturas em que começou (no pulo) que o mantiveram vivo.
+    # Os arcos ficam em colunas pelo passo em que começaram; no passo t a janela
+    # de colunas [t, t + ages) tem as idades ages..1, então as subidas (e os
+    # limites já descontados delas) são os mesmos em todo passo, sem mover dados.
+    # O pássaro entra no par de origem no passo 0 com qualquer idade de arco
+    rows = int(math.floor((gap_max - gap_min) / resolution)) + 1
+    gaps = gap_min + np.arange(rows, dtype=np.float64)[:, None] * resolution
+    rise_by_column = rise[::-1]
+    origin_low = np.maximum(gaps + inside_low, floor) - rise_by_column
+    origin_high = np.minimum(gaps + inside_high, ceiling) - rise_by_column
+    free_low = floor - rise_by_column
+    free_high = ceiling - rise_by_column
+    reach_low = rise_by_column - safe_high[::-1]
+    reach_high = rise_by_column - safe_low[::-1]
+    start_low = np.full((rows, ticks + ages), -np.inf)
+    start_high = np.full((rows, ticks + ages), np.inf)
+    gap_low = np.full((rows, ticks + 1), np.inf)
+    gap_high = np.full((rows, ticks + 1), -np.inf)
+    for t in range(ticks + 1):
+        low = start_low[:, t:t + ages]
+        high = start_high[:, t:t + ages]
+        if t:
+            # Um pulo no passo anterior começa um arco novo
+            low[:, -1] = position_low
+            high[:, -1] = position_high
+        inside = t < crossing
+        np.maximum(low, origin_low if inside else free_low, out=low)
+        np.minimum(high, origin_high if inside else free_high, out=high)
+        _normalize(low, high)
+        position_low = (low + rise_by_column).min(axis=1)
+        position_high = (high + rise_by_column).max(axis=1)
+
+        # Entrando no par seguinte neste passo: a base do vão precisa deixar a
+        # altura atual dentro das alturas que o atravessam, na mesma idade de arco
+        if not inside:
+            gap_low[:, t] = np.maximum((low + reach_low).min(axis=1), gap_min)
+            gap_high[:, t] = np.minimum((high + reach_high).max(axis=1), gap_max)
+
+    return ReachabilityTable(speed, step, gap_min, gap_max, resolution, crossing,
+                             gap_low.astype(np.float32), gap_high.astype(np.float32),
+                             entry_low.astype(np.float32), entry_high.astype(np.float32))
+
+def _parameters(speed: float, step: float, gap_min: float, gap_max: float, window_height: float,
+                pixel_collision: bool) -> bytes:
+    """
+    Constantes que determinam as tabelas, para validar o cache em disco
+    """
+    left, bottom, right, top = bird_box(pixel_collision)
+    return _PARAMETERS.pack(speed, step, BIRD_VELOCITY, GRAVITY, PIPE_GAP, PIPE_WIDTH, left - REACHABILITY_MARGIN,
+                            bottom - REACHABILITY_MARGIN, right + REACHABILITY_MARGIN, top + REACHABILITY_MARGIN,
+                            GROUND_HEIGHT, window_height, gap_min, gap_max, REACHABILITY_RESOLUTION, REACHABILITY_HORIZON)
+
+def _cache_path(tier: int, pixel_collision: bool, parameters: bytes) -> str:
+    """
+    Arquivo do cache de um nível, relativo à raiz do projeto. O nome leva um
+    hash das constantes da geração, então chamadores com outra faixa de vãos,
+    passo ou altura do mundo usam arquivos separados em vez de sobrescrever
+    um ao outro
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    suffix = "" if pixel_collision else "-box"
+    digest = hashlib.sha1(parameters).hexdigest()[:12]
+    return os.path.join(root, REACHABILITY_CACHE_DIRECTORY, f"reachability-{tier}{suffix}-{digest}.bin")
+
+def _load_table(path: str, parameters: bytes, speed: float, step: float, gap_min: float,
+                gap_max: float) -> typing.Optional[ReachabilityTable]:
+    """
+    Lê as tabelas gravadas por _save_table (None se ausentes, de outra versão
+    ou geradas com outras constantes)
+    """
+    try:
+        with open(path, "rb") as file:
+            data = file.read()
+    except OSError:
+        return None
+    if len(data) < _HEADER.size + _PARAMETERS.size:
+        return None
+    magic, version, rows, ticks, ages, crossing = _HEADER.unpack_from(data)
+    if (magic != REACHABILITY_MAGIC or version != REACHABILITY_VERSION or
+            data[_HEADER.size:_HEADER.size + _PARAMETERS.size] != parameters):
+        return None
+    offset = _HEADER.size + _PARAMETERS.size
+    gap_size = rows * (ticks + 1)
+    entry_size = (ticks + 1) * ages
+    if len(data) != offset + (2 * gap_size + 2 * entry_size) * 4:
+        return None
+    arrays = np.frombuffer(data, dtype=np.float32, offset=offset)
+    gap_low = arrays[:gap_size].reshape(rows, ticks + 1)
+    gap_high = arrays[gap_size:2 * gap_size].reshape(rows, ticks + 1)
+    entry = arrays[2 * gap_size:]
+    entry_low = entry[:entry_size].reshape(ticks + 1, ages)
+    entry_high = entry[entry_size:].reshape(ticks + 1, ages)
+    return ReachabilityTable(speed, step, gap_min, gap_max, REACHABILITY_RESOLUTION, crossing,
+                             gap_low, gap_high, entry_low, entry_high)
+
+def _save_table(path: str, parameters: bytes, table: ReachabilityTable) -> None:
+    """
+    Grava as tabelas de um nível (falhas de escrita só deixam de criar o cache)
+    """
+    rows, columns = table.gap_low.shape
+    ticks, ages = table.entry_low.shape
+    # Gravação atômica: outro processo (ou a thread de prefetch) nunca lê um arquivo pela metade
+    temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temporary, "wb") as file:
+            file.write(_HEADER.pack(REACHABILITY_MAGIC, REACHABILITY_VERSION, rows, columns - 1, ages,
+                                    table.crossing_ticks))
+            file.write(parameters)
+            for array in (table.gap_low, table.gap_high, table.entry_low, table.entry_high):
+                file.write(np.ascontiguousarray(array, dtype=np.float32).tobytes())
+        os.replace(temporary, path)
+    except OSError as e:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        print(f"Não foi possível gravar o cache de alcance {path}: {e}")
+
+def _table_key(speed: float, gap_min: float, gap_max: float, step: float, window_height: float,
+               pixel_collision: bool) -> typing.Tuple[typing.Any, ...]:
+    """
+    Chave de _TABLES/_PENDING: o nível de velocidade no lugar da velocidade
+    """
+    return (speed_tier(speed), gap_min, gap_max, step, window_height, pixel_collision)
+
+def _load_or_build(key: typing.Tuple[typing.Any, ...]) -> "ReachabilityTable":
+    """
+    Carrega do disco ou gera (e grava) as tabelas de uma chave de _TABLES
+    """
+    tier, gap_min, gap_max, step, window_height, pixel_collision = key
+    speed = tier_speed(tier)
+    parameters = _parameters(speed, step, gap_min, gap_max, window_height, pixel_collision)
+    path = _cache_path(tier, pixel_collision, parameters)
+    table = _load_table(path, parameters, speed, step, gap_min, gap_max)
+    if table is None:
+        table = build_reachability(speed, step, gap_min, gap_max, window_height, pixel_collision)
+        _save_table(path, parameters, table)
+    return table
+
+def reachability_table(speed: float, gap_min: float, gap_max: float, step: float = 1 / SIMULATION_RATE,
+                       window_height: float = WINDOW_HEIGHT,
+                       pixel_collision: bool = PIXEL_COLLISION) -> ReachabilityTable:
+    """
+    Tabelas de alcance do nível de velocidade mais próximo de speed: da memória,
+    do cache em disco ou geradas (e gravadas) na primeira chamada. Se o nível
+    estiver sendo preparado em segundo plano, espera por ele
+
+    Args:
+        speed: Velocidade atual dos canos
+        gap_min, gap_max: Faixa da base dos vãos sorteados
+        step: Duração do passo fixo em segundos
+        window_height: Altura do mundo
+        pixel_collision: Usa a caixa das máscaras de pixels do pássaro (ou a hitbox)
+    """
+    key = _table_key(speed, gap_min, gap_max, step, window_height, pixel_collision)
+    with _LOCK:
+        table = _TABLES.get(key)
+        pending = _PENDING.get(key)
+    if table is not None:
+        return table
+    if pending is not None:
+        return pending.result()
+
+    table = _load_or_build(key)
+    with _LOCK:
+        _TABLES[key] = table
+    return table
+
+def prefetch_reachability_table(speed: float, gap_min: float, gap_max: float, step: float = 1 / SIMULATION_RATE,
+                                window_height: float = WINDOW_HEIGHT,
+                                pixel_collision: bool = PIXEL_COLLISION) -> "Future[ReachabilityTable]":
+    """
+    Como reachability_table, mas carrega ou gera as tabelas em uma thread
+    (uma por vez, na ordem dos pedidos) sem bloquear quem chamou
+
+    Returns:
+        Future com as tabelas (já concluído se estiverem na memória)
+    """
+    global _EXECUTOR
+    key = _table_key(speed, gap_min, gap_max, step, window_height, pixel_collision)
+    with _LOCK:
+        table = _TABLES.get(key)
+        if table is not None:
+            done: "Future[ReachabilityTable]" = Future()
+            done.set_result(table)
+            return done
+        pending = _PENDING.get(key)
+        if pending is not None:
+            return pending
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reachability")
+        pending = _EXECUTOR.submit(_prefetch, key)
+        _PENDING[key] = pending
+        return pending
+
+def _prefetch(key: typing.Tuple[typing.Any, ...]) -> "ReachabilityTable":
+    """
+    Tarefa da thread de prefetch: prepara as tabelas e as publica em _TABLES
+    """
+    try:
+        table = _load_or_build(key)
+        with _LOCK:
+            _TABLES[key] = table
+        return table
+    finally:
+        with _LOCK:
+            _PENDING.pop(key, None)
+
+if __name__ == "__main__":
+    from simulation.entities import PipeField
+    tiers = min(int(sys.argv[1]) if len(sys.argv) > 1 else REACHABILITY_TIERS, REACHABILITY_TIERS)
+    pipes = PipeField(WINDOW_WIDTH, WINDOW_HEIGHT)
+    for tier in range(tiers):
+        speed = tier_speed(tier)
+        start = time.perf_counter()
+        table = build_reachability(speed, 1 / SIMULATION_RATE, pipes._min_pipe_height, pipes._max_pipe_height)
+        elapsed = time.perf_counter() - start
+        parameters = _parameters(speed, 1 / SIMULATION_RATE, pipes._min_pipe_height, pipes._max_pipe_height,
+                                 WINDOW_HEIGHT, PIXEL_COLLISION)
+        _save_table(_cache_path(tier, PIXEL_COLLISION, parameters), parameters, table)
+        print(f"nível {tier:>2}: canos a {speed:>6.0f} px/s, gerado em {elapsed * 1000:.0f} ms")
@@ -0,0 +1,273 @@
+"""
+Gravação e verificação de replays do Flappy Bird
+Um replay guarda a semente da partida, a duração do passo fixo e as entradas
+do jogador com o número do passo em que foram aplicadas. Como a simulação é
+determinística, refazer os passos sem janela reproduz a partida exatamente,
+e a pontuação e as vidas finais gravadas podem ser conferidas.
+
+Formato do arquivo (little-endian): cabeçalho _HEADER seguido de um registro
+_INPUT_DTYPE (passo u32 + bits de SimulationInput u8) por entrada.
+
+Uso: python src/simulation/replay.py <arquivo ou pasta> [processos]
+"""
+
+import multiprocessing
+import struct
+import sys
+import os
+import time
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SIMULATION_RATE, REPLAY_MAX_SECONDS
+from simulation.game_simulation import GameSimulation
+
+REPLAY_MAGIC: bytes = b"FBRP"
+REPLAY_VERSION: int = 6  # 2: colisões contínuas; 3: colisões por pixel; 4: vãos alcançáveis; 5: percurso por semente; 6: canos por distância (versões anteriores podem ter outro resultado)
+REPLAY_EXTENSION: str = ".replay"
+
+# Passos que o verificador aceita simular: o arquivo não é confiável, e um
+# contador u32 qualquer custaria horas de CPU
+REPLAY_MAX_STEPS: int = int(REPLAY_MAX_SECONDS * SIMULATION_RATE)
+
+# magic, versão, duração do passo, semente, passos, entradas, pontuação, vidas
+_HEADER = struct.Struct("<4sHdQIIii")
+_INPUT_DTYPE = np.dtype([("tick", "<u4"), ("inputs", "u1")])
+
+class Replay(typing.NamedTuple):
+    """
+    Partida gravada: o necessário para refazê-la e o resultado esperado
+    """
+    seed: int
+    step: float           # Duração de cada passo em segundos
+    steps: int            # Passos simulados na partida
+    inputs: np.ndarray    # Registros _INPUT_DTYPE em ordem de passo
+    score: int            # Pontuação final gravada
+    lives: int            # Vidas finais gravadas
+
+class ReplayResult(typing.NamedTuple):
+    """
+    Resultado da verificação de um replay
+    """
+    path: str
+    valid: bool
+    score: int
+    lives: int
+    error: str = ""
+
+class ReplayRecorder:
+    """
+    Registra as entradas aplicadas a cada passo de uma GameSimulation
+    """
+
+    def __init__(self, seed: int, step: float):
+        """
+        Inicializa o gravador
+
+        Args:
+            seed: Semente usada para criar a simulação
+            step: Duração do passo fixo em segundos
+        """
+        self.seed = seed
+        self.step = step
+        self._ticks: typing.List[int] = []
+        self._inputs: typing.List[int] = []
+
+    def record(self, tick: int, inputs: int) -> None:
+        """
+        Registra as entradas do passo (chamar antes de GameSimulation.step)
+
+        Args:
+            tick: Número do passo (GameSimulation.ticks antes do passo)
+            inputs: Bits de SimulationInput passados ao passo
+        """
+        if inputs:
+            self._ticks.append(tick)
+            self._inputs.append(inputs)
+
+    def truncate(self, tick: int) -> None:
+        """
+        Descarta as entradas a partir de um passo (a partida voltou no tempo
+        até ele): como a simulação é determinística, o replay continua
+        reproduzindo o caminho que a partida de fato seguiu
+
+        Args:
+            tick: Primeiro passo descartado (GameSimulation.ticks após restaurar)
+        """
+        while self._ticks and self._ticks[-1] >= tick:
+            self._ticks.pop()
+            self._inputs.pop()
+
+    def finish(self, simulation: GameSimulation) -> Replay:
+        """
+        Fecha a gravação com o estado final da simulação
+
+        Args:
+            simulation: Simulação gravada
+
+        Returns:
+            Replay da partida
+        """
+        inputs = np.empty(len(self._ticks), dtype=_INPUT_DTYPE)
+        inputs["tick"] = self._ticks
+        inputs["inputs"] = self._inputs
+        return Replay(self.seed, self.step, simulation.ticks, inputs, simulation.score, simulation.lives)
+
+def save_replay(path: str, replay: Replay) -> None:
+    """
+    Grava um replay em arquivo
+
+    Args:
+        path: Caminho do arquivo
+        replay: Replay a gravar
+    """
+    inputs = np.ascontiguousarray(replay.inputs, dtype=_INPUT_DTYPE)
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, replay.step, replay.seed,
+                                replay.steps, len(inputs), replay.score, replay.lives))
+        file.write(inputs.tobytes())
+
+def check_replay(replay: Replay) -> None:
+    """
+    Recusa replays que a verificação não deve simular: outra duração de passo
+    muda a física, e partidas longas demais só gastam CPU
+
+    Raises:
+        ValueError: Se o passo não for o da simulação ou a partida passar de REPLAY_MAX_STEPS
+    """
+    if replay.step != 1.0 / SIMULATION_RATE:
+        raise ValueError(f"duração do passo {replay.step!r} diferente de 1/{SIMULATION_RATE}")
+    if not 0 <= replay.steps <= REPLAY_MAX_STEPS:
+        raise ValueError(f"partida de {replay.steps} passos (máximo {REPLAY_MAX_STEPS})")
+
+def load_replay(path: str) -> Replay:
+    """
+    Lê um replay de arquivo
+
+    Args:
+        path: Caminho do arquivo
+
+    Returns:
+        Replay lido
+
+    Raises:
+        ValueError: Se o arquivo não for um replay válido desta versão (ver também check_replay)
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if len(data) < _HEADER.size:
+        raise ValueError("arquivo truncado")
+    magic, version, step, seed, steps, count, score, lives = _HEADER.unpack_from(data)
+    if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+        raise ValueError("formato de replay desconhecido")
+    if len(data) != _HEADER.size + count * _INPUT_DTYPE.itemsize:
+        raise ValueError("tamanho não confere com o cabeçalho")
+    inputs = np.frombuffer(data, dtype=_INPUT_DTYPE, count=count, offset=_HEADER.size)
+    replay = Replay(seed, step, steps, inputs, score, lives)
+    check_replay(replay)
+    return replay
+
+def simulate_replay(replay: Replay) -> GameSimulation:
+    """
+    Refaz a partida de um replay sem janela, o mais rápido possível
+
+    Args:
+        replay: Replay a simular
+
+    Returns:
+        Simulação no estado final
+
+    Raises:
+        ValueError: Se o replay for recusado por check_replay ou as entradas
+            estiverem fora de ordem ou além do fim da partida
+    """
+    check_replay(replay)
+    ticks = replay.inputs["tick"].tolist()
+    bits = replay.inputs["inputs"].tolist()
+    if any(a >= b for a, b in zip(ticks, ticks[1:])) or (ticks and ticks[-1] >= replay.steps):
+        raise ValueError("entradas fora de ordem ou além do fim da partida")
+
+    simulation = GameSimulation(seed=replay.seed)
+    step = simulation.step
+    delta_time = replay.step
+
+    # Avança em blocos sem entrada até o próximo passo com entrada
+    tick = 0
+    for input_tick, inputs in zip(ticks, bits):
+        for _ in range(input_tick - tick):
+            step(delta_time)
+        step(delta_time, inputs)
+        tick = input_tick + 1
+    for _ in range(replay.steps - tick):
+        step(delta_time)
+    return simulation
+
+def verify_replay(path: str) -> ReplayResult:
+    """
+    Verifica se um replay reproduz a pontuação e as vidas gravadas
+
+    Args:
+        path: Caminho do arquivo
+
+    Returns:
+        Resultado da verificação (erros de leitura viram um resultado inválido)
+    """
+    try:
+        replay = load_replay(path)
+        simulation = simulate_replay(replay)
+    except (OSError, ValueError) as e:
+        return ReplayResult(path, False, 0, 0, str(e))
+
+    valid = simulation.score == replay.score and simulation.lives == replay.lives
+    error = "" if valid else f"gravado {replay.score} pontos/{replay.lives} vidas"
+    return ReplayResult(path, valid, simulation.score, simulation.lives, error)
+
+def find_replays(path: str) -> typing.List[str]:
+    """
+    Lista os replays de uma pasta (ou o próprio arquivo, se path não for pasta)
+    """
+    if not os.path.isdir(path):
+        return [path]
+    return sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(REPLAY_EXTENSION))
+
+def verify_replays(paths: typing.Sequence[str], workers: typing.Optional[int] = None,
+                   context: typing.Optional[str] = None) -> typing.List[ReplayResult]:
+    """
+    Verifica vários replays em um pool de processos
+
+    Args:
+        paths: Caminhos dos arquivos
+        workers: Número de processos (padrão: um por núcleo; 1 verifica no próprio processo)
+        context: Método de início dos processos ("fork", "spawn"...); padrão do sistema
+
+    Returns:
+        Resultados na mesma ordem de paths
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) < 2:
+        return [verify_replay(path) for path in paths]
+
+    # Lotes de alguns arquivos por tarefa diluem o custo de comunicação entre processos
+    chunk_size = max(1, min(64, len(paths) // (workers * 4)))
+    with multiprocessing.get_context(context).Pool(workers) as pool:
+        return pool.map(verify_replay, paths, chunksize=chunk_size)
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python src/simulation/replay.py <arquivo ou pasta> [processos]")
+        sys.exit(2)
+
+    replay_paths = find_replays(sys.argv[1])
+    start = time.perf_counter()
+    results = verify_replays(replay_paths, int(sys.argv[2]) if len(sys.argv) > 2 else None)
+    elapsed = time.perf_counter() - start
+
+    invalid = [result for result in results if not result.valid]
+    for result in invalid:
+        print(f"INVÁLIDO {result.path}: {result.score} pontos/{result.lives} vidas ({result.error})")
+    rate = len(results) / elapsed * 60 if elapsed > 0 else 0.0
+    print(f"{len(results) - len(invalid)}/{len(results)} replays válidos em {elapsed:.2f} s ({rate:.0f} replays/min)")
+    sys.exit(1 if invalid else 0)
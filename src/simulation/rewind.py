@@ -0,0 +1,283 @@
+"""
+Histórico para voltar no tempo (rewind) durante a partida
+Guarda um snapshot da simulação (GameSimulation.snapshot) por passo, mas só
+de tempos em tempos por inteiro (keyframe): os demais passos guardam apenas
+as palavras de 8 bytes que mudaram em relação ao keyframe, com um mapa de
+bits de quais mudaram. Tudo fica em uma área de bytes pré-alocada usada como
+anel, então a memória é fixa: quando falta espaço (ou o histórico passa de
+seconds), os passos mais antigos são descartados.
+"""
+
+import math
+import sys
+import os
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import REWIND_MEMORY, REWIND_KEYFRAME_INTERVAL
+
+if typing.TYPE_CHECKING:
+    from simulation.game_simulation import GameSimulation
+
+# Maior snapshot aceito pelo buffer de trabalho (cresce se preciso)
+_INITIAL_SNAPSHOT_SIZE: int = 4096
+
+class RewindBuffer:
+    """
+    Anel com os estados dos últimos passos de uma GameSimulation, comprimidos
+    como diferenças em relação a keyframes periódicos
+    """
+
+    def __init__(self, seconds: float, rate: float, memory: int = REWIND_MEMORY,
+                 keyframe_interval: int = REWIND_KEYFRAME_INTERVAL):
+        """
+        Pré-aloca o histórico
+
+        Args:
+            seconds: Tempo de jogo guardado, em segundos (se couber em memory)
+            rate: Passos de simulação por segundo
+            memory: Total de bytes usados pelo histórico (tabelas e área dos estados)
+            keyframe_interval: A cada quantos passos um estado é guardado por inteiro
+        """
+        # Descartar um keyframe descarta os passos que dependem dele: com um
+        # intervalo de keyframes a mais na tabela, ao menos seconds ficam guardados
+        self.capacity = max(1, int(math.ceil(seconds * rate))) + keyframe_interval
+        self.rate = rate
+        self.keyframe_interval = keyframe_interval
+
+        # Tabela de registros, indexada pelo número do registro % capacity
+        self._offset = np.zeros(self.capacity, dtype=np.int64)    # Início na área de bytes
+        self._size = np.zeros(self.capacity, dtype=np.int32)      # Bytes ocupados na área
+        self._length = np.zeros(self.capacity, dtype=np.int32)    # Tamanho do snapshot
+        self._keyframe = np.zeros(self.capacity, dtype=np.int64)  # Número do keyframe do registro
+        tables = self._offset.nbytes + self._size.nbytes + self._length.nbytes + self._keyframe.nbytes
+
+        # Palavras do snapshot atual e do keyframe atual (buffers de trabalho)
+        self._words = np.zeros(_INITIAL_SNAPSHOT_SIZE // 8, dtype=np.uint64)
+        self._key_words = np.zeros(_INITIAL_SNAPSHOT_SIZE // 8, dtype=np.uint64)
+        self._key_length: int = 0
+
+        arena_size = memory - tables - self._words.nbytes - self._key_words.nbytes
+        if arena_size < _INITIAL_SNAPSHOT_SIZE:
+            raise ValueError(f"memória insuficiente para o histórico ({memory} bytes)")
+        self._arena = np.zeros(arena_size, dtype=np.uint8)
+
+        self._first: int = 0   # Número do registro mais antigo
+        self._end: int = 0     # Número do próximo registro
+        self._write: int = 0   # Fim do registro mais novo na área
+        self._key: int = -1    # Número do keyframe atual (-1 se nenhum)
+
+    def __len__(self) -> int:
+        """
+        Quantidade de passos guardados
+        """
+        return self._end - self._first
+
+    @property
+    def seconds(self) -> float:
+        """
+        Tempo de jogo guardado, em segundos
+        """
+        return len(self) / self.rate
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Memória alocada pelo histórico (fixa)
+        """
+        return (self._arena.nbytes + self._offset.nbytes + self._size.nbytes + self._length.nbytes +
+                self._keyframe.nbytes + self._words.nbytes + self._key_words.nbytes)
+
+    @property
+    def used_bytes(self) -> int:
+        """
+        Bytes da área ocupados pelos passos guardados
+        """
+        if not len(self):
+            return 0
+        slots = np.arange(self._first, self._end) % self.capacity
+        return int(self._size[slots].sum())
+
+    @property
+    def keyframes(self) -> int:
+        """
+        Quantidade de keyframes entre os passos guardados
+        """
+        slots = np.arange(self._first, self._end) % self.capacity
+        return int(np.count_nonzero(self._keyframe[slots] == np.arange(self._first, self._end)))
+
+    def clear(self) -> None:
+        """
+        Descarta todo o histórico
+        """
+        self._first = self._end = self._write = 0
+        self._key = -1
+
+    def _load_words(self, data: bytes) -> int:
+        """
+        Copia um snapshot para o buffer de trabalho, completando a última palavra com zeros
+
+        Returns:
+            Quantidade de palavras
+        """
+        count = (len(data) + 7) // 8
+        if count > len(self._words):
+            self._words = np.zeros(count * 2, dtype=np.uint64)
+            self._key_words = np.resize(self._key_words, count * 2)
+        words = self._words.view(np.uint8)
+        words[len(data):count * 8] = 0
+        words[:len(data)] = np.frombuffer(data, dtype=np.uint8)
+        return count
+
+    def _drop_first(self) -> None:
+        """
+        Descarta o registro mais antigo e os que dependiam do seu keyframe
+        """
+        self._first += 1
+        capacity = self.capacity
+        while self._first < self._end and self._keyframe[self._first % capacity] != self._first:
+            self._first += 1
+        if self._first == self._end:
+            self.clear()
+        elif self._key < self._first:
+            self._key = -1
+
+    def _reserve(self, size: int) -> int:
+        """
+        Libera espaço na área para um registro, descartando os mais antigos
+
+        Returns:
+            Início do espaço reservado
+        """
+        if size > len(self._arena):
+            raise ValueError(f"estado de {size} bytes maior que o histórico")
+        if len(self) == self.capacity:
+            self._drop_first()
+        while True:
+            if not len(self):
+                return 0
+            tail = int(self._offset[self._first % self.capacity])
+            write = self._write
+            # write == tail com registros guardados é o anel cheio (os registros
+            # deram a volta e terminam onde começa o mais antigo), nunca vazio
+            if write > tail:
+                # Registros em [tail, write): cabe no fim da área ou, dando a volta, antes de tail
+                if len(self._arena) - write >= size:
+                    return write
+                if tail >= size:
+                    return 0
+            elif tail - write >= size:
+                return write
+            self._drop_first()
+
+    def record(self, simulation: "GameSimulation") -> None:
+        """
+        Guarda o estado atual da simulação (chamar após cada passo)
+
+        Args:
+            simulation: Simulação gravada
+        """
+        data = simulation.snapshot()
+        length = len(data)
+        count = self._load_words(data)
+        words = self._words[:count]
+        index = self._end
+
+        # Diferença para o keyframe: mapa de bits das palavras alteradas + as palavras
+        is_keyframe = (self._key < 0 or length != self._key_length or
+                       index - self._key >= self.keyframe_interval)
+        if not is_keyframe:
+            changed = words != self._key_words[:count]
+            bitmap = np.packbits(changed)
+            values = words[changed].view(np.uint8)
+            size = len(bitmap) + len(values)
+            start = self._reserve(size)
+            # Reservar espaço pode ter descartado o próprio keyframe
+            is_keyframe = self._key < 0
+        if is_keyframe:
+            size = length
+            start = self._reserve(size)
+            self._arena[start:start + size] = words.view(np.uint8)[:length]
+            self._key_words[:count] = words
+            self._key_length = length
+            self._key = index
+        else:
+            middle = start + len(bitmap)
+            self._arena[start:middle] = bitmap
+            self._arena[middle:start + size] = values
+
+        slot = index % self.capacity
+        self._offset[slot] = start
+        self._size[slot] = size
+        self._length[slot] = length
+        self._keyframe[slot] = self._key
+        self._write = start + size
+        if not len(self):
+            self._first = index
+        self._end = index + 1
+
+    def state(self, index: int) -> bytes:
+        """
+        Reconstrói um snapshot guardado
+
+        Args:
+            index: Posição do passo no histórico (0 = mais antigo, -1 = mais novo)
+
+        Returns:
+            Snapshot do passo, para GameSimulation.restore
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("passo fora do histórico")
+        number = self._first + index
+        capacity = self.capacity
+        slot = number % capacity
+        length = int(self._length[slot])
+        key_slot = int(self._keyframe[slot]) % capacity
+        key_start = int(self._offset[key_slot])
+        key = self._arena[key_start:key_start + length]
+        if self._keyframe[slot] == number:
+            return key.tobytes()
+
+        count = (length + 7) // 8
+        words = np.zeros(count, dtype=np.uint64)
+        words.view(np.uint8)[:length] = key
+        start = int(self._offset[slot])
+        bitmap_size = (count + 7) // 8
+        changed = np.unpackbits(self._arena[start:start + bitmap_size], count=count).view(bool)
+        words[changed] = self._arena[start + bitmap_size:start + int(self._size[slot])].view(np.uint64)
+        return words.view(np.uint8)[:length].tobytes()
+
+    def rewind(self, simulation: "GameSimulation", steps: int) -> int:
+        """
+        Volta a simulação alguns passos no histórico e descarta os passos
+        posteriores, para a partida continuar a partir dali
+
+        Args:
+            simulation: Simulação a restaurar
+            steps: Quantos passos voltar a partir do mais novo
+
+        Returns:
+            Quantos passos de fato voltou (limitado ao mais antigo guardado)
+        """
+        if not len(self) or steps <= 0:
+            return 0
+        steps = min(steps, len(self) - 1)
+        number = self._end - 1 - steps
+        simulation.restore(self.state(number - self._first))
+
+        # O passo restaurado vira o mais novo; o keyframe dele volta a ser o atual
+        slot = number % self.capacity
+        self._end = number + 1
+        self._write = int(self._offset[slot]) + int(self._size[slot])
+        self._key = int(self._keyframe[slot])
+        key_slot = self._key % self.capacity
+        self._key_length = int(self._length[key_slot])
+        key_start = int(self._offset[key_slot])
+        self._load_words(self._arena[key_start:key_start + self._key_length].tobytes())
+        self._key_words[:] = self._words
+        return steps
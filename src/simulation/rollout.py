@@ -0,0 +1,286 @@
+"""
+Execução de rollouts do Flappy Bird em vários processos
+Cada processo trabalhador avança uma fatia dos mundos com BatchFlappyEnv; ações,
+observações, recompensas e flags de fim trafegam por buffers circulares em
+multiprocessing.shared_memory, e os pipes carregam apenas o índice do slot
+"""
+
+import multiprocessing
+from multiprocessing import shared_memory
+import sys
+import os
+import typing
+import numpy as np # type: ignore
+
+# Adiciona o diretório pai ao path para importar módulos
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulation.batch_env import BatchFlappyEnv, OBSERVATION_SIZE, FLOAT_DTYPE
+
+# Comandos enviados aos trabalhadores
+_CMD_STEP = 0
+_CMD_RESET = 1
+_CMD_CLOSE = 2
+
+StepResult = typing.Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+class SharedRolloutBuffers:
+    """
+    Buffers circulares em memória compartilhada, um slot por passo em andamento
+    """
+
+    # Nome, dtype e formato (sem as dimensões de slot e mundo) de cada buffer
+    _LAYOUT: typing.List[typing.Tuple[str, typing.Any, typing.Tuple[int, ...]]] = [
+        ("actions", np.uint8, ()),
+        ("observations", FLOAT_DTYPE, (OBSERVATION_SIZE,)),
+        ("rewards", np.float32, ()),
+        ("dones", np.bool_, ()),
+    ]
+
+    def __init__(self, ring_size: int, num_worlds: int, names: typing.Optional[typing.Dict[str, str]] = None):
+        """
+        Cria (ou anexa, se names for fornecido) os buffers compartilhados
+
+        Args:
+            ring_size: Número de slots do anel
+            num_worlds: Número total de mundos
+            names: Nomes dos blocos já criados pelo processo principal
+        """
+        self.ring_size = ring_size
+        self.num_worlds = num_worlds
+        self._owner = names is None
+        self._blocks: typing.Dict[str, shared_memory.SharedMemory] = {}
+        self.arrays: typing.Dict[str, np.ndarray] = {}
+
+        for key, dtype, tail in self._LAYOUT:
+            shape = (ring_size, num_worlds) + tail
+            size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            if names is None:
+                block = shared_memory.SharedMemory(create=True, size=size)
+            else:
+                block = shared_memory.SharedMemory(name=names[key])
+            self._blocks[key] = block
+            self.arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+    @property
+    def names(self) -> typing.Dict[str, str]:
+        """
+        Nomes dos blocos, para anexar nos trabalhadores
+        """
+        return {key: block.name for key, block in self._blocks.items()}
+
+    def close(self) -> None:
+        """
+        Solta os arrays e fecha os blocos (o dono também os remove do sistema)
+        """
+        self.arrays.clear()
+        for block in self._blocks.values():
+            block.close()
+            if self._owner:
+                block.unlink()
+        self._blocks.clear()
+
+def _worker_main(conn: typing.Any, names: typing.Dict[str, str], ring_size: int, num_worlds: int,
+                 first_world: int, last_world: int, seed: int, delta_time: float) -> None:
+    """
+    Laço de um processo trabalhador: avança os mundos [first_world, last_world)
+
+    Args:
+        conn: Ponta do pipe para receber comandos e confirmar slots concluídos
+        names: Nomes dos blocos de memória compartilhada
+        ring_size: Número de slots do anel
+        num_worlds: Número total de mundos
+        first_world: Primeiro mundo desta fatia
+        last_world: Fim (exclusivo) desta fatia
+        seed: Semente base do lote
+        delta_time: Duração de cada passo em segundos
+    """
+    buffers = SharedRolloutBuffers(ring_size, num_worlds, names)
+    actions = buffers.arrays["actions"][:, first_world:last_world]
+    observations = buffers.arrays["observations"][:, first_world:last_world]
+    rewards = buffers.arrays["rewards"][:, first_world:last_world]
+    dones = buffers.arrays["dones"][:, first_world:last_world]
+    env = BatchFlappyEnv(last_world - first_world, seed=seed, first_world=first_world)
+
+    try:
+        while True:
+            command, slot, argument = conn.recv()
+            if command == _CMD_STEP:
+                obs, reward, done = env.step(actions[slot], delta_time)
+                observations[slot] = obs
+                rewards[slot] = reward
+                dones[slot] = done
+            elif command == _CMD_RESET:
+                observations[slot] = env.reset(argument)
+                rewards[slot] = 0.0
+                dones[slot] = False
+            else:
+                break
+            conn.send(slot)
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        del actions, observations, rewards, dones
+        buffers.close()
+        conn.close()
+
+class RolloutRunner:
+    """
+    Distribui num_worlds mundos entre processos trabalhadores.
+
+    Modo síncrono: step(actions) retorna quando todas as fatias terminaram.
+    Modo assíncrono: step_async(actions) apenas publica as ações e retorna;
+    step_wait() devolve o resultado mais antigo. Até ring_size passos podem
+    ficar em andamento, permitindo sobrepor a política e a simulação.
+
+    Os arrays devolvidos são visões do anel compartilhado e continuam válidos
+    até que ring_size novos passos sejam publicados; copie-os para guardá-los.
+    """
+
+    def __init__(self, num_worlds: int, num_workers: typing.Optional[int] = None, seed: int = 0,
+                 ring_size: int = 4, delta_time: float = 1 / 60,
+                 context: typing.Optional[str] = None):
+        """
+        Inicia os processos trabalhadores
+
+        Args:
+            num_worlds: Número total de mundos
+            num_workers: Número de processos (padrão: núcleos disponíveis, no máximo num_worlds)
+            seed: Semente base (o resultado independe do número de processos)
+            ring_size: Número de slots do anel compartilhado
+            delta_time: Duração de cada passo em segundos
+            context: Método de início dos processos ("fork", "spawn"...); padrão do sistema
+        """
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        num_workers = max(1, min(num_workers, num_worlds))
+
+        self.num_worlds = num_worlds
+        self.num_workers = num_workers
+        self.ring_size = ring_size
+        self.buffers = SharedRolloutBuffers(ring_size, num_worlds)
+        self._next_slot = 0
+        self._pending: typing.List[int] = []  # Slots publicados e ainda não coletados (em ordem)
+        self._closed = False
+
+        ctx = multiprocessing.get_context(context)
+        bounds = np.linspace(0, num_worlds, num_workers + 1).astype(int)
+        self._connections: typing.List[typing.Any] = []
+        self._processes: typing.List[typing.Any] = []
+        for i in range(num_workers):
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=_worker_main,
+                args=(child_conn, self.buffers.names, ring_size, num_worlds,
+                      int(bounds[i]), int(bounds[i + 1]), seed, delta_time),
+                daemon=True)
+            process.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._processes.append(process)
+
+    def _publish(self, command: int, argument: typing.Any = None) -> int:
+        """
+        Envia um comando para todos os trabalhadores usando o próximo slot do anel
+        """
+        if len(self._pending) >= self.ring_size:
+            raise RuntimeError("Anel cheio: chame step_wait() antes de publicar novos passos")
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.ring_size
+        for conn in self._connections:
+            conn.send((command, slot, argument))
+        self._pending.append(slot)
+        return slot
+
+    def _collect(self) -> StepResult:
+        """
+        Aguarda todos os trabalhadores concluírem o slot mais antigo
+        """
+        if not self._pending:
+            raise RuntimeError("Nenhum passo em andamento")
+        slot = self._pending.pop(0)
+        for conn in self._connections:
+            conn.recv()
+        arrays = self.buffers.arrays
+        return arrays["observations"][slot], arrays["rewards"][slot], arrays["dones"][slot]
+
+    def reset(self, seed: typing.Optional[int] = None) -> np.ndarray:
+        """
+        Reinicia todos os mundos (aguarda os passos em andamento)
+
+        Args:
+            seed: Nova semente base (mantém os fluxos atuais se None)
+
+        Returns:
+            Observações iniciais, shape (num_worlds, OBSERVATION_SIZE)
+        """
+        while self._pending:
+            self._collect()
+        self._publish(_CMD_RESET, seed)
+        return self._collect()[0]
+
+    def step_async(self, actions: np.ndarray) -> None:
+        """
+        Publica as ações de um passo sem esperar o resultado
+
+        Args:
+            actions: Array (num_worlds,) com 1 para bater asas e 0 para não fazer nada
+        """
+        if len(self._pending) >= self.ring_size:
+            raise RuntimeError("Anel cheio: chame step_wait() antes de publicar novos passos")
+        self.buffers.arrays["actions"][self._next_slot] = actions
+        self._publish(_CMD_STEP)
+
+    def step_wait(self) -> StepResult:
+        """
+        Aguarda o passo publicado há mais tempo
+
+        Returns:
+            observações, recompensas e flags de fim (visões do anel compartilhado)
+        """
+        return self._collect()
+
+    def step(self, actions: np.ndarray) -> StepResult:
+        """
+        Avança todos os mundos em um passo e aguarda o resultado
+
+        Args:
+            actions: Array (num_worlds,) com 1 para bater asas e 0 para não fazer nada
+
+        Returns:
+            observações, recompensas e flags de fim (visões do anel compartilhado)
+
+        Raises:
+            RuntimeError: Se houver passos de step_async ainda não coletados (o
+                resultado devolvido seria o deles, não o de actions)
+        """
+        if self._pending:
+            raise RuntimeError("Passos em andamento: chame step_wait() antes de step()")
+        self.step_async(actions)
+        return self._collect()
+
+    def close(self) -> None:
+        """
+        Encerra os trabalhadores e libera a memória compartilhada
+        """
+        if self._closed:
+            return
+        self._closed = True
+        for conn in self._connections:
+            try:
+                conn.send((_CMD_CLOSE, 0, None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._connections:
+            conn.close()
+        self.buffers.close()
+
+    def __enter__(self) -> "RolloutRunner":
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        self.close()
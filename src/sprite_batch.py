@@ -0,0 +1,322 @@
+"""
+Renderizador de sprites em lote para o jogo Flappy Bird
+Acumula os quadriláteros de um quadro em um único array NumPy, envia tudo ao
+OpenGL com uma atualização de VBO e desenha com um glDrawArrays por textura
+"""
+
+from OpenGL.GL import glGenBuffers, glBindBuffer, glBufferData, glDeleteBuffers, glInterleavedArrays # type: ignore
+from OpenGL.GL import glDrawArrays, glDisableClientState, glBindTexture, glEnable, glDisable, glColor4f # type: ignore
+from OpenGL.GL import glGenTextures, glTexParameteri, glTexImage2D, glDeleteTextures # type: ignore
+from OpenGL.GL import GL_ARRAY_BUFFER, GL_STREAM_DRAW, GL_T2F_C4UB_V3F, GL_QUADS, GL_TEXTURE_2D # type: ignore
+from OpenGL.GL import GL_VERTEX_ARRAY, GL_TEXTURE_COORD_ARRAY, GL_COLOR_ARRAY # type: ignore
+from OpenGL.GL import GL_TEXTURE_MIN_FILTER, GL_TEXTURE_MAG_FILTER, GL_NEAREST, GL_RGBA, GL_UNSIGNED_BYTE # type: ignore
+import ctypes
+import numpy as np # type: ignore
+import typing # type: ignore
+
+from texture_manager import SpriteRegion
+
+# Coordenadas de textura (u0, v0, u1, v1) cobrindo a imagem inteira
+FULL_UV: typing.Tuple[float, float, float, float] = (0.0, 0.0, 1.0, 1.0)
+
+# Cor RGBA (0-1) neutra: não altera a textura
+WHITE: typing.Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0)
+
+# Formato de cada vértice, compatível com glInterleavedArrays(GL_T2F_C4UB_V3F)
+VERTEX_DTYPE = np.dtype([("uv", np.float32, 2), ("color", np.uint8, 4), ("position", np.float32, 3)])
+
+# Colunas do registro de cada sprite
+_X, _Y, _W, _H, _U0, _V0, _U1, _V1, _ROTATION, _R, _G, _B, _A = range(13)
+_SPRITE_FIELDS = 13
+
+class SpriteBatch:
+    """
+    Lote de sprites desenhados com um VBO.
+
+    Entre begin() e end(), draw() apenas registra o sprite em um array NumPy
+    (posição, tamanho, UV, rotação e cor). Em flush() os vértices de todos os
+    sprites são calculados de forma vetorizada — inclusive a rotação, feita na
+    CPU —, enviados com um único glBufferData e desenhados com um
+    glDrawArrays por sequência de sprites com a mesma textura, preservando a
+    ordem de desenho.
+    """
+
+    def __init__(self, capacity: int = 256):
+        """
+        Inicializa o lote (o contexto OpenGL já deve estar ativo)
+
+        Args:
+            capacity: Número inicial de sprites suportados (cresce sob demanda)
+        """
+        self._sprites: np.ndarray = np.zeros((capacity, _SPRITE_FIELDS), dtype=np.float32)
+        self._textures: np.ndarray = np.zeros(capacity, dtype=np.int64)
+        self._vertices: np.ndarray = np.zeros(capacity * 4, dtype=VERTEX_DTYPE)
+        self._count: int = 0
+
+        # Estatísticas do último quadro (zeradas em begin())
+        self.draw_calls: int = 0
+        self.texture_binds: int = 0
+        self.sprites_drawn: int = 0
+
+        self._vbo: int = glGenBuffers(1)
+        self._white_texture: int = self._create_white_texture()
+
+        # Região branca usada por draw_rect; apontá-la para o sprite "white" do
+        # atlas evita trocar de textura só para desenhar retângulos de cor
+        self.white_region: SpriteRegion = SpriteRegion(self._white_texture, 0.0, 0.0, 1.0, 1.0, 1, 1)
+
+    @staticmethod
+    def _create_white_texture() -> int:
+        """
+        Cria uma textura 1x1 branca, usada para retângulos de cor sólida
+        """
+        texture_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, texture_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, 1, 1, 0, GL_RGBA, GL_UNSIGNED_BYTE,
+                     np.full(4, 255, dtype=np.uint8))
+        return texture_id
+
+    def begin(self) -> None:
+        """
+        Começa um novo quadro
+        """
+        self._count = 0
+        self.draw_calls = 0
+        self.texture_binds = 0
+        self.sprites_drawn = 0
+
+    def draw(self, texture_id: typing.Optional[int], x: float, y: float, width: float, height: float,
+             uv: typing.Tuple[float, float, float, float] = FULL_UV, rotation: float = 0.0,
+             color: typing.Tuple[float, float, float, float] = WHITE) -> None:
+        """
+        Registra um sprite
+
+        Args:
+            texture_id: Textura OpenGL (ignorado se None)
+            x: Borda esquerda
+            y: Borda inferior
+            width: Largura
+            height: Altura
+            uv: Coordenadas de textura (u0, v0, u1, v1)
+            rotation: Rotação em graus em torno do centro do sprite (sentido anti-horário)
+            color: Cor RGBA (0-1) multiplicada pela textura
+        """
+        if texture_id is None:
+            return
+        index = self._count
+        if index == len(self._textures):
+            self._grow()
+        self._sprites[index] = (x, y, width, height, uv[0], uv[1], uv[2], uv[3], rotation,
+                                color[0], color[1], color[2], color[3])
+        self._textures[index] = texture_id
+        self._count = index + 1
+
+    def draw_region(self, region: typing.Optional[SpriteRegion], x: float, y: float, width: float, height: float,
+                    rotation: float = 0.0, color: typing.Tuple[float, float, float, float] = WHITE) -> None:
+        """
+        Registra um sprite a partir da sua região no atlas
+
+        Args:
+            region: Região do sprite (ignorado se None)
+            x: Borda esquerda
+            y: Borda inferior
+            width: Largura
+            height: Altura
+            rotation: Rotação em graus em torno do centro do sprite (sentido anti-horário)
+            color: Cor RGBA (0-1) multiplicada pela textura
+        """
+        if region is None:
+            return
+        self.draw(region.texture_id, x, y, width, height, region.uv, rotation, color)
+
+    def draw_rect(self, x: float, y: float, width: float, height: float,
+                  color: typing.Tuple[float, float, float, float]) -> None:
+        """
+        Registra um retângulo de cor sólida
+
+        Args:
+            x: Borda esquerda
+            y: Borda inferior
+            width: Largura
+            height: Altura
+            color: Cor RGBA (0-1)
+        """
+        # Amostra só o centro da região, longe das bordas filtradas
+        self.draw(self.white_region.texture_id, x, y, width, height,
+                  self.white_region.sub_uv(0.5, 0.5, 0.5, 0.5), 0.0, color)
+
+    def draw_rects(self, x: np.ndarray, y: np.ndarray, width: np.ndarray, height: np.ndarray,
+                   color: typing.Tuple[float, float, float, float]) -> None:
+        """
+        Registra vários retângulos de uma mesma cor de uma vez (ex.: barras de um
+        gráfico), sem uma chamada Python por retângulo
+
+        Args:
+            x, y, width, height: Arrays (ou escalares) com as bordas e tamanhos
+            color: Cor RGBA (0-1)
+        """
+        x, y, width, height = np.broadcast_arrays(x, y, width, height)
+        count = x.size
+        if count == 0:
+            return
+        start = self._count
+        while start + count > len(self._textures):
+            self._grow()
+        rows = self._sprites[start:start + count]
+        rows[:, _X] = x.ravel()
+        rows[:, _Y] = y.ravel()
+        rows[:, _W] = width.ravel()
+        rows[:, _H] = height.ravel()
+        rows[:, _U0:_V1 + 1] = self.white_region.sub_uv(0.5, 0.5, 0.5, 0.5)
+        rows[:, _ROTATION] = 0.0
+        rows[:, _R:_A + 1] = color
+        self._textures[start:start + count] = self.white_region.texture_id
+        self._count = start + count
+
+    @staticmethod
+    def sprite_rows(x: np.ndarray, y: np.ndarray, width: np.ndarray, height: np.ndarray, uv: np.ndarray,
+                    color: typing.Tuple[float, float, float, float] = WHITE) -> np.ndarray:
+        """
+        Monta os registros de vários sprites sem rotação, para guardar e
+        desenhar depois com draw_rows (ex.: o layout de um texto)
+
+        Args:
+            x, y, width, height: Arrays com as bordas e tamanhos
+            uv: Array (sprites, 4) com as coordenadas de textura
+            color: Cor RGBA (0-1) de todos os sprites
+
+        Returns:
+            Array (sprites, campos) no formato interno do lote
+        """
+        rows = np.zeros((len(x), _SPRITE_FIELDS), dtype=np.float32)
+        rows[:, _X] = x
+        rows[:, _Y] = y
+        rows[:, _W] = width
+        rows[:, _H] = height
+        rows[:, _U0:_V1 + 1] = uv
+        rows[:, _R:_A + 1] = color
+        return rows
+
+    def draw_rows(self, texture_id: int, rows: np.ndarray) -> None:
+        """
+        Registra de uma vez sprites já montados com sprite_rows, todos da mesma textura
+
+        Args:
+            texture_id: Textura OpenGL
+            rows: Registros dos sprites
+        """
+        count = len(rows)
+        if count == 0:
+            return
+        start = self._count
+        while start + count > len(self._textures):
+            self._grow()
+        self._sprites[start:start + count] = rows
+        self._textures[start:start + count] = texture_id
+        self._count = start + count
+
+    def _grow(self) -> None:
+        """
+        Dobra a capacidade dos arrays
+        """
+        capacity = len(self._textures) * 2
+        self._sprites = np.resize(self._sprites, (capacity, _SPRITE_FIELDS))
+        self._textures = np.resize(self._textures, capacity)
+        self._vertices = np.zeros(capacity * 4, dtype=VERTEX_DTYPE)
+
+    def _build_vertices(self, count: int) -> np.ndarray:
+        """
+        Calcula os 4 vértices (inferior esquerdo, inferior direito, superior
+        direito, superior esquerdo) de cada sprite registrado
+
+        Returns:
+            Visão de self._vertices com count * 4 vértices
+        """
+        sprites = self._sprites[:count]
+        vertices = self._vertices[:count * 4]
+        position = vertices["position"].reshape(count, 4, 3)
+        uv = vertices["uv"].reshape(count, 4, 2)
+
+        half_w = sprites[:, _W] * 0.5
+        half_h = sprites[:, _H] * 0.5
+        center_x = sprites[:, _X] + half_w
+        center_y = sprites[:, _Y] + half_h
+
+        # Deslocamentos dos cantos em relação ao centro
+        offset_x = np.stack((-half_w, half_w, half_w, -half_w), axis=1)
+        offset_y = np.stack((-half_h, -half_h, half_h, half_h), axis=1)
+
+        rotation = sprites[:, _ROTATION]
+        if rotation.any():
+            radians = np.radians(rotation)[:, None]
+            cos_r = np.cos(radians)
+            sin_r = np.sin(radians)
+            position[:, :, 0] = center_x[:, None] + offset_x * cos_r - offset_y * sin_r
+            position[:, :, 1] = center_y[:, None] + offset_x * sin_r + offset_y * cos_r
+        else:
+            position[:, :, 0] = center_x[:, None] + offset_x
+            position[:, :, 1] = center_y[:, None] + offset_y
+        position[:, :, 2] = 0.0
+
+        u0 = sprites[:, _U0]
+        v0 = sprites[:, _V0]
+        u1 = sprites[:, _U1]
+        v1 = sprites[:, _V1]
+        uv[:, :, 0] = np.stack((u0, u1, u1, u0), axis=1)
+        uv[:, :, 1] = np.stack((v0, v0, v1, v1), axis=1)
+
+        colors = np.clip(sprites[:, _R:_A + 1] * 255.0 + 0.5, 0.0, 255.0).astype(np.uint8)
+        vertices["color"].reshape(count, 4, 4)[:] = colors[:, None, :]
+        return vertices
+
+    def flush(self) -> None:
+        """
+        Envia e desenha os sprites registrados até agora
+        """
+        count = self._count
+        if count == 0:
+            return
+
+        vertices = self._build_vertices(count)
+
+        # Sequências de sprites consecutivos com a mesma textura
+        textures = self._textures[:count]
+        starts = np.flatnonzero(np.concatenate(([True], textures[1:] != textures[:-1])))
+        ends = np.append(starts[1:], count)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STREAM_DRAW)
+        glInterleavedArrays(GL_T2F_C4UB_V3F, 0, ctypes.c_void_p(0))
+        glEnable(GL_TEXTURE_2D)
+
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            glBindTexture(GL_TEXTURE_2D, int(textures[start]))
+            glDrawArrays(GL_QUADS, start * 4, (end - start) * 4)
+
+        glDisable(GL_TEXTURE_2D)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        # O array de cores deixa a cor corrente indefinida; volta para branco opaco
+        glColor4f(1.0, 1.0, 1.0, 1.0)
+
+        self.draw_calls += len(starts)
+        self.texture_binds += len(starts)
+        self.sprites_drawn += count
+        self._count = 0
+
+    def end(self) -> None:
+        """
+        Termina o quadro, desenhando o que restar no lote
+        """
+        self.flush()
+
+    def cleanup(self) -> None:
+        """
+        Libera o VBO e a textura branca
+        """
+        glDeleteBuffers(1, [self._vbo])
+        glDeleteTextures(1, [self._white_texture])
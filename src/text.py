@@ -0,0 +1,371 @@
+"""
+Renderização de texto com um atlas de glifos para o jogo Flappy Bird
+Os glifos de uma fonte são desenhados uma única vez com o Pillow e
+empacotados em uma textura (atlas.pack_atlas); com o cache de assets eles já
+estão na página do atlas de sprites e as métricas vêm do cache, sem desenhar
+nada na inicialização. Um TextLabel guarda os sprites do seu texto já
+posicionados em um array e só refaz o layout quando o texto muda; a cada
+quadro o texto inteiro entra no lote com uma chamada.
+"""
+
+from PIL import Image, ImageDraw, ImageFont # type: ignore
+from OpenGL.GL import GL_CLAMP_TO_EDGE # type: ignore
+import PIL # type: ignore
+import numpy as np # type: ignore
+import hashlib
+import os
+import string
+import typing
+import unicodedata
+
+from atlas import pack_atlas
+from sprite_batch import SpriteBatch, WHITE
+
+if typing.TYPE_CHECKING:
+    from texture_manager import TextureManager
+
+Color = typing.Tuple[float, float, float, float]
+
+# Caracteres incluídos no atlas (ASCII imprimível e os acentos do português)
+DEFAULT_CHARACTERS: str = "".join(ch for ch in string.printable if ch.isprintable()) + "áàâãéêíóôõúçÁÀÂÃÉÊÍÓÔÕÚÇ"
+
+# Caractere usado no lugar dos que não estão no atlas
+FALLBACK_CHARACTER: str = "?"
+
+# Caractere que nenhuma fonte tem: a fonte o desenha com o glifo de "caractere inexistente"
+MISSING_CHARACTER: str = "\uffff"
+
+# Colunas da tabela de glifos
+_U0, _V0, _U1, _V1, _WIDTH, _HEIGHT, _OFFSET_X, _OFFSET_Y, _ADVANCE = range(9)
+
+def load_font(size: int, path: typing.Optional[str] = None) -> typing.Any:
+    """
+    Abre uma fonte TrueType no tamanho indicado
+
+    Args:
+        size: Tamanho em pixels
+        path: Arquivo .ttf/.otf (usa a fonte embutida no Pillow se None)
+
+    Returns:
+        Fonte do Pillow
+    """
+    if path is not None:
+        return ImageFont.truetype(path, size)
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        # Pillow antigo: só a fonte bitmap padrão, sem escolha de tamanho
+        return ImageFont.load_default()
+
+class FontGlyphs(typing.NamedTuple):
+    """
+    Glifos de uma fonte desenhados pelo Pillow, antes de irem para uma textura
+    """
+    images: typing.Dict[str, np.ndarray]  # Pixels de cada glifo visível, por glyph_sprite_name
+    table: np.ndarray                     # Uma linha por caractere (colunas _CODE a _GLYPH_ADVANCE)
+    metrics: np.ndarray                   # ascent, descent
+
+# Colunas de FontGlyphs.table: código do caractere, linha usada (a do substituto
+# para os caracteres que a fonte não tem), caixa, deslocamentos e avanço
+_CODE, _ROW, _GLYPH_WIDTH, _GLYPH_HEIGHT, _GLYPH_OFFSET_X, _GLYPH_OFFSET_Y, _GLYPH_ADVANCE = range(7)
+
+# Glifos já desenhados, por (tamanho, arquivo, caracteres)
+_GLYPHS: typing.Dict[typing.Tuple[int, typing.Optional[str], str], FontGlyphs] = {}
+
+def font_name(size: int, path: typing.Optional[str] = None, characters: str = DEFAULT_CHARACTERS) -> str:
+    """
+    Nome de uma fonte no cache de assets: muda com tudo o que muda os glifos
+    (tamanho, arquivo e sua versão, caracteres, versão do Pillow)
+    """
+    if path is not None:
+        stat = os.stat(path)
+        source = f"{os.path.basename(path)}-{stat.st_size}-{stat.st_mtime_ns}"
+    else:
+        source = "default"
+    digest = hashlib.sha1(characters.encode("utf-8")).hexdigest()[:8]
+    return f"font_{size}_{source}_{digest}_pil{PIL.__version__}"
+
+def glyph_sprite_name(font: str, code: int) -> str:
+    """
+    Nome do sprite de um glifo no atlas
+    """
+    return f"{font}_glyph_{code}"
+
+def rasterize_font(size: int, path: typing.Optional[str] = None,
+                   characters: str = DEFAULT_CHARACTERS) -> FontGlyphs:
+    """
+    Desenha os glifos de uma fonte com o Pillow (uma vez por processo)
+
+    Args:
+        size: Tamanho da fonte em pixels
+        path: Arquivo da fonte (fonte embutida no Pillow se None)
+        characters: Caracteres desenhados
+
+    Returns:
+        Pixels e métricas dos glifos
+    """
+    key = (size, path, characters)
+    glyphs = _GLYPHS.get(key)
+    if glyphs is not None:
+        return glyphs
+
+    name = font_name(size, path, characters)
+    font = load_font(size, path)
+    try:
+        ascent, descent = font.getmetrics()
+    except AttributeError:
+        # Fonte bitmap: sem métricas, usa a altura da caixa dos caracteres
+        ascent, descent = font.getbbox(characters)[3], 0
+
+    if FALLBACK_CHARACTER not in characters:
+        characters += FALLBACK_CHARACTER
+    characters = "".join(dict.fromkeys(characters))
+
+    def mask_bytes(ch: str) -> typing.Tuple[typing.Tuple[int, int], bytes]:
+        # Tamanho e pixels do glifo de um caractere, para comparar glifos entre si
+        mask = font.getmask(ch)
+        return mask.size, bytes(mask)
+
+    # Caracteres que a fonte não tem saem como o glifo de "caractere
+    # inexistente"; eles ficam fora do atlas e usam a letra sem acento
+    missing_glyph = mask_bytes(MISSING_CHARACTER)
+    substitutes: typing.Dict[str, str] = {}
+    for ch in characters:
+        if ch != FALLBACK_CHARACTER and mask_bytes(ch) == missing_glyph:
+            base = unicodedata.normalize("NFD", ch)[0]
+            substitutes[ch] = base if base in characters and base not in substitutes else FALLBACK_CHARACTER
+    drawn = [ch for ch in characters if ch not in substitutes]
+    rows = {ch: i for i, ch in enumerate(drawn)}
+
+    # Cada glifo é desenhado em branco, com a cobertura no canal alpha, para
+    # que a cor do texto venha da cor do sprite no lote
+    images: typing.Dict[str, np.ndarray] = {}
+    table = np.zeros((len(drawn) + len(substitutes), 7), dtype=np.float64)
+    for i, ch in enumerate(drawn):
+        left, top, right, bottom = font.getbbox(ch)
+        table[i] = (ord(ch), i, max(0, right - left), max(0, bottom - top), left,
+                    ascent - bottom,  # Base do glifo em relação à linha de base
+                    font.getlength(ch))
+        if right <= left or bottom <= top:
+            continue  # Espaço e outros caracteres sem pixels
+        mask = Image.new("L", (right - left, bottom - top), 0)
+        ImageDraw.Draw(mask).text((-left, -top), ch, font=font, fill=255)
+        pixels = np.full((bottom - top, right - left, 4), 255, dtype=np.uint8)
+        pixels[:, :, 3] = np.asarray(mask)
+        images[glyph_sprite_name(name, ord(ch))] = pixels
+    for i, (ch, substitute) in enumerate(substitutes.items(), len(drawn)):
+        table[i] = table[rows[substitute]]
+        table[i, _CODE] = ord(ch)
+
+    glyphs = FontGlyphs(images, table, np.array([ascent, descent], dtype=np.float64))
+    _GLYPHS[key] = glyphs
+    return glyphs
+
+def font_sprites(size: int, path: typing.Optional[str] = None) -> typing.Callable[[], typing.Dict[str, np.ndarray]]:
+    """
+    Glifos de uma fonte para o atlas do cache de assets (função que os desenha)
+    """
+    return lambda: rasterize_font(size, path).images
+
+def font_arrays(size: int, path: typing.Optional[str] = None) -> typing.Dict[str, typing.Callable[[], np.ndarray]]:
+    """
+    Métricas de uma fonte para o cache de assets (nome -> função que gera o array)
+    """
+    name = font_name(size, path)
+    return {f"{name}.glyphs": lambda: rasterize_font(size, path).table,
+            f"{name}.metrics": lambda: rasterize_font(size, path).metrics}
+
+class FontAtlas:
+    """
+    Glifos de uma fonte em um tamanho, em uma textura, e as métricas de cada glifo
+    """
+
+    def __init__(self, texture_manager: "TextureManager", size: int, path: typing.Optional[str] = None,
+                 characters: str = DEFAULT_CHARACTERS, padding: int = 1):
+        """
+        Usa os glifos da página do atlas de sprites, se o cache de assets os
+        tiver (sem desenhar nada); senão desenha os glifos e envia um atlas
+        próprio ao OpenGL
+
+        Args:
+            texture_manager: Gerenciador onde a textura é registrada
+            size: Tamanho da fonte em pixels
+            path: Arquivo da fonte (fonte embutida no Pillow se None)
+            characters: Caracteres incluídos no atlas
+            padding: Pixels de borda em volta de cada glifo (no atlas próprio)
+        """
+        self.size = size
+        name = font_name(size, path, characters)
+        cache = texture_manager.cache
+        table = cache.array(f"{name}.glyphs") if cache is not None else None
+        metrics = cache.array(f"{name}.metrics") if cache is not None else None
+
+        regions: typing.Dict[int, typing.Tuple[float, float, float, float]] = {}
+        texture_id: typing.Optional[int] = None
+        if table is not None and metrics is not None:
+            # Glifos já na página do atlas de sprites: o texto entra no mesmo lote que os sprites
+            visible = ((table[:, _ROW] == np.arange(len(table))) & (table[:, _GLYPH_WIDTH] > 0) &
+                       (table[:, _GLYPH_HEIGHT] > 0))
+            for code in table[visible, _CODE].astype(int):
+                region = texture_manager.regions.get(glyph_sprite_name(name, int(code)))
+                if region is None or texture_id not in (None, region.texture_id):
+                    table = None
+                    break
+                texture_id = region.texture_id
+                regions[int(code)] = region.uv
+        if table is None or metrics is None or texture_id is None:
+            glyphs = rasterize_font(size, path, characters)
+            table, metrics = glyphs.table, glyphs.metrics
+            page = pack_atlas(glyphs.images, padding)[0]
+            texture_id = texture_manager.add_texture(f"font_{size}_{path or 'default'}", page.pixels,
+                                                     GL_CLAMP_TO_EDGE)
+            regions = {}
+            for code in table[:, _CODE].astype(int):
+                region = page.regions.get(glyph_sprite_name(name, int(code)))
+                if region is not None:
+                    regions[int(code)] = region[:4]
+        self.texture_id: int = texture_id
+
+        ascent, descent = int(metrics[0]), int(metrics[1])
+        self.ascent: int = ascent
+        self.descent: int = descent
+        self.line_height: int = ascent + descent
+
+        # Tabela de glifos: uma linha por caractere desenhado, indexada por _index
+        # (os caracteres que a fonte não tem apontam para a linha do substituto)
+        rows = table[:, _ROW].astype(int)
+        drawn = rows == np.arange(len(table))
+        self._index: typing.Dict[str, int] = {chr(int(code)): int(row) for code, row in zip(table[:, _CODE], rows)}
+        self._fallback: int = self._index[FALLBACK_CHARACTER]
+        self.substitutes: typing.Dict[str, str] = {chr(int(code)): chr(int(table[row, _CODE]))
+                                                   for code, row, own in zip(table[:, _CODE], rows, drawn) if not own}
+        self._glyphs: np.ndarray = np.zeros((int(drawn.sum()), 9), dtype=np.float64)
+        for i in np.flatnonzero(drawn):
+            code = int(table[i, _CODE])
+            uv = regions.get(code)
+            if uv is not None:
+                self._glyphs[i, _U0:_V1 + 1] = uv
+                self._glyphs[i, _WIDTH] = table[i, _GLYPH_WIDTH]
+                self._glyphs[i, _HEIGHT] = table[i, _GLYPH_HEIGHT]
+            self._glyphs[i, _OFFSET_X] = table[i, _GLYPH_OFFSET_X]
+            self._glyphs[i, _OFFSET_Y] = table[i, _GLYPH_OFFSET_Y]
+            self._glyphs[i, _ADVANCE] = table[i, _GLYPH_ADVANCE]
+
+    def _glyph_rows(self, text: str) -> np.ndarray:
+        """
+        Linhas da tabela de glifos para cada caractere do texto
+        """
+        index = self._index
+        fallback = self._fallback
+        return self._glyphs[[index.get(ch, fallback) for ch in text]]
+
+    def measure(self, text: str, scale: float = 1.0) -> float:
+        """
+        Largura do texto em pixels
+
+        Args:
+            text: Texto de uma linha
+            scale: Escala aplicada ao tamanho da fonte
+        """
+        return float(self._glyph_rows(text)[:, _ADVANCE].sum()) * scale
+
+    def layout(self, text: str, x: float, y: float, scale: float = 1.0) -> typing.Tuple[np.ndarray, ...]:
+        """
+        Posiciona os glifos de uma linha de texto
+
+        Args:
+            text: Texto de uma linha
+            x: Borda esquerda
+            y: Borda inferior da linha (a linha de base fica descent acima)
+            scale: Escala aplicada ao tamanho da fonte
+
+        Returns:
+            Tupla (x, y, width, height, uv) com um elemento por glifo visível;
+            uv é um array (glifos, 4)
+        """
+        glyphs = self._glyph_rows(text)
+        pen = np.cumsum(glyphs[:, _ADVANCE]) - glyphs[:, _ADVANCE]  # Avanço acumulado antes de cada glifo
+        visible = glyphs[:, _WIDTH] > 0
+        glyphs = glyphs[visible]
+        # Cantos arredondados para pixels inteiros: sem borrar os glifos com a filtragem linear
+        left = np.round(x + (pen[visible] + glyphs[:, _OFFSET_X]) * scale)
+        bottom = np.round(y + (self.descent + glyphs[:, _OFFSET_Y]) * scale)
+        return (left, bottom, glyphs[:, _WIDTH] * scale, glyphs[:, _HEIGHT] * scale, glyphs[:, _U0:_V1 + 1])
+
+class TextLabel:
+    """
+    Uma linha de texto com o layout em cache, refeito só quando o texto muda
+    """
+
+    def __init__(self, font: FontAtlas, x: float, y: float, text: str = "", color: Color = WHITE,
+                 scale: float = 1.0, anchor_x: float = 0.0, shadow: typing.Optional[Color] = None,
+                 shadow_offset: typing.Tuple[float, float] = (1.0, -1.0)):
+        """
+        Inicializa o texto
+
+        Args:
+            font: Atlas da fonte
+            x: Posição horizontal do ponto de ancoragem
+            y: Borda inferior da linha
+            text: Texto inicial
+            color: Cor RGBA (0-1) do texto
+            scale: Escala aplicada ao tamanho da fonte
+            anchor_x: Ponto de ancoragem na largura do texto (0 = esquerda, 0.5 = centro, 1 = direita)
+            shadow: Cor da sombra desenhada por baixo do texto (sem sombra se None)
+            shadow_offset: Deslocamento da sombra em pixels
+        """
+        self.font = font
+        self.x = x
+        self.y = y
+        self.color = color
+        self.scale = scale
+        self.anchor_x = anchor_x
+        self.shadow = shadow
+        self.shadow_offset = shadow_offset
+        self.text: str = text
+        self.width: float = 0.0
+        self.layouts: int = 0  # Quantas vezes o layout foi refeito
+        self._rows: np.ndarray
+        self._layout()
+
+    @property
+    def height(self) -> float:
+        """
+        Altura da linha em pixels
+        """
+        return self.font.line_height * self.scale
+
+    def set_text(self, text: str) -> None:
+        """
+        Troca o texto, refazendo o layout só se ele mudou
+
+        Args:
+            text: Novo texto
+        """
+        if text != self.text:
+            self.text = text
+            self._layout()
+
+    def _layout(self) -> None:
+        """
+        Monta os sprites do texto (e da sombra, antes dele) no formato do lote
+        """
+        self.layouts += 1
+        self.width = self.font.measure(self.text, self.scale)
+        left = self.x - self.width * self.anchor_x
+        x, y, width, height, uv = self.font.layout(self.text, left, self.y, self.scale)
+        rows = SpriteBatch.sprite_rows(x, y, width, height, uv, self.color)
+        if self.shadow is not None:
+            dx, dy = self.shadow_offset
+            shadow = SpriteBatch.sprite_rows(x + dx, y + dy, width, height, uv, self.shadow)
+            rows = np.concatenate((shadow, rows))
+        self._rows = rows
+
+    def render(self, batch: SpriteBatch) -> None:
+        """
+        Registra o texto no lote
+
+        Args:
+            batch: Lote de sprites do quadro atual
+        """
+        batch.draw_rows(self.font.texture_id, self._rows)
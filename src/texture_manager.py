@@ -7,20 +7,70 @@ from OpenGL.GL import * # type: ignore
 from OpenGL.GL import glGenTextures, glBindTexture, glTexParameteri, glTexImage2D, glDeleteTextures # type: ignore
 from OpenGL.GL import GL_TEXTURE_2D, GL_REPEAT, GL_LINEAR, GL_RGBA, GL_UNSIGNED_BYTE # type: ignore
 from OpenGL.GL import GL_TEXTURE_WRAP_S, GL_TEXTURE_WRAP_T, GL_TEXTURE_MIN_FILTER, GL_TEXTURE_MAG_FILTER # type: ignore
+from OpenGL.GL import GL_CLAMP_TO_EDGE, GL_MAX_TEXTURE_SIZE, glGetIntegerv # type: ignore
 from PIL import Image # type: ignore
 import numpy as np # type: ignore
 import typing # type: ignore
 import os # type: ignore
 
+from atlas import AtlasPage, decode_image, pack_atlas
+
+if typing.TYPE_CHECKING:
+    from asset_cache import AssetCache
+    from text import FontAtlas
+
+class SpriteRegion(typing.NamedTuple):
+    """
+    Região de uma textura ocupada por um sprite (coordenadas UV no padrão do OpenGL,
+    com v crescendo de baixo para cima)
+    """
+    texture_id: int
+    u0: float
+    v0: float
+    u1: float
+    v1: float
+    width: int  # Tamanho original da imagem em pixels
+    height: int
+
+    @property
+    def uv(self) -> typing.Tuple[float, float, float, float]:
+        """
+        Coordenadas (u0, v0, u1, v1) da região inteira
+        """
+        return (self.u0, self.v0, self.u1, self.v1)
+
+    def sub_uv(self, s0: float, t0: float, s1: float, t1: float) -> typing.Tuple[float, float, float, float]:
+        """
+        Converte um retângulo em coordenadas locais do sprite (0-1) para UV da textura
+
+        Args:
+            s0, t0: Canto inferior esquerdo em coordenadas locais
+            s1, t1: Canto superior direito em coordenadas locais
+
+        Returns:
+            Tupla (u0, v0, u1, v1)
+        """
+        du = self.u1 - self.u0
+        dv = self.v1 - self.v0
+        return (self.u0 + s0 * du, self.v0 + t0 * dv, self.u0 + s1 * du, self.v0 + t1 * dv)
+
 class TextureManager:
     """
     Gerenciador de texturas para o jogo Flappy Bird.
     Carrega e gerencia texturas para uso com OpenGL.
     """
     
-    def __init__(self):
-        """Inicializa o gerenciador de texturas."""
+    def __init__(self, cache: typing.Optional["AssetCache"] = None):
+        """
+        Inicializa o gerenciador de texturas.
+        
+        Args:
+            cache: Cache de assets pré-processados (opcional)
+        """
+        self.cache = cache
         self.textures: dict[str, int] = {}  # Dicionário para armazenar texturas pelo nome
+        self.regions: dict[str, SpriteRegion] = {}  # Sprites empacotados no atlas, pelo nome
+        self.fonts: dict[typing.Tuple[int, typing.Optional[str]], "FontAtlas"] = {}  # Atlas de glifos por (tamanho, fonte)
 
     def load_texture(self, path: str, name: typing.Optional[str] = None) -> typing.Optional[int]:
         """
@@ -46,40 +96,19 @@ class TextureManager:
                 print(f"Erro: Arquivo '{path}' não encontrado.")
                 return None
                 
-            # Carrega a imagem com PIL
-            image = Image.open(path)
-            # No OpenGL, textura começa na parte inferior esquerda, mas no PIL na parte superior esquerda
-            image = image.transpose(Image.FLIP_TOP_BOTTOM)
-            # Converte para RGBA para garantir canal alpha
-            img_data = np.array(image.convert("RGBA"), dtype=np.uint8)
+            # Pixels já invertidos e em RGBA, direto do cache (sem decodificar)
+            img_data = self.cache.image(path) if self.cache is not None else None
             
-            # Gera um ID de textura OpenGL
-            texture_id = glGenTextures(1)
+            if img_data is None:
+                # Carrega a imagem com PIL
+                image = Image.open(path)
+                # No OpenGL, textura começa na parte inferior esquerda, mas no PIL na parte superior esquerda
+                image = image.transpose(Image.FLIP_TOP_BOTTOM)
+                # Converte para RGBA para garantir canal alpha
+                img_data = np.array(image.convert("RGBA"), dtype=np.uint8)
             
-            # Vincula a textura
-            glBindTexture(GL_TEXTURE_2D, texture_id)
-            
-            # Configura parâmetros da textura
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-            
-            # Carrega os dados da imagem na textura OpenGL
-            glTexImage2D(
-                GL_TEXTURE_2D,
-                0,
-                GL_RGBA,
-                image.width,
-                image.height,
-                0,
-                GL_RGBA,
-                GL_UNSIGNED_BYTE,
-                img_data
-            )
-            
-            # Armazena a textura no dicionário
-            self.textures[name] = texture_id
+            # Gera a textura OpenGL, carrega os dados da imagem e a armazena no dicionário
+            texture_id = self.add_texture(name, img_data)
             
             print(f"Textura '{name}' carregada com sucesso. ID: {texture_id}")
             return texture_id
@@ -88,6 +117,157 @@ class TextureManager:
             print(f"Erro ao carregar textura '{path}': {e}")
             return None
             
+    def load_sprite(self, path: str, name: str) -> typing.Optional[SpriteRegion]:
+        """
+        Obtém um sprite pelo nome: a região do atlas, se ele foi empacotado,
+        ou uma textura própria cobrindo a imagem inteira
+
+        Args:
+            path: Caminho do arquivo de imagem (usado se o sprite não estiver no atlas)
+            name: Nome do sprite
+
+        Returns:
+            Região do sprite ou None se houver erro
+        """
+        region = self.regions.get(name)
+        if region is not None:
+            return region
+
+        texture_id = self.load_texture(path, name)
+        if texture_id is None:
+            return None
+        with Image.open(path) as image:
+            width, height = image.size
+        region = SpriteRegion(texture_id, 0.0, 0.0, 1.0, 1.0, width, height)
+        self.regions[name] = region
+        return region
+
+    def load_font(self, size: int, path: typing.Optional[str] = None) -> "FontAtlas":
+        """
+        Obtém o atlas de glifos de uma fonte, gerando-o na primeira vez
+
+        Args:
+            size: Tamanho da fonte em pixels
+            path: Arquivo da fonte (fonte embutida no Pillow se None)
+
+        Returns:
+            Atlas da fonte, compartilhado por todos os textos do mesmo tamanho
+        """
+        font = self.fonts.get((size, path))
+        if font is None:
+            # Importado aqui: o módulo de texto depende do lote, que depende deste módulo
+            from text import FontAtlas
+            font = FontAtlas(self, size, path)
+            self.fonts[(size, path)] = font
+        return font
+
+    def get_region(self, name: str) -> typing.Optional[SpriteRegion]:
+        """
+        Obtém a região de um sprite pelo nome
+
+        Args:
+            name: Nome do sprite
+
+        Returns:
+            Região do sprite ou None se não encontrada
+        """
+        if name in self.regions:
+            return self.regions[name]
+        print(f"Aviso: Sprite '{name}' não encontrado")
+        return None
+
+    def build_atlas(self, sprites: typing.Mapping[str, typing.Any], padding: int = 2,
+                    max_size: int = 2048) -> typing.List[int]:
+        """
+        Empacota várias imagens em uma ou mais texturas (páginas do atlas), ver atlas.pack_atlas.
+        Se houver um cache de assets gerado para estes sprites, as páginas são
+        enviadas direto do cache, sem decodificar as imagens.
+        Também é incluído o sprite "white" (branco sólido), usado para retângulos de cor.
+
+        Args:
+            sprites: Dicionário nome -> caminho da imagem
+            padding: Pixels de borda em volta de cada sprite
+            max_size: Tamanho máximo de uma página
+
+        Returns:
+            IDs das texturas das páginas criadas
+        """
+        max_size = self.max_atlas_size(max_size)
+
+        pages: typing.Optional[typing.List[AtlasPage]] = None
+        if self.cache is not None and self.cache.has_atlas(sprites, padding):
+            pages = self.cache.atlas_pages()
+            if any(page.pixels.shape[0] > max_size for page in pages):
+                pages = None
+
+        if pages is None:
+            images: typing.Dict[str, np.ndarray] = {}
+            for name, path in sprites.items():
+                if not os.path.exists(path):
+                    print(f"Erro: Arquivo '{path}' não encontrado.")
+                    continue
+                images[name] = decode_image(path)
+            pages = pack_atlas(images, padding, max_size)
+
+        return [self.add_atlas_page(page.pixels, page.regions) for page in pages]
+
+    def max_atlas_size(self, max_size: int = 2048) -> int:
+        """
+        Limita o tamanho de uma página do atlas ao suportado pela placa de vídeo
+        """
+        return min(max_size, int(glGetIntegerv(GL_MAX_TEXTURE_SIZE)))
+
+    def add_texture(self, name: str, pixels: np.ndarray, wrap: int = GL_REPEAT) -> int:
+        """
+        Cria uma textura a partir de pixels RGBA já invertidos e a registra pelo nome
+
+        Args:
+            name: Nome para referenciar a textura
+            pixels: Array (altura, largura, 4)
+            wrap: Modo de repetição (GL_REPEAT ou GL_CLAMP_TO_EDGE)
+
+        Returns:
+            ID da textura OpenGL
+        """
+        texture_id = self._upload_rgba(pixels, wrap)
+        self.textures[name] = texture_id
+        return texture_id
+
+    def add_atlas_page(self, pixels: np.ndarray, regions: typing.Mapping[str, typing.Sequence[typing.Any]]) -> int:
+        """
+        Cria uma página do atlas e registra as regiões dos seus sprites. Os
+        pixels podem ser enviados depois, sprite a sprite (ver AssetLoader)
+
+        Args:
+            pixels: Pixels RGBA da página, já invertidos
+            regions: Dicionário nome -> (u0, v0, u1, v1, largura, altura)
+
+        Returns:
+            ID da textura da página
+        """
+        page_name = f"atlas_{sum(1 for name in self.textures if name.startswith('atlas_'))}"
+        texture_id = self.add_texture(page_name, pixels, GL_CLAMP_TO_EDGE)
+        for name, (u0, v0, u1, v1, width, height) in regions.items():
+            self.regions[name] = SpriteRegion(texture_id, u0, v0, u1, v1, width, height)
+        size = pixels.shape[0]
+        print(f"Atlas '{page_name}' ({size}x{size}) com {len(regions)} sprites. ID: {texture_id}")
+        return texture_id
+
+    @staticmethod
+    def _upload_rgba(pixels: np.ndarray, wrap: int) -> int:
+        """
+        Cria uma textura OpenGL a partir de um array RGBA (altura, largura, 4)
+        """
+        texture_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, texture_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, wrap)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, wrap)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, pixels.shape[1], pixels.shape[0], 0,
+                     GL_RGBA, GL_UNSIGNED_BYTE, pixels)
+        return texture_id
+
     def get_texture(self, name: str) -> typing.Optional[int]:
         """
         Obtém o ID de uma textura carregada pelo nome
@@ -110,4 +290,9 @@ class TextureManager:
         for texture_id in self.textures.values():
             glDeleteTextures(1, [texture_id])
         self.textures.clear()
+        self.regions.clear()
+        self.fonts.clear()
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
         print("Todas as texturas foram liberadas") 
\ No newline at end of file